@@ -0,0 +1,93 @@
+"""Move podcast transcript segments into their own table
+
+Revision ID: 3f6a9c1d8e27
+Revises: 9e2b5d7a3c41
+Create Date: 2026-10-16 21:02:37.481226
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3f6a9c1d8e27"
+down_revision: Union[str, Sequence[str], None] = "9e2b5d7a3c41"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "podcast_transcript_segments",
+        sa.Column("episode_id", sa.Integer(), nullable=False),
+        sa.Column("seq", sa.Integer(), nullable=False),
+        sa.Column("start_time", sa.Float(), nullable=False),
+        sa.Column("end_time", sa.Float(), nullable=False),
+        sa.Column("text", sa.Text(), nullable=False),
+        sa.Column("language", sa.String(length=16), nullable=True),
+        sa.Column("emotion", sa.String(length=32), nullable=True),
+        sa.Column("events", sa.JSON(), nullable=True),
+        sa.Column("confidence", sa.Float(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["episode_id"], ["podcast_episodes.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("episode_id", "seq"),
+    )
+    op.create_index(
+        "idx_transcript_segment_start",
+        "podcast_transcript_segments",
+        ["episode_id", "start_time"],
+        unique=False,
+    )
+
+    op.execute("""
+        INSERT INTO podcast_transcript_segments
+            (episode_id, seq, start_time, end_time, text,
+             language, emotion, events, confidence)
+        SELECT e.id, s.ordinality - 1,
+               COALESCE((s.value->>'start_time')::float, 0),
+               COALESCE((s.value->>'end_time')::float, 0),
+               COALESCE(s.value->>'text', ''),
+               s.value->>'language',
+               s.value->>'emotion',
+               s.value->'events',
+               (s.value->>'confidence')::float
+        FROM podcast_episodes e,
+             json_array_elements(e.transcript_segments) WITH ORDINALITY s
+        WHERE e.transcript_segments IS NOT NULL
+    """)
+    op.drop_column("podcast_episodes", "transcript_segments")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column(
+        "podcast_episodes",
+        sa.Column("transcript_segments", sa.JSON(), nullable=True),
+    )
+    op.execute("""
+        UPDATE podcast_episodes e SET transcript_segments = s.segments
+        FROM (
+            SELECT episode_id,
+                   json_agg(
+                       json_strip_nulls(json_build_object(
+                           'start_time', start_time, 'end_time', end_time,
+                           'text', text, 'language', language,
+                           'emotion', emotion, 'events', events,
+                           'confidence', confidence
+                       ))
+                       ORDER BY seq
+                   ) AS segments
+            FROM podcast_transcript_segments
+            GROUP BY episode_id
+        ) s
+        WHERE e.id = s.episode_id
+    """)
+    op.drop_index(
+        "idx_transcript_segment_start", table_name="podcast_transcript_segments"
+    )
+    op.drop_table("podcast_transcript_segments")
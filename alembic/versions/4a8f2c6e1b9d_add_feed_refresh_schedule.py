@@ -0,0 +1,52 @@
+"""Add background refresh schedule to podcast feeds
+
+Revision ID: 4a8f2c6e1b9d
+Revises: 7c1e4b9a2d3f
+Create Date: 2026-10-16 14:03:27.518204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4a8f2c6e1b9d"
+down_revision: Union[str, Sequence[str], None] = "7c1e4b9a2d3f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "podcast_feeds", sa.Column("next_refresh_at", sa.TIMESTAMP(), nullable=True)
+    )
+    op.add_column(
+        "podcast_feeds",
+        sa.Column("refresh_interval_seconds", sa.Integer(), nullable=True),
+    )
+    op.add_column(
+        "podcast_feeds",
+        sa.Column("refresh_failures", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.add_column(
+        "podcast_feeds", sa.Column("last_refresh_error", sa.Text(), nullable=True)
+    )
+    op.create_index(
+        "idx_podcast_feed_next_refresh",
+        "podcast_feeds",
+        ["next_refresh_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_podcast_feed_next_refresh", table_name="podcast_feeds")
+    op.drop_column("podcast_feeds", "last_refresh_error")
+    op.drop_column("podcast_feeds", "refresh_failures")
+    op.drop_column("podcast_feeds", "refresh_interval_seconds")
+    op.drop_column("podcast_feeds", "next_refresh_at")
@@ -0,0 +1,34 @@
+"""Remove API keys from the payloads of finished transcription jobs
+
+Revision ID: 5c7e1b9d2f40
+Revises: 8b4d2e6f1a93
+Create Date: 2026-10-16 23:12:41.208513
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5c7e1b9d2f40"
+down_revision: Union[str, Sequence[str], None] = "8b4d2e6f1a93"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("""
+        UPDATE transcription_jobs
+        SET payload = (payload::jsonb - 'api_key')::json
+        WHERE status NOT IN ('queued', 'running')
+          AND payload::jsonb ? 'api_key'
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # The removed keys are not recoverable
+    pass
@@ -0,0 +1,98 @@
+"""Add feed cache validators and unique episode guid per feed
+
+Revision ID: 7c1e4b9a2d3f
+Revises: b3d7e1d37e4e
+Create Date: 2026-10-16 10:12:41.203118
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7c1e4b9a2d3f"
+down_revision: Union[str, Sequence[str], None] = "b3d7e1d37e4e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _merge_duplicate_episodes() -> None:
+    """Merge duplicate (feed_id, guid) episodes into the oldest row.
+
+    Runs before the unique constraint used by the refresh upsert is added.
+    A user may have playback state on several copies of one episode; only
+    the most recently updated row survives the merge.
+    """
+    op.execute("""
+        CREATE TEMPORARY TABLE episode_dupes AS
+        SELECT e.id AS dupe_id, k.keep_id
+        FROM podcast_episodes e
+        JOIN (
+            SELECT feed_id, guid, MIN(id) AS keep_id
+            FROM podcast_episodes
+            GROUP BY feed_id, guid
+            HAVING COUNT(*) > 1
+        ) k ON k.feed_id = e.feed_id AND k.guid = e.guid AND e.id <> k.keep_id
+    """)
+    op.execute("""
+        UPDATE podcast_listening_sessions SET episode_id = (
+            SELECT d.keep_id FROM episode_dupes d
+            WHERE d.dupe_id = podcast_listening_sessions.episode_id
+        )
+        WHERE episode_id IN (SELECT dupe_id FROM episode_dupes)
+    """)
+    op.execute("""
+        DELETE FROM user_episode_states WHERE id IN (
+            SELECT id FROM (
+                SELECT s.id, ROW_NUMBER() OVER (
+                    PARTITION BY s.user_id, COALESCE(d.keep_id, s.episode_id)
+                    ORDER BY s.updated_at DESC, s.id DESC
+                ) AS rn
+                FROM user_episode_states s
+                LEFT JOIN episode_dupes d ON d.dupe_id = s.episode_id
+                WHERE s.episode_id IN (SELECT dupe_id FROM episode_dupes)
+                   OR s.episode_id IN (SELECT keep_id FROM episode_dupes)
+            ) ranked
+            WHERE ranked.rn > 1
+        )
+    """)
+    op.execute("""
+        UPDATE user_episode_states SET episode_id = (
+            SELECT d.keep_id FROM episode_dupes d
+            WHERE d.dupe_id = user_episode_states.episode_id
+        )
+        WHERE episode_id IN (SELECT dupe_id FROM episode_dupes)
+    """)
+    op.execute(
+        "DELETE FROM podcast_episodes WHERE id IN (SELECT dupe_id FROM episode_dupes)"
+    )
+    op.execute("DROP TABLE episode_dupes")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "podcast_feeds",
+        sa.Column("last_modified", sa.String(length=255), nullable=True),
+    )
+    op.add_column(
+        "podcast_feeds", sa.Column("content_hash", sa.String(length=64), nullable=True)
+    )
+
+    _merge_duplicate_episodes()
+
+    op.create_unique_constraint(
+        "uq_podcast_episode_feed_guid", "podcast_episodes", ["feed_id", "guid"]
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint(
+        "uq_podcast_episode_feed_guid", "podcast_episodes", type_="unique"
+    )
+    op.drop_column("podcast_feeds", "content_hash")
+    op.drop_column("podcast_feeds", "last_modified")
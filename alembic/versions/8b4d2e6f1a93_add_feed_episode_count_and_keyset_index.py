@@ -0,0 +1,46 @@
+"""Add cached feed episode count and keyset index for episode lists
+
+Revision ID: 8b4d2e6f1a93
+Revises: 3f6a9c1d8e27
+Create Date: 2026-10-16 21:48:12.905317
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8b4d2e6f1a93"
+down_revision: Union[str, Sequence[str], None] = "3f6a9c1d8e27"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "podcast_feeds",
+        sa.Column("episode_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.execute("""
+        UPDATE podcast_feeds f SET episode_count = c.n
+        FROM (
+            SELECT feed_id, COUNT(*) AS n FROM podcast_episodes GROUP BY feed_id
+        ) c
+        WHERE c.feed_id = f.id
+    """)
+    op.create_index(
+        "idx_podcast_episode_feed_pub_id",
+        "podcast_episodes",
+        ["feed_id", "published_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_podcast_episode_feed_pub_id", table_name="podcast_episodes")
+    op.drop_column("podcast_feeds", "episode_count")
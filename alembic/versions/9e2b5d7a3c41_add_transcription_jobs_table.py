@@ -0,0 +1,69 @@
+"""Add transcription_jobs table
+
+Revision ID: 9e2b5d7a3c41
+Revises: 4a8f2c6e1b9d
+Create Date: 2026-10-16 16:41:09.734512
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9e2b5d7a3c41"
+down_revision: Union[str, Sequence[str], None] = "4a8f2c6e1b9d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "transcription_jobs",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("kind", sa.String(length=32), nullable=False),
+        sa.Column("target_key", sa.Text(), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("user_id", sa.Text(), nullable=True),
+        sa.Column("priority", sa.Integer(), nullable=False),
+        sa.Column("status", sa.String(length=16), nullable=False),
+        sa.Column("progress", sa.Float(), nullable=False),
+        sa.Column("progress_message", sa.Text(), nullable=True),
+        sa.Column("cancel_requested", sa.Boolean(), nullable=False),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("max_attempts", sa.Integer(), nullable=False),
+        sa.Column("lease_owner", sa.String(length=64), nullable=True),
+        sa.Column("lease_expires_at", sa.TIMESTAMP(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("started_at", sa.TIMESTAMP(), nullable=True),
+        sa.Column("finished_at", sa.TIMESTAMP(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "idx_transcription_job_queue",
+        "transcription_jobs",
+        ["status", "priority", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "idx_transcription_job_target",
+        "transcription_jobs",
+        ["target_key"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_transcription_job_target", table_name="transcription_jobs")
+    op.drop_index("idx_transcription_job_queue", table_name="transcription_jobs")
+    op.drop_table("transcription_jobs")
@@ -3,11 +3,11 @@ Audiobook API Router.
 Endpoints for browsing and streaming audiobooks with subtitle sync.
 """
 
-from fastapi import APIRouter, HTTPException, Query, BackgroundTasks, Depends
+from fastapi import APIRouter, HTTPException, Query, Depends
 from fastapi.responses import FileResponse
 from fastapi.concurrency import run_in_threadpool
 from typing import List, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 import logging
 from pathlib import Path
 
@@ -15,7 +15,11 @@ from app.api.routers.auth import get_current_user_id
 from app.services.content_service import content_service
 from app.services.content_providers.audiobook_provider import AudiobookProvider
 from app.models.content_schemas import SourceType
-from app.services.transcription import AudioInput, get_default_engine
+from app.services.transcription_jobs import (
+    JobCancelled,
+    JobContext,
+    transcription_queue,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +30,9 @@ class TranscribeRequest(BaseModel):
     force: bool = False
     remote_url: Optional[str] = None
     api_key: Optional[str] = None
+    # Higher runs first in the shared transcription queue; bounded so no
+    # caller can push ahead of every other user's jobs
+    priority: int = Field(0, ge=-10, le=10)
 
 
 def get_audiobook_provider() -> AudiobookProvider:
@@ -141,31 +148,21 @@ def _segments_to_srt(segments: list) -> str:
     return "\n".join(srt_parts)
 
 
-async def _run_audiobook_transcription(
-    book_id: str,
-    track_index: int,
-    audio_path: Path,
-    subtitle_path: Path,
-    remote_url: Optional[str] = None,
-    api_key: Optional[str] = None,
-):
-    """Background task to run transcription for an audiobook track."""
+async def _run_audiobook_transcription(job: JobContext):
+    """Queue handler for "audiobook_track" jobs: transcribe and write an SRT."""
+    book_id = job.payload["book_id"]
+    track_index = job.payload["track"]
+    audio_path = Path(job.payload["audio_path"])
+    subtitle_path = Path(job.payload["subtitle_path"])
     logger.info(f"Starting audiobook transcription for {book_id} track {track_index}")
 
     try:
-        # Run transcription in thread pool (CPU/GPU bound)
-        def do_transcription():
-            # Get engine (Local or Remote)
-            engine = get_default_engine(remote_url=remote_url, api_key=api_key)
-
-            # Load audio
-            audio_input = AudioInput.from_file(audio_path)
-
-            # Transcribe
-            result = engine.transcribe(audio_input)
-            return result
-
-        result = await run_in_threadpool(do_transcription)
+        # Run transcription in thread pool (CPU/GPU bound), reporting per-chunk progress
+        result = await job.transcribe(
+            audio_path,
+            remote_url=job.payload.get("remote_url"),
+            api_key=job.payload.get("api_key"),
+        )
 
         logger.info(f"Transcription complete: {len(result.segments)} segments")
 
@@ -180,18 +177,25 @@ async def _run_audiobook_transcription(
 
         logger.info(f"Saved subtitles to {subtitle_path}")
 
+    except JobCancelled:
+        logger.info(f"Audiobook transcription cancelled for {book_id}")
+        raise
+
     except Exception as e:
         import traceback
 
         logger.error(
             f"Audiobook transcription failed for {book_id}: {e}\n{traceback.format_exc()}"
         )
+        raise
+
+
+transcription_queue.register_handler("audiobook_track", _run_audiobook_transcription)
 
 
 @router.post("/{book_id}/transcribe")
 async def transcribe_audiobook(
     book_id: str,
-    background_tasks: BackgroundTasks,
     track: int = Query(0, ge=0),
     req: Optional[TranscribeRequest] = None,
     user_id: str = Depends(get_current_user_id),
@@ -222,24 +226,27 @@ async def transcribe_audiobook(
             detail="Subtitle file already exists. Use force=true to overwrite.",
         )
 
-    # Parse options
-    remote_url = req.remote_url if req else None
-    api_key = req.api_key if req else None
-
-    # Start background task
-    background_tasks.add_task(
-        _run_audiobook_transcription,
-        book_id,
-        track,
-        audio_path,
-        subtitle_path,
-        remote_url,
-        api_key,
+    # Queue the job (one active job per track; force replaces it)
+    job = await transcription_queue.enqueue(
+        "audiobook_track",
+        f"audiobook:{book_id}:{track}",
+        {
+            "book_id": book_id,
+            "track": track,
+            "audio_path": str(audio_path),
+            "subtitle_path": str(subtitle_path),
+            "remote_url": req.remote_url if req else None,
+            "api_key": req.api_key if req else None,
+        },
+        user_id=user_id,
+        priority=req.priority if req else 0,
+        replace=should_force,
     )
 
     return {
         "status": "pending",
-        "message": "Transcription started in background",
+        "message": "Transcription queued",
+        "job_id": job.id,
         "audio_file": audio_path.name,
         "target_subtitle": subtitle_path.name,
     }
@@ -1,9 +1,10 @@
-from fastapi import APIRouter, HTTPException, Response, Depends
-from typing import Optional, Dict, Any
-from bs4 import BeautifulSoup
+from fastapi import APIRouter, HTTPException, Request, Response, Depends, Query
+from fastapi.responses import StreamingResponse
+from typing import Optional, Dict, Any, Tuple
 from sqlalchemy import select, func
 
 from app.api.routers.auth import get_current_user_id
+from app.core.utils import etag_matches
 from app.services.content_service import content_service
 from app.models.content_schemas import SourceType
 from app.models.orm import ReadingSession, SentenceLearningRecord, ReviewItem
@@ -21,28 +22,13 @@ router = APIRouter()
 def _get_block_sentence_count(article: Dict[str, Any], provider) -> int:
     """
     Get sentence count from structured blocks (paragraphs only).
-    Uses cached value from EPUB loading for performance.
-    Falls back to computation if cache is missing (for backwards compatibility).
+    Uses the value computed once when the EPUB was parsed.
     """
-    # Use cached value if available (set during EPUB loading)
     if "block_sentence_count" in article:
         return article["block_sentence_count"]
 
-    # Fallback: compute from raw_html
-    raw_html = article.get("raw_html", "")
-    if not raw_html:
-        # Final fallback to lenient splitting if no HTML available
-        return len(provider._split_sentences_lenient(article.get("full_text", "")))
-
-    soup = BeautifulSoup(raw_html, "lxml-xml")
-    blocks = provider._extract_structured_blocks(soup)
-
-    sentence_count = 0
-    for block in blocks:
-        if block.type.value == "paragraph" and block.sentences:
-            sentence_count += len(block.sentences)
-
-    return sentence_count
+    # Fallback to lenient splitting if the article has no block count
+    return len(provider._split_sentences_lenient(article.get("full_text", "")))
 
 
 @router.get("/api/reading/epub/books")
@@ -559,11 +545,48 @@ async def get_article_content(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _parse_byte_range(range_header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single "bytes=start-end" range into inclusive offsets.
+
+    Returns None for headers we don't handle (multiple ranges, other units),
+    in which case the full body is sent; raises HTTP 416 if unsatisfiable.
+    """
+    unit, _, spec = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+
+    first, _, last = spec.strip().partition("-")
+    try:
+        if first:
+            start = int(first)
+            end = min(int(last), size - 1) if last else size - 1
+        elif last:
+            # Suffix range: last N bytes
+            start = max(size - int(last), 0)
+            end = size - 1
+        else:
+            return None
+    except ValueError:
+        return None
+
+    if start > end or start >= size:
+        raise HTTPException(
+            status_code=416,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+    return start, end
+
+
 @router.get("/api/reading/epub/image")
-def get_epub_image(filename: str, image_path: str):
+def get_epub_image(filename: str, image_path: str, request: Request):
     """
     Serve an image from an EPUB file.
 
+    Bytes are streamed from the EPUB zip on demand, with ETag /
+    If-None-Match and single Range support.
+
     Args:
         filename: EPUB filename (e.g., 'TheEconomist.2025.12.27.epub')
         image_path: Path to image within the EPUB
@@ -575,19 +598,40 @@ def get_epub_image(filename: str, image_path: str):
 
         provider = EpubProvider()
 
-        result = provider.get_image(filename, image_path)
-        if result is None:
+        image = provider.get_image_member(filename, image_path)
+        if image is None:
             raise HTTPException(
                 status_code=404, detail=f"Image not found: {image_path}"
             )
 
-        image_data, content_type = result
-        return Response(
-            content=image_data,
-            media_type=content_type,
-            headers={
-                "Cache-Control": "public, max-age=86400"  # Cache for 24 hours
-            },
+        headers = {
+            "Cache-Control": "public, max-age=86400",  # Cache for 24 hours
+            "ETag": image.etag,
+            "Accept-Ranges": "bytes",
+        }
+
+        if etag_matches(request.headers.get("if-none-match"), image.etag):
+            return Response(status_code=304, headers=headers)
+
+        byte_range = None
+        range_header = request.headers.get("range")
+        if range_header and request.headers.get("if-range", image.etag) == image.etag:
+            byte_range = _parse_byte_range(range_header, image.size)
+
+        if byte_range is None:
+            headers["Content-Length"] = str(image.size)
+            return StreamingResponse(
+                image.iter_bytes(), media_type=image.media_type, headers=headers
+            )
+
+        start, end = byte_range
+        headers["Content-Length"] = str(end - start + 1)
+        headers["Content-Range"] = f"bytes {start}-{end}/{image.size}"
+        return StreamingResponse(
+            image.iter_bytes(start, end),
+            status_code=206,
+            media_type=image.media_type,
+            headers=headers,
         )
     except HTTPException:
         raise
@@ -793,6 +837,8 @@ async def get_player_content(
     source_type: str,
     content_id: str,
     track: int = 0,
+    from_time: Optional[float] = Query(None, alias="from", ge=0),
+    to_time: Optional[float] = Query(None, alias="to", ge=0),
     user_id: str = Depends(get_current_user_id),
 ):
     """
@@ -805,6 +851,8 @@ async def get_player_content(
         source_type: "podcast" or "audiobook"
         content_id: Episode ID (podcast) or book ID (audiobook)
         track: Track index for audiobooks (default 0)
+        from_time, to_time: Podcast only: just the segments overlapping this
+            window (``?from=600&to=900``)
 
     Returns:
         ContentBundle with audio_url and time-aligned segments
@@ -812,7 +860,9 @@ async def get_player_content(
     from app.models.content_schemas import ContentBundle, ContentBlock, BlockType
 
     if source_type == "podcast":
-        return await _get_podcast_player_content(int(content_id), user_id)
+        return await _get_podcast_player_content(
+            int(content_id), user_id, from_time=from_time, to_time=to_time
+        )
     elif source_type == "audiobook":
         return await _get_audiobook_player_content(content_id, track)
     else:
@@ -822,10 +872,16 @@ async def get_player_content(
         )
 
 
-async def _get_podcast_player_content(episode_id: int, user_id: str):
+async def _get_podcast_player_content(
+    episode_id: int,
+    user_id: str,
+    from_time: Optional[float] = None,
+    to_time: Optional[float] = None,
+):
     """Get podcast episode content for unified player."""
     from app.core.db import AsyncSessionLocal
     from app.models.podcast_orm import PodcastEpisode, PodcastFeed, UserEpisodeState
+    from app.services import podcast_transcripts
     from app.models.content_schemas import (
         ContentBundle,
         ContentBlock,
@@ -848,8 +904,14 @@ async def _get_podcast_player_content(episode_id: int, user_id: str):
 
         episode, feed = row
 
-        # Check if transcription is available
-        if episode.transcript_status != "completed" or not episode.transcript_segments:
+        # Check if transcription is available (an empty window is fine)
+        segments = []
+        if episode.transcript_status == "completed":
+            segments = await podcast_transcripts.load_segments(
+                db, episode_id, from_time=from_time, to_time=to_time
+            )
+        windowed = from_time is not None or to_time is not None
+        if episode.transcript_status != "completed" or not (segments or windowed):
             raise HTTPException(
                 status_code=400,
                 detail="Transcription not available. Please generate transcription first.",
@@ -863,20 +925,20 @@ async def _get_podcast_player_content(episode_id: int, user_id: str):
         state_result = await db.execute(state_stmt)
         user_state = state_result.scalar_one_or_none()
 
-        # Convert transcript_segments to ContentBlocks
+        # Convert transcript segments to ContentBlocks
         blocks = []
-        for seg in episode.transcript_segments:
+        for seg in segments:
             block = ContentBlock(
                 type=BlockType.AUDIO_SEGMENT,
-                text=seg.get("text", ""),
-                sentences=[seg.get("text", "")],
-                start_time=seg.get("start_time", 0.0),
-                end_time=seg.get("end_time", 0.0),
+                text=seg.text,
+                sentences=[seg.text],
+                start_time=seg.start_time,
+                end_time=seg.end_time,
             )
             blocks.append(block)
 
-        # Build full text
-        full_text = " ".join(seg.get("text", "") for seg in episode.transcript_segments)
+        # Build full text (of the requested window, if any)
+        full_text = " ".join(seg.text for seg in segments)
 
         return ContentBundle(
             id=f"podcast:{episode_id}",
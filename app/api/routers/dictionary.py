@@ -1,17 +1,27 @@
-from fastapi import APIRouter, Response, HTTPException, Query
+from fastapi import APIRouter, Request, Response, HTTPException, Query
 from fastapi.concurrency import run_in_threadpool
-from pydantic import BaseModel
+from fastapi.responses import FileResponse, StreamingResponse
+from pydantic import BaseModel, Field
+import asyncio
 import os
+import json
 from pathlib import Path
 import mimetypes
-from app.services.dictionary import dict_manager
+from app.services.dictionary import dict_manager, dictionary_matches_source
+from app.services.dictionary_assets import (
+    IMMUTABLE_CACHE_CONTROL,
+    CachedAsset,
+    dict_asset_cache,
+)
 from app.services.llm import llm_service
 from app.services.collins_parser import collins_parser
 from app.models.collins_schemas import CollinsWord
 from app.services.ldoce_parser import ldoce_parser
 from app.models.ldoce_schemas import LDOCEWord
-from typing import Literal, Union
+from typing import List, Literal, Optional, Union
 from app.config import settings
+from app.core.cache import LRUCache
+from app.core.utils import etag_matches
 import logging
 
 logger = logging.getLogger(__name__)
@@ -28,8 +38,26 @@ class DictionaryContextRequest(BaseModel):
     sentence: str
 
 
+MAX_BATCH_WORDS = 1000
+# Batch misses parsed at once (each parse runs in the threadpool)
+BATCH_PARSE_CONCURRENCY = 4
+
+
+class DictionaryBatchRequest(BaseModel):
+    words: List[str] = Field(..., min_length=1, max_length=MAX_BATCH_WORDS)
+    source: Literal["collins", "ldoce"] = "ldoce"
+
+
+def _asset_response(request: Request, asset: CachedAsset) -> Response:
+    """Serve an extracted asset from disk with a strong ETag (Range handled by FileResponse)."""
+    headers = {"ETag": asset.etag, "Cache-Control": IMMUTABLE_CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), asset.etag):
+        return Response(status_code=304, headers=headers)
+    return FileResponse(asset.path, media_type=asset.media_type, headers=headers)
+
+
 @router.get("/dict-assets/{file_path:path}")
-async def get_dict_asset(file_path: str):
+async def get_dict_asset(file_path: str, request: Request):
     """
     Unified endpoint for dictionary assets (CSS, JS, Images).
     """
@@ -51,36 +79,50 @@ async def get_dict_asset(file_path: str):
     # 1. Check disk
     if requested_path.exists() and requested_path.is_file():
         media_type, _ = mimetypes.guess_type(requested_path)
-        with open(requested_path, "rb") as f:
-            content = f.read()
-        return Response(
-            content=content, media_type=media_type or "application/octet-stream"
+        return FileResponse(
+            requested_path, media_type=media_type or "application/octet-stream"
         )
 
-    # 2. Check MDD (Fallback)
+    # 2. Check MDD (Fallback): exact path first, then basename, in one lookup
     filename = os.path.basename(file_path)
+    fallbacks = (filename,) if filename != file_path else ()
 
-    # Try exact match first
-    content, media_type = await dict_manager.get_resource(file_path)
-    if content:
-        return Response(content=content, media_type=media_type)
-
-    # Try basename match
-    if filename != file_path:
-        content, media_type = await dict_manager.get_resource(filename)
-        if content:
-            return Response(content=content, media_type=media_type)
+    asset = await dict_asset_cache.get(file_path, *fallbacks)
+    if asset:
+        return _asset_response(request, asset)
 
     raise HTTPException(status_code=404, detail="Asset not found")
 
 
 @router.get("/dict/resource")
-async def get_resource_legacy(path: str):
-    content, media_type = await dict_manager.get_resource(path)
-    if not content:
+async def get_resource_legacy(path: str, request: Request):
+    asset = await dict_asset_cache.get(path)
+    if not asset:
         raise HTTPException(status_code=404, detail="Resource not found")
 
-    return Response(content=content, media_type=media_type)
+    return _asset_response(request, asset)
+
+
+@router.get("/api/dictionary/cache-stats")
+async def get_dictionary_cache_stats():
+    """Hit/miss/eviction counters for the in-process dictionary caches."""
+    from app.services.collins_parser import CollinsParser
+    from app.services.ldoce_parser import LDOCEParser
+
+    return {
+        "caches": [
+            dict_manager._lookup_cache.stats(),
+            CollinsParser._parse_cache.stats(),
+            LDOCEParser._parse_cache.stats(),
+            _ldoce_cache.stats(),
+        ]
+    }
+
+
+@router.get("/api/dictionary/pool-stats")
+async def get_dictionary_pool_stats():
+    """Connection pool metrics (checkouts, queue wait times) per dictionary DB."""
+    return {"pools": dict_manager.pool_stats()}
 
 
 @router.post("/api/dictionary/lookup")
@@ -153,6 +195,24 @@ async def api_dict_context(payload: DictionaryContextRequest):
         return {"explanation": "An error occurred while generating explanation."}
 
 
+async def _prebuilt_word_response(source: str, word: str) -> Optional[Response]:
+    """
+    Serve a pre-parsed entry (scripts/build_parsed_dictionary.py) without parsing.
+
+    Stored blobs omit the "word" field so the requested word can be spliced in,
+    keeping the payload identical to a live CollinsWord/LDOCEWord response.
+    """
+    data = await dict_manager.get_parsed(source, word)
+    if not data:
+        return None
+    return Response(content=_with_word(word, data), media_type="application/json")
+
+
+def _with_word(word: str, data: bytes) -> bytes:
+    """Splice the requested word into a pre-parsed JSON blob stored without it."""
+    return b'{"word":' + json.dumps(word).encode() + b"," + data[1:]
+
+
 @router.get("/api/dictionary/collins/{word}", response_model=CollinsWord)
 async def get_collins_word(
     word: str,
@@ -173,6 +233,11 @@ async def get_collins_word(
 
     Example: GET /api/dictionary/collins/simmer
     """
+    if not include_raw_html:
+        prebuilt = await _prebuilt_word_response("collins", word)
+        if prebuilt:
+            return prebuilt
+
     return await _get_collins_word_internal(word, include_raw_html, _recursion_depth=0)
 
 
@@ -205,7 +270,7 @@ async def _get_collins_word_internal(
         # Find Collins dictionary result
         collins_html = None
         for result in results:
-            if "collins" in result.get("dictionary", "").lower():
+            if dictionary_matches_source(result.get("dictionary", ""), "collins"):
                 collins_html = result.get("definition", "")
                 break
 
@@ -214,8 +279,9 @@ async def _get_collins_word_internal(
 
         # Parse the HTML
         t3 = time.time()
-        parsed = collins_parser.parse(
-            collins_html, word, include_raw_html=include_raw_html
+        # Large entries take seconds to parse; keep the event loop free
+        parsed = await run_in_threadpool(
+            collins_parser.parse, collins_html, word, include_raw_html=include_raw_html
         )
         t4 = time.time()
         logger.debug(f"Collins parser.parse('{word}'): {(t4 - t3) * 1000:.1f}ms")
@@ -230,8 +296,11 @@ async def _get_collins_word_internal(
             # Try to extract cross-reference target
             from bs4 import BeautifulSoup
 
-            soup = BeautifulSoup(collins_html, "lxml")
-            cross_ref = collins_parser._extract_cross_reference(soup)
+            cross_ref = await run_in_threadpool(
+                lambda: collins_parser._extract_cross_reference(
+                    BeautifulSoup(collins_html, "lxml")
+                )
+            )
 
             if cross_ref and cross_ref.lower() != word.lower():
                 logger.info(
@@ -268,8 +337,11 @@ async def _get_collins_word_internal(
 # Cache parsed LDOCEWord results to avoid expensive re-parsing.
 # High-frequency words like "on" take 10+ seconds to parse due to 2MB+ HTML.
 # Cache dramatically improves repeated lookups.
-_ldoce_cache: dict = {}
-_ldoce_cache_max_size = 500
+_ldoce_cache = LRUCache(
+    "ldoce_word",
+    max_bytes=settings.DICT_PARSE_CACHE_MB * 1024 * 1024,
+    ttl_seconds=settings.DICT_CACHE_TTL_SECONDS or None,
+)
 
 
 @router.get("/api/dictionary/ldoce/{word}", response_model=LDOCEWord)
@@ -288,10 +360,23 @@ async def get_ldoce_word(
 
     Example: GET /api/dictionary/ldoce/simmer
     """
+    if not include_raw_html:
+        prebuilt = await _prebuilt_word_response("ldoce", word)
+        if prebuilt:
+            return prebuilt
+
+    return await _get_ldoce_word_internal(word, include_raw_html)
+
+
+async def _get_ldoce_word_internal(
+    word: str, include_raw_html: bool = False
+) -> LDOCEWord:
+    """Live lookup + parse for LDOCE, memoized in _ldoce_cache."""
     # Check cache first
     cache_key = (word.lower(), include_raw_html)
-    if cache_key in _ldoce_cache:
-        return _ldoce_cache[cache_key]
+    cached = _ldoce_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
     try:
         # Lookup in dictionary (Async, Non-blocking)
@@ -300,26 +385,20 @@ async def get_ldoce_word(
         # Find LDOCE dictionary result
         ldoce_html = None
         for result in results:
-            dict_name = result.get("dictionary", "").upper()
-            if "LDOCE" in dict_name or "LONGMAN" in dict_name:
+            if dictionary_matches_source(result.get("dictionary", ""), "ldoce"):
                 ldoce_html = result.get("definition", "")
                 break
 
         if not ldoce_html:
             parsed = LDOCEWord(word=word, found=False)
         else:
-            # Parse the HTML
-            parsed = ldoce_parser.parse(
-                ldoce_html, word, include_raw_html=include_raw_html
+            # Parse the HTML (seconds for large entries; keep the loop free)
+            parsed = await run_in_threadpool(
+                ldoce_parser.parse, ldoce_html, word, include_raw_html=include_raw_html
             )
 
         # Cache the result
-        if len(_ldoce_cache) >= _ldoce_cache_max_size:
-            # Simple eviction: clear half
-            keys_to_remove = list(_ldoce_cache.keys())[: _ldoce_cache_max_size // 2]
-            for k in keys_to_remove:
-                del _ldoce_cache[k]
-        _ldoce_cache[cache_key] = parsed
+        _ldoce_cache.set(cache_key, parsed)
 
         return parsed
 
@@ -328,6 +407,67 @@ async def get_ldoce_word(
         return LDOCEWord(word=word, found=False)
 
 
+@router.post("/api/dictionary/batch")
+async def api_dict_batch(payload: DictionaryBatchRequest):
+    """
+    Resolve many words at once, streamed as NDJSON (one CollinsWord/LDOCEWord per line).
+
+    Pre-parsed entries are fetched with a single IN (...) query per dictionary
+    database and emitted first; raw HTML for the remaining words is fetched
+    the same way, then parsed through the regular (cached) path in the
+    threadpool, a few at a time, and emitted as they finish. Intended for
+    pre-warming a chapter's vocabulary.
+
+    Example: POST /api/dictionary/batch {"words": ["simmer", "hoist"], "source": "ldoce"}
+    """
+    words = list(dict.fromkeys(w.strip() for w in payload.words if w.strip()))
+
+    async def generate():
+        try:
+            prebuilt = await dict_manager.get_parsed_many(payload.source, words)
+        except Exception:
+            logger.exception("Dict Batch Lookup Error")
+            prebuilt = {}
+
+        misses = []
+        for word in words:
+            data = prebuilt.get(word.lower())
+            if data:
+                yield _with_word(word, data) + b"\n"
+            else:
+                misses.append(word)
+
+        if misses:
+            # Warm dict_manager's lookup cache with one IN (...) query per DB
+            try:
+                await dict_manager.lookup_many(misses)
+            except Exception:
+                logger.exception("Dict Batch Lookup Error")
+
+        if payload.source == "collins":
+            get_word = _get_collins_word_internal
+        else:
+            get_word = _get_ldoce_word_internal
+        semaphore = asyncio.Semaphore(BATCH_PARSE_CONCURRENCY)
+
+        async def parse(word: str):
+            async with semaphore:
+                return await get_word(word)
+
+        # Emitted as they finish; each line carries its word
+        tasks = [asyncio.create_task(parse(word)) for word in misses]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                parsed = await next_done
+                yield parsed.model_dump_json().encode() + b"\n"
+        finally:
+            # Client went away: don't parse the rest
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
 @router.get("/api/dictionary/{source}/{word}")
 async def get_dictionary_word(
     source: Literal["collins", "ldoce"],
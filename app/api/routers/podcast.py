@@ -3,7 +3,7 @@ Podcast API Router.
 Endpoints for searching, subscribing, and managing podcasts.
 """
 
-from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Request
+from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Request, Query
 from fastapi.responses import Response
 
 # from pydantic import BaseModel (Moved to schemas)
@@ -14,7 +14,18 @@ import time
 from app.api.routers.auth import get_current_user_id
 from app.config import settings
 from app.core.db import AsyncSessionLocal
+from app.core.http import http_clients
+from app.services import podcast_transcripts
+from app.services.audio_cache import episode_audio_cache
+from app.services.image_cache import image_cache
+from app.services.transcription import TranscriptionSegment
+from app.services.transcription_jobs import (
+    JobCancelled,
+    JobContext,
+    transcription_queue,
+)
 
+from app.services.podcast_refresh import feed_refresh_scheduler
 from app.services.podcast_service import podcast_service
 
 import logging
@@ -51,16 +62,16 @@ from app.models.podcast_schemas import (
 # --- Proxy Helpers ---
 
 
-async def _proxy_image(url: str, filename: str = "image.jpg"):
+async def _proxy_image(
+    url: str, filename: str = "image.jpg", size: Optional[int] = None
+):
     """
-    Stream an image from a remote URL through the server.
-    Caches the image locally to improve performance.
+    Serve a remote image through the server from the local image cache,
+    downscaled when ``size`` is given (see image_cache.THUMBNAIL_SIZES).
     """
     import httpx
     import mimetypes
-    import hashlib
     from fastapi.responses import FileResponse
-    from fastapi.concurrency import run_in_threadpool
 
     if not url:
         raise HTTPException(status_code=404, detail="No image URL")
@@ -69,87 +80,33 @@ async def _proxy_image(url: str, filename: str = "image.jpg"):
     if not url.startswith("http"):
         raise HTTPException(status_code=400, detail="Invalid URL protocol")
 
-    # Cache Configuration
-    CACHE_DIR = settings.podcast_cache_dir
-
-    # Generate Cache Key (Hash)
-    url_hash = hashlib.md5(url.encode("utf-8")).hexdigest()
-
-    # Check cache (Search for any extension with this hash)
-    # This is more robust than checking a hardcoded list of extensions
     try:
-        # Use iterator with next() for performance (stops at first match)
-        candidate = next(CACHE_DIR.glob(f"{url_hash}.*"), None)
-        if candidate and candidate.exists():
-            # logger.debug(f"Cache HIT for {url} -> {candidate}")
-            return FileResponse(
-                path=candidate,
-                filename=filename,
-                headers={"Cache-Control": "public, max-age=604800, immutable"},
-            )
-    except Exception as e:
-        logger.warning(f"Cache lookup failed for {url}: {e}")
-
-    logger.info(f"Cache MISS for {url} - Fetching from upstream")
-
-    # Cache Miss - Fetch from Upstream
-    proxies = settings.PROXY_URL if settings.PROXY_URL else None
-
-    headers = {"User-Agent": BROWSER_USER_AGENT}
-
-    try:
-        async with httpx.AsyncClient(
-            timeout=10.0,
-            follow_redirects=True,
-            proxy=proxies,
-            verify=False,
-            headers=headers,
-        ) as client:
-            r = await client.get(url)
-
-            if r.status_code != 200:
-                logger.warning(f"Proxy upstream returned {r.status_code} for {url}")
-                raise HTTPException(status_code=404, detail="Image not found upstream")
-
-            # Determine extension
-            content_type = r.headers.get("content-type", "image/jpeg")
-            ext = mimetypes.guess_extension(content_type) or ".jpg"
-            if ext == ".jpe":
-                ext = ".jpg"
-
-            save_path = CACHE_DIR / f"{url_hash}{ext}"
-            content = r.content
-
-            # Write to disk (in threadpool to avoid blocking event loop)
-            def write_file():
-                try:
-                    with open(save_path, "wb") as f:
-                        f.write(content)
-                    logger.info(f"Saved to cache: {save_path}")
-                except Exception as e:
-                    logger.error(f"Failed to write cache file {save_path}: {e}")
-
-            await run_in_threadpool(write_file)
-
-            return FileResponse(
-                path=save_path,
-                media_type=content_type,
-                filename=filename,
-                headers={"Cache-Control": "public, max-age=604800, immutable"},
-            )
-
-    except HTTPException:
-        raise
+        path = await image_cache.fetch(
+            url, size=size, headers={"User-Agent": BROWSER_USER_AGENT}
+        )
+    except httpx.HTTPStatusError as e:
+        logger.warning(f"Proxy upstream returned {e.response.status_code} for {url}")
+        raise HTTPException(status_code=404, detail="Image not found upstream")
     except httpx.RequestError as e:
         logger.warning(f"Proxy fetch failed for {url}: {e}")
         raise HTTPException(
             status_code=502, detail=f"Failed to fetch upstream image: {str(e)}"
         )
+    except ValueError as e:
+        logger.warning(f"Proxy refused {url}: {e}")
+        raise HTTPException(status_code=502, detail=str(e))
     except Exception as e:
         logger.error(f"Proxy unexpected error for {url}: {e}")
         # Return generic error
         raise HTTPException(status_code=500, detail="Internal proxy error")
 
+    return FileResponse(
+        path=path,
+        media_type=mimetypes.guess_type(path.name)[0] or "image/jpeg",
+        filename=filename,
+        headers={"Cache-Control": "public, max-age=604800, immutable"},
+    )
+
 
 # --- Signing Helper ---
 
@@ -202,25 +159,33 @@ def verify_signed_url(signed_token: str) -> Optional[str]:
         return None
 
 
+def _itunes_result(result: dict) -> ItunesSearchResult:
+    """An iTunes result whose artwork the client loads through /proxy/image."""
+    return ItunesSearchResult(
+        **result, artwork_token=sign_url(result.get("artwork_url")) or None
+    )
+
+
 # --- Endpoints ---
 
 
 @router.get("/proxy/image")
-async def proxy_external_image(token: str):
+async def proxy_external_image(token: str, size: Optional[int] = Query(None, ge=1)):
     """
     Proxy an arbitrary external image URL using a signed token.
     This allows frontend to load images from third-party domains (iTunes, etc)
     without CORS/Mixed Content issues, while preventing open relay abuse.
+    Pass ``size`` (CSS px x density) to get a thumbnail instead of the original.
     """
     url = verify_signed_url(token)
     if not url:
         raise HTTPException(status_code=400, detail="Invalid or expired token")
 
-    return await _proxy_image(url, filename="artwork.jpg")
+    return await _proxy_image(url, filename="artwork.jpg", size=size)
 
 
 @router.get("/feed/{feed_id}/image")
-async def get_feed_image(feed_id: int):
+async def get_feed_image(feed_id: int, size: Optional[int] = Query(None, ge=1)):
     """Proxy feed image."""
     # Note: Public endpoint (no auth) to allow easy use in <img> tags
     async with AsyncSessionLocal() as db:
@@ -235,11 +200,11 @@ async def get_feed_image(feed_id: int):
             # Return 404 so browser can show alt text or default
             raise HTTPException(status_code=404, detail="Feed has no image")
 
-        return await _proxy_image(image_url, f"feed_{feed_id}.jpg")
+        return await _proxy_image(image_url, f"feed_{feed_id}.jpg", size=size)
 
 
 @router.get("/episode/{episode_id}/image")
-async def get_episode_image(episode_id: int):
+async def get_episode_image(episode_id: int, size: Optional[int] = Query(None, ge=1)):
     """Proxy episode image."""
     # Note: Public endpoint (no auth)
     async with AsyncSessionLocal() as db:
@@ -253,7 +218,7 @@ async def get_episode_image(episode_id: int):
         if not image_url:
             raise HTTPException(status_code=404, detail="Episode has no image")
 
-        return await _proxy_image(image_url, f"episode_{episode_id}.jpg")
+        return await _proxy_image(image_url, f"episode_{episode_id}.jpg", size=size)
 
 
 @router.get("/search")
@@ -272,8 +237,7 @@ async def search_podcasts(
             db, q, user_id, limit=limit, country=country
         )
 
-        # Return results directly (frontend handles images)
-        return [ItunesSearchResult(**r) for r in results]
+        return [_itunes_result(r) for r in results]
 
 
 @router.get("/categories")
@@ -385,8 +349,7 @@ async def get_trending_podcasts(
             db, user_id, category, limit=limit
         )
 
-        # Return results directly (frontend handles images)
-        return [ItunesSearchResult(**r) for r in results]
+        return [_itunes_result(r) for r in results]
 
 
 @router.post("/subscribe")
@@ -472,15 +435,24 @@ async def get_episodes_batch(
 @router.get("/feed/{feed_id}")
 async def get_feed_detail(
     feed_id: int,
-    limit: int = 50,
-    offset: int = 0,
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = None,
     user_id: str = Depends(get_current_user_id),
 ) -> FeedDetailResponse:
-    """Get feed details with episodes (includes user state for resume)."""
+    """
+    Get feed details with episodes (includes user state for resume).
+
+    Page with ``cursor`` (the previous page's ``next_cursor``); ``offset``
+    is kept for older clients.
+    """
     async with AsyncSessionLocal() as db:
-        data = await podcast_service.get_feed_with_episodes(
-            db, user_id, feed_id, limit=limit, offset=offset
-        )
+        try:
+            data = await podcast_service.get_feed_with_episodes(
+                db, user_id, feed_id, limit=limit, offset=offset, cursor=cursor
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         if not data:
             raise HTTPException(status_code=404, detail="Feed not found")
 
@@ -520,6 +492,7 @@ async def get_feed_detail(
             ],
             is_subscribed=is_subscribed,
             total_episodes=total_episodes,
+            next_cursor=data.get("next_cursor"),
         )
 
 
@@ -534,6 +507,12 @@ async def refresh_feed(
         return {"new_episodes": new_count}
 
 
+@router.get("/refresh/metrics")
+async def refresh_metrics(user_id: str = Depends(get_current_user_id)):
+    """Queue depth and latency of the background feed refresh scheduler."""
+    return feed_refresh_scheduler.metrics()
+
+
 @router.post("/episodes/check-size")
 async def check_episode_sizes(
     data: CheckSizeRequest,
@@ -940,7 +919,6 @@ async def download_episode_head(
     HEAD request to get Content-Length for progress tracking.
     Returns headers only, no body.
     """
-    import httpx
     from fastapi.responses import Response
     from sqlalchemy import select
     from app.models.podcast_orm import PodcastEpisode
@@ -957,15 +935,13 @@ async def download_episode_head(
 
     # Make a HEAD request to the upstream to get Content-Length
     try:
-        proxies = settings.PROXY_URL if settings.PROXY_URL else None
         headers = {"User-Agent": BROWSER_USER_AGENT}
 
-        async with httpx.AsyncClient(
-            timeout=10.0, follow_redirects=True, proxy=proxies, headers=headers
-        ) as client:
-            head_response = await client.head(audio_url)
-            content_length = head_response.headers.get("content-length", "0")
-            content_type = head_response.headers.get("content-type", "audio/mpeg")
+        head_response = await http_clients.get().head(
+            audio_url, headers=headers, timeout=10.0, follow_redirects=True
+        )
+        content_length = head_response.headers.get("content-length", "0")
+        content_type = head_response.headers.get("content-type", "audio/mpeg")
     except Exception:
         # If HEAD fails, return 0 (frontend will handle gracefully)
         content_length = "0"
@@ -994,7 +970,6 @@ async def download_episode(
     Streams the audio through the server for offline storage.
     Supports Range requests for resumable downloads.
     """
-    import httpx
     from fastapi.responses import StreamingResponse
     from sqlalchemy import select
     from app.models.podcast_orm import PodcastEpisode
@@ -1017,18 +992,19 @@ async def download_episode(
 
     # Stream the audio file
     # RE-IMPLEMENTATION with efficient header forwarding
-    proxies = settings.PROXY_URL if settings.PROXY_URL else None
-    client = httpx.AsyncClient(timeout=None, follow_redirects=True, proxy=proxies)
-    req = client.build_request("GET", audio_url, headers=headers_to_upstream)
-    r = await client.send(req, stream=True)
+    client = http_clients.get()
+    req = client.build_request(
+        "GET", audio_url, headers=headers_to_upstream, timeout=None
+    )
+    r = await client.send(req, stream=True, follow_redirects=True)
 
     async def iter_response():
         try:
             async for chunk in r.aiter_bytes(chunk_size=65536):
                 yield chunk
         finally:
+            # Returns the connection to the shared pool
             await r.aclose()
-            await client.aclose()
 
     # Forward relevant headers
     response_headers = {
@@ -1072,7 +1048,7 @@ async def transcribe_episode(
     """
     Trigger AI transcription for a podcast episode.
 
-    This endpoint starts a background transcription job.
+    This endpoint queues a transcription job (see /api/transcription/jobs).
     Supports local SenseVoice (default) or Remote Transcription (via config).
 
     Args:
@@ -1081,18 +1057,18 @@ async def transcribe_episode(
     """
     from sqlalchemy import select, update
     from app.models.podcast_orm import PodcastEpisode
-    from fastapi import BackgroundTasks
-    from fastapi.concurrency import run_in_threadpool
 
     # Merge options
     should_force = force
     remote_url = None
     api_key = None
+    priority = 0
 
     if req:
         should_force = req.force or force
         remote_url = req.remote_url
         api_key = req.api_key
+        priority = req.priority
 
     async with AsyncSessionLocal() as db:
         # Get episode
@@ -1124,116 +1100,315 @@ async def transcribe_episode(
         )
         await db.commit()
 
-        # Get audio URL for background task
+        # Get audio URL for the job
         audio_url = episode.audio_url
 
-    # Start background transcription task
-    import asyncio
-
-    asyncio.create_task(_run_transcription(episode_id, audio_url, remote_url, api_key))
+    # Queue the job (force replaces a queued/running one for this episode)
+    job = await transcription_queue.enqueue(
+        "podcast_episode",
+        f"episode:{episode_id}",
+        {
+            "episode_id": episode_id,
+            "audio_url": audio_url,
+            "remote_url": remote_url,
+            "api_key": api_key,
+        },
+        user_id=user_id,
+        priority=priority,
+        replace=should_force,
+    )
 
     return TranscribeResponse(
         status="pending",
-        message="Transcription started. Check episode status for progress.",
+        message="Transcription queued. Check episode status for progress.",
+        job_id=job.id,
     )
 
 
-async def _run_transcription(
+@router.get("/episode/{episode_id}/transcript")
+async def get_episode_transcript(
     episode_id: int,
-    audio_url: str,
-    remote_url: Optional[str] = None,
-    api_key: Optional[str] = None,
+    from_time: Optional[float] = Query(None, alias="from", ge=0),
+    to_time: Optional[float] = Query(None, alias="to", ge=0),
+    user_id: str = Depends(get_current_user_id),
 ):
     """
-    Background task to run transcription.
+    Get an episode's transcript segments, optionally only a time window.
 
-    Downloads audio, runs Engine (Local or Remote), and saves results to database.
+    ``?from=600&to=900`` returns the segments overlapping 10:00-15:00, so a
+    player can load subtitles around the playback position instead of the
+    whole transcript.
     """
+    from sqlalchemy import select
+    from app.models.podcast_orm import PodcastEpisode
 
-    import tempfile
-    import httpx
+    async with AsyncSessionLocal() as db:
+        status = await db.scalar(
+            select(PodcastEpisode.transcript_status).where(
+                PodcastEpisode.id == episode_id
+            )
+        )
+        if status is None:
+            raise HTTPException(status_code=404, detail="Episode not found")
+        segments = await podcast_transcripts.load_segments(
+            db, episode_id, from_time=from_time, to_time=to_time
+        )
 
-    from pathlib import Path
-    from sqlalchemy import update
-    from app.models.podcast_orm import PodcastEpisode
-    from fastapi.concurrency import run_in_threadpool
+    return {
+        "episode_id": episode_id,
+        "transcript_status": status,
+        "segments": [podcast_transcripts.segment_to_dict(s) for s in segments],
+    }
 
-    logger.info(f"Starting transcription for episode {episode_id}")
 
-    try:
-        # Update status to processing
+# How often the transcript stream checks for new segments, and sends keep-alives
+TRANSCRIPT_STREAM_POLL_SECONDS = 1.0
+TRANSCRIPT_STREAM_KEEPALIVE_SECONDS = 15.0
+
+
+@router.get("/episode/{episode_id}/transcript/stream")
+async def stream_episode_transcript(
+    episode_id: int,
+    request: Request,
+    after: int = 0,
+    user_id: str = Depends(get_current_user_id),
+):
+    """
+    Stream an episode's transcript over SSE while it is being transcribed.
+
+    Segments are saved as chunks finish, so the first minutes of a long
+    episode can be shown long before the whole file is done. Every segment
+    sent is final: later events only append.
+
+    Yields JSON events:
+    - {"type": "status", "status": "..."} - transcript_status changed
+    - {"type": "segments", "start": i, "segments": [...]} - segments from index i
+    - {"type": "reset"} - the transcript was restarted; drop received segments
+    - {"type": "complete", "status": "...", "total": N} - done, stream ends
+
+    Args:
+        after: Segments the client already has (EventSource reconnects send
+            the last event id instead)
+    """
+    from fastapi.responses import StreamingResponse
+    from sqlalchemy import func, select
+    from app.models.podcast_orm import PodcastEpisode, PodcastTranscriptSegment
+    import asyncio
+    import json
+
+    # Status and segment count only; segments are read once they are new
+    stmt = select(
+        PodcastEpisode.transcript_status,
+        select(func.count())
+        .where(PodcastTranscriptSegment.episode_id == episode_id)
+        .scalar_subquery(),
+    ).where(PodcastEpisode.id == episode_id)
+
+    async def load():
         async with AsyncSessionLocal() as db:
-            await db.execute(
-                update(PodcastEpisode)
-                .where(PodcastEpisode.id == episode_id)
-                .values(transcript_status="processing")
-            )
-            await db.commit()
+            return (await db.execute(stmt)).one_or_none()
 
-        # Download audio to temp file
-        temp_dir = Path(tempfile.mkdtemp(prefix="podcast_transcribe_"))
+    row = await load()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Episode not found")
 
-        # Preserve original extension from URL
-        from urllib.parse import urlparse
+    last_event_id = request.headers.get("last-event-id", "")
+    sent = int(last_event_id) if last_event_id.isdigit() else max(after, 0)
 
-        parsed_url = urlparse(audio_url)
-        original_ext = Path(parsed_url.path).suffix or ".mp3"
-        audio_path = temp_dir / f"audio{original_ext}"
+    async def event_generator():
+        nonlocal row, sent
+        status = None
+        idle = 0.0
+        while row is not None:
+            new_status, count = row
+            if count < sent:
+                # A forced restart replaced the transcript being streamed
+                sent = 0
+                yield f"data: {json.dumps({'type': 'reset'})}\n\n"
+            if new_status != status:
+                status = new_status
+                yield f"data: {json.dumps({'type': 'status', 'status': status})}\n\n"
+            if count > sent:
+                async with AsyncSessionLocal() as db:
+                    segments = await podcast_transcripts.load_segments(
+                        db, episode_id, after=sent
+                    )
+                event = {
+                    "type": "segments",
+                    "start": sent,
+                    "segments": [
+                        podcast_transcripts.segment_to_dict(s) for s in segments
+                    ],
+                }
+                sent += len(segments)
+                idle = 0.0
+                yield f"id: {sent}\ndata: {json.dumps(event)}\n\n"
+            if status not in ("pending", "processing"):
+                break
+
+            await asyncio.sleep(TRANSCRIPT_STREAM_POLL_SECONDS)
+            idle += TRANSCRIPT_STREAM_POLL_SECONDS
+            if idle >= TRANSCRIPT_STREAM_KEEPALIVE_SECONDS:
+                idle = 0.0
+                yield ": keep-alive\n\n"
+            row = await load()
+
+        complete = {"type": "complete", "status": status, "total": sent}
+        yield f"data: {json.dumps(complete)}\n\n"
 
-        logger.info(f"Downloading audio from {audio_url}")
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",  # Disable nginx buffering
+        },
+    )
 
-        proxies = settings.PROXY_URL if settings.PROXY_URL else None
-        async with httpx.AsyncClient(
-            timeout=300.0,  # 5 minutes for large files
-            follow_redirects=True,
-            proxy=proxies,
-            headers={"User-Agent": BROWSER_USER_AGENT},
-        ) as client:
-            response = await client.get(audio_url)
-            response.raise_for_status()
 
-            with open(audio_path, "wb") as f:
-                f.write(response.content)
+async def _set_transcript_status(
+    episode_id: int,
+    status: str,
+    segments: Optional[List[TranscriptionSegment]] = None,
+    segments_from: int = 0,
+    **values,
+):
+    """Set the status (and other columns), saving ``segments`` from position
+    ``segments_from`` on in the same transaction."""
+    from sqlalchemy import update
+    from app.models.podcast_orm import PodcastEpisode
 
-        logger.info(f"Audio downloaded to {audio_path}")
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            update(PodcastEpisode)
+            .where(PodcastEpisode.id == episode_id)
+            .values(transcript_status=status, **values)
+        )
+        if segments is not None:
+            await podcast_transcripts.save_segments(
+                db,
+                episode_id,
+                [seg.to_dict() for seg in segments],
+                start=segments_from,
+            )
+        await db.commit()
 
-        # Run transcription in thread pool (CPU-bound)
-        # Note: utils._load_audio_flexible handles format conversion internally
-        def do_transcription():
-            from app.services.transcription import AudioInput, get_default_engine
 
-            engine = get_default_engine(remote_url=remote_url, api_key=api_key)
-            audio_input = AudioInput.from_file(audio_path)
-            result = engine.transcribe(audio_input)
-            return result
+async def _reset_transcript_status(episode_id: int, discard: bool = False):
+    """
+    Undo pending/processing after a cancel (keeps an earlier transcript).
 
-        result = await run_in_threadpool(do_transcription)
+    With ``discard``, the run already overwrote the segments with a partial
+    transcript, so there is no earlier transcript left to keep.
+    """
+    from sqlalchemy import case, update
+    from app.models.podcast_orm import PodcastEpisode
 
-        logger.info(f"Transcription complete: {len(result.segments)} segments")
+    if discard:
+        values = dict(transcript_status="none", transcript_text=None)
+    else:
+        values = dict(
+            transcript_status=case(
+                (PodcastEpisode.transcript_text.is_not(None), "completed"),
+                else_="none",
+            )
+        )
 
-        # Save results to database
-        segments_data = [seg.to_dict() for seg in result.segments]
+    async with AsyncSessionLocal() as db:
+        reset = await db.execute(
+            update(PodcastEpisode)
+            .where(
+                PodcastEpisode.id == episode_id,
+                PodcastEpisode.transcript_status.in_(("pending", "processing")),
+            )
+            .values(**values)
+        )
+        if discard and reset.rowcount:
+            await podcast_transcripts.save_segments(db, episode_id, [])
+        await db.commit()
 
-        async with AsyncSessionLocal() as db:
-            await db.execute(
-                update(PodcastEpisode)
-                .where(PodcastEpisode.id == episode_id)
-                .values(
-                    transcript_status="completed",
-                    transcript_text=result.full_text,
-                    transcript_segments=segments_data,
+
+async def _has_transcript(episode_id: int) -> bool:
+    from sqlalchemy import select
+    from app.models.podcast_orm import PodcastEpisode
+
+    async with AsyncSessionLocal() as db:
+        return bool(
+            await db.scalar(
+                select(PodcastEpisode.transcript_text.is_not(None)).where(
+                    PodcastEpisode.id == episode_id
                 )
             )
-            await db.commit()
+        )
+
+
+async def _run_transcription(job: JobContext):
+    """
+    Queue handler for "podcast_episode" jobs.
+
+    Downloads audio, runs Engine (Local or Remote), and saves results to database.
+    Raising marks the job failed (or cancelled, for JobCancelled).
+    """
+    episode_id = job.payload["episode_id"]
+    audio_url = job.payload["audio_url"]
+    saved = 0  # Segments already stored by partial saves
+    audio_path = None
+
+    async def save_partial(segments: List[TranscriptionSegment]):
+        # Listeners get subtitles for the first chunks while the rest runs
+        nonlocal saved
+        await _set_transcript_status(
+            episode_id, "processing", segments=segments[saved:], segments_from=saved
+        )
+        saved = len(segments)
+
+    logger.info(f"Starting transcription for episode {episode_id} (job {job.job_id})")
+
+    try:
+        # Update status to processing
+        await _set_transcript_status(episode_id, "processing")
+        # A forced re-run keeps the earlier transcript until it completes;
+        # partial saves would overwrite it with the new run's first chunks
+        stream_partials = not await _has_transcript(episode_id)
+
+        # Stream audio to the shared on-disk cache (reused across users/retries)
+        logger.info(f"Fetching audio from {audio_url}")
+        audio_path = await episode_audio_cache.fetch(
+            audio_url, headers={"User-Agent": BROWSER_USER_AGENT}
+        )
+        logger.info(f"Audio available at {audio_path}")
+
+        # Run transcription in thread pool (CPU-bound), reporting per-chunk progress
+        # Note: utils.iter_audio_windows decodes and resamples any format internally
+        result = await job.transcribe(
+            audio_path,
+            remote_url=job.payload.get("remote_url"),
+            api_key=job.payload.get("api_key"),
+            on_segments=save_partial if stream_partials else None,
+        )
+
+        logger.info(f"Transcription complete: {len(result.segments)} segments")
+
+        # Save results to database (partial saves are a prefix of the result)
+        await _set_transcript_status(
+            episode_id,
+            "completed",
+            segments=result.segments[saved:],
+            segments_from=saved,
+            transcript_text=result.full_text,
+        )
 
         logger.info(f"Transcription saved for episode {episode_id}")
 
-        # Cleanup temp files
-        try:
-            audio_path.unlink()
-            temp_dir.rmdir()
-        except Exception as e:
-            logger.warning(f"Failed to cleanup temp files: {e}")
+    except JobCancelled:
+        logger.info(f"Transcription cancelled for episode {episode_id}")
+        # A forced restart queues a replacement that owns the status now
+        if not await transcription_queue.has_other_active_job(
+            job.target_key, job.job_id
+        ):
+            await _reset_transcript_status(episode_id, discard=saved > 0)
+        raise
 
     except Exception as e:
         import traceback
@@ -1244,12 +1419,25 @@ async def _run_transcription(
 
         # Update status to failed
         try:
-            async with AsyncSessionLocal() as db:
-                await db.execute(
-                    update(PodcastEpisode)
-                    .where(PodcastEpisode.id == episode_id)
-                    .values(transcript_status="failed")
-                )
-                await db.commit()
+            await _set_transcript_status(episode_id, "failed")
         except Exception as db_error:
             logger.error(f"Failed to update status to failed: {db_error}")
+        raise
+
+    finally:
+        # Other jobs' downloads may evict the audio from now on
+        if audio_path is not None:
+            episode_audio_cache.release(audio_path)
+
+
+async def _on_transcription_abandoned(payload: dict, status: str):
+    """Job ended without running: cancelled while queued, or worker lost."""
+    if status == "cancelled":
+        await _reset_transcript_status(payload["episode_id"])
+    else:
+        await _set_transcript_status(payload["episode_id"], "failed")
+
+
+transcription_queue.register_handler(
+    "podcast_episode", _run_transcription, on_abandoned=_on_transcription_abandoned
+)
@@ -502,26 +502,18 @@ async def get_review_context(
 
     try:
         from app.services.content_service import content_service
-        from app.models.content_schemas import BlockType, SourceType
+        from app.models.content_schemas import SourceType
 
-        # 3. Fetch Content Bundle
+        # 3. Fetch the chapter's flat sentence list (in-memory after first load)
         if source_type == "epub":
             if len(parts) < 3:
                 return ReviewContextResponse(target_sentence=item.sentence_text)
             filename = parts[1]
             chapter_index = int(parts[2])
 
-            bundle = await content_service.get_content(
-                source_type=SourceType.EPUB,
-                filename=filename,
-                chapter_index=chapter_index,
-            )
-
-            # Flatten sentences from blocks
-            all_sentences = []
-            for block in bundle.blocks:
-                if block.type == BlockType.PARAGRAPH:
-                    all_sentences.extend(block.sentences)
+            provider = content_service.get_provider(SourceType.EPUB)
+            chapter = await provider.get_chapter(filename, chapter_index)
+            all_sentences = chapter.sentences
 
         else:
             # RSS, Podcast, PlainText - usually flat lists or handle differently
@@ -545,23 +537,18 @@ async def get_review_context(
             except ValueError:
                 # Text mismatch (maybe cleaned?), return just target
                 return ReviewContextResponse(
-                    target_sentence=item.sentence_text, source_title=bundle.title
+                    target_sentence=item.sentence_text, source_title=chapter.title
                 )
 
         # 5. Extract Context
-        prev_sent = all_sentences[target_idx - 1] if target_idx > 0 else None
-        next_sent = (
-            all_sentences[target_idx + 1]
-            if target_idx < len(all_sentences) - 1
-            else None
-        )
+        prev_sent, next_sent = chapter.neighbours(target_idx)
 
         return ReviewContextResponse(
             previous_sentence=prev_sent,
             target_sentence=item.sentence_text,
             next_sentence=next_sent,
-            source_title=bundle.metadata.get("filename", source_type),
-            chapter_title=bundle.title,
+            source_title=filename,
+            chapter_title=chapter.title,
         )
 
     except Exception as e:
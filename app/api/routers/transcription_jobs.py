@@ -0,0 +1,70 @@
+"""
+Transcription Jobs API Router.
+
+Lets users follow and cancel the transcriptions they queued
+(podcast episodes, audiobook tracks).
+"""
+
+from datetime import datetime
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import BaseModel, ConfigDict
+
+from app.api.routers.auth import get_current_user_id
+from app.services.transcription_jobs import transcription_queue
+
+router = APIRouter(prefix="/api/transcription/jobs", tags=["transcription"])
+
+
+class TranscriptionJobResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    kind: str
+    target_key: str
+    priority: int
+    status: str
+    progress: float
+    progress_message: Optional[str] = None
+    cancel_requested: bool
+    error: Optional[str] = None
+    attempts: int
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+
+async def _get_own_job(job_id: int, user_id: str):
+    job = await transcription_queue.get(job_id)
+    if job is None or job.user_id != user_id:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@router.get("", response_model=List[TranscriptionJobResponse])
+async def list_jobs(
+    active_only: bool = Query(True),
+    limit: int = Query(50, ge=1, le=200),
+    user_id: str = Depends(get_current_user_id),
+):
+    """List the current user's transcription jobs, highest priority first."""
+    return await transcription_queue.list_jobs(
+        user_id=user_id, active_only=active_only, limit=limit
+    )
+
+
+@router.get("/{job_id}", response_model=TranscriptionJobResponse)
+async def get_job(job_id: int, user_id: str = Depends(get_current_user_id)):
+    """Status and progress of one transcription job."""
+    return await _get_own_job(job_id, user_id)
+
+
+@router.post("/{job_id}/cancel", response_model=TranscriptionJobResponse)
+async def cancel_job(job_id: int, user_id: str = Depends(get_current_user_id)):
+    """
+    Cancel a job. Queued jobs are cancelled immediately; running jobs stop
+    before their next chunk (``cancel_requested`` is set until then).
+    """
+    await _get_own_job(job_id, user_id)
+    return await transcription_queue.cancel(job_id)
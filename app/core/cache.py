@@ -0,0 +1,156 @@
+"""
+In-process LRU cache with a byte budget and optional TTL.
+
+Used for hot dictionary data (processed HTML, parsed Collins/LDOCE models)
+where a handful of very large entries (e.g. "on", "get") would otherwise
+dominate a count-limited cache.
+"""
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from pydantic import BaseModel
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Rough, cheap estimate of the memory held by a cached value (in bytes).
+
+    Strings and bytes dominate our cache payloads, so they are counted by
+    length; containers are walked recursively; Pydantic models are measured
+    by their field values.
+    """
+    if value is None:
+        return 0
+    if isinstance(value, (str, bytes, bytearray)):
+        return len(value)
+    if isinstance(value, BaseModel):
+        return estimate_size(value.__dict__)
+    if isinstance(value, dict):
+        return sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sum(estimate_size(v) for v in value)
+    return sys.getsizeof(value)
+
+
+class LRUCache:
+    """
+    Thread-safe LRU cache bounded by total size in bytes (and optionally entry count).
+
+    - Entries are evicted least-recently-used first until the byte budget fits.
+    - Values larger than the whole budget are not cached at all.
+    - With ``ttl_seconds`` set, entries older than the TTL are treated as misses.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_bytes: int,
+        max_entries: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+        sizeof: Callable[[Any], int] = estimate_size,
+    ):
+        self.name = name
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._sizeof = sizeof
+
+        # key -> (value, size, inserted_at)
+        self._data: "OrderedDict[Hashable, Tuple[Any, int, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return self._get_fresh(key) is not None
+
+    def _get_fresh(self, key: Hashable) -> Optional[Tuple[Any, int, float]]:
+        """Return the raw entry if present and not expired (caller holds the lock)."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if self.ttl_seconds is not None and (
+            time.monotonic() - entry[2] > self.ttl_seconds
+        ):
+            self._remove(key)
+            self.expirations += 1
+            return None
+        return entry
+
+    def _remove(self, key: Hashable) -> None:
+        _, size, _ = self._data.pop(key)
+        self._bytes -= size
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value and mark it most recently used."""
+        with self._lock:
+            entry = self._get_fresh(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Insert or replace a value, evicting LRU entries to stay within budget."""
+        size = self._sizeof(value)
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            if size > self.max_bytes:
+                return
+
+            self._data[key] = (value, size, time.monotonic())
+            self._bytes += size
+
+            while self._data and (
+                self._bytes > self.max_bytes
+                or (self.max_entries is not None and len(self._data) > self.max_entries)
+            ):
+                oldest_key = next(iter(self._data))
+                self._remove(oldest_key)
+                self.evictions += 1
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            if key not in self._data:
+                return default
+            value = self._data[key][0]
+            self._remove(key)
+            return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of cache counters for diagnostics endpoints."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "name": self.name,
+                "entries": len(self._data),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
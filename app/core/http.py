@@ -0,0 +1,208 @@
+"""
+Shared, pooled HTTP clients for all outbound (upstream) requests.
+
+Creating an ``httpx.AsyncClient`` per call throws away keep-alive connections
+and TLS sessions, so every iTunes lookup, feed fetch or image proxy paid a
+fresh handshake. Services instead borrow a long-lived client from
+``http_clients``; clients are keyed by (proxy, verify) since those are fixed
+per connection pool, while timeouts, headers and redirects stay per request.
+"""
+
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import httpx
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response body that frees its per-host slot when closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]):
+        self._stream = stream
+        self._release = release
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._release()
+
+
+class HostLimitedTransport(httpx.AsyncBaseTransport):
+    """
+    Wraps a pooled transport and caps concurrent requests per host.
+
+    httpx only limits connections per pool; one slow upstream (a podcast CDN
+    during a bulk download) could otherwise take every connection. A slot is
+    held until the response body is closed, so streamed downloads count too.
+    Waiting for a slot is bounded by the request's pool timeout, like waiting
+    for a pooled connection, and raises ``httpx.PoolTimeout``.
+    """
+
+    def __init__(self, transport: httpx.AsyncHTTPTransport, max_per_host: int):
+        self._transport = transport
+        self._max_per_host = max_per_host
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self.in_flight: Dict[str, int] = defaultdict(int)
+        self.requests: Dict[str, int] = defaultdict(int)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        self.requests[host] += 1
+        if self._max_per_host <= 0:
+            return await self._transport.handle_async_request(request)
+
+        semaphore = self._semaphores.get(host)
+        if semaphore is None:
+            semaphore = self._semaphores[host] = asyncio.Semaphore(self._max_per_host)
+
+        pool_timeout = request.extensions.get("timeout", {}).get("pool")
+        try:
+            await asyncio.wait_for(semaphore.acquire(), pool_timeout)
+        except asyncio.TimeoutError:
+            raise httpx.PoolTimeout(
+                f"No free connection slot for {host} within {pool_timeout}s",
+                request=request,
+            ) from None
+        self.in_flight[host] += 1
+        released = False
+
+        def release() -> None:
+            nonlocal released
+            if not released:
+                released = True
+                self.in_flight[host] -= 1
+                semaphore.release()
+
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            release()
+            raise
+
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_ReleasingStream(response.stream, release),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+    def stats(self) -> Dict[str, Any]:
+        stats: Dict[str, Any] = {
+            "in_flight": {h: n for h, n in self.in_flight.items() if n},
+            "requests_by_host": dict(self.requests),
+        }
+        # httpcore's pool is not public API; report it only while it exists
+        connections = getattr(
+            getattr(self._transport, "_pool", None), "connections", None
+        )
+        if connections is not None:
+            stats["connections"] = len(connections)
+            stats["idle_connections"] = sum(1 for c in connections if c.is_idle())
+        return stats
+
+
+ClientKey = Tuple[Optional[str], bool]
+
+
+class HttpClientRegistry:
+    """
+    App-wide registry of pooled ``httpx.AsyncClient`` instances.
+
+    Opened/closed by the app lifespan; ``get()`` also creates clients lazily
+    so scripts and tests work without it. A client is bound to the event loop
+    it was created on, and is recreated if used from a different loop.
+    """
+
+    def __init__(self):
+        self._clients: Dict[
+            ClientKey,
+            Tuple[httpx.AsyncClient, HostLimitedTransport, asyncio.AbstractEventLoop],
+        ] = {}
+
+    def get(self, *, use_proxy: bool = True, verify: bool = True) -> httpx.AsyncClient:
+        """
+        Return the shared client for these connection settings.
+
+        Args:
+            use_proxy: Route through settings.PROXY_URL (if configured)
+            verify: Verify TLS certificates
+
+        Do not close the returned client; pass timeout/headers/follow_redirects
+        per request instead of creating a new one.
+        """
+        proxy = (settings.PROXY_URL or None) if use_proxy else None
+        key = (proxy, verify)
+        loop = asyncio.get_running_loop()
+
+        entry = self._clients.get(key)
+        if entry is not None and entry[2] is loop and not entry[0].is_closed:
+            return entry[0]
+
+        transport = HostLimitedTransport(
+            httpx.AsyncHTTPTransport(
+                proxy=proxy,
+                verify=verify,
+                http2=settings.HTTP2_ENABLED and HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=settings.HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY_SECONDS,
+                ),
+            ),
+            max_per_host=settings.HTTP_MAX_CONNECTIONS_PER_HOST,
+        )
+        client = httpx.AsyncClient(
+            transport=transport, timeout=settings.HTTP_TIMEOUT_SECONDS
+        )
+        self._clients[key] = (client, transport, loop)
+        logger.info(
+            f"Created pooled HTTP client (proxy={'yes' if proxy else 'no'}, verify={verify})"
+        )
+        return client
+
+    async def open(self) -> None:
+        """Create the default client up front (called from the app lifespan)."""
+        self.get()
+
+    async def aclose(self) -> None:
+        clients, self._clients = self._clients, {}
+        for client, _, _ in clients.values():
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"Error closing HTTP client: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "http2": settings.HTTP2_ENABLED and HTTP2_AVAILABLE,
+            "max_connections": settings.HTTP_MAX_CONNECTIONS,
+            "max_connections_per_host": settings.HTTP_MAX_CONNECTIONS_PER_HOST,
+            "clients": [
+                {"proxy": bool(proxy), "verify": verify, **transport.stats()}
+                for (proxy, verify), (_, transport, _) in self._clients.items()
+            ],
+        }
+
+
+http_clients = HttpClientRegistry()
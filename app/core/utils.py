@@ -1,12 +1,12 @@
 import json
 import re
-from typing import Dict, List, Union, Any
+from typing import Dict, List, Optional, Union, Any
 from fastapi import HTTPException
 
 # Safe pattern: Alphanumeric, common punctuation, safe symbols.
 # Allows: ( ) [ ] - good for text content
 # Blocks: < > { } - potential HTML/JS/Template injection vectors
-SAFE_INPUT_PATTERN = r'^[\w\s\.,!?\'\";:()\-&%+=/@$*\[\]#~]+$'
+SAFE_INPUT_PATTERN = r"^[\w\s\.,!?\'\";:()\-&%+=/@$*\[\]#~]+$"
 
 
 def validate_input(
@@ -24,15 +24,34 @@ def validate_input(
 
     if len(text) > max_length:
         raise HTTPException(
-            status_code=400, detail=f"{field_name} exceeds maximum length of {max_length}"
+            status_code=400,
+            detail=f"{field_name} exceeds maximum length of {max_length}",
         )
 
     if not re.match(pattern, text):
-        raise HTTPException(status_code=400, detail=f"{field_name} contains invalid characters")
+        raise HTTPException(
+            status_code=400, detail=f"{field_name} contains invalid characters"
+        )
 
     return text
 
 
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Whether an If-None-Match header value matches ``etag``.
+    Handles ``*``, comma-separated lists and weak (``W/``) validators, which
+    If-None-Match compares weakly.
+    """
+    if not if_none_match:
+        return False
+
+    def opaque(tag: str) -> str:
+        return tag.strip().removeprefix("W/")
+
+    candidates = {opaque(tag) for tag in if_none_match.split(",")}
+    return "*" in candidates or opaque(etag) in candidates
+
+
 def parse_llm_json(content: str) -> Union[Dict[str, Any], List[Any]]:
     """
     Parses JSON from an LLM response, handling markdown code blocks.
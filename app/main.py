@@ -1,4 +1,4 @@
-from fastapi import FastAPI, Request
+from fastapi import Depends, FastAPI, Request
 from fastapi.responses import JSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
@@ -7,6 +7,7 @@ import asyncio
 from dotenv import load_dotenv
 import os
 
+from app.core.http import http_clients
 from app.services.dictionary import dict_manager
 from app.api.routers import (
     auth,
@@ -35,7 +36,9 @@ from app.api.routers import (
     vocabulary,
     audiobook,
     transcription,
+    transcription_jobs,
 )
+from app.api.routers.auth import get_current_user_id
 
 from app.services.log_collector import setup_logging
 
@@ -69,6 +72,9 @@ async def lifespan(app: FastAPI):
     # The original main.py had comments about creating tables but didn't actually call create_all.
     # It seems Alembic is used or database.py handles it.
 
+    # Shared pooled HTTP clients for all upstream calls
+    await http_clients.open()
+
     # Load dictionary on startup (Background)
     logger.info("Startup: Initiating dictionary loading in background...")
     # Run async load_dictionaries directly in background
@@ -84,6 +90,32 @@ async def lifespan(app: FastAPI):
 
     asyncio.create_task(podcast_service.start_cache_refresher(initial_delay=3600))
 
+    # Start background refresh of subscribed podcast feeds
+    from app.services.podcast_refresh import feed_refresh_scheduler
+
+    if settings.PODCAST_REFRESH_ENABLED:
+        feed_refresh_scheduler.start(
+            initial_delay=settings.PODCAST_REFRESH_INITIAL_DELAY_SECONDS
+        )
+
+    # Start transcription workers (resume jobs left queued or running)
+    from app.services.transcription_jobs import transcription_queue
+
+    transcription_queue.start()
+
+    # Load the local ASR model (or spawn and warm its worker processes) early
+    from app.services.transcription import preload_engine, shutdown_engine
+
+    if settings.SENSEVOICE_PRELOAD or settings.SENSEVOICE_PROCESS_WORKERS > 0:
+
+        async def run_preload():
+            try:
+                await asyncio.to_thread(preload_engine)
+            except Exception as e:
+                logger.error(f"Transcription engine preload failed: {e}")
+
+        asyncio.create_task(run_preload())
+
     # Start Content Analysis Service (analyze EPUBs in background)
     from app.services.content_analysis import content_analysis_service
 
@@ -101,7 +133,12 @@ async def lifespan(app: FastAPI):
     yield
 
     # Cleanup
+    await feed_refresh_scheduler.stop()
+    await transcription_queue.stop()
+    shutdown_engine()
     await input_service.stop_listener()
+    await dict_manager.close()
+    await http_clients.aclose()
 
 
 app = FastAPI(title="NCE English Practice", lifespan=lifespan)
@@ -217,6 +254,7 @@ app.include_router(podcast.router)
 app.include_router(vocabulary.router)
 app.include_router(audiobook.router)
 app.include_router(transcription.router)
+app.include_router(transcription_jobs.router)
 
 from app.models.schemas import RemoteLog  # noqa: E402
 
@@ -274,6 +312,12 @@ async def receive_remote_log(log: RemoteLog):
     return {"status": "ok"}
 
 
+@app.get("/api/http-client-stats")
+async def http_client_stats(user_id: str = Depends(get_current_user_id)):
+    """Connection pool stats of the shared outbound HTTP clients."""
+    return http_clients.stats()
+
+
 # --- Static File Serving for Frontend SPA ---
 # Must be mounted AFTER all API routes to avoid shadowing them
 from fastapi.staticfiles import StaticFiles  # noqa: E402
@@ -6,6 +6,7 @@ Schema Design (2026-01-22):
 - PodcastFeed: Global feed metadata (no user_id)
 - PodcastFeedSubscription: User <-> Feed many-to-many
 - PodcastEpisode: Episodes belong to Feed
+- PodcastTranscriptSegment: Time-aligned transcript segments per episode
 - UserEpisodeState: User's playback position & finished status per episode
 - PodcastListeningSession: Analytics logs for listening history
 """
@@ -24,7 +25,7 @@ from sqlalchemy import (
     UniqueConstraint,
     JSON,
 )
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, deferred, mapped_column, relationship
 from sqlalchemy.sql import func
 from app.core.db import Base
 
@@ -35,7 +36,10 @@ class PodcastFeed(Base):
     """
 
     __tablename__ = "podcast_feeds"
-    __table_args__ = (Index("idx_podcast_feed_url", "rss_url"),)
+    __table_args__ = (
+        Index("idx_podcast_feed_url", "rss_url"),
+        Index("idx_podcast_feed_next_refresh", "next_refresh_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
 
@@ -54,10 +58,29 @@ class PodcastFeed(Base):
     # Cache control
 
     etag: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    last_modified: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    content_hash: Mapped[Optional[str]] = mapped_column(
+        String(64), nullable=True
+    )  # SHA-256 of the last fetched RSS body
     last_fetched_at: Mapped[Optional[datetime]] = mapped_column(
         TIMESTAMP, nullable=True
     )
 
+    # Background refresh schedule (see podcast_refresh.py)
+    next_refresh_at: Mapped[Optional[datetime]] = mapped_column(
+        TIMESTAMP, nullable=True
+    )
+    refresh_interval_seconds: Mapped[Optional[int]] = mapped_column(
+        Integer, nullable=True
+    )  # Derived from the feed's publish cadence
+    refresh_failures: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0"
+    )  # Consecutive failed refreshes (drives backoff)
+
+    # Cached number of episodes, updated whenever episodes are upserted
+    episode_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    last_refresh_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(TIMESTAMP, server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
@@ -104,6 +127,10 @@ class PodcastEpisode(Base):
         Index("idx_podcast_episode_feed", "feed_id"),
         Index("idx_podcast_episode_guid", "guid"),
         Index("idx_podcast_episode_pub", "published_at"),
+        # Keyset pagination of a feed's episodes, newest first
+        Index("idx_podcast_episode_feed_pub_id", "feed_id", "published_at", "id"),
+        # Target of the refresh upsert (INSERT ... ON CONFLICT)
+        UniqueConstraint("feed_id", "guid", name="uq_podcast_episode_feed_guid"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -121,13 +148,14 @@ class PodcastEpisode(Base):
     published_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP, nullable=True)
 
     # Transcription (On-Demand)
-    transcript_text: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Deferred: loading an episode row never drags the transcript along
+    transcript_text: Mapped[Optional[str]] = deferred(
+        mapped_column(Text, nullable=True)
+    )
     transcript_status: Mapped[str] = mapped_column(
         String(20), default="none"
     )  # none, pending, processing, completed, failed
-    transcript_segments: Mapped[Optional[List[dict]]] = mapped_column(
-        JSON, nullable=True
-    )  # Time-aligned segments: [{"start_time": 0.0, "end_time": 2.5, "text": "...", ...}]
+    # Time-aligned segments live in podcast_transcript_segments
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(TIMESTAMP, server_default=func.now())
@@ -142,6 +170,40 @@ class PodcastEpisode(Base):
         back_populates="episode",
         cascade="all, delete-orphan",
     )
+    transcript_segments: Mapped[List["PodcastTranscriptSegment"]] = relationship(
+        "PodcastTranscriptSegment",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",  # Query the segments (or a time window) explicitly
+    )
+
+
+class PodcastTranscriptSegment(Base):
+    """
+    One time-aligned transcript segment of an episode.
+
+    ``seq`` is the segment's position in the transcript; segments are stored
+    in time order, so a time window is a range on (episode_id, start_time).
+    """
+
+    __tablename__ = "podcast_transcript_segments"
+    __table_args__ = (
+        Index("idx_transcript_segment_start", "episode_id", "start_time"),
+    )
+
+    episode_id: Mapped[int] = mapped_column(
+        ForeignKey("podcast_episodes.id", ondelete="CASCADE"), primary_key=True
+    )
+    seq: Mapped[int] = mapped_column(Integer, primary_key=True)
+    start_time: Mapped[float] = mapped_column(Float)
+    end_time: Mapped[float] = mapped_column(Float)
+    text: Mapped[str] = mapped_column(Text)
+
+    # Optional per-segment details from the ASR engine
+    language: Mapped[Optional[str]] = mapped_column(String(16), nullable=True)
+    emotion: Mapped[Optional[str]] = mapped_column(String(32), nullable=True)
+    events: Mapped[Optional[List[str]]] = mapped_column(JSON, nullable=True)
+    confidence: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
 
 
 class UserEpisodeState(Base):
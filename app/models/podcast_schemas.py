@@ -3,7 +3,7 @@ Podcast Pydantic Schemas.
 Moved from app/api/routers/podcast.py to separate concerns.
 """
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
@@ -43,6 +43,7 @@ class ItunesSearchResult(BaseModel):
     author: Optional[str] = None
     rss_url: Optional[str] = None
     artwork_url: Optional[str] = None
+    artwork_token: Optional[str] = None  # Signed token for /proxy/image
     genre: Optional[str] = None
     episode_count: Optional[int] = None
     is_subscribed: bool = False
@@ -86,8 +87,7 @@ class EpisodeResponse(BaseModel):
     chapters: Optional[List[dict]] = None
     image_url: Optional[str]
     published_at: Optional[str]
-    transcript_status: str
-    transcript_segments: Optional[List[dict]] = None  # Time-aligned segments
+    transcript_status: str  # Segments: GET /episode/{id}/transcript
     # User state for resume playback
     current_position: float = 0.0
     is_finished: bool = False
@@ -101,6 +101,7 @@ class FeedDetailResponse(BaseModel):
     episodes: List[EpisodeResponse]
     is_subscribed: bool = False
     total_episodes: int = 0  # Added for pagination support
+    next_cursor: Optional[str] = None  # Pass as ?cursor= for the next page
 
 
 class ListeningSessionRequest(BaseModel):
@@ -132,9 +133,13 @@ class OPMLImportResult(BaseModel):
 class TranscribeResponse(BaseModel):
     status: str
     message: str
+    job_id: Optional[int] = None
 
 
 class TranscribeRequest(BaseModel):
     force: bool = False
     remote_url: Optional[str] = None
     api_key: Optional[str] = None
+    # Higher runs first in the shared transcription queue; bounded so no
+    # caller can push ahead of every other user's jobs
+    priority: int = Field(0, ge=-10, le=10)
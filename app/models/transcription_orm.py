@@ -0,0 +1,62 @@
+"""
+Transcription job queue ORM model.
+
+Jobs are leased by workers with SELECT ... FOR UPDATE SKIP LOCKED; a lease
+that is not renewed (worker crashed or restarted) expires and the job is
+picked up again. See app/services/transcription_jobs.py.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Optional
+from sqlalchemy import (
+    String,
+    Integer,
+    Text,
+    Boolean,
+    Float,
+    TIMESTAMP,
+    JSON,
+    Index,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+from app.core.db import Base
+
+
+class TranscriptionJob(Base):
+    """A queued, running or finished transcription (podcast episode, audiobook track)."""
+
+    __tablename__ = "transcription_jobs"
+    __table_args__ = (
+        # Lease query: next queued job by priority, then age
+        Index("idx_transcription_job_queue", "status", "priority", "id"),
+        Index("idx_transcription_job_target", "target_key"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    kind: Mapped[str] = mapped_column(String(32))  # Handler name
+    target_key: Mapped[str] = mapped_column(Text)  # e.g. "episode:42"
+    payload: Mapped[Dict[str, Any]] = mapped_column(JSON, default=dict)
+    user_id: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    priority: Mapped[int] = mapped_column(Integer, default=0)  # Higher runs first
+
+    status: Mapped[str] = mapped_column(
+        String(16), default="queued"
+    )  # queued, running, completed, failed, cancelled
+    progress: Mapped[float] = mapped_column(Float, default=0.0)  # 0.0 - 1.0
+    progress_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    cancel_requested: Mapped[bool] = mapped_column(Boolean, default=False)
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    # Leasing
+    attempts: Mapped[int] = mapped_column(Integer, default=0)
+    max_attempts: Mapped[int] = mapped_column(Integer, default=3)
+    lease_owner: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    lease_expires_at: Mapped[Optional[datetime]] = mapped_column(
+        TIMESTAMP, nullable=True
+    )
+
+    # Timestamps
+    created_at: Mapped[datetime] = mapped_column(TIMESTAMP, server_default=func.now())
+    started_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP, nullable=True)
+    finished_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP, nullable=True)
@@ -0,0 +1,274 @@
+"""
+Content-addressed on-disk cache of podcast episode audio.
+
+Episodes are streamed to disk in chunks, resumed with Range requests when
+a connection drops, and kept as ``blobs/<sha256>.<ext>``, so identical audio
+served from several URLs is stored once. A small index keyed by URL
+remembers the ETag of each blob: re-transcribing an episode, or
+transcribing it for another user, costs at most a conditional GET instead
+of a second download.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, Set
+from urllib.parse import urlparse
+
+import httpx
+
+from app.config import settings
+from app.core.http import http_clients
+
+logger = logging.getLogger(__name__)
+
+# Attempts per fetch; each retry resumes from the bytes already on disk
+DOWNLOAD_ATTEMPTS = 3
+DOWNLOAD_TIMEOUT = httpx.Timeout(30.0, read=120.0)
+
+
+def _url_key(url: str) -> str:
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(1024 * 1024):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _read_json(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _write_json(path: Path, payload: Dict[str, Any]) -> None:
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(payload), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+class EpisodeAudioCache:
+    """
+    Downloads episode audio once and hands out a local path.
+
+    Layout under ``cache_dir``: ``blobs/`` (complete files named by content
+    hash), ``index/<sha256(url)>.json`` (url, etag, blob) and ``partial/``
+    (interrupted downloads plus the ETag they were started with).
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_bytes: Optional[int] = None,
+        max_download_bytes: Optional[int] = None,
+    ):
+        self._cache_dir = cache_dir
+        self._max_bytes = max_bytes
+        self._max_download_bytes = max_download_bytes
+        self._locks: Dict[str, asyncio.Lock] = {}
+        # Blobs handed out by fetch() and not released yet: never evicted
+        self._in_use: Dict[Path, int] = {}
+
+    @property
+    def cache_dir(self) -> Path:
+        return self._cache_dir or settings.podcast_audio_cache_dir
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes or settings.PODCAST_AUDIO_CACHE_MB * 1024 * 1024
+
+    @property
+    def max_download_bytes(self) -> int:
+        return (
+            self._max_download_bytes
+            or settings.PODCAST_AUDIO_MAX_DOWNLOAD_MB * 1024 * 1024
+        )
+
+    def _dir(self, name: str) -> Path:
+        path = self.cache_dir / name
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+    async def fetch(self, url: str, headers: Optional[Dict[str, str]] = None) -> Path:
+        """
+        Return a local file with the audio at ``url``, downloading if needed.
+
+        Concurrent fetches of one URL share a single download. The file is
+        kept out of eviction until ``release(path)`` is called. Raises
+        ValueError if the audio exceeds PODCAST_AUDIO_MAX_DOWNLOAD_MB and
+        httpx errors if the download keeps failing.
+        """
+        key = _url_key(url)
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            entry = await asyncio.to_thread(
+                _read_json, self._dir("index") / f"{key}.json"
+            )
+            cached = self._dir("blobs") / entry["blob"] if entry else None
+            if cached is not None and not cached.exists():
+                entry = cached = None
+
+            # No validator to revalidate with: audio URLs are effectively immutable
+            if cached is not None and not entry.get("etag"):
+                os.utime(cached)
+                self._acquire(cached)
+                return cached
+
+            path = await self._download(url, key, headers or {}, entry, cached)
+            self._acquire(path)
+            await asyncio.to_thread(self._evict, keep=set(self._in_use))
+            return path
+
+    def release(self, path: Path) -> None:
+        """Let a file returned by ``fetch`` be evicted again."""
+        count = self._in_use.get(path, 0) - 1
+        if count > 0:
+            self._in_use[path] = count
+        else:
+            self._in_use.pop(path, None)
+
+    def _acquire(self, path: Path) -> None:
+        self._in_use[path] = self._in_use.get(path, 0) + 1
+
+    async def _download(
+        self,
+        url: str,
+        key: str,
+        headers: Dict[str, str],
+        entry: Optional[Dict[str, Any]],
+        cached: Optional[Path],
+    ) -> Path:
+        part = self._dir("partial") / f"{key}.part"
+        part_meta_path = part.with_suffix(".json")
+        client = http_clients.get()
+
+        for attempt in range(1, DOWNLOAD_ATTEMPTS + 1):
+            part_meta = _read_json(part_meta_path) or {}
+            offset = part.stat().st_size if part.exists() else 0
+            request_headers = dict(headers)
+            if offset and part_meta.get("etag"):
+                # If-Range: the server sends the full body if the file changed
+                request_headers["Range"] = f"bytes={offset}-"
+                request_headers["If-Range"] = part_meta["etag"]
+            elif cached is not None:
+                request_headers["If-None-Match"] = entry["etag"]
+
+            request = client.build_request(
+                "GET", url, headers=request_headers, timeout=DOWNLOAD_TIMEOUT
+            )
+            try:
+                response = await client.send(
+                    request, stream=True, follow_redirects=True
+                )
+            except httpx.TransportError as e:
+                if attempt == DOWNLOAD_ATTEMPTS:
+                    raise
+                logger.warning(f"Audio download attempt {attempt} failed: {e}")
+                continue
+
+            try:
+                etag = response.headers.get("etag")
+                if cached is not None and (
+                    response.status_code == 304
+                    or (response.status_code == 200 and etag == entry["etag"])
+                ):
+                    logger.info(f"Audio cache hit for {url}")
+                    os.utime(cached)
+                    return cached
+
+                if response.status_code == 416:
+                    # Partial file no longer matches the remote; start over
+                    part.unlink(missing_ok=True)
+                    continue
+                response.raise_for_status()
+
+                if response.status_code != 206:
+                    offset = 0
+                limit = self.max_download_bytes
+                total = self._expected_size(response, offset)
+                if total is not None and total > limit:
+                    raise ValueError(
+                        f"Audio is {total} bytes, over the {limit} byte download limit"
+                    )
+
+                _write_json(part_meta_path, {"url": url, "etag": etag})
+                written = offset
+                # Write chunks as they arrive so an interruption loses nothing
+                with open(part, "ab" if offset else "wb") as f:
+                    async for chunk in response.aiter_bytes():
+                        written += len(chunk)
+                        if written > limit:
+                            raise ValueError(
+                                f"Audio exceeds the {limit} byte download limit"
+                            )
+                        f.write(chunk)
+            except httpx.TransportError as e:
+                if attempt == DOWNLOAD_ATTEMPTS:
+                    raise
+                logger.warning(
+                    f"Audio download interrupted at attempt {attempt}, resuming: {e}"
+                )
+                continue
+            except ValueError:
+                part.unlink(missing_ok=True)
+                part_meta_path.unlink(missing_ok=True)
+                raise
+            finally:
+                await response.aclose()
+
+            logger.info(f"Audio downloaded ({written} bytes) from {url}")
+            return await asyncio.to_thread(self._commit, url, key, part, etag)
+
+        raise httpx.TransportError(
+            f"Audio download failed after {DOWNLOAD_ATTEMPTS} attempts"
+        )
+
+    @staticmethod
+    def _expected_size(response: httpx.Response, offset: int) -> Optional[int]:
+        content_range = response.headers.get("content-range", "")
+        if response.status_code == 206 and "/" in content_range:
+            total = content_range.rsplit("/", 1)[1]
+            return int(total) if total.isdigit() else None
+        length = response.headers.get("content-length")
+        return offset + int(length) if length and length.isdigit() else None
+
+    def _commit(self, url: str, key: str, part: Path, etag: Optional[str]) -> Path:
+        """Move a finished download into the content-addressed store."""
+        ext = Path(urlparse(url).path).suffix.lower()[:8] or ".mp3"
+        blob = self._dir("blobs") / f"{_hash_file(part)}{ext}"
+        if blob.exists():
+            part.unlink()
+            os.utime(blob)
+        else:
+            os.replace(part, blob)
+        part.with_suffix(".json").unlink(missing_ok=True)
+
+        _write_json(
+            self._dir("index") / f"{key}.json",
+            {"url": url, "etag": etag, "blob": blob.name, "size": blob.stat().st_size},
+        )
+        return blob
+
+    def _evict(self, keep: Set[Path]) -> None:
+        """Delete least recently used blobs beyond the byte budget, except ``keep``."""
+        blobs = [(p.stat(), p) for p in self._dir("blobs").iterdir() if p.is_file()]
+        total = sum(st.st_size for st, _ in blobs)
+        for st, path in sorted(blobs, key=lambda b: b[0].st_mtime):
+            if total <= self.max_bytes:
+                break
+            if path in keep:
+                continue
+            path.unlink(missing_ok=True)
+            total -= st.st_size
+            logger.info(f"Evicted cached audio {path.name} ({st.st_size} bytes)")
+
+
+episode_audio_cache = EpisodeAudioCache()
@@ -9,6 +9,8 @@ import logging
 from typing import List, Optional, Tuple
 from bs4 import BeautifulSoup, Tag
 
+from app.config import settings
+from app.core.cache import LRUCache
 from app.models.collins_schemas import (
     CollinsAudio,
     CollinsInflection,
@@ -46,8 +48,11 @@ class CollinsParser:
     # Cache parsed results to avoid re-parsing the same HTML.
     # Key: (hash of HTML, word, include_raw_html)
     # Value: CollinsWord model
-    _parse_cache: dict = {}
-    _cache_max_size: int = 500
+    _parse_cache = LRUCache(
+        "collins_parse",
+        max_bytes=settings.DICT_PARSE_CACHE_MB * 1024 * 1024,
+        ttl_seconds=settings.DICT_CACHE_TTL_SECONDS or None,
+    )
 
     def __init__(self):
         pass
@@ -76,26 +81,29 @@ class CollinsParser:
         # Check cache (use hash of HTML as key to save memory)
         import hashlib
         import time
-        
+
         t0 = time.time()
         cache_key = (
             hashlib.md5(html.encode()).hexdigest(),
             word.lower(),
             include_raw_html,
         )
-        if cache_key in self._parse_cache:
-            logger.info(f"Collins cache hit for '{word}' in {(time.time()-t0)*1000:.1f}ms")
-            return self._parse_cache[cache_key]
+        cached = self._parse_cache.get(cache_key)
+        if cached is not None:
+            logger.info(
+                f"Collins cache hit for '{word}' in {(time.time() - t0) * 1000:.1f}ms"
+            )
+            return cached
 
         logger.info(f"Collins cache miss for '{word}', parsing...")
         t_parse_start = time.time()
-        
+
         try:
             # Use lxml parser for ~5-10x faster parsing
             t1 = time.time()
             soup = BeautifulSoup(html, "lxml")
             t2 = time.time()
-            logger.info(f"  - BeautifulSoup parsing: {(t2-t1)*1000:.1f}ms")
+            logger.info(f"  - BeautifulSoup parsing: {(t2 - t1) * 1000:.1f}ms")
 
             # Find the main entry container
             word_entry = soup.select_one(".word_entry")
@@ -105,7 +113,7 @@ class CollinsParser:
             t3 = time.time()
             entry = self._parse_entry(soup, word_entry)
             t4 = time.time()
-            logger.info(f"  - Entry extraction: {(t4-t3)*1000:.1f}ms")
+            logger.info(f"  - Entry extraction: {(t4 - t3) * 1000:.1f}ms")
 
             result = CollinsWord(
                 word=word,
@@ -114,18 +122,13 @@ class CollinsParser:
                 raw_html=html if include_raw_html else None,
             )
 
-            # Add to cache (with simple eviction if too large)
-            if len(self._parse_cache) >= self._cache_max_size:
-                # Remove oldest entries (FIFO-ish by clearing half)
-                keys_to_remove = list(self._parse_cache.keys())[
-                    : self._cache_max_size // 2
-                ]
-                for k in keys_to_remove:
-                    del self._parse_cache[k]
-            self._parse_cache[cache_key] = result
-            
+            # Add to cache (LRU eviction keeps it within the byte budget)
+            self._parse_cache.set(cache_key, result)
+
             t_total = time.time() - t_parse_start
-            logger.info(f"Collins parsed '{word}' in {t_total*1000:.1f}ms (senses={len(result.entry.senses)})")
+            logger.info(
+                f"Collins parsed '{word}' in {t_total * 1000:.1f}ms (senses={len(result.entry.senses)})"
+            )
 
             return result
 
@@ -231,7 +234,7 @@ class CollinsParser:
             # Early termination
             if len(inflections) >= MAX_INFLECTIONS:
                 break
-                
+
             # Get text but exclude icon spans
             form_text = ""
             for child in a_tag.children:
@@ -302,7 +305,7 @@ class CollinsParser:
             # Early termination: stop parsing once we have enough senses
             if len(senses) >= MAX_SENSES_PER_ENTRY:
                 break
-                
+
             sense = self._parse_sense_block(block)
             if sense:
                 senses.append(sense)
@@ -419,7 +422,7 @@ class CollinsParser:
         # Remove patterns like (冲突、争吵等)酝酿，即将爆发
         result = re.sub(r"[\u4e00-\u9fff，；。、]+", "", result)
         result = re.sub(r"\s+", " ", result).strip()
-        
+
         # Remove spaces before punctuation (e.g. "word , you mean" -> "word, you mean")
         result = re.sub(r"\s+([,.;:?!])", r"\1", result)
 
@@ -440,7 +443,7 @@ class CollinsParser:
             # Early termination
             if len(examples) >= MAX_EXAMPLES_PER_SENSE:
                 break
-                
+
             paragraphs = li.select("p")
 
             if len(paragraphs) >= 1:
@@ -506,7 +509,7 @@ class CollinsParser:
             # Early termination
             if len(synonyms) >= MAX_SYNONYMS_PER_SENSE:
                 break
-                
+
             # Get text, prefer <a> text if exists
             a_tag = form.select_one("a")
             if a_tag:
@@ -529,7 +532,7 @@ class CollinsParser:
                 # Early termination
                 if len(phrasal_verbs) >= MAX_PHRASAL_VERBS:
                     break
-                    
+
                 text = a_tag.get_text(strip=True)
                 if text:
                     phrasal_verbs.append(text)
@@ -1,8 +1,11 @@
+import asyncio
+import posixpath
 import re
 import ebooklib
 import time
+import zipfile
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, Iterator, List, Dict, Any, NamedTuple, Tuple
 from bs4 import BeautifulSoup
 from ebooklib import epub
 import mimetypes
@@ -13,7 +16,10 @@ from app.models.content_schemas import (
     BlockType,
     SourceType,
 )
+from app.config import settings
+from app.core.cache import LRUCache
 from app.services.content_providers.base import BaseContentProvider
+from app.services.epub_cache import epub_parse_cache, file_signature
 import logging
 
 logger = logging.getLogger(__name__)
@@ -23,28 +29,23 @@ logger = logging.getLogger(__name__)
 # Module-level EPUB Cache (Singleton Pattern)
 # ============================================================
 # This prevents re-parsing EPUB files on each API request.
-# Cache entry: {filename: {"data": parsed_data, "mtime": file_mtime, "accessed": timestamp}}
+# Cache entry: {filename: {"data": parsed_data, "signature": file_signature, "accessed": timestamp}}
+# Backed by the persistent epub_parse_cache, so only article metadata and the
+# image index live here; chapter blocks and image bytes are loaded on demand.
 
 _epub_cache: Dict[str, Dict[str, Any]] = {}
 _CACHE_MAX_ENTRIES = 5
 _CACHE_TTL_SECONDS = 300  # 5 minutes
 
 
-def _get_cached_epub(filename: str, epub_dir: Path) -> Optional[Dict[str, Any]]:
+def _get_cached_epub(filename: str, signature: str) -> Optional[Dict[str, Any]]:
     """Get cached EPUB data if valid (not expired, file not modified)."""
     if filename not in _epub_cache:
         return None
 
     entry = _epub_cache[filename]
-    filepath = (epub_dir / filename).resolve()
 
-    # Check if file still exists and hasn't been modified
-    if not filepath.exists():
-        del _epub_cache[filename]
-        return None
-
-    current_mtime = filepath.stat().st_mtime
-    if entry["mtime"] != current_mtime:
+    if entry["signature"] != signature:
         del _epub_cache[filename]
         return None
 
@@ -58,7 +59,7 @@ def _get_cached_epub(filename: str, epub_dir: Path) -> Optional[Dict[str, Any]]:
     return entry["data"]
 
 
-def _set_cached_epub(filename: str, data: Dict[str, Any], mtime: float) -> None:
+def _set_cached_epub(filename: str, data: Dict[str, Any], signature: str) -> None:
     """Store parsed EPUB in module-level cache with LRU eviction."""
     # LRU eviction if at capacity
     if len(_epub_cache) >= _CACHE_MAX_ENTRIES and filename not in _epub_cache:
@@ -67,11 +68,84 @@ def _set_cached_epub(filename: str, data: Dict[str, Any], mtime: float) -> None:
 
     _epub_cache[filename] = {
         "data": data,
-        "mtime": mtime,
+        "signature": signature,
         "accessed": time.time(),
     }
 
 
+# Chapters currently being read/reviewed, ready to serve without touching disk
+_chapter_cache = LRUCache(
+    "epub_chapters", max_bytes=settings.EPUB_CHAPTER_CACHE_MB * 1024 * 1024
+)
+
+
+class EpubChapter(NamedTuple):
+    """
+    A chapter's structured content plus a flat view of its paragraph sentences.
+
+    ``sentences`` is the concatenation of every paragraph block's sentences
+    (the index space used by sentence study / review items), and
+    ``block_offsets[i]`` is the position in ``sentences`` where block ``i``
+    starts (with a final entry equal to ``len(sentences)``).
+    """
+
+    title: str
+    full_text: str
+    blocks: List[ContentBlock]
+    sentences: List[str]
+    block_offsets: List[int]
+    total_chapters: int
+
+    @classmethod
+    def from_blocks(
+        cls, title: str, full_text: str, blocks: List[ContentBlock], total_chapters: int
+    ) -> "EpubChapter":
+        sentences: List[str] = []
+        offsets: List[int] = []
+        for block in blocks:
+            offsets.append(len(sentences))
+            if block.type == BlockType.PARAGRAPH:
+                sentences.extend(block.sentences)
+        offsets.append(len(sentences))
+        return cls(title, full_text, blocks, sentences, offsets, total_chapters)
+
+    def neighbours(self, index: int) -> Tuple[Optional[str], Optional[str]]:
+        """Sentences immediately before and after ``sentences[index]``."""
+        prev_sent = self.sentences[index - 1] if index > 0 else None
+        next_sent = (
+            self.sentences[index + 1] if index < len(self.sentences) - 1 else None
+        )
+        return prev_sent, next_sent
+
+
+class EpubImage(NamedTuple):
+    """An image member of an EPUB zip, streamable without loading the book."""
+
+    epub_path: Path
+    member: str
+    media_type: str
+    size: int
+    etag: str  # From the member's CRC-32 and size in the central directory
+
+    def iter_bytes(
+        self, start: int = 0, end: Optional[int] = None, chunk_size: int = 64 * 1024
+    ) -> Iterator[bytes]:
+        """Yield bytes ``start`` to ``end`` (inclusive) of the image."""
+        end = self.size - 1 if end is None else end
+        remaining = end - start + 1
+
+        # Stored (uncompressed) members seek without inflating anything
+        with zipfile.ZipFile(self.epub_path) as zf, zf.open(self.member) as f:
+            if start:
+                f.seek(start)
+            while remaining > 0:
+                chunk = f.read(min(chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+
+
 class EpubProvider(BaseContentProvider):
     """
     Provider for local EPUB files.
@@ -86,17 +160,20 @@ class EpubProvider(BaseContentProvider):
         return SourceType.EPUB
 
     def __init__(self):
-        self._current_book: Optional[epub.EpubBook] = None
         self._current_filename: Optional[str] = None
+        self._current_path: Optional[Path] = None
+        self._current_signature: Optional[str] = None
         self._cached_articles: List[Dict] = []
-        self._cached_images: Dict[str, bytes] = {}  # {image_path: bytes}
+        self._image_index: Dict[str, str] = {}  # {image_path: zip member name}
+        self._book_data: Dict[str, Any] = {}  # Memory-cache entry of the loaded book
 
     def _load_epub(self, filename: str) -> bool:
-        """Load EPUB file, using module-level cache if available."""
-        # Check if already loaded in this instance
-        if self._current_filename == filename and self._current_book:
-            return True
+        """
+        Load EPUB article metadata, parsing the file only if it changed.
 
+        Lookup order: module-level memory cache, persistent parse cache,
+        then a full ebooklib parse (whose result is persisted).
+        """
         try:
             filepath = (self.EPUB_DIR / filename).resolve()
 
@@ -110,47 +187,123 @@ class EpubProvider(BaseContentProvider):
         if not filepath.exists():
             return False
 
+        signature = file_signature(filepath)
+
         # Try module-level cache first
-        cached = _get_cached_epub(filename, self.EPUB_DIR)
-        if cached:
-            self._current_filename = filename
-            self._cached_articles = cached["articles"]
-            self._cached_images = cached["images"]
-            # Note: _current_book is not cached (large object, rarely needed after parsing)
-            return True
-
-        # Cache miss - parse EPUB
-        try:
-            book = epub.read_epub(str(filepath))
-            self._current_book = book
-            self._current_filename = filename
+        cached = _get_cached_epub(filename, signature)
+        if cached is None:
+            # Then the on-disk parse cache (survives restarts)
+            stored = epub_parse_cache.load_book(filename, signature)
+            if stored is not None:
+                articles, image_index = stored
+                cached = {"articles": articles, "image_index": image_index}
+                _set_cached_epub(filename, cached, signature)
+
+        if cached is None:
+            # Cache miss - parse EPUB
+            try:
+                cached = self._parse_epub(filepath)
+            except Exception:
+                logger.exception("Error loading EPUB %s", filename)
+                return False
+
+            if epub_parse_cache.store_book(
+                filename, signature, cached["articles"], cached["image_index"]
+            ):
+                # Blocks are persisted; drop them so whole books don't stay in RAM
+                for article in cached["articles"]:
+                    article.pop("blocks", None)
+            _set_cached_epub(filename, cached, signature)
+
+        self._current_filename = filename
+        self._current_path = filepath
+        self._current_signature = signature
+        self._cached_articles = cached["articles"]
+        self._image_index = cached["image_index"]
+        self._book_data = cached
+        return True
+
+    def _parse_epub(self, filepath: Path) -> Dict[str, Any]:
+        """Fully parse an EPUB into articles (with blocks) and an image index."""
+        # Same as epub.read_epub, but keeps the reader for its OPF directory
+        reader = epub.EpubReader(str(filepath))
+        book = reader.load()
+        reader.process()
+
+        return {
+            "articles": self._extract_articles(book),
+            "image_index": self._extract_image_index(book, reader.opf_dir),
+        }
+
+    def _extract_image_index(self, book: epub.EpubBook, opf_dir: str) -> Dict[str, str]:
+        """Map each image's EPUB item name to its member name in the zip."""
+        images = {}
+        for item in book.get_items():
+            if item.get_type() == ebooklib.ITEM_IMAGE:
+                # Item names are relative to the OPF file, zip members to the root
+                images[item.get_name()] = posixpath.normpath(
+                    posixpath.join(opf_dir, item.get_name())
+                )
+        return images
 
-            # Extract and cache images
-            self._cached_images = self._extract_images(book)
+    def _resolve_image(self, image_path: str) -> Optional[str]:
+        """Find the image's EPUB item name by exact path, then by basename."""
+        if image_path in self._image_index:
+            return image_path
 
-            # Extract articles with image position tracking
-            self._cached_articles = self._extract_articles(book)
+        # Basename index is built lazily, once per loaded book
+        basenames = self._book_data.get("basename_index")
+        if basenames is None:
+            basenames = {}
+            for item_name in self._image_index:
+                basenames.setdefault(posixpath.basename(item_name), item_name)
+            self._book_data["basename_index"] = basenames
+
+        return basenames.get(posixpath.basename(image_path))
+
+    def get_image_member(self, filename: str, image_path: str) -> Optional[EpubImage]:
+        """
+        Locate an image inside the EPUB zip without reading its bytes.
+
+        Member metadata comes from the zip central directory and is cached
+        with the book, so repeat requests cost one dict lookup.
+        """
+        if not self._load_epub(filename):
+            return None
+
+        # Images might be referenced with or without directory prefix
+        item_name = self._resolve_image(image_path)
+        if item_name is None:
+            return None
 
-            # Store in module-level cache
-            _set_cached_epub(
-                filename,
-                {"articles": self._cached_articles, "images": self._cached_images},
-                filepath.stat().st_mtime,
+        members = self._book_data.setdefault("members", {})
+        image = members.get(item_name)
+        if image is not None:
+            return image
+
+        try:
+            image = self._read_member_info(
+                self._current_path, self._image_index[item_name], item_name
             )
+        except (KeyError, zipfile.BadZipFile, OSError):
+            logger.warning("Image %s missing from %s", item_name, filename)
+            return None
 
-            return True
-        except Exception:
-            logger.exception("Error loading EPUB %s", filename)
-            return False
+        members[item_name] = image
+        return image
 
-    def _extract_images(self, book: epub.EpubBook) -> Dict[str, bytes]:
-        """Extract all images from the EPUB and cache them."""
-        images = {}
-        for item in book.get_items():
-            if item.get_type() == ebooklib.ITEM_IMAGE:
-                # Store with the item's file name as key
-                images[item.get_name()] = item.get_content()
-        return images
+    @staticmethod
+    def _read_member_info(epub_path: Path, member: str, item_name: str) -> EpubImage:
+        with zipfile.ZipFile(epub_path) as zf:
+            info = zf.getinfo(member)
+
+        return EpubImage(
+            epub_path=epub_path,
+            member=member,
+            media_type=mimetypes.guess_type(item_name)[0] or "image/jpeg",
+            size=info.file_size,
+            etag=f'"{info.CRC:08x}-{info.file_size:x}"',
+        )
 
     def get_image(self, filename: str, image_path: str) -> Optional[Tuple[bytes, str]]:
         """
@@ -163,23 +316,10 @@ class EpubProvider(BaseContentProvider):
         Returns:
             Tuple of (bytes, content_type) or None if not found
         """
-        if not self._load_epub(filename):
+        image = self.get_image_member(filename, image_path)
+        if image is None:
             return None
-
-        # Normalize path - images might be referenced with or without directory prefix
-        # Try exact match first
-        if image_path in self._cached_images:
-            content_type = mimetypes.guess_type(image_path)[0] or "image/jpeg"
-            return (self._cached_images[image_path], content_type)
-
-        # Try matching by basename
-        target_basename = Path(image_path).name
-        for cached_path, data in self._cached_images.items():
-            if Path(cached_path).name == target_basename:
-                content_type = mimetypes.guess_type(cached_path)[0] or "image/jpeg"
-                return (data, content_type)
-
-        return None
+        return (b"".join(image.iter_bytes()), image.media_type)
 
     def _extract_articles(self, book: epub.EpubBook) -> List[Dict]:
         """Extract all articles/chapters from the book with image positions."""
@@ -240,7 +380,7 @@ class EpubProvider(BaseContentProvider):
                     if len(text) < 100:
                         continue
 
-                    # Precompute block-based sentence count for consistency with article content
+                    # Blocks are computed once here and persisted with the article
                     blocks = self._extract_structured_blocks(soup)
                     block_sentence_count = sum(
                         len(block.sentences)
@@ -254,7 +394,7 @@ class EpubProvider(BaseContentProvider):
                             "full_text": text,
                             "source_id": item.get_name(),
                             "raw_images": images,
-                            "raw_html": str(soup),  # Store for structured parsing
+                            "blocks": blocks,
                             "is_toc": is_toc,
                             "block_sentence_count": block_sentence_count,  # Cached for performance
                         }
@@ -414,36 +554,60 @@ class EpubProvider(BaseContentProvider):
         # Only filter trivially invalid content
         return [s.strip() for s in sentences if len(s.strip()) >= 5]
 
-    async def fetch(
-        self, filename: str, chapter_index: int = 0, **kwargs: Any
-    ) -> ContentBundle:
+    async def get_chapter(self, filename: str, chapter_index: int) -> EpubChapter:
         """
-        Fetch a specific chapter from an EPUB.
+        Get a chapter's blocks and flat sentence list, from memory when possible.
 
-        Args:
-            filename: EPUB filename in resources/epub/
-            chapter_index: Index of the chapter to load (0-based)
+        Raises FileNotFoundError / ValueError / IndexError like fetch().
         """
         if not self._load_epub(filename):
             raise FileNotFoundError(f"EPUB file not found: {filename}")
 
-        if not self._cached_articles:
+        # Capture state before any await: this provider instance is shared
+        articles = self._cached_articles
+        signature = self._current_signature
+
+        if not articles:
             raise ValueError(f"No valid articles found in {filename}")
 
-        if chapter_index < 0 or chapter_index >= len(self._cached_articles):
+        if chapter_index < 0 or chapter_index >= len(articles):
             raise IndexError(
-                f"Chapter index {chapter_index} out of range (Total: {len(self._cached_articles)})"
+                f"Chapter index {chapter_index} out of range (Total: {len(articles)})"
+            )
+
+        cache_key = (filename, signature, chapter_index)
+        chapter = _chapter_cache.get(cache_key)
+        if chapter is not None:
+            return chapter
+
+        article = articles[chapter_index]
+
+        # Blocks are only kept in memory when they could not be persisted
+        blocks = article.get("blocks")
+        if blocks is None:
+            blocks = await asyncio.to_thread(
+                epub_parse_cache.load_blocks, filename, signature, chapter_index
             )
+        if blocks is None:
+            raise ValueError(f"Chapter {chapter_index} of {filename} is not available")
 
-        article = self._cached_articles[chapter_index]
+        chapter = EpubChapter.from_blocks(
+            article["title"], article["full_text"], blocks, len(articles)
+        )
+        _chapter_cache.set(cache_key, chapter)
+        return chapter
 
-        # Parse HTML to extract structured blocks
-        raw_html = article.get("raw_html", "")
-        if raw_html:
-            soup = BeautifulSoup(raw_html, "lxml-xml")
-            blocks = self._extract_structured_blocks(soup)
-        else:
-            blocks = []
+    async def fetch(
+        self, filename: str, chapter_index: int = 0, **kwargs: Any
+    ) -> ContentBundle:
+        """
+        Fetch a specific chapter from an EPUB.
+
+        Args:
+            filename: EPUB filename in resources/epub/
+            chapter_index: Index of the chapter to load (0-based)
+        """
+        chapter = await self.get_chapter(filename, chapter_index)
 
         # Construct ID: filename:chapter_index
         bundle_id = f"epub:{filename}:{chapter_index}"
@@ -451,12 +615,12 @@ class EpubProvider(BaseContentProvider):
         return ContentBundle(
             id=bundle_id,
             source_type=SourceType.EPUB,
-            title=article["title"],
-            full_text=article["full_text"],
-            blocks=blocks,
+            title=chapter.title,
+            full_text=chapter.full_text,
+            blocks=chapter.blocks,
             metadata={
                 "filename": filename,
                 "chapter_index": chapter_index,
-                "total_chapters": len(self._cached_articles),
+                "total_chapters": chapter.total_chapters,
             },
         )
@@ -3,7 +3,7 @@ import re
 import feedparser
 import httpx
 from typing import Any, List
-from app.config import settings
+from app.core.http import http_clients
 from app.models.content_schemas import ContentBundle, ContentSentence, SourceType
 from app.services.content_providers.base import BaseContentProvider
 
@@ -47,18 +47,16 @@ class RssProvider(BaseContentProvider):
         }
 
         try:
-            proxies = settings.PROXY_URL if settings.PROXY_URL else None
             content = None
 
             # Attempt 1: Standard compliant request
             try:
                 # Use 45s timeout (safe margin below Nginx default 60s)
-                async with httpx.AsyncClient(
-                    timeout=45.0, follow_redirects=True, proxy=proxies
-                ) as client:
-                    response = await client.get(url, headers=headers)
-                    response.raise_for_status()
-                    content = response.content
+                response = await http_clients.get().get(
+                    url, headers=headers, timeout=45.0, follow_redirects=True
+                )
+                response.raise_for_status()
+                content = response.content
             except Exception as e:
                 # Check if retryable (SSL, Timeout)
                 is_ssl_error = (
@@ -77,15 +75,11 @@ class RssProvider(BaseContentProvider):
                 if is_ssl_error or is_conn_error:
                     # Attempt 2: Relaxed Security
                     try:
-                        async with httpx.AsyncClient(
-                            timeout=45.0,
-                            follow_redirects=True,
-                            verify=False,
-                            proxy=proxies,
-                        ) as client:
-                            response = await client.get(url, headers=headers)
-                            response.raise_for_status()
-                            content = response.content
+                        response = await http_clients.get(verify=False).get(
+                            url, headers=headers, timeout=45.0, follow_redirects=True
+                        )
+                        response.raise_for_status()
+                        content = response.content
                     except Exception as e2:
                         raise ValueError(
                             f"Failed to fetch RSS feed {url} (after retry): {str(e2)}"
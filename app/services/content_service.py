@@ -30,6 +30,13 @@ class ContentService:
         """注册一个新的 Content Provider"""
         self._providers[provider.source_type] = provider
 
+    def get_provider(self, source_type: SourceType) -> BaseContentProvider:
+        """获取已注册的 Provider (for provider-specific APIs)"""
+        provider = self._providers.get(source_type)
+        if not provider:
+            raise ValueError(f"No provider registered for source type: {source_type}")
+        return provider
+
     async def get_content(
         self, source_type: SourceType, **params: Any
     ) -> ContentBundle:
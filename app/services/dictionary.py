@@ -10,18 +10,268 @@ SQLite databases are created by running: scripts/convert_mdx_to_sqlite.py
 import os
 import mimetypes
 import sqlite3
+import time
+import zlib
 import aiosqlite
 import asyncio
-from typing import Optional, Tuple, List, Dict
+from collections import deque
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator, Deque, Optional, Tuple, List, Dict
 from bs4 import BeautifulSoup
 import logging
 from fastapi.concurrency import run_in_threadpool
 
+from app.config import settings
+from app.core.cache import LRUCache
+
 logger = logging.getLogger(__name__)
 
 # Global path configuration
 DICT_BASE_DIR = r"resources/dictionaries"
 
+# Max bound parameters per IN (...) query (SQLite's historical default limit is 999)
+BATCH_QUERY_CHUNK = 500
+
+# Point lookups are a single seek on the normalized key (word_lower), preferring
+# the exact-case headword, then the all-lowercase one. Keeping the SQL text
+# constant lets sqlite3's per-connection statement cache reuse the prepared
+# statement (see SQLITE_STATEMENT_CACHE_SIZE).
+ENTRY_SQL = (
+    "SELECT definition FROM entries WHERE word_lower = ? "
+    "ORDER BY word = ? DESC, word = word_lower DESC LIMIT 1"
+)
+RENDERED_SQL = (
+    "SELECT html, codec FROM rendered_entries WHERE word_lower = ? "
+    "ORDER BY word = ? DESC, word = word_lower DESC LIMIT 1"
+)
+PARSED_SQL = (
+    "SELECT data, codec FROM parsed_entries WHERE word_lower = ? "
+    "ORDER BY word = ? DESC, word = word_lower DESC LIMIT 1"
+)
+RESOURCE_SQL = "SELECT path, content FROM resources WHERE path IN ({placeholders})"
+SQLITE_STATEMENT_CACHE_SIZE = 256
+
+
+def normalize_key(word: str) -> str:
+    """Normalized lookup key stored in the word_lower column."""
+    return word.strip().lower()
+
+
+def decode_definition(definition_bytes: bytes) -> Optional[str]:
+    """Decode MDX definition bytes (UTF-8, falling back to GBK)."""
+    try:
+        return definition_bytes.decode("utf-8").strip()
+    except UnicodeDecodeError:
+        try:
+            return definition_bytes.decode("gbk").strip()
+        except UnicodeDecodeError:
+            return None
+
+
+# Codecs for pre-rendered HTML / pre-parsed models stored in the dictionary DBs
+# (see scripts/convert_mdx_to_sqlite.py and scripts/build_parsed_dictionary.py)
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+def compress_blob(raw: bytes) -> Tuple[bytes, str]:
+    """Compress a blob, preferring zstd when available. Returns (data, codec)."""
+    if zstandard is not None:
+        return zstandard.ZstdCompressor(level=9).compress(raw), "zstd"
+    return zlib.compress(raw, 6), "zlib"
+
+
+def decompress_blob(data: bytes, codec: str) -> Optional[bytes]:
+    """Inverse of compress_blob. Returns None if the codec is unavailable."""
+    if codec == "zstd":
+        if zstandard is None:
+            return None
+        return zstandard.ZstdDecompressor().decompress(data)
+    if codec == "zlib":
+        return zlib.decompress(data)
+    return data
+
+
+def compress_html(html: str) -> Tuple[bytes, str]:
+    return compress_blob(html.encode("utf-8"))
+
+
+def decompress_html(data: bytes, codec: str) -> Optional[str]:
+    raw = decompress_blob(data, codec)
+    return raw.decode("utf-8") if raw is not None else None
+
+
+def dictionary_matches_source(dict_name: str, source: str) -> bool:
+    """Whether a dictionary file belongs to a structured source ("collins" / "ldoce")."""
+    if source == "collins":
+        return "collins" in dict_name.lower()
+    if source == "ldoce":
+        upper = dict_name.upper()
+        return "LDOCE" in upper or "LONGMAN" in upper
+    return False
+
+
+def render_definition_html(html_content: str, dict_name: str, subdir: str) -> str:
+    """
+    Rewrite asset paths and inject dictionary-specific CSS/JS.
+
+    Shared by the runtime lookup path and the offline converter, so
+    pre-rendered entries are byte-identical to on-the-fly rendering.
+    """
+    soup = BeautifulSoup(html_content, "lxml")
+    asset_base = f"/dict-assets/{subdir}/" if subdir else "/dict-assets/"
+
+    # Rewrite src attributes
+    for tag in soup.find_all(["img", "script", "input", "embed"], src=True):
+        src = tag["src"]
+        if src.startswith(("http", "https", "data:")):
+            continue
+        if src.lower().endswith(
+            (".jpg", ".jpeg", ".png", ".gif", ".bmp", ".wav", ".mp3", ".spx")
+        ):
+            tag["src"] = f"/dict/resource?path={src}"
+        else:
+            clean_src = src.lstrip("/\\")
+            tag["src"] = f"{asset_base}{clean_src}"
+
+    # Rewrite href attributes
+    for tag in soup.find_all("link", href=True):
+        href = tag["href"]
+        if href.startswith(("http", "https", "data:", "#", "javascript:")):
+            continue
+        if href.startswith("sound://"):
+            tag["href"] = f"/dict/resource?path={href.replace('sound://', '')}"
+            continue
+        if href.startswith("entry://"):
+            continue
+        clean_href = href.lstrip("/\\")
+        tag["href"] = f"{asset_base}{clean_href}"
+
+    # Inject Collins-specific assets
+    if "Collins" in dict_name and soup.head:
+        if not soup.find("link", href=lambda h: h and "colcobuildstyle.css" in h):
+            new_css = soup.new_tag(
+                "link", rel="stylesheet", href=f"{asset_base}colcobuildstyle.css"
+            )
+            soup.head.append(new_css)
+        new_js = soup.new_tag("script", src=f"{asset_base}colcobuildoverhaul_switch.js")
+        soup.head.append(new_js)
+
+    return str(soup)
+
+
+class SQLiteReadPool:
+    """
+    Fixed-size pool of read-only aiosqlite connections to one dictionary DB.
+
+    aiosqlite runs each connection on its own worker thread, so a single
+    connection serializes every query. The pool opens ``size`` connections
+    (``mode=ro``, each with its own mmap) and hands them out in
+    strict FIFO order: a released connection goes straight to the oldest
+    waiter, so late arrivals cannot starve queued requests.
+    """
+
+    def __init__(self, db_path: str, size: int):
+        self.db_path = db_path
+        self.size = max(1, size)
+        self._idle: Deque[aiosqlite.Connection] = deque()
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._connections: List[aiosqlite.Connection] = []
+
+        self.checkouts = 0
+        self.waited_checkouts = 0
+        self.total_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+
+    async def open(self) -> None:
+        # Not immutable=1: the conversion scripts add rendered/parsed tables
+        # to these files while the server may be reading them.
+        uri = f"{Path(self.db_path).resolve().as_uri()}?mode=ro"
+        try:
+            for _ in range(self.size):
+                conn = await aiosqlite.connect(
+                    uri,
+                    uri=True,
+                    check_same_thread=False,
+                    cached_statements=SQLITE_STATEMENT_CACHE_SIZE,
+                )
+                self._connections.append(conn)
+
+                # Optimize for low memory usage
+                await conn.execute("PRAGMA cache_size = -2000")  # 2MB cache
+                await conn.execute("PRAGMA mmap_size = 268435456")  # 256MB mmap
+                await conn.execute("PRAGMA query_only = ON")  # Read-only optimization
+
+                self._idle.append(conn)
+        except BaseException:
+            await self.close()
+            raise
+
+    async def close(self) -> None:
+        for conn in self._connections:
+            await conn.close()
+        self._connections.clear()
+        self._idle.clear()
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[aiosqlite.Connection]:
+        conn = await self._checkout()
+        try:
+            yield conn
+        finally:
+            self._release(conn)
+
+    async def _checkout(self) -> aiosqlite.Connection:
+        start = time.perf_counter()
+        if self._idle and not self._waiters:
+            conn = self._idle.popleft()
+        else:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                conn = await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # Connection was handed over just as we were cancelled
+                    self._release(waiter.result())
+                else:
+                    try:
+                        self._waiters.remove(waiter)
+                    except ValueError:
+                        pass
+                raise
+            self.waited_checkouts += 1
+
+        wait_ms = (time.perf_counter() - start) * 1000
+        self.checkouts += 1
+        self.total_wait_ms += wait_ms
+        self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+        return conn
+
+    def _release(self, conn: aiosqlite.Connection) -> None:
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(conn)
+                return
+        self._idle.append(conn)
+
+    def stats(self) -> Dict:
+        return {
+            "size": self.size,
+            "idle": len(self._idle),
+            "waiting": len(self._waiters),
+            "checkouts": self.checkouts,
+            "waited_checkouts": self.waited_checkouts,
+            "avg_wait_ms": round(self.total_wait_ms / self.checkouts, 3)
+            if self.checkouts
+            else 0.0,
+            "max_wait_ms": round(self.max_wait_ms, 3),
+        }
+
 
 class DictionaryManager:
     """
@@ -36,9 +286,12 @@ class DictionaryManager:
         self.loaded = False
         self._use_legacy = False
 
-        # LRU cache for lookup results
-        self._lookup_cache: dict = {}
-        self._cache_max_size: int = 500
+        # LRU cache for lookup results (bounded by processed HTML size)
+        self._lookup_cache = LRUCache(
+            "dict_lookup",
+            max_bytes=settings.DICT_LOOKUP_CACHE_MB * 1024 * 1024,
+            ttl_seconds=settings.DICT_CACHE_TTL_SECONDS or None,
+        )
 
     async def load_dictionaries(self):
         """
@@ -85,31 +338,52 @@ class DictionaryManager:
         for db_path in db_files:
             try:
                 logger.info(f"Opening SQLite (Async): {db_path} ...")
-                # aiosqlite.connect
-                conn = await aiosqlite.connect(db_path, check_same_thread=False)
-
-                # Optimize for low memory usage
-                await conn.execute("PRAGMA cache_size = -2000")  # 2MB cache
-                await conn.execute("PRAGMA mmap_size = 268435456")  # 256MB mmap
-                await conn.execute("PRAGMA query_only = ON")  # Read-only optimization
+                pool = SQLiteReadPool(db_path, settings.DICT_POOL_SIZE)
+                await pool.open()
 
                 # Calculate relative subdir for asset paths
                 rel_path = os.path.relpath(os.path.dirname(db_path), DICT_BASE_DIR)
                 rel_path = rel_path.replace("\\", "/")
 
+                # Pre-rendered HTML (built by convert_mdx_to_sqlite.py) skips
+                # link-following and BeautifulSoup rewriting at request time
+                async with pool.acquire() as conn:
+                    async with conn.execute(
+                        "SELECT name FROM sqlite_master WHERE type = 'table'"
+                    ) as cursor:
+                        tables = {row[0] for row in await cursor.fetchall()}
+
                 self.databases.append(
                     {
                         "name": os.path.basename(db_path),
-                        "conn": conn,
+                        "pool": pool,
                         "subdir": rel_path if rel_path != "." else "",
+                        "rendered": "rendered_entries" in tables,
+                        "parsed": "parsed_entries" in tables,
                         "_legacy": False,
                     }
                 )
-                logger.info(f"  ✓ Opened {os.path.basename(db_path)}")
+                logger.info(
+                    f"  ✓ Opened {os.path.basename(db_path)} ({pool.size} connections)"
+                )
 
             except Exception as e:
                 logger.error(f"Failed to open {db_path}: {e}")
 
+    async def close(self):
+        """Close all SQLite connection pools."""
+        for d in self.databases:
+            if d.get("pool"):
+                await d["pool"].close()
+
+    def pool_stats(self) -> List[Dict]:
+        """Per-dictionary connection pool metrics (queue wait times)."""
+        return [
+            {"dictionary": d["name"], **d["pool"].stats()}
+            for d in self.databases
+            if d.get("pool")
+        ]
+
     def _load_legacy_mdx(self):
         """Legacy loading: Load MDX files into memory (high memory usage)."""
         try:
@@ -200,37 +474,43 @@ class DictionaryManager:
             except Exception as e:
                 logger.error(f"Failed to load {mdx_path}: {e}")
 
-    async def get_resource(self, path: str) -> Tuple[Optional[bytes], str]:
-        """Get a resource (audio, image, CSS) from dictionary (Async)."""
-        # Normalize path
-        key = path.replace("/", "\\")
-        if not key.startswith("\\"):
-            key = "\\" + key
+    async def get_resource(
+        self, path: str, *fallback_paths: str
+    ) -> Tuple[Optional[bytes], str]:
+        """
+        Get a resource (audio, image, CSS) from dictionary (Async).
 
-        key_bytes_utf8 = key.encode("utf-8")
-        key_bytes_gbk = None
-        try:
-            key_bytes_gbk = key.encode("gbk")
-        except UnicodeEncodeError:
-            pass
+        ``fallback_paths`` (e.g. the basename of ``path``) are tried in order;
+        all candidates are resolved with a single query per dictionary.
+        """
+        # Normalize paths into MDD keys (UTF-8 and GBK), in priority order
+        keys: List[bytes] = []
+        for candidate in (path, *fallback_paths):
+            key = candidate.replace("/", "\\")
+            if not key.startswith("\\"):
+                key = "\\" + key
+            for encoding in ("utf-8", "gbk"):
+                try:
+                    key_bytes = key.encode(encoding)
+                except UnicodeEncodeError:
+                    continue
+                if key_bytes not in keys:
+                    keys.append(key_bytes)
 
         for d in self.databases:
             if d.get("_legacy"):
                 # Legacy: use mdd_cache dict (Sync is fine, it's just dict lookup)
-                cache = d.get("mdd_cache", {})
-                content = cache.get(key_bytes_utf8)
-                if not content and key_bytes_gbk:
-                    content = cache.get(key_bytes_gbk)
+                found = d.get("mdd_cache", {})
             else:
                 # SQLite: query resources table (Async)
-                conn = d["conn"]
-                async with conn.execute(
-                    "SELECT content FROM resources WHERE path = ? OR path = ?",
-                    (key_bytes_utf8, key_bytes_gbk or key_bytes_utf8),
-                ) as cursor:
-                    row = await cursor.fetchone()
-                    content = row[0] if row else None
-
+                placeholders = ",".join("?" * len(keys))
+                async with d["pool"].acquire() as conn:
+                    async with conn.execute(
+                        RESOURCE_SQL.format(placeholders=placeholders), keys
+                    ) as cursor:
+                        found = {row[0]: row[1] for row in await cursor.fetchall()}
+
+            content = next((found[k] for k in keys if found.get(k)), None)
             if content:
                 media_type, _ = mimetypes.guess_type(path)
                 return content, media_type or "application/octet-stream"
@@ -240,19 +520,26 @@ class DictionaryManager:
     async def lookup(self, word: str) -> List[Dict[str, str]]:
         """Look up a word in all dictionaries (Async)."""
         word = word.strip()
-        word_lower = word.lower()
+        word_lower = normalize_key(word)
 
         # Check cache first
         cache_key = word_lower
-        if cache_key in self._lookup_cache:
+        cached = self._lookup_cache.get(cache_key)
+        if cached is not None:
             logger.info(f"dict_manager cache HIT for '{word}'")
-            return self._lookup_cache[cache_key]
+            return cached
 
         logger.info(f"dict_manager cache MISS for '{word}'")
 
         results = []
 
         for d in self.databases:
+            if d.get("rendered"):
+                rendered_html = await self._lookup_rendered(word, word_lower, d["pool"])
+                if rendered_html is not None:
+                    results.append(self._make_result(d, rendered_html))
+                    continue
+
             if d.get("_legacy"):
                 # Use threadpool for legacy if it gets heavy, but simple dict lookup is fast enough for main thread
                 # unless _follow_links does heavy recursion.
@@ -260,50 +547,190 @@ class DictionaryManager:
                 definition_bytes = self._lookup_legacy(word, d)
             else:
                 definition_bytes = await self._lookup_sqlite(
-                    word, word_lower, d["conn"]
+                    word, word_lower, d["pool"]
                 )
 
-            if definition_bytes:
-                html_content = self._decode_definition(definition_bytes)
-                if html_content:
-                    # Handle @@@LINK redirects
-                    html_content = await self._follow_links(html_content, d)
+            result = await self._render_definition(definition_bytes, d)
+            if result:
+                results.append(result)
 
-                    # Process HTML in threadpool to avoid blocking event loop with BeautifulSoup
-                    processed_html = await run_in_threadpool(
-                        self._process_html, html_content, d["name"], d["subdir"]
-                    )
+        # Store in cache (LRU eviction keeps it within the byte budget)
+        self._lookup_cache.set(cache_key, results)
 
-                    results.append(
-                        {
-                            "dictionary": d["name"],
-                            "definition": processed_html,
-                            "source_dir": d["subdir"],
-                        }
-                    )
+        return results
 
-        # Store in cache (with eviction if too large)
-        if len(self._lookup_cache) >= self._cache_max_size:
-            # Remove oldest entries (FIFO-ish by clearing half)
-            keys_to_remove = list(self._lookup_cache.keys())[
-                : self._cache_max_size // 2
-            ]
-            for k in keys_to_remove:
-                del self._lookup_cache[k]
-        self._lookup_cache[cache_key] = results
+    async def lookup_many(self, words: List[str]) -> Dict[str, List[Dict[str, str]]]:
+        """
+        Batch version of lookup: resolves all uncached words with one
+        ``IN (...)`` query per dictionary DB and fills the lookup cache.
 
-        return results
+        Returns {lowercased word: results} (same result shape as lookup).
+        """
+        out: Dict[str, List[Dict[str, str]]] = {}
+        pending: List[str] = []
+        for w in dict.fromkeys(normalize_key(w) for w in words if w.strip()):
+            cached = self._lookup_cache.get(w)
+            if cached is not None:
+                out[w] = cached
+            else:
+                pending.append(w)
+
+        if not pending:
+            return out
+
+        results: Dict[str, List[Dict[str, str]]] = {w: [] for w in pending}
+
+        for d in self.databases:
+            if d.get("_legacy"):
+                for w in pending:
+                    result = await self._render_definition(self._lookup_legacy(w, d), d)
+                    if result:
+                        results[w].append(result)
+                continue
+
+            remaining = pending
+            if d.get("rendered"):
+                rows = await self._fetch_many(
+                    d["pool"],
+                    "SELECT word_lower, html, codec FROM rendered_entries",
+                    remaining,
+                )
+                for w, (html, codec) in rows.items():
+                    rendered_html = decompress_html(html, codec)
+                    if rendered_html is not None:
+                        results[w].append(self._make_result(d, rendered_html))
+                remaining = [w for w in remaining if w not in rows]
+
+            if remaining:
+                rows = await self._fetch_many(
+                    d["pool"], "SELECT word_lower, definition FROM entries", remaining
+                )
+                for w, (definition_bytes,) in rows.items():
+                    result = await self._render_definition(definition_bytes, d)
+                    if result:
+                        results[w].append(result)
+
+        for w, word_results in results.items():
+            self._lookup_cache.set(w, word_results)
+            out[w] = word_results
+
+        return out
+
+    async def _fetch_many(
+        self, pool: SQLiteReadPool, select_sql: str, words_lower: List[str]
+    ) -> Dict[str, tuple]:
+        """
+        Run ``<select_sql> WHERE word_lower IN (...)`` in chunks. Like the
+        single-word queries, the all-lowercase headword wins over other
+        casings of the same key ("polish" over "Polish").
+        """
+        rows: Dict[str, tuple] = {}
+        async with pool.acquire() as conn:
+            for i in range(0, len(words_lower), BATCH_QUERY_CHUNK):
+                chunk = words_lower[i : i + BATCH_QUERY_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                async with conn.execute(
+                    f"{select_sql} WHERE word_lower IN ({placeholders}) "
+                    "ORDER BY word_lower, word = word_lower DESC",
+                    chunk,
+                ) as cursor:
+                    for row in await cursor.fetchall():
+                        rows.setdefault(row[0], tuple(row[1:]))
+        return rows
+
+    def _make_result(self, d: Dict, definition: str) -> Dict[str, str]:
+        return {
+            "dictionary": d["name"],
+            "definition": definition,
+            "source_dir": d["subdir"],
+        }
+
+    async def _render_definition(
+        self, definition_bytes: Optional[bytes], d: Dict
+    ) -> Optional[Dict[str, str]]:
+        """Decode raw entry bytes, follow @@@LINK redirects and rewrite the HTML."""
+        if not definition_bytes:
+            return None
+        html_content = self._decode_definition(definition_bytes)
+        if not html_content:
+            return None
+
+        # Handle @@@LINK redirects
+        html_content = await self._follow_links(html_content, d)
+
+        # Process HTML in threadpool to avoid blocking event loop with BeautifulSoup
+        processed_html = await run_in_threadpool(
+            self._process_html, html_content, d["name"], d["subdir"]
+        )
+        return self._make_result(d, processed_html)
+
+    async def get_parsed(self, source: str, word: str) -> Optional[bytes]:
+        """
+        Get a pre-parsed structured entry (CollinsWord / LDOCEWord JSON without
+        the "word" field) built by scripts/build_parsed_dictionary.py.
+
+        Returns the decompressed JSON bytes, or None if not available.
+        """
+        word = word.strip()
+        for d in self.databases:
+            if not d.get("parsed") or not dictionary_matches_source(d["name"], source):
+                continue
+            async with d["pool"].acquire() as conn:
+                async with conn.execute(
+                    PARSED_SQL, (normalize_key(word), word)
+                ) as cursor:
+                    row = await cursor.fetchone()
+            if row:
+                return decompress_blob(row[0], row[1])
+        return None
+
+    async def get_parsed_many(self, source: str, words: List[str]) -> Dict[str, bytes]:
+        """
+        Batch version of get_parsed: one ``IN (...)`` query per dictionary DB
+        (chunked to stay under SQLite's bound-parameter limit).
+
+        Returns {lowercased word: JSON bytes}; words without an entry are absent.
+        """
+        pending = list(dict.fromkeys(normalize_key(w) for w in words if w.strip()))
+        found: Dict[str, bytes] = {}
+
+        for d in self.databases:
+            if not pending:
+                break
+            if not d.get("parsed") or not dictionary_matches_source(d["name"], source):
+                continue
+
+            rows = await self._fetch_many(
+                d["pool"], "SELECT word_lower, data, codec FROM parsed_entries", pending
+            )
+            for word_lower, (data, codec) in rows.items():
+                raw = decompress_blob(data, codec)
+                if raw is not None:
+                    found[word_lower] = raw
+
+            pending = [w for w in pending if w not in found]
+
+        return found
 
     async def _lookup_sqlite(
-        self, word: str, word_lower: str, conn: aiosqlite.Connection
+        self, word: str, word_lower: str, pool: SQLiteReadPool
     ) -> Optional[bytes]:
         """Query SQLite database for word definition (Async)."""
-        async with conn.execute(
-            "SELECT definition FROM entries WHERE word = ? OR word_lower = ? LIMIT 1",
-            (word, word_lower),
-        ) as cursor:
-            row = await cursor.fetchone()
-            return row[0] if row else None
+        async with pool.acquire() as conn:
+            async with conn.execute(ENTRY_SQL, (word_lower, word)) as cursor:
+                row = await cursor.fetchone()
+                return row[0] if row else None
+
+    async def _lookup_rendered(
+        self, word: str, word_lower: str, pool: SQLiteReadPool
+    ) -> Optional[str]:
+        """Read pre-rendered HTML for a word (links already followed, assets rewritten)."""
+        async with pool.acquire() as conn:
+            async with conn.execute(RENDERED_SQL, (word_lower, word)) as cursor:
+                row = await cursor.fetchone()
+        if not row:
+            return None
+        return decompress_html(row[0], row[1])
 
     def _lookup_legacy(self, word: str, d: Dict) -> Optional[bytes]:
         """Query legacy in-memory cache for word definition."""
@@ -315,13 +742,7 @@ class DictionaryManager:
 
     def _decode_definition(self, definition_bytes: bytes) -> Optional[str]:
         """Decode definition bytes to string."""
-        try:
-            return definition_bytes.decode("utf-8").strip()
-        except UnicodeDecodeError:
-            try:
-                return definition_bytes.decode("gbk").strip()
-            except UnicodeDecodeError:
-                return None
+        return decode_definition(definition_bytes)
 
     async def _follow_links(self, html_content: str, d: Dict, depth: int = 0) -> str:
         """Follow @@@LINK redirects in definition (Async support)."""
@@ -329,7 +750,7 @@ class DictionaryManager:
             return html_content
 
         target_word = html_content.replace("@@@LINK=", "").strip()
-        target_word_lower = target_word.lower()
+        target_word_lower = normalize_key(target_word)
 
         if d.get("_legacy"):
             # Try exact match first, then case variations
@@ -340,13 +761,10 @@ class DictionaryManager:
                         target_bytes = d["mdx_cache"][w]
                         break
         else:
-            # Query both word and word_lower for case-insensitive matching
-            cursor = await d["conn"].execute(
-                "SELECT definition FROM entries WHERE word = ? OR word_lower = ? LIMIT 1",
-                (target_word, target_word_lower),
+            # Case-insensitive match on the normalized key, exact case preferred
+            target_bytes = await self._lookup_sqlite(
+                target_word, target_word_lower, d["pool"]
             )
-            row = await cursor.fetchone()
-            target_bytes = row[0] if row else None
 
         if target_bytes:
             new_content = self._decode_definition(target_bytes)
@@ -357,48 +775,7 @@ class DictionaryManager:
 
     def _process_html(self, html_content: str, dict_name: str, subdir: str) -> str:
         """Process HTML content: rewrite asset paths, inject CSS/JS."""
-        soup = BeautifulSoup(html_content, "lxml")
-        asset_base = f"/dict-assets/{subdir}/" if subdir else "/dict-assets/"
-
-        # Rewrite src attributes
-        for tag in soup.find_all(["img", "script", "input", "embed"], src=True):
-            src = tag["src"]
-            if src.startswith(("http", "https", "data:")):
-                continue
-            if src.lower().endswith(
-                (".jpg", ".jpeg", ".png", ".gif", ".bmp", ".wav", ".mp3", ".spx")
-            ):
-                tag["src"] = f"/dict/resource?path={src}"
-            else:
-                clean_src = src.lstrip("/\\")
-                tag["src"] = f"{asset_base}{clean_src}"
-
-        # Rewrite href attributes
-        for tag in soup.find_all("link", href=True):
-            href = tag["href"]
-            if href.startswith(("http", "https", "data:", "#", "javascript:")):
-                continue
-            if href.startswith("sound://"):
-                tag["href"] = f"/dict/resource?path={href.replace('sound://', '')}"
-                continue
-            if href.startswith("entry://"):
-                continue
-            clean_href = href.lstrip("/\\")
-            tag["href"] = f"{asset_base}{clean_href}"
-
-        # Inject Collins-specific assets
-        if "Collins" in dict_name and soup.head:
-            if not soup.find("link", href=lambda h: h and "colcobuildstyle.css" in h):
-                new_css = soup.new_tag(
-                    "link", rel="stylesheet", href=f"{asset_base}colcobuildstyle.css"
-                )
-                soup.head.append(new_css)
-            new_js = soup.new_tag(
-                "script", src=f"{asset_base}colcobuildoverhaul_switch.js"
-            )
-            soup.head.append(new_js)
-
-        return str(soup)
+        return render_definition_html(html_content, dict_name, subdir)
 
 
 # Singleton
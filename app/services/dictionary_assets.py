@@ -0,0 +1,114 @@
+"""
+Disk-backed cache for dictionary (MDD) resources.
+
+The first request for an asset reads it from the dictionary DB once and
+writes it to a content-addressed file (named by the SHA-256 of its bytes).
+Later requests for the same path are answered from an in-memory index and
+served straight from disk (sendfile, Range, strong ETag), so pronunciation
+audio and CSS stop hitting SQLite on every page render.
+"""
+
+import asyncio
+import hashlib
+import logging
+import mimetypes
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from app.config import settings
+from app.core.cache import LRUCache
+from app.services.dictionary import dict_manager
+
+logger = logging.getLogger(__name__)
+
+# Assets are addressed by content hash, so clients may cache them forever
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Misses are only trusted for a while: a dictionary added later (or one still
+# being opened at startup) may provide the path after all
+MISS_TTL_SECONDS = 300
+
+
+@dataclass(frozen=True)
+class CachedAsset:
+    path: Path
+    media_type: str
+    etag: str
+
+
+class DictionaryAssetCache:
+    """
+    Maps request paths to extracted asset files.
+
+    Misses (paths not present in any dictionary) are remembered for
+    MISS_TTL_SECONDS, so broken references in dictionary HTML do not query
+    SQLite on every render. Misses seen before the dictionaries have finished
+    loading are not remembered at all.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_entries: int = 50000):
+        self._cache_dir = cache_dir
+        self._index = LRUCache(
+            "dict_assets_index", max_bytes=64 * 1024 * 1024, max_entries=max_entries
+        )
+        self._misses = LRUCache(
+            "dict_assets_misses",
+            max_bytes=16 * 1024 * 1024,
+            max_entries=max_entries,
+            ttl_seconds=MISS_TTL_SECONDS,
+        )
+
+    @property
+    def cache_dir(self) -> Path:
+        return self._cache_dir or settings.dict_asset_cache_dir
+
+    async def get(self, path: str, *fallback_paths: str) -> Optional[CachedAsset]:
+        """
+        Resolve ``path`` (then ``fallback_paths``) to an on-disk asset,
+        extracting it if needed.
+        """
+        index_key = (path, fallback_paths)
+        if self._misses.get(index_key):
+            return None
+        cached = self._index.get(index_key)
+        if cached is not None and cached.path.exists():
+            return cached
+
+        content, media_type = await dict_manager.get_resource(path, *fallback_paths)
+        if not content:
+            if dict_manager.loaded:
+                self._misses.set(index_key, True)
+            return None
+
+        asset = await asyncio.to_thread(self._store, content, media_type, path)
+        self._index.set(index_key, asset)
+        return asset
+
+    def _store(self, content: bytes, media_type: str, path: str) -> CachedAsset:
+        """Write content to its content-addressed location (idempotent, atomic)."""
+        digest = hashlib.sha256(content).hexdigest()
+        suffix = (
+            Path(path).suffix.lower() or mimetypes.guess_extension(media_type) or ""
+        )
+        target = self.cache_dir / digest[:2] / f"{digest}{suffix}"
+
+        if not target.exists():
+            target.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(content)
+                os.replace(tmp_path, target)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
+            logger.debug(f"Extracted dictionary asset {path} -> {target.name}")
+
+        return CachedAsset(path=target, media_type=media_type, etag=f'"{digest}"')
+
+
+dict_asset_cache = DictionaryAssetCache()
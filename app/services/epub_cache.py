@@ -0,0 +1,212 @@
+"""
+Persistent parse cache for EPUB files.
+
+Parsing a large EPUB (ebooklib + BeautifulSoup) takes seconds, so the result
+is stored once in a small SQLite database keyed by filename and file
+signature (mtime + size). Each chapter row holds the extracted article
+metadata, full text and its pre-computed ContentBlock list; the book row holds
+an index of image paths to zip members. Cold starts and worker restarts load
+article lists and single chapters from here in milliseconds, and image bytes
+stay in the EPUB until requested.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import TypeAdapter
+
+from app.config import settings
+from app.models.content_schemas import ContentBlock
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever article/block extraction changes so stale rows are re-parsed
+EPUB_CACHE_VERSION = 1
+
+_BLOCKS_ADAPTER = TypeAdapter(List[ContentBlock])
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS epub_books (
+    filename TEXT PRIMARY KEY,
+    signature TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    image_index TEXT NOT NULL,
+    parsed_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS epub_chapters (
+    filename TEXT NOT NULL,
+    chapter_index INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    source_id TEXT NOT NULL,
+    full_text TEXT NOT NULL,
+    raw_images TEXT NOT NULL,
+    is_toc INTEGER NOT NULL,
+    block_sentence_count INTEGER NOT NULL,
+    blocks BLOB NOT NULL,
+    PRIMARY KEY (filename, chapter_index)
+);
+"""
+
+
+def file_signature(path: Path) -> str:
+    """Cheap change detector for an EPUB file (no need to hash the whole book)."""
+    stat = path.stat()
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def encode_blocks(blocks: List[ContentBlock]) -> bytes:
+    return zlib.compress(_BLOCKS_ADAPTER.dump_json(blocks, exclude_defaults=True))
+
+
+def decode_blocks(data: bytes) -> List[ContentBlock]:
+    return _BLOCKS_ADAPTER.validate_json(zlib.decompress(data))
+
+
+class EpubParseCache:
+    """SQLite-backed store of parsed EPUB chapters, shared by all workers."""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        self._db_path = db_path
+        self._initialized_for: Optional[Path] = None
+        self._init_lock = threading.Lock()
+
+    @property
+    def db_path(self) -> Path:
+        return self._db_path or settings.epub_cache_dir / "epub_parse_cache.db"
+
+    @contextmanager
+    def _connect(self):
+        db_path = self.db_path
+        conn = sqlite3.connect(str(db_path), timeout=30)
+        try:
+            if self._initialized_for != db_path:
+                with self._init_lock:
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.executescript(SCHEMA)
+                    self._initialized_for = db_path
+            yield conn
+        finally:
+            conn.close()
+
+    def _book_is_current(
+        self, conn: sqlite3.Connection, filename: str, signature: str
+    ) -> Optional[Dict[str, str]]:
+        row = conn.execute(
+            "SELECT signature, version, image_index FROM epub_books WHERE filename = ?",
+            (filename,),
+        ).fetchone()
+        if not row or row[0] != signature or row[1] != EPUB_CACHE_VERSION:
+            return None
+        return json.loads(row[2])
+
+    def load_book(
+        self, filename: str, signature: str
+    ) -> Optional[Tuple[List[Dict[str, Any]], Dict[str, str]]]:
+        """
+        Return (articles, image_index) for an unchanged book, or None on a miss.
+
+        Articles carry everything the listing endpoints need but not their
+        blocks; use load_blocks() for the chapter being opened.
+        """
+        try:
+            with self._connect() as conn:
+                image_index = self._book_is_current(conn, filename, signature)
+                if image_index is None:
+                    return None
+                rows = conn.execute(
+                    "SELECT title, source_id, full_text, raw_images, is_toc, "
+                    "block_sentence_count FROM epub_chapters "
+                    "WHERE filename = ? ORDER BY chapter_index",
+                    (filename,),
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"EPUB cache read failed for {filename}: {e}")
+            return None
+
+        articles = [
+            {
+                "title": title,
+                "source_id": source_id,
+                "full_text": full_text,
+                "raw_images": json.loads(raw_images),
+                "is_toc": bool(is_toc),
+                "block_sentence_count": block_sentence_count,
+            }
+            for title, source_id, full_text, raw_images, is_toc, block_sentence_count in rows
+        ]
+        return articles, image_index
+
+    def load_blocks(
+        self, filename: str, signature: str, chapter_index: int
+    ) -> Optional[List[ContentBlock]]:
+        """Load the pre-computed blocks for one chapter, or None if stale/missing."""
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT c.blocks FROM epub_chapters c "
+                    "JOIN epub_books b ON b.filename = c.filename "
+                    "WHERE c.filename = ? AND c.chapter_index = ? "
+                    "AND b.signature = ? AND b.version = ?",
+                    (filename, chapter_index, signature, EPUB_CACHE_VERSION),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"EPUB cache read failed for {filename}: {e}")
+            return None
+        return decode_blocks(row[0]) if row else None
+
+    def store_book(
+        self,
+        filename: str,
+        signature: str,
+        articles: List[Dict[str, Any]],
+        image_index: Dict[str, str],
+    ) -> bool:
+        """Replace the cached parse of a book. Articles must include their "blocks"."""
+        chapter_rows = [
+            (
+                filename,
+                i,
+                article["title"],
+                article["source_id"],
+                article["full_text"],
+                json.dumps(article["raw_images"]),
+                int(article["is_toc"]),
+                article["block_sentence_count"],
+                encode_blocks(article["blocks"]),
+            )
+            for i, article in enumerate(articles)
+        ]
+        try:
+            with self._connect() as conn:
+                with conn:
+                    conn.execute(
+                        "DELETE FROM epub_chapters WHERE filename = ?", (filename,)
+                    )
+                    conn.executemany(
+                        "INSERT INTO epub_chapters VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        chapter_rows,
+                    )
+                    conn.execute(
+                        "INSERT OR REPLACE INTO epub_books VALUES (?, ?, ?, ?, ?)",
+                        (
+                            filename,
+                            signature,
+                            EPUB_CACHE_VERSION,
+                            json.dumps(image_index),
+                            time.time(),
+                        ),
+                    )
+            return True
+        except sqlite3.Error as e:
+            logger.warning(f"EPUB cache write failed for {filename}: {e}")
+            return False
+
+
+epub_parse_cache = EpubParseCache()
@@ -0,0 +1,288 @@
+"""
+Content-addressed on-disk cache of podcast artwork, with thumbnails.
+
+Images are streamed to ``blobs/<sha256>.<ext>`` (identical artwork behind
+several URLs is stored once), found through a URL index that is held in
+memory after the first read, and kept under a byte budget with
+least-recently-used eviction. Requests for one of ``THUMBNAIL_SIZES`` get a
+downscaled copy from ``thumbs/``, so grids of small covers don't transfer
+multi-megabyte originals.
+"""
+
+import asyncio
+import hashlib
+import logging
+import mimetypes
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional
+
+import httpx
+from PIL import Image
+
+from app.config import settings
+from app.core.http import http_clients
+
+logger = logging.getLogger(__name__)
+
+# Square bounding boxes (px) for the covers the web podcast UI requests
+# (CSS size x 2, see api/podcast.js): player bar (56px), search results
+# (96px), and recently played / library cards and the feed header (up to
+# 256px).
+THUMBNAIL_SIZES = (128, 256, 512)
+THUMBNAIL_JPEG_QUALITY = 85
+
+# Refuse anything larger; artwork is rarely over a few megabytes
+MAX_IMAGE_BYTES = 20 * 1024 * 1024
+FETCH_TIMEOUT = httpx.Timeout(10.0, read=30.0)
+
+
+def thumbnail_size(size: Optional[int]) -> Optional[int]:
+    """
+    The smallest thumbnail size covering ``size``, or None when the
+    original should be served (no size, or larger than every thumbnail).
+    """
+    if not size:
+        return None
+    return next((s for s in THUMBNAIL_SIZES if s >= size), None)
+
+
+def _url_key(url: str) -> str:
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+
+def _extension(content_type: str) -> str:
+    ext = mimetypes.guess_extension(content_type.split(";")[0].strip()) or ".jpg"
+    return ".jpg" if ext == ".jpe" else ext
+
+
+class ImageCache:
+    """
+    Downloads images once and hands out local paths.
+
+    Layout under ``cache_dir``: ``blobs/`` (originals named by content
+    hash), ``thumbs/<sha256>_<size>.<ext>`` (resized copies),
+    ``index/<sha256(url)>`` (the blob name for a URL) and ``partial/``
+    (downloads in progress). Blobs and thumbnails share one byte budget.
+    """
+
+    def __init__(
+        self, cache_dir: Optional[Path] = None, max_bytes: Optional[int] = None
+    ):
+        self._cache_dir = cache_dir
+        self._max_bytes = max_bytes
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._index: Dict[str, str] = {}
+        # Cached file -> size, least recently used first; loaded on first use.
+        # Updated from worker threads, hence the mutex.
+        self._files: Optional["OrderedDict[Path, int]"] = None
+        self._total = 0
+        self._mutex = threading.Lock()
+
+    @property
+    def cache_dir(self) -> Path:
+        return self._cache_dir or settings.podcast_cache_dir
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes or settings.PODCAST_IMAGE_CACHE_MB * 1024 * 1024
+
+    def _dir(self, name: str) -> Path:
+        path = self.cache_dir / name
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+    async def fetch(
+        self,
+        url: str,
+        size: Optional[int] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Path:
+        """
+        Return a local file with the image at ``url``, downloading it if
+        needed, downscaled to fit ``size`` when that is a thumbnail size.
+
+        Raises httpx.HTTPStatusError if upstream does not return the image,
+        other httpx errors if it cannot be reached and ValueError if it is
+        larger than MAX_IMAGE_BYTES.
+        """
+        if self._files is None:
+            await asyncio.to_thread(self._load)
+
+        key = _url_key(url)
+        async with self._locks.setdefault(key, asyncio.Lock()):
+            blob = await asyncio.to_thread(self._lookup, key)
+            if blob is None:
+                blob = await self._download(url, key, headers or {})
+
+        thumb_size = thumbnail_size(size)
+        if thumb_size is None:
+            return blob
+        thumb_key = f"{blob.stem}_{thumb_size}"
+        async with self._locks.setdefault(thumb_key, asyncio.Lock()):
+            return await asyncio.to_thread(self._thumbnail, blob, thumb_size)
+
+    def _lookup(self, key: str) -> Optional[Path]:
+        """The cached blob for a URL key, marked as just used."""
+        index_path = self._dir("index") / key
+        name = self._index.get(key)
+        if name is None:
+            try:
+                name = index_path.read_text(encoding="utf-8")
+            except OSError:
+                return None
+        blob = self._dir("blobs") / name
+        if not self._touch(blob):
+            # Evicted since it was indexed
+            self._index.pop(key, None)
+            index_path.unlink(missing_ok=True)
+            return None
+        self._index[key] = name
+        return blob
+
+    async def _download(self, url: str, key: str, headers: Dict[str, str]) -> Path:
+        part = self._dir("partial") / f"{key}.part"
+        client = http_clients.get(verify=False)
+        request = client.build_request(
+            "GET", url, headers=headers, timeout=FETCH_TIMEOUT
+        )
+        response = await client.send(request, stream=True, follow_redirects=True)
+        try:
+            response.raise_for_status()
+            if response.status_code != 200:
+                raise httpx.HTTPStatusError(
+                    f"Unexpected status {response.status_code} for {url}",
+                    request=request,
+                    response=response,
+                )
+            digest = hashlib.sha256()
+            written = 0
+            with open(part, "wb") as f:
+                async for chunk in response.aiter_bytes():
+                    written += len(chunk)
+                    if written > MAX_IMAGE_BYTES:
+                        raise ValueError(
+                            f"Image exceeds the {MAX_IMAGE_BYTES} byte limit"
+                        )
+                    digest.update(chunk)
+                    f.write(chunk)
+        except BaseException:
+            part.unlink(missing_ok=True)
+            raise
+        finally:
+            await response.aclose()
+
+        content_type = response.headers.get("content-type", "image/jpeg")
+        name = f"{digest.hexdigest()}{_extension(content_type)}"
+        return await asyncio.to_thread(self._commit, key, part, name)
+
+    def _commit(self, key: str, part: Path, name: str) -> Path:
+        """Move a finished download into the store and index it."""
+        blob = self._dir("blobs") / name
+        if self._touch(blob):
+            part.unlink()
+        else:
+            os.replace(part, blob)
+            self._add(blob)
+
+        index_path = self._dir("index") / key
+        tmp = index_path.with_suffix(".tmp")
+        tmp.write_text(name, encoding="utf-8")
+        os.replace(tmp, index_path)
+        self._index[key] = name
+        self._evict(keep=blob)
+        return blob
+
+    def _thumbnail(self, blob: Path, size: int) -> Path:
+        """A copy of ``blob`` that fits in ``size`` x ``size``, made on first use."""
+        for ext in (".jpg", ".png"):
+            thumb = self._dir("thumbs") / f"{blob.stem}_{size}{ext}"
+            if self._touch(thumb):
+                return thumb
+
+        try:
+            with Image.open(blob) as img:
+                if img.width <= size and img.height <= size:
+                    return blob
+                img.thumbnail((size, size), Image.LANCZOS)
+                has_alpha = img.mode in ("RGBA", "LA") or "transparency" in img.info
+                if has_alpha:
+                    thumb = self._dir("thumbs") / f"{blob.stem}_{size}.png"
+                    img.save(thumb, "PNG", optimize=True)
+                else:
+                    thumb = self._dir("thumbs") / f"{blob.stem}_{size}.jpg"
+                    img.convert("RGB").save(
+                        thumb, "JPEG", quality=THUMBNAIL_JPEG_QUALITY, optimize=True
+                    )
+        except Exception as e:
+            # Not an image Pillow can read: serve it as it is
+            logger.warning(f"Could not resize {blob.name}: {e}")
+            thumb.unlink(missing_ok=True)
+            return blob
+
+        self._add(thumb)
+        self._evict(keep=thumb)
+        return thumb
+
+    def _load(self) -> None:
+        """Read sizes and ages of what is on disk, oldest first."""
+        if self._files is not None:
+            return
+        # Files from the old layout (<md5(url)>.<ext> at the top level)
+        # are not tracked by anything any more
+        for path in self.cache_dir.iterdir():
+            if path.is_file() and len(path.stem) == 32:
+                path.unlink(missing_ok=True)
+        for path in self._dir("partial").iterdir():
+            path.unlink(missing_ok=True)
+
+        found = [
+            (st.st_mtime, path, st.st_size)
+            for name in ("blobs", "thumbs")
+            for path in self._dir(name).iterdir()
+            if path.is_file() and (st := path.stat())
+        ]
+        self._files = OrderedDict(
+            (path, size) for _, path, size in sorted(found, key=lambda f: f[0])
+        )
+        self._total = sum(self._files.values())
+
+    def _add(self, path: Path) -> None:
+        size = path.stat().st_size
+        with self._mutex:
+            self._files[path] = size
+            self._total += size
+
+    def _touch(self, path: Path) -> bool:
+        """Mark a cached file as just used; False if it is not cached."""
+        with self._mutex:
+            if path not in self._files:
+                return False
+            self._files.move_to_end(path)
+        try:
+            # Keeps the LRU order across restarts
+            os.utime(path)
+        except OSError:
+            pass
+        return True
+
+    def _evict(self, keep: Path) -> None:
+        """Delete least recently used files beyond the byte budget."""
+        with self._mutex:
+            evicted = []
+            for path in list(self._files):
+                if self._total <= self.max_bytes:
+                    break
+                if path == keep:
+                    continue
+                size = self._files.pop(path)
+                self._total -= size
+                evicted.append((path, size))
+        for path, size in evicted:
+            path.unlink(missing_ok=True)
+            logger.info(f"Evicted cached image {path.name} ({size} bytes)")
+
+
+image_cache = ImageCache()
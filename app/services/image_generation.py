@@ -1,10 +1,10 @@
 import hashlib
 from typing import Optional
-import httpx
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.models.orm import GeneratedImage
 from app.config import settings
+from app.core.http import http_clients
 from app.services.log_collector import log_collector, LogLevel, LogCategory
 
 
@@ -86,25 +86,25 @@ class ImageGenerationService:
         # Using Zhipu GLM-Image defaults
         payload = {"model": "glm-image", "prompt": prompt, "size": "1024x1024"}
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(url, headers=headers, json=payload)
-            response.raise_for_status()
-            data = response.json()
+        client = http_clients.get(use_proxy=False)
+        response = await client.post(url, headers=headers, json=payload, timeout=60.0)
+        response.raise_for_status()
+        data = response.json()
 
-            # Check for error in response body if 200 OK but logical error
-            if "error" in data:
-                raise ValueError(f"API Error: {data['error']}")
+        # Check for error in response body if 200 OK but logical error
+        if "error" in data:
+            raise ValueError(f"API Error: {data['error']}")
 
-            # Extract image URL
-            if "data" not in data or not data["data"]:
-                raise ValueError(f"Invalid API response structure: {data}")
+        # Extract image URL
+        if "data" not in data or not data["data"]:
+            raise ValueError(f"Invalid API response structure: {data}")
 
-            image_url = data["data"][0]["url"]
+        image_url = data["data"][0]["url"]
 
-            # Download image
-            img_response = await client.get(image_url, timeout=60.0)
-            img_response.raise_for_status()
-            return img_response.content
+        # Download image
+        img_response = await client.get(image_url, timeout=60.0)
+        img_response.raise_for_status()
+        return img_response.content
 
 
 image_service = ImageGenerationService()
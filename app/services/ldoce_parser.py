@@ -10,6 +10,8 @@ import hashlib
 from typing import List, Optional, Tuple
 from bs4 import BeautifulSoup, Tag
 
+from app.config import settings
+from app.core.cache import LRUCache
 from app.models.ldoce_schemas import (
     LDOCEAudio,
     LDOCEExample,
@@ -56,8 +58,11 @@ class LDOCEParser:
     # Cache parsed results to avoid re-parsing the same HTML.
     # Key: (hash of HTML, word, include_raw_html)
     # Value: LDOCEWord model
-    _parse_cache: dict = {}  # Simple dict cache with manual eviction
-    _cache_max_size: int = 500
+    _parse_cache = LRUCache(
+        "ldoce_parse",
+        max_bytes=settings.DICT_PARSE_CACHE_MB * 1024 * 1024,
+        ttl_seconds=settings.DICT_CACHE_TTL_SECONDS or None,
+    )
 
     def __init__(self):
         pass
@@ -87,8 +92,9 @@ class LDOCEParser:
             word.lower(),
             include_raw_html,
         )
-        if cache_key in self._parse_cache:
-            return self._parse_cache[cache_key]
+        cached = self._parse_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         try:
             # Use lxml parser for ~5-10x faster parsing
@@ -107,15 +113,8 @@ class LDOCEParser:
                     raw_html=html if include_raw_html else None,
                 )
 
-            # Add to cache (with simple eviction if too large)
-            if len(self._parse_cache) >= self._cache_max_size:
-                # Remove oldest entry (FIFO-ish by clearing half)
-                keys_to_remove = list(self._parse_cache.keys())[
-                    : self._cache_max_size // 2
-                ]
-                for k in keys_to_remove:
-                    del self._parse_cache[k]
-            self._parse_cache[cache_key] = result
+            # Add to cache (LRU eviction keeps it within the byte budget)
+            self._parse_cache.set(cache_key, result)
 
             return result
 
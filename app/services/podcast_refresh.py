@@ -0,0 +1,319 @@
+"""
+Background refresh of all subscribed podcast feeds.
+
+A dispatcher polls for feeds whose persisted ``next_refresh_at`` is due and
+hands them to a fixed pool of workers, so a large subscription list never
+fans out into hundreds of simultaneous fetches. Fetches to the same host are
+spaced out, and each feed's next run is derived from how often it actually
+publishes. Because the schedule lives in the database, a restart only picks
+up feeds that were really due instead of refreshing everything at once.
+"""
+
+import asyncio
+import logging
+import random
+import statistics
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Set
+from urllib.parse import urlsplit
+
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.core.db import AsyncSessionLocal
+from app.models.podcast_orm import (
+    PodcastEpisode,
+    PodcastFeed,
+    PodcastFeedSubscription,
+)
+from app.services.podcast_service import podcast_service
+
+logger = logging.getLogger(__name__)
+
+# How often the dispatcher looks for due feeds
+POLL_INTERVAL_SECONDS = 60
+# Interval for feeds without enough episodes to estimate a cadence
+DEFAULT_INTERVAL_SECONDS = 6 * 3600
+# Recent episodes used to estimate the publish cadence
+CADENCE_SAMPLE = 10
+# Poll this many times per typical gap between episodes
+POLLS_PER_GAP = 4
+# +/- fraction applied to every interval so feeds don't stay in lockstep
+JITTER = 0.1
+# Refresh latencies kept for the metrics endpoint
+LATENCY_WINDOW = 500
+
+
+def compute_refresh_interval(
+    published: Sequence[Optional[datetime]],
+    now: datetime,
+    min_seconds: int,
+    max_seconds: int,
+) -> int:
+    """
+    Refresh interval (seconds) from a feed's recent publish dates.
+
+    A daily show is polled every ~6h, an hourly news feed hits the minimum,
+    and a feed that has gone quiet backs off as its silence grows.
+    """
+    dates = sorted((d for d in published if d), reverse=True)[: CADENCE_SAMPLE + 1]
+    gaps = [
+        (newer - older).total_seconds()
+        for newer, older in zip(dates, dates[1:])
+        if newer > older
+    ]
+    if not gaps:
+        interval = DEFAULT_INTERVAL_SECONDS
+    else:
+        silence = max((now - dates[0]).total_seconds(), 0)
+        interval = max(statistics.median(gaps), silence) / POLLS_PER_GAP
+    return int(min(max(interval, min_seconds), max_seconds))
+
+
+def _jittered(seconds: float) -> timedelta:
+    return timedelta(seconds=seconds * random.uniform(1 - JITTER, 1 + JITTER))
+
+
+class FeedRefreshScheduler:
+    """
+    Keeps subscribed feeds fresh in the background.
+
+    Started/stopped by the app lifespan. ``enqueue_due()`` and
+    ``refresh_one()`` are usable on their own (tests, scripts).
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+        concurrency: Optional[int] = None,
+        host_delay: Optional[float] = None,
+    ):
+        self._session_factory = session_factory
+        self.concurrency = concurrency or settings.PODCAST_REFRESH_CONCURRENCY
+        self.host_delay = (
+            settings.PODCAST_REFRESH_HOST_DELAY_SECONDS
+            if host_delay is None
+            else host_delay
+        )
+        self.min_interval = settings.PODCAST_REFRESH_MIN_INTERVAL_MINUTES * 60
+        self.max_interval = settings.PODCAST_REFRESH_MAX_INTERVAL_HOURS * 3600
+
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._queued: Set[int] = set()  # Queued or in flight
+        self._tasks: List[asyncio.Task] = []
+        self._host_locks: Dict[str, asyncio.Lock] = {}
+        self._host_next_at: Dict[str, float] = {}
+
+        self._in_flight = 0
+        self._due = 0
+        self._last_poll_at: Optional[datetime] = None
+        self._latencies: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._counters = {"refreshed": 0, "failed": 0, "new_episodes": 0}
+
+    # --- Lifecycle ---
+
+    def start(self, initial_delay: float = 0) -> None:
+        if self._tasks:
+            return
+        self._queue = asyncio.Queue()
+        self._queued.clear()
+        self._tasks = [asyncio.create_task(self._dispatch(initial_delay))]
+        self._tasks += [
+            asyncio.create_task(self._worker()) for _ in range(self.concurrency)
+        ]
+        logger.info(
+            f"Feed refresh scheduler started ({self.concurrency} workers, "
+            f"first poll in {initial_delay}s)"
+        )
+
+    async def stop(self) -> None:
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _dispatch(self, initial_delay: float) -> None:
+        if initial_delay > 0:
+            await asyncio.sleep(initial_delay)
+        while True:
+            try:
+                await self.enqueue_due()
+            except Exception as e:
+                logger.error(f"Feed refresh dispatch failed: {e}")
+            await asyncio.sleep(POLL_INTERVAL_SECONDS)
+
+    async def _worker(self) -> None:
+        while True:
+            feed_id = await self._queue.get()
+            try:
+                await self.refresh_one(feed_id)
+            except Exception as e:
+                logger.error(f"Background refresh of feed {feed_id} failed: {e}")
+            finally:
+                self._queued.discard(feed_id)
+                self._queue.task_done()
+
+    # --- Scheduling ---
+
+    async def enqueue_due(self) -> int:
+        """Queue subscribed feeds whose refresh is due. Returns how many."""
+        now = datetime.utcnow()
+        subscribed = (
+            select(PodcastFeedSubscription.feed_id).distinct().scalar_subquery()
+        )
+
+        async with self._session_factory() as db:
+            await self._schedule_unscheduled(db, subscribed, now)
+
+            due = (PodcastFeed.id.in_(subscribed), PodcastFeed.next_refresh_at <= now)
+            self._due = await db.scalar(select(func.count(PodcastFeed.id)).where(*due))
+            self._last_poll_at = now
+
+            # Keep the in-memory queue short; the rest stays due in the DB
+            room = self.concurrency * 2 - self._queue.qsize()
+            if room <= 0:
+                return 0
+            result = await db.execute(
+                select(PodcastFeed.id)
+                .where(*due, PodcastFeed.id.not_in(self._queued))
+                .order_by(PodcastFeed.next_refresh_at)
+                .limit(room)
+            )
+            feed_ids = result.scalars().all()
+
+        for feed_id in feed_ids:
+            self._queued.add(feed_id)
+            self._queue.put_nowait(feed_id)
+        return len(feed_ids)
+
+    async def _schedule_unscheduled(self, db: AsyncSession, subscribed, now) -> None:
+        """Spread feeds that have never been scheduled over the default interval."""
+        result = await db.execute(
+            select(PodcastFeed.id).where(
+                PodcastFeed.id.in_(subscribed), PodcastFeed.next_refresh_at.is_(None)
+            )
+        )
+        feed_ids = result.scalars().all()
+        if not feed_ids:
+            return
+
+        spread = min(DEFAULT_INTERVAL_SECONDS, self.max_interval)
+        await db.execute(
+            update(PodcastFeed),
+            [
+                {
+                    "id": feed_id,
+                    "next_refresh_at": now
+                    + timedelta(seconds=random.uniform(0, spread)),
+                }
+                for feed_id in feed_ids
+            ],
+        )
+        await db.commit()
+        logger.info(f"Scheduled first background refresh for {len(feed_ids)} feeds")
+
+    async def _wait_for_host(self, host: str) -> None:
+        """Space out fetch starts to the same host by ``host_delay``."""
+        lock = self._host_locks.setdefault(host, asyncio.Lock())
+        loop = asyncio.get_running_loop()
+        async with lock:
+            delay = self._host_next_at.get(host, 0) - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._host_next_at[host] = loop.time() + self.host_delay
+
+    # --- Refresh ---
+
+    async def refresh_one(self, feed_id: int) -> None:
+        """Refresh one feed and persist when it should run next."""
+        async with self._session_factory() as db:
+            feed = await db.get(PodcastFeed, feed_id)
+            if feed is None:
+                return
+
+            await self._wait_for_host(urlsplit(feed.rss_url).hostname or "")
+
+            self._in_flight += 1
+            started = time.monotonic()
+            try:
+                new_count = await podcast_service.refresh_feed_content(db, feed)
+            except Exception as e:
+                await db.rollback()
+                await db.refresh(feed)
+                feed.refresh_failures += 1
+                feed.last_refresh_error = str(e)[:500]
+                interval = min(
+                    (feed.refresh_interval_seconds or DEFAULT_INTERVAL_SECONDS)
+                    * 2 ** min(feed.refresh_failures, 6),
+                    self.max_interval,
+                )
+                self._counters["failed"] += 1
+                logger.warning(
+                    f"Feed {feed_id} refresh failed ({feed.refresh_failures}x): {e}"
+                )
+            else:
+                feed.refresh_failures = 0
+                feed.last_refresh_error = None
+                feed.refresh_interval_seconds = interval = await self._cadence_interval(
+                    db, feed_id
+                )
+                self._counters["refreshed"] += 1
+                self._counters["new_episodes"] += new_count
+            finally:
+                self._in_flight -= 1
+                self._latencies.append(time.monotonic() - started)
+
+            feed.next_refresh_at = datetime.utcnow() + _jittered(interval)
+            await db.commit()
+
+    async def _cadence_interval(self, db: AsyncSession, feed_id: int) -> int:
+        result = await db.execute(
+            select(PodcastEpisode.published_at)
+            .where(
+                PodcastEpisode.feed_id == feed_id,
+                PodcastEpisode.published_at.is_not(None),
+            )
+            .order_by(PodcastEpisode.published_at.desc())
+            .limit(CADENCE_SAMPLE + 1)
+        )
+        return compute_refresh_interval(
+            result.scalars().all(),
+            datetime.utcnow(),
+            self.min_interval,
+            self.max_interval,
+        )
+
+    # --- Metrics ---
+
+    def metrics(self) -> Dict[str, Any]:
+        latencies = sorted(self._latencies)
+
+        def pct(p: float) -> Optional[float]:
+            if not latencies:
+                return None
+            return round(latencies[min(int(p * len(latencies)), len(latencies) - 1)], 3)
+
+        return {
+            "running": bool(self._tasks),
+            "concurrency": self.concurrency,
+            "queue_depth": self._queue.qsize(),
+            "in_flight": self._in_flight,
+            "due": self._due,
+            "last_poll_at": self._last_poll_at.isoformat()
+            if self._last_poll_at
+            else None,
+            **self._counters,
+            "latency_seconds": {
+                "count": len(latencies),
+                "avg": round(statistics.fmean(latencies), 3) if latencies else None,
+                "p50": pct(0.5),
+                "p95": pct(0.95),
+                "max": round(latencies[-1], 3) if latencies else None,
+            },
+        }
+
+
+feed_refresh_scheduler = FeedRefreshScheduler()
@@ -8,21 +8,28 @@ Uses the Shared Feed Model:
 - UserEpisodeState: User's playback position & finished status per episode
 """
 
+import asyncio
+import base64
 import logging
 import hashlib
+import json
+import os
 from datetime import datetime
+from pathlib import Path
 from typing import List, Optional, Dict, Any, Tuple
 from xml.etree import ElementTree as ET
 
 import httpx
 import feedparser
 
-from sqlalchemy import select, func, and_, update
+from sqlalchemy import Text, cast, select, func, and_, or_, update
 from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi.concurrency import run_in_threadpool
 
 from app.config import settings
+from app.core.http import http_clients
 from app.models.podcast_orm import (
     PodcastFeed,
     PodcastFeedSubscription,
@@ -35,6 +42,88 @@ logger = logging.getLogger(__name__)
 
 # iTunes Search API
 ITUNES_SEARCH_URL = "https://itunes.apple.com/search"
+# Rows per INSERT ... ON CONFLICT when upserting episodes (11 params per row)
+EPISODE_UPSERT_CHUNK = 1000
+
+# Columns episode lists need (never the transcript)
+EPISODE_LIST_COLUMNS = (
+    PodcastEpisode.id,
+    PodcastEpisode.guid,
+    PodcastEpisode.title,
+    PodcastEpisode.description,
+    PodcastEpisode.audio_url,
+    PodcastEpisode.file_size,
+    PodcastEpisode.duration_seconds,
+    PodcastEpisode.chapters,
+    PodcastEpisode.image_url,
+    PodcastEpisode.published_at,
+    PodcastEpisode.transcript_status,
+)
+
+
+def encode_episode_cursor(published_at: Optional[datetime], episode_id: int) -> str:
+    """Opaque keyset cursor for the episode after which the next page starts."""
+    key = [published_at.isoformat() if published_at else None, episode_id]
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode().rstrip("=")
+
+
+def decode_episode_cursor(cursor: str) -> Tuple[Optional[datetime], int]:
+    """Inverse of ``encode_episode_cursor``; raises ValueError if malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        published_at, episode_id = json.loads(raw)
+        return (
+            datetime.fromisoformat(published_at) if published_at else None,
+            int(episode_id),
+        )
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+
+def _episode_dict(row: Any) -> Dict[str, Any]:
+    """Episode fields of a row selected with EPISODE_LIST_COLUMNS."""
+    return {
+        "id": row.id,
+        "guid": row.guid,
+        "title": row.title,
+        "description": row.description,
+        "audio_url": row.audio_url,
+        "file_size": row.file_size,
+        "duration_seconds": row.duration_seconds,
+        "chapters": row.chapters,
+        "image_url": row.image_url,
+        "published_at": row.published_at.isoformat() if row.published_at else None,
+        "transcript_status": row.transcript_status,
+    }
+
+
+class _RateLimiter:
+    """Caps concurrent upstream calls and spaces out their start times."""
+
+    def __init__(self, max_concurrent: int, min_interval: float):
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._min_interval = min_interval
+        self._lock = asyncio.Lock()
+        self._next_start = 0.0
+
+    async def __aenter__(self):
+        await self._semaphore.acquire()
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            delay = self._next_start - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_start = loop.time() + self._min_interval
+        return self
+
+    async def __aexit__(self, *exc):
+        self._semaphore.release()
+
+
+def _write_json_atomic(path: Path, payload: Any) -> None:
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp, path)
 
 
 class PodcastService:
@@ -42,9 +131,16 @@ class PodcastService:
 
     # --- Cache ---
     _trending_cache: Dict[str, Dict[str, Any]] = {}  # key -> {timestamp, data}
+    _trending_loaded = False  # Persisted snapshots read into _trending_cache
+    _trending_revalidating: Dict[str, asyncio.Task] = {}  # key -> refresh task
     CACHE_TTL = 12 * 3600  # 12 hours
     CACHE_SIZE = 100  # Safe limit for both V1 and V2 APIs (V2 fails at 200)
 
+    # Trending warmup: concurrent upstream requests / min gap between starts
+    WARMUP_CONCURRENCY = 4
+    WARMUP_MIN_INTERVAL = 0.25
+    WARMUP_COLD_DELAY = 60  # First warmup delay when snapshots are missing/stale
+
     # Categories for background refresh (ID only)
     CATEGORY_IDS = [
         "1301",
@@ -95,11 +191,10 @@ class PodcastService:
         }
 
         try:
-            proxies = settings.PROXY_URL if settings.PROXY_URL else None
-            async with httpx.AsyncClient(timeout=15.0, proxy=proxies) as client:
-                response = await client.get(ITUNES_SEARCH_URL, params=params)
-                response.raise_for_status()
-                data = response.json()
+            client = http_clients.get()
+            response = await client.get(ITUNES_SEARCH_URL, params=params, timeout=15.0)
+            response.raise_for_status()
+            data = response.json()
 
             results = []
             rss_urls = []
@@ -226,183 +321,197 @@ class PodcastService:
 
         return chapters if chapters else None
 
-    async def parse_feed(self, rss_url: str) -> Dict[str, Any]:
+    async def _fetch_feed(
+        self, rss_url: str, extra_headers: Optional[Dict[str, str]] = None
+    ) -> httpx.Response:
         """
-        Fetch and parse an RSS feed.
-        Returns feed metadata and list of episodes.
+        GET an RSS feed, retrying with verify=False on SSL/connection errors.
+
+        Returns the response for 2xx and 304 (conditional requests); raises
+        ValueError otherwise.
         """
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36",
             "Accept": "application/rss+xml, application/xml, application/atom+xml, text/xml;q=0.9, */*;q=0.8",
+            **(extra_headers or {}),
         }
+
+        # Attempt 1: Standard compliant request
         try:
-            proxies = settings.PROXY_URL if settings.PROXY_URL else None
-            content = None
+            # Use 45s timeout (safe margin below Nginx default 60s)
+            response = await http_clients.get().get(
+                rss_url, headers=headers, timeout=45.0, follow_redirects=True
+            )
+            if response.status_code != 304:
+                response.raise_for_status()
+            return response
+        except Exception as e:
+            # Check if retryable (SSL, Timeout, or just connection issues common with proxies)
+            is_ssl_error = "ssl" in str(e).lower() or "certificate" in str(e).lower()
+            is_conn_error = isinstance(
+                e,
+                (
+                    httpx.ConnectError,
+                    httpx.ReadTimeout,
+                    httpx.ConnectTimeout,
+                    httpx.NetworkError,
+                ),
+            )
 
-            # Attempt 1: Standard compliant request
-            try:
-                # Use 45s timeout (safe margin below Nginx default 60s)
-                async with httpx.AsyncClient(
-                    timeout=45.0, follow_redirects=True, proxy=proxies
-                ) as client:
-                    response = await client.get(rss_url, headers=headers)
-                    response.raise_for_status()
-                    content = response.text
-            except Exception as e:
-                # Check if retryable (SSL, Timeout, or just connection issues common with proxies)
-                is_ssl_error = (
-                    "ssl" in str(e).lower() or "certificate" in str(e).lower()
-                )
-                is_conn_error = isinstance(
-                    e,
-                    (
-                        httpx.ConnectError,
-                        httpx.ReadTimeout,
-                        httpx.ConnectTimeout,
-                        httpx.NetworkError,
-                    ),
+            # If using proxy, network errors are common, so we retry with verify=False might not help for network,
+            # but sometimes it helps if the proxy itself has issues with strict SSL upstream.
+            # However, usually verify=False is for the target server.
+
+            if not (is_ssl_error or is_conn_error):
+                raise ValueError(f"Failed to fetch feed: {e}")
+
+            logger.warning(
+                f"Standard fetch failed for {rss_url}: {e}. Retrying with verify=False."
+            )
+
+        try:
+            # Attempt 2: Relaxed Security
+            response = await http_clients.get(verify=False).get(
+                rss_url, headers=headers, timeout=45.0, follow_redirects=True
+            )
+            if response.status_code != 304:
+                response.raise_for_status()
+            return response
+        except Exception as e2:
+            logger.error(f"Fallback fetch failed for {rss_url}: {e2}")
+            raise ValueError(f"Failed to fetch feed: {e2}")
+
+    @staticmethod
+    def _cache_validators(response: httpx.Response) -> Dict[str, Optional[str]]:
+        """HTTP validators and body hash to store on PodcastFeed."""
+        return {
+            "etag": response.headers.get("etag"),
+            "last_modified": response.headers.get("last-modified"),
+            "content_hash": hashlib.sha256(response.content).hexdigest(),
+        }
+
+    async def parse_feed(self, rss_url: str) -> Dict[str, Any]:
+        """
+        Fetch and parse an RSS feed.
+        Returns feed metadata, list of episodes and HTTP cache validators.
+        """
+        try:
+            response = await self._fetch_feed(rss_url)
+            parsed = await self._parse_feed_content(response.content)
+            parsed["cache"] = self._cache_validators(response)
+            return parsed
+        except Exception as e:
+            logger.error(f"Feed parsing failed for {rss_url}: {e}")
+            raise ValueError(f"Failed to parse feed: {e}")
+
+    async def _parse_feed_content(self, content: bytes) -> Dict[str, Any]:
+        """Parse an RSS document into feed metadata and a list of episodes."""
+        # Parse feed in threadpool (CPU bound)
+        feed = await run_in_threadpool(feedparser.parse, content)
+
+        # Extract feed metadata
+        feed_data = {
+            "title": feed.feed.get("title", "Unknown Podcast"),
+            "description": feed.feed.get("description") or feed.feed.get("subtitle"),
+            "author": feed.feed.get("author") or feed.feed.get("itunes_author"),
+            "image_url": None,
+            "website_url": feed.feed.get("link"),
+            "category": None,
+        }
+
+        # Try to get image from various sources
+        if hasattr(feed.feed, "image") and feed.feed.image:
+            feed_data["image_url"] = feed.feed.image.get("href")
+        elif hasattr(feed.feed, "itunes_image"):
+            feed_data["image_url"] = feed.feed.itunes_image.get("href")
+
+        # Extract category (iTunes category often nested)
+        if hasattr(feed.feed, "itunes_category"):
+            # Handle single category or list
+            cat = feed.feed.get("itunes_category")
+            if isinstance(cat, dict):
+                feed_data["category"] = cat.get("text")
+            elif isinstance(cat, list) and cat:
+                feed_data["category"] = (
+                    cat[0].get("text") if isinstance(cat[0], dict) else str(cat[0])
                 )
+        elif hasattr(feed.feed, "category"):
+            feed_data["category"] = feed.feed.category
 
-                # If using proxy, network errors are common, so we retry with verify=False might not help for network,
-                # but sometimes it helps if the proxy itself has issues with strict SSL upstream.
-                # However, usually verify=False is for the target server.
+        # Extract episodes
 
-                if is_ssl_error or is_conn_error:
-                    logger.warning(
-                        f"Standard fetch failed for {rss_url}: {e}. Retrying with verify=False."
-                    )
+        episodes = []
+        for entry in feed.entries:
+            # Find audio enclosure
+            audio_url = None
+            file_size = None
+
+            for link in entry.get("links", []):
+                if (
+                    link.get("type", "").startswith("audio/")
+                    or link.get("rel") == "enclosure"
+                ):
+                    audio_url = link.get("href")
+                    # Try to get length
                     try:
-                        # Attempt 2: Relaxed Security
-                        async with httpx.AsyncClient(
-                            timeout=45.0,
-                            follow_redirects=True,
-                            verify=False,
-                            proxy=proxies,
-                        ) as client:
-                            response = await client.get(rss_url, headers=headers)
-                            response.raise_for_status()
-                            content = response.text
-                    except Exception as e2:
-                        logger.error(f"Fallback fetch failed for {rss_url}: {e2}")
-                        raise ValueError(f"Failed to fetch feed: {e2}")
-                else:
-                    raise ValueError(f"Failed to fetch feed: {e}")
-
-            # Parse feed in threadpool (CPU bound)
-            feed = await run_in_threadpool(feedparser.parse, content)
-
-            # Extract feed metadata
-            feed_data = {
-                "title": feed.feed.get("title", "Unknown Podcast"),
-                "description": feed.feed.get("description")
-                or feed.feed.get("subtitle"),
-                "author": feed.feed.get("author") or feed.feed.get("itunes_author"),
-                "image_url": None,
-                "website_url": feed.feed.get("link"),
-                "category": None,
-            }
+                        file_size = (
+                            int(link.get("length", 0)) if link.get("length") else None
+                        )
+                    except (ValueError, TypeError):
+                        pass
+                    break
 
-            # Try to get image from various sources
-            if hasattr(feed.feed, "image") and feed.feed.image:
-                feed_data["image_url"] = feed.feed.image.get("href")
-            elif hasattr(feed.feed, "itunes_image"):
-                feed_data["image_url"] = feed.feed.itunes_image.get("href")
-
-            # Extract category (iTunes category often nested)
-            if hasattr(feed.feed, "itunes_category"):
-                # Handle single category or list
-                cat = feed.feed.get("itunes_category")
-                if isinstance(cat, dict):
-                    feed_data["category"] = cat.get("text")
-                elif isinstance(cat, list) and cat:
-                    feed_data["category"] = (
-                        cat[0].get("text") if isinstance(cat[0], dict) else str(cat[0])
-                    )
-            elif hasattr(feed.feed, "category"):
-                feed_data["category"] = feed.feed.category
-
-            # Extract episodes
-
-            episodes = []
-            for entry in feed.entries:
-                # Find audio enclosure
-                audio_url = None
-                file_size = None
-
-                for link in entry.get("links", []):
-                    if (
-                        link.get("type", "").startswith("audio/")
-                        or link.get("rel") == "enclosure"
-                    ):
-                        audio_url = link.get("href")
+            # Also check enclosures list
+            if not audio_url:
+                for enc in entry.get("enclosures", []):
+                    if enc.get("type", "").startswith("audio/"):
+                        audio_url = enc.get("href")
                         # Try to get length
                         try:
                             file_size = (
-                                int(link.get("length", 0))
-                                if link.get("length")
-                                else None
+                                int(enc.get("length", 0)) if enc.get("length") else None
                             )
                         except (ValueError, TypeError):
                             pass
                         break
 
-                # Also check enclosures list
-                if not audio_url:
-                    for enc in entry.get("enclosures", []):
-                        if enc.get("type", "").startswith("audio/"):
-                            audio_url = enc.get("href")
-                            # Try to get length
-                            try:
-                                file_size = (
-                                    int(enc.get("length", 0))
-                                    if enc.get("length")
-                                    else None
-                                )
-                            except (ValueError, TypeError):
-                                pass
-                            break
-
-                if not audio_url:
-                    continue  # Skip episodes without audio
-
-                # Parse published date
-                published_at = None
-                if entry.get("published_parsed"):
-                    try:
-                        published_at = datetime(*entry.published_parsed[:6])
-                    except Exception:
-                        pass
-
-                # Generate stable GUID
-                guid = (
-                    entry.get("id")
-                    or entry.get("guid")
-                    or hashlib.md5(audio_url.encode("utf-8")).hexdigest()
-                )
+            if not audio_url:
+                continue  # Skip episodes without audio
 
-                episodes.append(
-                    {
-                        "guid": guid,
-                        "title": entry.get("title", "Untitled Episode"),
-                        "description": entry.get("summary") or entry.get("description"),
-                        "audio_url": audio_url,
-                        "file_size": file_size,
-                        "duration_seconds": self._parse_duration(
-                            entry.get("itunes_duration")
-                        ),
-                        "image_url": entry.get("itunes_image", {}).get("href")
-                        if isinstance(entry.get("itunes_image"), dict)
-                        else None,
-                        "published_at": published_at,
-                        "chapters": self._parse_chapters(entry),
-                    }
-                )
+            # Parse published date
+            published_at = None
+            if entry.get("published_parsed"):
+                try:
+                    published_at = datetime(*entry.published_parsed[:6])
+                except Exception:
+                    pass
+
+            # Generate stable GUID
+            guid = (
+                entry.get("id")
+                or entry.get("guid")
+                or hashlib.md5(audio_url.encode("utf-8")).hexdigest()
+            )
 
-            return {"feed": feed_data, "episodes": episodes}
+            episodes.append(
+                {
+                    "guid": guid,
+                    "title": entry.get("title", "Untitled Episode"),
+                    "description": entry.get("summary") or entry.get("description"),
+                    "audio_url": audio_url,
+                    "file_size": file_size,
+                    "duration_seconds": self._parse_duration(
+                        entry.get("itunes_duration")
+                    ),
+                    "image_url": entry.get("itunes_image", {}).get("href")
+                    if isinstance(entry.get("itunes_image"), dict)
+                    else None,
+                    "published_at": published_at,
+                    "chapters": self._parse_chapters(entry),
+                }
+            )
 
-        except Exception as e:
-            logger.error(f"Feed parsing failed for {rss_url}: {e}")
-            raise ValueError(f"Failed to parse feed: {e}")
+        return {"feed": feed_data, "episodes": episodes}
 
     # --- Subscription Management (Shared Feed Model) ---
 
@@ -431,24 +540,13 @@ class PodcastService:
                 website_url=feed_data["website_url"],
                 category=feed_data["category"],
                 last_fetched_at=datetime.utcnow(),
+                **parsed["cache"],
             )
             db.add(feed)
             await db.flush()  # Get feed.id
 
             # Add episodes
-            for ep_data in episodes_data:
-                episode = PodcastEpisode(
-                    feed_id=feed.id,
-                    guid=ep_data["guid"],
-                    title=ep_data["title"],
-                    description=ep_data["description"],
-                    audio_url=ep_data["audio_url"],
-                    file_size=ep_data.get("file_size"),
-                    duration_seconds=ep_data["duration_seconds"],
-                    image_url=ep_data["image_url"],
-                    published_at=ep_data["published_at"],
-                )
-                db.add(episode)
+            await self._upsert_episodes(db, feed.id, episodes_data)
 
         return feed
 
@@ -518,25 +616,23 @@ class PodcastService:
     ) -> List[Dict[str, Any]]:
         """
         Get all feeds that user is subscribed to, with episode counts.
-        Optimized to use a single query instead of N+1.
+        Counts are the per-feed cache kept by refreshes, so no episode scan.
         """
         stmt = (
-            select(PodcastFeed, func.count(PodcastEpisode.id).label("episode_count"))
+            select(PodcastFeed)
             .join(
                 PodcastFeedSubscription,
                 PodcastFeedSubscription.feed_id == PodcastFeed.id,
             )
-            .outerjoin(PodcastEpisode, PodcastEpisode.feed_id == PodcastFeed.id)
             .where(PodcastFeedSubscription.user_id == user_id)
-            .group_by(PodcastFeed.id)
             .order_by(PodcastFeed.title)
         )
 
         result = await db.execute(stmt)
-        rows = result.all()
+        feeds = result.scalars().all()
 
         subscriptions = []
-        for feed, count in rows:
+        for feed in feeds:
             # Create a dict merging feed data with episode count
             feed_dict = {
                 "id": feed.id,
@@ -545,7 +641,7 @@ class PodcastService:
                 "author": feed.author,
                 "image_url": feed.image_url,
                 "rss_url": feed.rss_url,
-                "episode_count": count,
+                "episode_count": feed.episode_count,
             }
             subscriptions.append(feed_dict)
 
@@ -563,7 +659,14 @@ class PodcastService:
             return []
 
         stmt = (
-            select(PodcastEpisode, PodcastFeed, UserEpisodeState)
+            select(
+                *EPISODE_LIST_COLUMNS,
+                PodcastFeed.id.label("feed_id"),
+                PodcastFeed.title.label("feed_title"),
+                PodcastFeed.image_url.label("feed_image_url"),
+                UserEpisodeState.current_position_seconds,
+                UserEpisodeState.is_finished,
+            )
             .join(PodcastFeed, PodcastEpisode.feed_id == PodcastFeed.id)
             .outerjoin(
                 UserEpisodeState,
@@ -579,35 +682,20 @@ class PodcastService:
         rows = result.all()
 
         episodes = []
-        for episode, feed, state in rows:
+        for row in rows:
+            position = row.current_position_seconds or 0.0
             ep_dict = {
                 "episode": {
-                    "id": episode.id,
-                    "guid": episode.guid,
-                    "title": episode.title,
-                    "description": episode.description,
-                    "audio_url": episode.audio_url,
-                    "file_size": episode.file_size,
-                    "duration_seconds": episode.duration_seconds,
-                    "chapters": episode.chapters,
-                    "image_url": episode.image_url,
-                    "published_at": episode.published_at.isoformat()
-                    if episode.published_at
-                    else None,
-                    "transcript_status": episode.transcript_status,
-                    "current_position": state.current_position_seconds
-                    if state
-                    else 0.0,
-                    "is_finished": state.is_finished if state else False,
+                    **_episode_dict(row),
+                    "current_position": position,
+                    "is_finished": bool(row.is_finished),
                 },
                 "feed": {
-                    "id": feed.id,
-                    "title": feed.title,
-                    "image_url": feed.image_url,
+                    "id": row.feed_id,
+                    "title": row.feed_title,
+                    "image_url": row.feed_image_url,
                 },
-                "last_position_seconds": state.current_position_seconds
-                if state
-                else 0.0,
+                "last_position_seconds": position,
             }
             episodes.append(ep_dict)
 
@@ -620,11 +708,19 @@ class PodcastService:
         feed_id: int,
         limit: int = 50,
         offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Get a feed with its episodes (paginated).
         Returns feed details, subscription status, and episodes with user state.
+
+        Episodes are newest first (undated ones last). Pass the returned
+        ``next_cursor`` to get the next page; ``offset`` still works but
+        makes the database skip every earlier row. Raises ValueError for a
+        malformed cursor.
         """
+        after = decode_episode_cursor(cursor) if cursor else None
+
         # Check if user is subscribed
         sub_stmt = select(PodcastFeedSubscription).where(
             PodcastFeedSubscription.feed_id == feed_id,
@@ -641,50 +737,20 @@ class PodcastService:
         if not feed:
             return None
 
-        # Get total episode count
-        count_stmt = select(func.count(PodcastEpisode.id)).where(
-            PodcastEpisode.feed_id == feed_id
-        )
-        count_result = await db.execute(count_stmt)
-        total_episodes = count_result.scalar_one()
-
-        # Get episodes with user states (Paginated)
-        ep_stmt = (
-            select(PodcastEpisode, UserEpisodeState)
-            .outerjoin(
-                UserEpisodeState,
-                and_(
-                    UserEpisodeState.episode_id == PodcastEpisode.id,
-                    UserEpisodeState.user_id == user_id,
-                ),
-            )
-            .where(PodcastEpisode.feed_id == feed_id)
-            .order_by(PodcastEpisode.published_at.desc())
-            .limit(limit)
-            .offset(offset)
-        )
-        ep_result = await db.execute(ep_stmt)
-        rows = ep_result.all()
+        # Get episodes with user states (one extra row tells if there is more)
+        rows = await self._episode_page(db, user_id, feed_id, limit + 1, offset, after)
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_episode_cursor(rows[-1].published_at, rows[-1].id)
 
         episodes = []
-        for episode, state in rows:
+        for row in rows:
             ep_dict = {
-                "id": episode.id,
-                "guid": episode.guid,
-                "title": episode.title,
-                "description": episode.description,
-                "audio_url": episode.audio_url,
-                "file_size": episode.file_size,
-                "duration_seconds": episode.duration_seconds,
-                "chapters": episode.chapters,
-                "image_url": episode.image_url,
-                "published_at": episode.published_at.isoformat()
-                if episode.published_at
-                else None,
-                "transcript_status": episode.transcript_status,
+                **_episode_dict(row),
                 # User state
-                "current_position": state.current_position_seconds if state else 0.0,
-                "is_finished": state.is_finished if state else False,
+                "current_position": row.current_position_seconds or 0.0,
+                "is_finished": bool(row.is_finished),
             }
             episodes.append(ep_dict)
 
@@ -692,14 +758,86 @@ class PodcastService:
             "feed": feed,
             "is_subscribed": is_subscribed,
             "episodes": episodes,
-            "total_episodes": total_episodes,
+            # Cached count maintained by refreshes (no COUNT(*) per page)
+            "total_episodes": feed.episode_count,
+            "next_cursor": next_cursor,
         }
 
+    async def _episode_page(
+        self,
+        db: AsyncSession,
+        user_id: str,
+        feed_id: int,
+        limit: int,
+        offset: int = 0,
+        after: Optional[Tuple[Optional[datetime], int]] = None,
+    ) -> List[Any]:
+        """
+        Up to ``limit`` episode rows of a feed, ordered by (published_at, id)
+        descending with undated episodes last, starting after the ``after``
+        key (keyset) or skipping ``offset`` rows.
+
+        Dated and undated episodes are read by separate range scans on
+        (feed_id, published_at, id), since SQLite and Postgres disagree on
+        where NULLs sort and SQLite indexes cannot say NULLS LAST.
+        """
+        ep = PodcastEpisode
+        stmt = (
+            select(
+                *EPISODE_LIST_COLUMNS,
+                UserEpisodeState.current_position_seconds,
+                UserEpisodeState.is_finished,
+            )
+            .outerjoin(
+                UserEpisodeState,
+                and_(
+                    UserEpisodeState.episode_id == ep.id,
+                    UserEpisodeState.user_id == user_id,
+                ),
+            )
+            .where(ep.feed_id == feed_id)
+        )
+
+        if offset and after is None:
+            order = (ep.published_at.desc().nulls_last(), ep.id.desc())
+            result = await db.execute(stmt.order_by(*order).limit(limit).offset(offset))
+            return list(result.all())
+
+        rows: List[Any] = []
+        after_date, after_id = after or (None, None)
+        if after is None or after_date is not None:
+            dated = stmt.where(ep.published_at.is_not(None))
+            if after is not None:
+                dated = dated.where(
+                    or_(
+                        ep.published_at < after_date,
+                        and_(ep.published_at == after_date, ep.id < after_id),
+                    )
+                )
+            result = await db.execute(
+                dated.order_by(ep.published_at.desc(), ep.id.desc()).limit(limit)
+            )
+            rows = list(result.all())
+
+        if len(rows) < limit:
+            undated = stmt.where(ep.published_at.is_(None))
+            if after_date is None and after_id is not None:
+                undated = undated.where(ep.id < after_id)
+            result = await db.execute(
+                undated.order_by(ep.id.desc()).limit(limit - len(rows))
+            )
+            rows.extend(result.all())
+        return rows
+
     # --- Trending / Top Charts ---
 
     async def start_cache_refresher(self, initial_delay: int = 0):
         """Background task to refresh trending cache every 12 hours."""
-        import asyncio
+        await self._load_persisted_trending()
+
+        # Snapshots survive restarts; only warm early if some are missing/stale
+        if initial_delay > 0 and not self._trending_cache_complete():
+            initial_delay = min(initial_delay, self.WARMUP_COLD_DELAY)
 
         if initial_delay > 0:
             logger.info(
@@ -721,20 +859,45 @@ class PodcastService:
             await asyncio.sleep(12 * 3600)
 
     async def refresh_trending_cache(self):
-        """Force refresh of all trending categories."""
-        # Global
-        await self._fetch_trending_upstream(
-            category_id=None, limit=self.CACHE_SIZE, force_refresh=True
+        """
+        Force refresh of the global chart and all trending categories.
+
+        Charts are fetched concurrently under a rate limiter, then the feed
+        URL lookups of all charts are merged so each podcast ID is resolved
+        once instead of once per chart it appears in.
+        """
+        client = http_clients.get(verify=False)
+        limiter = _RateLimiter(self.WARMUP_CONCURRENCY, self.WARMUP_MIN_INTERVAL)
+        category_ids = [None, *self.CATEGORY_IDS]
+
+        async def fetch(category_id):
+            async with limiter:
+                return await self._fetch_chart(client, category_id, self.CACHE_SIZE)
+
+        charts = await asyncio.gather(
+            *(fetch(c) for c in category_ids), return_exceptions=True
+        )
+
+        fetched = {}
+        for category_id, chart in zip(category_ids, charts):
+            key = self._trending_key(category_id)
+            if isinstance(chart, BaseException):
+                logger.error(f"Trending warmup failed for {key}: {chart}")
+            else:
+                fetched[key] = chart
+
+        ids = sorted({r["itunes_id"] for chart in fetched.values() for r in chart})
+        feed_urls = await self._lookup_feed_urls(client, ids, limiter)
+
+        now = datetime.utcnow()
+        for key, chart in fetched.items():
+            self._apply_feed_urls(chart, feed_urls)
+            await self._store_trending(key, chart, now)
+
+        logger.info(
+            f"Warmed {len(fetched)}/{len(category_ids)} trending charts "
+            f"({len(ids)} unique podcasts looked up)"
         )
-        # Categories
-        for cat_id in self.CATEGORY_IDS:
-            # Add a small delay to be nice to the API
-            import asyncio
-
-            await asyncio.sleep(1.0)
-            await self._fetch_trending_upstream(
-                category_id=cat_id, limit=self.CACHE_SIZE, force_refresh=True
-            )
 
     async def _fetch_trending_upstream(
         self,
@@ -743,182 +906,274 @@ class PodcastService:
         force_refresh: bool = False,
     ) -> List[Dict[str, Any]]:
         """
-        Fetch trending podcasts from upstream API (V1 for Genre, V2 for Top).
-        Handles caching and slices results if larger cache exists.
+        Trending podcasts for a category, served stale-while-revalidate.
+
+        A cached chart with enough items is returned immediately, even past
+        CACHE_TTL; a stale one is refreshed in the background. Only a missing
+        (or too short) chart waits on upstream (V1 for Genre, V2 for Top).
         Returns raw list of results (without subscription status).
         """
         # Cache key is just the category (we store the 'max' version)
-        cache_key = str(category_id) if category_id else "global"
-        now = datetime.utcnow()
+        cache_key = self._trending_key(category_id)
+        await self._load_persisted_trending()
+        entry = self._trending_cache.get(cache_key)
 
-        # Check cache (if not forcing refresh)
-        if not force_refresh and cache_key in self._trending_cache:
-            entry = self._trending_cache[cache_key]
-            # If cache is valid AND has enough items
-            if (now - entry["timestamp"]).total_seconds() < self.CACHE_TTL:
-                cached_data = entry["data"]
-                if len(cached_data) >= limit:
-                    return cached_data[:limit]
-                # If we need more than cached, strictly speaking we should fetch,
-                # but falling back to what we have might be acceptable behavior in some cases.
-                # For now, let's fetch upstream if we need more than we have.
-
-        proxies = settings.PROXY_URL if settings.PROXY_URL else None
-        results = []
+        if not force_refresh and entry and len(entry["data"]) >= limit:
+            age = (datetime.utcnow() - entry["timestamp"]).total_seconds()
+            if age >= self.CACHE_TTL:
+                self._revalidate_in_background(category_id)
+            return entry["data"][:limit]
 
         try:
-            if category_id and str(category_id).isdigit():
-                # Use V1 API for Genre Filtering (V2 param is unreliable)
-                # https://itunes.apple.com/us/rss/toppodcasts/limit=X/genre=Y/json
-                url = f"https://itunes.apple.com/us/rss/toppodcasts/limit={limit}/genre={category_id}/json"
-
-                async with httpx.AsyncClient(
-                    timeout=15.0, proxy=proxies, follow_redirects=True, verify=False
-                ) as client:
-                    response = await client.get(url)
-                    response.raise_for_status()
-                    data = response.json()
-
-                # Parse V1 Response
-                feed = data.get("feed", {})
-                entries = feed.get("entry", [])
-
-                # Handle single entry edge case (dict instead of list)
-                if isinstance(entries, dict):
-                    entries = [entries]
-
-                for entry in entries:
-                    try:
-                        # Safe extraction with defaults
-                        im_name = entry.get("im:name", {})
-                        title = (
-                            im_name.get("label")
-                            if isinstance(im_name, dict)
-                            else im_name
+            return await self._refresh_trending_chart(category_id, limit)
+        except Exception as e:
+            logger.error(f"Trending fetch failed: {e}")
+            # Fall back to whatever we have, even if stale or smaller
+            if entry:
+                return entry["data"][:limit]
+            return []
+
+    async def _refresh_trending_chart(
+        self, category_id: Optional[str], limit: int
+    ) -> List[Dict[str, Any]]:
+        """Fetch one chart, resolve its feed URLs, and cache it."""
+        client = http_clients.get(verify=False)
+        results = await self._fetch_chart(client, category_id, limit)
+        feed_urls = await self._lookup_feed_urls(
+            client, [r["itunes_id"] for r in results]
+        )
+        self._apply_feed_urls(results, feed_urls)
+
+        # Only update cache if we fetched a significant amount (e.g. >= 20)
+        # This prevents a small ad-hoc query from overwriting a large background cache
+        if limit >= 20:
+            await self._store_trending(
+                self._trending_key(category_id), results, datetime.utcnow()
+            )
+        return results
+
+    def _revalidate_in_background(self, category_id: Optional[str]) -> None:
+        """Refresh a stale chart without making the caller wait (deduplicated)."""
+        key = self._trending_key(category_id)
+        if key in self._trending_revalidating:
+            return
+
+        async def revalidate():
+            try:
+                await self._refresh_trending_chart(category_id, self.CACHE_SIZE)
+            except Exception as e:
+                logger.warning(f"Background trending refresh failed for {key}: {e}")
+
+        task = asyncio.create_task(revalidate())
+        self._trending_revalidating[key] = task
+        task.add_done_callback(lambda _: self._trending_revalidating.pop(key, None))
+
+    async def _fetch_chart(
+        self, client: httpx.AsyncClient, category_id: Optional[str], limit: int
+    ) -> List[Dict[str, Any]]:
+        """Fetch a top chart; results carry itunes_id but no rss_url yet."""
+        results = []
+
+        if category_id and str(category_id).isdigit():
+            # Use V1 API for Genre Filtering (V2 param is unreliable)
+            # https://itunes.apple.com/us/rss/toppodcasts/limit=X/genre=Y/json
+            url = f"https://itunes.apple.com/us/rss/toppodcasts/limit={limit}/genre={category_id}/json"
+
+            response = await client.get(url, timeout=15.0, follow_redirects=True)
+            response.raise_for_status()
+            data = response.json()
+
+            # Parse V1 Response
+            feed = data.get("feed", {})
+            entries = feed.get("entry", [])
+
+            # Handle single entry edge case (dict instead of list)
+            if isinstance(entries, dict):
+                entries = [entries]
+
+            for entry in entries:
+                try:
+                    # Safe extraction with defaults
+                    im_name = entry.get("im:name", {})
+                    title = (
+                        im_name.get("label") if isinstance(im_name, dict) else im_name
+                    )
+
+                    im_artist = entry.get("im:artist", {})
+                    author = (
+                        im_artist.get("label")
+                        if isinstance(im_artist, dict)
+                        else im_artist
+                    )
+
+                    # Images: get the last one (largest)
+                    images = entry.get("im:image", [])
+                    artwork_url = None
+                    if images and isinstance(images, list):
+                        last_img = images[-1]
+                        artwork_url = (
+                            last_img.get("label")
+                            if isinstance(last_img, dict)
+                            else last_img
                         )
 
-                        im_artist = entry.get("im:artist", {})
-                        author = (
-                            im_artist.get("label")
-                            if isinstance(im_artist, dict)
-                            else im_artist
+                    # ID
+                    id_node = entry.get("id", {})
+                    itunes_id = id_node.get("attributes", {}).get("im:id")
+
+                    # Genre
+                    cat_node = entry.get("category", {})
+                    genre = cat_node.get("attributes", {}).get("label")
+
+                    if itunes_id:
+                        results.append(
+                            {
+                                "itunes_id": itunes_id,
+                                "title": title,
+                                "author": author,
+                                "rss_url": None,  # V1 doesn't provide RSS URL
+                                "artwork_url": artwork_url,
+                                "genre": genre,
+                                "is_subscribed": False,
+                            }
                         )
+                except Exception as e:
+                    logger.warning(f"Failed to parse V1 entry: {e}")
+                    continue
 
-                        # Images: get the last one (largest)
-                        images = entry.get("im:image", [])
-                        artwork_url = None
-                        if images and isinstance(images, list):
-                            last_img = images[-1]
-                            artwork_url = (
-                                last_img.get("label")
-                                if isinstance(last_img, dict)
-                                else last_img
-                            )
+        else:
+            # Use V2 API for Global Top Charts
+            # https://rss.applemarketingtools.com/api/v2/us/podcasts/top/{limit}/podcasts.json
+            url = f"https://rss.applemarketingtools.com/api/v2/us/podcasts/top/{limit}/podcasts.json"
 
-                        # ID
-                        id_node = entry.get("id", {})
-                        itunes_id = id_node.get("attributes", {}).get("im:id")
+            response = await client.get(url, timeout=10.0, follow_redirects=True)
+            response.raise_for_status()
+            data = response.json()
 
-                        # Genre
-                        cat_node = entry.get("category", {})
-                        genre = cat_node.get("attributes", {}).get("label")
+            feed = data.get("feed", {})
+            for item in feed.get("results", []):
+                if not item.get("id"):
+                    continue
+                genres = item.get("genres", [])
+                primary_genre = genres[0].get("name") if genres else None
 
-                        if itunes_id:
-                            results.append(
-                                {
-                                    "itunes_id": itunes_id,
-                                    "title": title,
-                                    "author": author,
-                                    "rss_url": None,  # V1 doesn't provide RSS URL
-                                    "artwork_url": artwork_url,
-                                    "genre": genre,
-                                    "is_subscribed": False,
-                                }
-                            )
-                    except Exception as e:
-                        logger.warning(f"Failed to parse V1 entry: {e}")
-                        continue
+                results.append(
+                    {
+                        "itunes_id": item.get("id"),
+                        "title": item.get("name"),
+                        "author": item.get("artistName"),
+                        "rss_url": None,
+                        "artwork_url": item.get("artworkUrl100"),
+                        "genre": primary_genre,
+                        "is_subscribed": False,
+                    }
+                )
+
+        return results
+
+    async def _lookup_feed_urls(
+        self,
+        client: httpx.AsyncClient,
+        ids: List[str],
+        limiter: Optional[_RateLimiter] = None,
+    ) -> Dict[str, str]:
+        """
+        Resolve iTunes IDs to feed URLs via the lookup API.
+
+        Both V1 and V2 Top Charts APIs often omit the direct RSS feed URL, so
+        we look up by ID to get the feedUrl. Failed batches are skipped.
+        """
+        ids = list(dict.fromkeys(ids))
+        limiter = limiter or _RateLimiter(self.WARMUP_CONCURRENCY, 0)
+        # iTunes allows ~200 IDs per request, but let's be safe with 150
+        chunk_size = 150
+
+        async def lookup(chunk: List[str]) -> Dict[str, str]:
+            lookup_url = f"https://itunes.apple.com/lookup?id={','.join(chunk)}"
+            async with limiter:
+                response = await client.get(lookup_url, timeout=20.0)
+            if response.status_code != 200:
+                return {}
+            return {
+                str(item.get("collectionId")): item["feedUrl"]
+                for item in response.json().get("results", [])
+                if item.get("feedUrl")
+            }
+
+        batches = await asyncio.gather(
+            *(lookup(ids[i : i + chunk_size]) for i in range(0, len(ids), chunk_size)),
+            return_exceptions=True,
+        )
 
+        id_map: Dict[str, str] = {}
+        for batch in batches:
+            if isinstance(batch, BaseException):
+                logger.warning(f"Failed to lookup feed URLs batch: {batch}")
             else:
-                # Use V2 API for Global Top Charts
-                # https://rss.applemarketingtools.com/api/v2/us/podcasts/top/{limit}/podcasts.json
-                url = f"https://rss.applemarketingtools.com/api/v2/us/podcasts/top/{limit}/podcasts.json"
-
-                async with httpx.AsyncClient(
-                    timeout=10.0, proxy=proxies, follow_redirects=True, verify=False
-                ) as client:
-                    response = await client.get(url)
-                    response.raise_for_status()
-                    data = response.json()
-
-                feed = data.get("feed", {})
-                for item in feed.get("results", []):
-                    genres = item.get("genres", [])
-                    primary_genre = genres[0].get("name") if genres else None
-
-                    results.append(
-                        {
-                            "itunes_id": item.get("id"),
-                            "title": item.get("name"),
-                            "author": item.get("artistName"),
-                            "rss_url": None,
-                            "artwork_url": item.get("artworkUrl100"),
-                            "genre": primary_genre,
-                            "is_subscribed": False,
-                        }
-                    )
+                id_map.update(batch)
+        return id_map
 
-            # Common: Lookup RSS URLs for all results
-            # Both V1 and V2 Top Charts APIs often omit the direct RSS feed URL.
-            # We must lookup by ID to get the feedUrl.
-            if results:
-                ids = [r["itunes_id"] for r in results if r.get("itunes_id")]
-                if ids:
-                    # Batch lookup (iTunes allows ~200 IDs per request, but let's be safe with 150)
-                    chunk_size = 150
-                    id_map = {}
-
-                    for i in range(0, len(ids), chunk_size):
-                        chunk = ids[i : i + chunk_size]
-                        ids_str = ",".join(chunk)
-                        lookup_url = f"https://itunes.apple.com/lookup?id={ids_str}"
+    @staticmethod
+    def _apply_feed_urls(
+        results: List[Dict[str, Any]], feed_urls: Dict[str, str]
+    ) -> None:
+        for r in results:
+            if r["itunes_id"] in feed_urls:
+                r["rss_url"] = feed_urls[r["itunes_id"]]
 
-                        try:
-                            async with httpx.AsyncClient(
-                                timeout=20.0, proxy=proxies, verify=False
-                            ) as client:
-                                l_res = await client.get(lookup_url)
-                                if l_res.status_code == 200:
-                                    l_data = l_res.json()
-                                    # Merge into main map
-                                    for item in l_data.get("results", []):
-                                        c_id = str(item.get("collectionId"))
-                                        if item.get("feedUrl"):
-                                            id_map[c_id] = item.get("feedUrl")
-                        except Exception as e:
-                            logger.warning(f"Failed to lookup feed URLs batch {i}: {e}")
-
-                    # Update results from map
-                    for r in results:
-                        if r.get("itunes_id") in id_map:
-                            r["rss_url"] = id_map[r.get("itunes_id")]
-
-            # Update Cache
-            # Only update cache if we fetched a significant amount (e.g. >= 20)
-            # This prevents a small ad-hoc query from overwriting a large background cache
-            if limit >= 20:
-                self._trending_cache[cache_key] = {"timestamp": now, "data": results}
+    # --- Trending persistence ---
 
-            return results
+    @staticmethod
+    def _trending_key(category_id: Optional[str]) -> str:
+        return str(category_id) if category_id else "global"
 
-        except Exception as e:
-            logger.error(f"Trending fetch failed: {e}")
-            # Return stale cache if available?
-            # Return slice of cache if it exists, even if stale or smaller?
-            if cache_key in self._trending_cache:
-                cached = self._trending_cache[cache_key]["data"]
-                return cached[:limit]
-            return []
+    def _trending_cache_complete(self) -> bool:
+        """True if every chart has a snapshot younger than CACHE_TTL."""
+        now = datetime.utcnow()
+        keys = [self._trending_key(c) for c in [None, *self.CATEGORY_IDS]]
+        return all(
+            key in self._trending_cache
+            and (now - self._trending_cache[key]["timestamp"]).total_seconds()
+            < self.CACHE_TTL
+            for key in keys
+        )
+
+    async def _store_trending(
+        self, key: str, data: List[Dict[str, Any]], timestamp: datetime
+    ) -> None:
+        """Update the in-memory chart and persist it for the next restart."""
+        self._trending_cache[key] = {"timestamp": timestamp, "data": data}
+        path = settings.podcast_trending_dir / f"{key}.json"
+        payload = {"timestamp": timestamp.isoformat(), "data": data}
+        try:
+            await asyncio.to_thread(_write_json_atomic, path, payload)
+        except OSError as e:
+            logger.warning(f"Failed to persist trending chart {key}: {e}")
+
+    async def _load_persisted_trending(self) -> None:
+        """Load chart snapshots saved by a previous run (once per process)."""
+        if self._trending_loaded:
+            return
+        PodcastService._trending_loaded = True
+
+        def read_all() -> Dict[str, Dict[str, Any]]:
+            entries = {}
+            for path in settings.podcast_trending_dir.glob("*.json"):
+                try:
+                    payload = json.loads(path.read_text(encoding="utf-8"))
+                    entries[path.stem] = {
+                        "timestamp": datetime.fromisoformat(payload["timestamp"]),
+                        "data": payload["data"],
+                    }
+                except (OSError, ValueError, KeyError) as e:
+                    logger.warning(f"Ignoring unreadable trending snapshot {path}: {e}")
+            return entries
+
+        entries = await asyncio.to_thread(read_all)
+        for key, entry in entries.items():
+            self._trending_cache.setdefault(key, entry)
+        if entries:
+            logger.info(f"Loaded {len(entries)} persisted trending charts")
 
     async def get_trending_podcasts(
         self,
@@ -986,53 +1241,136 @@ class PodcastService:
         if not feed:
             return 0
 
-        # Parse the feed again
-        parsed = await self.parse_feed(feed.rss_url)
-        episodes_data = parsed["episodes"]
+        return await self.refresh_feed_content(db, feed)
 
-        # Get existing episodes to update
-        ep_stmt = select(PodcastEpisode).where(PodcastEpisode.feed_id == feed_id)
-        ep_result = await db.execute(ep_stmt)
-        existing_episodes = {ep.guid: ep for ep in ep_result.scalars().all()}
+    async def refresh_feed_content(self, db: AsyncSession, feed: PodcastFeed) -> int:
+        """
+        Conditionally re-fetch a feed and upsert its episodes.
 
-        # Process episodes
-        new_count = 0
-        for ep_data in episodes_data:
-            guid = ep_data["guid"]
-            if guid in existing_episodes:
-                # Update existing episode
-                episode = existing_episodes[guid]
-                # Update fields that might have changed or were missing
-                episode.file_size = ep_data.get("file_size")
-                episode.chapters = ep_data.get("chapters")
-                episode.duration_seconds = ep_data["duration_seconds"]
-                if ep_data.get("image_url"):
-                    episode.image_url = ep_data["image_url"]
-                # We typically don't update title/description to avoid overwriting user edits
-                # (if we had them), but for now sticking to source is fine.
-                # episode.title = ep_data["title"]
-                # episode.description = ep_data["description"]
-            else:
-                # Create new episode
-                episode = PodcastEpisode(
-                    feed_id=feed.id,
-                    guid=guid,
-                    title=ep_data["title"],
-                    description=ep_data["description"],
-                    audio_url=ep_data["audio_url"],
-                    file_size=ep_data.get("file_size"),
-                    duration_seconds=ep_data["duration_seconds"],
-                    chapters=ep_data.get("chapters"),
-                    image_url=ep_data["image_url"],
-                    published_at=ep_data["published_at"],
-                )
-                db.add(episode)
-                new_count += 1
+        Sends If-None-Match / If-Modified-Since from the last fetch; a 304 or
+        an unchanged body hash skips parsing entirely. Returns the number of
+        new episodes added.
+        """
+        conditional_headers = {}
+        if feed.etag:
+            conditional_headers["If-None-Match"] = feed.etag
+        if feed.last_modified:
+            conditional_headers["If-Modified-Since"] = feed.last_modified
 
+        response = await self._fetch_feed(feed.rss_url, conditional_headers)
         feed.last_fetched_at = datetime.utcnow()
+
+        if response.status_code == 304:
+            logger.debug(f"Feed not modified (304): {feed.rss_url}")
+            await db.commit()
+            return 0
+
+        validators = self._cache_validators(response)
+        feed.etag = validators["etag"]
+        feed.last_modified = validators["last_modified"]
+
+        if validators["content_hash"] == feed.content_hash:
+            logger.debug(f"Feed body unchanged: {feed.rss_url}")
+            await db.commit()
+            return 0
+
+        try:
+            parsed = await self._parse_feed_content(response.content)
+        except Exception as e:
+            logger.error(f"Feed parsing failed for {feed.rss_url}: {e}")
+            raise ValueError(f"Failed to parse feed: {e}")
+
+        new_count = await self._upsert_episodes(db, feed.id, parsed["episodes"])
+
+        # Only remember the hash once its episodes are stored
+        feed.content_hash = validators["content_hash"]
         await db.commit()
         return new_count
 
+    async def _upsert_episodes(
+        self, db: AsyncSession, feed_id: int, episodes_data: List[Dict[str, Any]]
+    ) -> int:
+        """
+        Insert new episodes and update changed ones in one INSERT ... ON CONFLICT.
+
+        Existing rows are only rewritten when an updatable field actually
+        differs, so an unchanged back catalogue costs no writes. Returns the
+        number of newly inserted episodes.
+        """
+        # Feeds occasionally repeat a GUID; one statement may touch a row only once
+        rows = {}
+        for ep_data in episodes_data:
+            rows.setdefault(
+                ep_data["guid"],
+                {
+                    "feed_id": feed_id,
+                    "guid": ep_data["guid"],
+                    "title": ep_data["title"],
+                    "description": ep_data["description"],
+                    "audio_url": ep_data["audio_url"],
+                    "file_size": ep_data.get("file_size"),
+                    "duration_seconds": ep_data["duration_seconds"],
+                    "chapters": ep_data.get("chapters"),
+                    "image_url": ep_data["image_url"],
+                    "published_at": ep_data["published_at"],
+                    "transcript_status": "none",
+                },
+            )
+        if not rows:
+            return 0
+
+        count_stmt = select(func.count(PodcastEpisode.id)).where(
+            PodcastEpisode.feed_id == feed_id
+        )
+        before = (await db.execute(count_stmt)).scalar_one()
+
+        dialect = db.get_bind().dialect.name
+        insert = pg_insert if dialect == "postgresql" else sqlite_insert
+        values = list(rows.values())
+        # Chunked to stay under the bind-parameter limit on huge back catalogues
+        for i in range(0, len(values), EPISODE_UPSERT_CHUNK):
+            await db.execute(
+                self._episode_upsert_stmt(insert, values[i : i + EPISODE_UPSERT_CHUNK])
+            )
+
+        after = (await db.execute(count_stmt)).scalar_one()
+        # Cached for episode lists, which would otherwise COUNT(*) every page
+        await db.execute(
+            update(PodcastFeed)
+            .where(PodcastFeed.id == feed_id)
+            .values(episode_count=after)
+        )
+        return after - before
+
+    @staticmethod
+    def _episode_upsert_stmt(insert, values: List[Dict[str, Any]]):
+        stmt = insert(PodcastEpisode).values(values)
+        excluded = stmt.excluded
+        # We typically don't update title/description to avoid overwriting user edits
+        # (if we had them); keep the existing image if the feed dropped it.
+        new_image = func.coalesce(excluded.image_url, PodcastEpisode.image_url)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["feed_id", "guid"],
+            set_={
+                "file_size": excluded.file_size,
+                "chapters": excluded.chapters,
+                "duration_seconds": excluded.duration_seconds,
+                "image_url": new_image,
+            },
+            where=or_(
+                PodcastEpisode.file_size.is_distinct_from(excluded.file_size),
+                PodcastEpisode.duration_seconds.is_distinct_from(
+                    excluded.duration_seconds
+                ),
+                # JSON has no equality operator in Postgres; compare as text
+                cast(PodcastEpisode.chapters, Text).is_distinct_from(
+                    cast(excluded.chapters, Text)
+                ),
+                PodcastEpisode.image_url.is_distinct_from(new_image),
+            ),
+        )
+        return stmt
+
     async def update_episode_sizes(
         self, db: AsyncSession, episode_ids: List[int]
     ) -> Dict[int, int]:
@@ -1057,26 +1395,24 @@ class PodcastService:
             return {}
 
         semaphore = asyncio.Semaphore(10)  # 10 concurrent requests
-        proxies = settings.PROXY_URL if settings.PROXY_URL else None
+        client = http_clients.get()
 
-        async with httpx.AsyncClient(
-            timeout=10.0, follow_redirects=True, proxy=proxies
-        ) as client:
+        async def check_size(ep):
+            async with semaphore:
+                try:
+                    resp = await client.head(
+                        ep.audio_url, timeout=10.0, follow_redirects=True
+                    )
+                    if resp.status_code == 200:
+                        cl = resp.headers.get("content-length")
+                        if cl and cl.isdigit():
+                            size = int(cl)
+                            ep.file_size = size
+                            updated_sizes[ep.id] = size
+                except Exception as e:
+                    logger.warning(f"Failed to check size for ep {ep.id}: {e}")
 
-            async def check_size(ep):
-                async with semaphore:
-                    try:
-                        resp = await client.head(ep.audio_url)
-                        if resp.status_code == 200:
-                            cl = resp.headers.get("content-length")
-                            if cl and cl.isdigit():
-                                size = int(cl)
-                                ep.file_size = size
-                                updated_sizes[ep.id] = size
-                    except Exception as e:
-                        logger.warning(f"Failed to check size for ep {ep.id}: {e}")
-
-            await asyncio.gather(*(check_size(ep) for ep in to_check))
+        await asyncio.gather(*(check_size(ep) for ep in to_check))
 
         if updated_sizes:
             await db.commit()
@@ -0,0 +1,112 @@
+"""
+Podcast transcript segment storage.
+
+Segments live one per row in ``podcast_transcript_segments``, keyed by
+(episode_id, seq) and indexed by start time, so readers fetch only a time
+window or only the segments they have not seen yet, and episode rows stay
+small.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.podcast_orm import PodcastTranscriptSegment
+
+# Rows per INSERT when saving a transcript
+INSERT_BATCH_SIZE = 500
+
+
+def segment_to_dict(segment: PodcastTranscriptSegment) -> Dict[str, Any]:
+    """Same shape as ``TranscriptionSegment.to_dict()`` (unset details omitted)."""
+    result = {
+        "start_time": segment.start_time,
+        "end_time": segment.end_time,
+        "text": segment.text,
+    }
+    for field in ("language", "emotion", "events", "confidence"):
+        value = getattr(segment, field)
+        if value is not None:
+            result[field] = value
+    return result
+
+
+async def save_segments(
+    db: AsyncSession,
+    episode_id: int,
+    segments: Sequence[Dict[str, Any]],
+    start: int = 0,
+) -> None:
+    """
+    Store ``segments`` at positions ``start`` onwards of the episode's
+    transcript, replacing whatever was stored from ``start`` on. Does not
+    commit.
+
+    A running transcription saves only what it added since its last save;
+    ``start=0`` with no segments clears the transcript.
+    """
+    await db.execute(
+        delete(PodcastTranscriptSegment).where(
+            PodcastTranscriptSegment.episode_id == episode_id,
+            PodcastTranscriptSegment.seq >= start,
+        )
+    )
+    rows = [
+        {
+            "episode_id": episode_id,
+            "seq": seq,
+            "start_time": seg.get("start_time", 0.0),
+            "end_time": seg.get("end_time", 0.0),
+            "text": seg.get("text", ""),
+            "language": seg.get("language"),
+            "emotion": seg.get("emotion"),
+            "events": seg.get("events"),
+            "confidence": seg.get("confidence"),
+        }
+        for seq, seg in enumerate(segments, start=start)
+    ]
+    for i in range(0, len(rows), INSERT_BATCH_SIZE):
+        await db.execute(
+            insert(PodcastTranscriptSegment), rows[i : i + INSERT_BATCH_SIZE]
+        )
+
+
+async def count_segments(db: AsyncSession, episode_id: int) -> int:
+    return await db.scalar(
+        select(func.count()).where(PodcastTranscriptSegment.episode_id == episode_id)
+    )
+
+
+async def load_segments(
+    db: AsyncSession,
+    episode_id: int,
+    from_time: Optional[float] = None,
+    to_time: Optional[float] = None,
+    after: int = 0,
+) -> List[PodcastTranscriptSegment]:
+    """
+    An episode's segments in order, optionally only those overlapping
+    [from_time, to_time) and/or from position ``after`` on.
+
+    Both ends of a time window are start-time bounds on the index: the window
+    begins at the last segment starting at or before ``from_time``.
+    """
+    seg = PodcastTranscriptSegment
+    stmt = select(seg).where(seg.episode_id == episode_id)
+    if after:
+        stmt = stmt.where(seg.seq >= after)
+    if from_time is not None:
+        first_start = (
+            select(func.max(seg.start_time))
+            .where(seg.episode_id == episode_id, seg.start_time <= from_time)
+            .scalar_subquery()
+        )
+        stmt = stmt.where(
+            seg.start_time >= func.coalesce(first_start, from_time),
+            seg.end_time > from_time,
+        )
+    if to_time is not None:
+        stmt = stmt.where(seg.start_time < to_time)
+    result = await db.execute(stmt.order_by(seg.seq))
+    return list(result.scalars().all())
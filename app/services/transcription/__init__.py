@@ -5,16 +5,24 @@ Provides AI-powered audio transcription with time-aligned segments.
 """
 
 from .schemas import AudioInput, TranscriptionSegment, TranscriptionResult
-from .base import BaseTranscriptionEngine, TranscriptionError
+from .base import (
+    BaseTranscriptionEngine,
+    ProgressCallback,
+    SegmentsCallback,
+    TranscriptionError,
+)
 
 __all__ = [
     "AudioInput",
     "TranscriptionSegment",
     "TranscriptionResult",
     "BaseTranscriptionEngine",
+    "ProgressCallback",
+    "SegmentsCallback",
     "TranscriptionError",
     "get_default_engine",
     "preload_engine",
+    "shutdown_engine",
 ]
 
 # Singleton engine instance (lazy initialized)
@@ -47,9 +55,12 @@ def get_default_engine(
     # Otherwise return singleton local engine
     if _default_engine is None:
         try:
+            from app.config import settings
             from .sensevoice import SenseVoiceEngine
 
-            _default_engine = SenseVoiceEngine()
+            _default_engine = SenseVoiceEngine(
+                process_workers=settings.SENSEVOICE_PROCESS_WORKERS
+            )
         except ImportError as e:
             # Provide a clear error if optional dependencies are missing
             raise ImportError(
@@ -63,6 +74,9 @@ def get_default_engine(
 def preload_engine() -> None:
     """
     Preload the local transcription engine model if available.
+
+    With SENSEVOICE_PROCESS_WORKERS set, this spawns the worker processes and
+    waits until each has loaded and warmed up its model.
     """
     try:
         engine = get_default_engine()
@@ -71,3 +85,10 @@ def preload_engine() -> None:
             engine._load_model()  # type: ignore
     except ImportError:
         pass  # Skip if local engine not installed
+
+
+def shutdown_engine() -> None:
+    """Stop the local engine's worker processes, if it has any."""
+    pool = getattr(_default_engine, "_pool", None)
+    if pool is not None:
+        pool.shutdown()
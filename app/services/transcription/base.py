@@ -5,9 +5,15 @@ All transcription engines must implement this interface.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Callable, Optional
 
-from .schemas import AudioInput, TranscriptionResult
+from .schemas import AudioInput, TranscriptionResult, TranscriptionSegment
+
+# on_progress(done, total) in the engine's unit (seconds of audio for chunked
+# local engines); may raise to abort between chunks
+ProgressCallback = Callable[[int, int], None]
+# on_segments(new_segments): segments that are final, in transcript order
+SegmentsCallback = Callable[[list[TranscriptionSegment]], None]
 
 
 class BaseTranscriptionEngine(ABC):
@@ -30,7 +36,12 @@ class BaseTranscriptionEngine(ABC):
         pass
 
     @abstractmethod
-    def transcribe(self, audio: AudioInput) -> TranscriptionResult:
+    def transcribe(
+        self,
+        audio: AudioInput,
+        on_progress: Optional[ProgressCallback] = None,
+        on_segments: Optional[SegmentsCallback] = None,
+    ) -> TranscriptionResult:
         """
         Transcribe audio to text with timestamps.
 
@@ -42,6 +53,11 @@ class BaseTranscriptionEngine(ABC):
 
         Args:
             audio: AudioInput instance containing the audio to transcribe
+            on_progress: Called after each processed chunk. Exceptions it
+                raises (e.g. a cancelled job) propagate to the caller.
+            on_segments: Called with each run of segments as soon as they
+                can no longer change. Together, the calls deliver exactly
+                ``result.segments``, so callers can show a transcript early.
 
         Returns:
             TranscriptionResult with segments and metadata
@@ -0,0 +1,252 @@
+"""
+Process pool for local SenseVoice inference.
+
+Running the model in the API process's threadpool makes inference compete
+with request handling for the GIL and caps throughput at one model run at a
+time. With SENSEVOICE_PROCESS_WORKERS > 0, each of N spawned worker
+processes loads (and warms up) its own model once, and chunk windows are
+handed to them through shared memory instead of being pickled. Batches of
+one transcription run on all workers concurrently and come back in order.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+from typing import Any, Callable, Deque, Iterable, Iterator, Optional
+
+import numpy as np
+
+from .base import TranscriptionError
+
+logger = logging.getLogger(__name__)
+
+# A batch is a list of (samples, start_time, end_time) windows
+Batch = list[tuple[np.ndarray, float, float]]
+
+POOL_ENGINE_NAME = "sensevoice-pool"
+# Seconds of silence each worker transcribes once after loading its model
+WARM_UP_SECONDS = 1.0
+
+# --- Worker process side ---
+
+_worker_engine: Any = None
+
+
+def _init_worker(engine_factory: Callable[[], Any], threads: int) -> None:
+    """Load the model once per worker and run a short warm-up inference."""
+    global _worker_engine
+
+    try:
+        import torch
+
+        # Split the cores between workers instead of oversubscribing them
+        torch.set_num_threads(threads)
+    except ImportError:
+        pass
+
+    started = time.perf_counter()
+    _worker_engine = engine_factory()
+    _worker_engine._load_model()
+    try:
+        silence = np.zeros(int(16000 * WARM_UP_SECONDS), dtype=np.float32)
+        _worker_engine._run_batch([silence])
+    except Exception as e:
+        logger.warning(f"Transcription worker {os.getpid()} warm-up failed: {e}")
+    logger.info(
+        f"Transcription worker {os.getpid()} ready in "
+        f"{time.perf_counter() - started:.1f}s"
+    )
+
+
+def _worker_ready() -> int:
+    return os.getpid()
+
+
+def _run_batch_in_worker(
+    shm_name: str, layout: list[tuple[int, int]], generate_kwargs: dict[str, Any]
+) -> tuple[list[Any], float]:
+    """Transcribe windows read from a shared memory block; returns (items, seconds)."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    _untrack(shm)
+    try:
+        inputs = [
+            np.ndarray((length,), dtype=np.float32, buffer=shm.buf, offset=offset * 4)
+            for offset, length in layout
+        ]
+        started = time.perf_counter()
+        items = _worker_engine._run_batch(inputs, **generate_kwargs)
+        elapsed = time.perf_counter() - started
+        del inputs
+        return items, elapsed
+    finally:
+        try:
+            shm.close()
+        except BufferError:
+            pass  # The model kept a view; the mapping goes away with the process
+
+
+def _untrack(shm: shared_memory.SharedMemory) -> None:
+    # The parent creates and unlinks every block; attaching must not make this
+    # process's resource tracker claim it too (Python < 3.13)
+    try:
+        from multiprocessing import resource_tracker
+
+        resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore
+    except Exception:
+        pass
+
+
+# --- API process side ---
+
+
+def _share(arrays: list[np.ndarray]) -> tuple[shared_memory.SharedMemory, list]:
+    """Copy float32 arrays into one new shared memory block."""
+    total = sum(len(a) for a in arrays)
+    shm = shared_memory.SharedMemory(create=True, size=max(total * 4, 1))
+    buf = np.ndarray((total,), dtype=np.float32, buffer=shm.buf)
+    layout = []
+    offset = 0
+    for a in arrays:
+        buf[offset : offset + len(a)] = a
+        layout.append((offset, len(a)))
+        offset += len(a)
+    del buf
+    return shm, layout
+
+
+def _release(shm: shared_memory.SharedMemory) -> None:
+    shm.close()
+    try:
+        shm.unlink()
+    except FileNotFoundError:
+        pass
+
+
+class TranscriptionProcessPool:
+    """
+    N worker processes, each holding a loaded transcription model.
+
+    ``start()`` spawns the workers and blocks until every one has loaded and
+    warmed up its model; ``run_batches()`` is called from the engine.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        model_size: str = "small",
+        device: str = "cpu",
+        engine_factory: Optional[Callable[[], Any]] = None,
+    ):
+        self.workers = workers
+        if engine_factory is None:
+            from .sensevoice import SenseVoiceEngine
+
+            engine_factory = functools.partial(
+                SenseVoiceEngine, model_size=model_size, device=device
+            )
+        self._engine_factory = engine_factory
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._start_lock = threading.Lock()
+
+    @property
+    def started(self) -> bool:
+        return self._executor is not None
+
+    def start(self) -> None:
+        with self._start_lock:
+            if self._executor is None:
+                self._executor = self._spawn()
+
+    def _spawn(self) -> ProcessPoolExecutor:
+        threads = max((os.cpu_count() or 1) // self.workers, 1)
+        executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            # Never fork a process that already runs threads and an event loop
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self._engine_factory, threads),
+        )
+        started = time.perf_counter()
+        try:
+            # Make every worker spawn (and load its model) now, not on first use
+            futures = [executor.submit(_worker_ready) for _ in range(self.workers)]
+            wait(futures)
+            pids = sorted({f.result() for f in futures})
+        except BrokenProcessPool as e:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise TranscriptionError(
+                "Transcription worker processes failed to start",
+                engine=POOL_ENGINE_NAME,
+                cause=e,
+            )
+        logger.info(
+            f"Transcription process pool ready in {time.perf_counter() - started:.1f}s "
+            f"({self.workers} workers, {threads} threads each, pids {pids})"
+        )
+        return executor
+
+    def shutdown(self) -> None:
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def run_batches(
+        self,
+        batches: Iterable[Batch],
+        generate_kwargs: dict[str, Any],
+        max_in_flight: Optional[int] = None,
+    ) -> Iterator[tuple[Batch, list[Any], float]]:
+        """
+        Transcribe batches on the workers, yielding (batch, items, seconds)
+        in submission order.
+
+        Up to ``max_in_flight`` batches (default two per worker) are queued
+        ahead, so decoding the next windows overlaps with inference. Closing
+        the iterator early cancels whatever has not started yet.
+        """
+        self.start()
+        in_flight = max_in_flight or self.workers * 2
+        pending: Deque[tuple[Batch, Future, shared_memory.SharedMemory]] = deque()
+        try:
+            for batch in batches:
+                shm, layout = _share([samples for samples, _, _ in batch])
+                try:
+                    future = self._executor.submit(
+                        _run_batch_in_worker, shm.name, layout, generate_kwargs
+                    )
+                except Exception:
+                    _release(shm)
+                    raise
+                pending.append((batch, future, shm))
+                if len(pending) >= in_flight:
+                    yield self._collect(*pending.popleft())
+            while pending:
+                yield self._collect(*pending.popleft())
+        finally:
+            for _, future, shm in pending:
+                future.cancel()
+                _release(shm)
+
+    def _collect(
+        self, batch: Batch, future: Future, shm: shared_memory.SharedMemory
+    ) -> tuple[Batch, list[Any], float]:
+        try:
+            items, elapsed = future.result()
+        except BrokenProcessPool as e:
+            # A worker died (e.g. out of memory); start fresh next time
+            self.shutdown()
+            raise TranscriptionError(
+                "Transcription worker process died", engine=POOL_ENGINE_NAME, cause=e
+            )
+        finally:
+            _release(shm)
+        return batch, items, elapsed
@@ -10,7 +10,12 @@ import httpx
 from typing import Optional
 from pathlib import Path
 
-from .base import BaseTranscriptionEngine, TranscriptionError
+from .base import (
+    BaseTranscriptionEngine,
+    ProgressCallback,
+    SegmentsCallback,
+    TranscriptionError,
+)
 from .schemas import AudioInput, TranscriptionResult
 
 logger = logging.getLogger(__name__)
@@ -42,12 +47,19 @@ class RemoteTranscriptionEngine(BaseTranscriptionEngine):
     def name(self) -> str:
         return f"remote-http[{self.remote_url}]"
 
-    def transcribe(self, audio: AudioInput) -> TranscriptionResult:
+    def transcribe(
+        self,
+        audio: AudioInput,
+        on_progress: Optional[ProgressCallback] = None,
+        on_segments: Optional[SegmentsCallback] = None,
+    ) -> TranscriptionResult:
         """
         Transcribe audio by sending to remote server.
 
         Args:
             audio: AudioInput instance
+            on_progress: Called once (1/1) when the remote result arrives
+            on_segments: Called once with all segments of the remote result
 
         Returns:
             TranscriptionResult from remote server
@@ -81,7 +93,7 @@ class RemoteTranscriptionEngine(BaseTranscriptionEngine):
                         )
 
                     data = response.json()
-                    return TranscriptionResult.from_dict(data)
+                    result = TranscriptionResult.from_dict(data)
 
         except httpx.RequestError as e:
             raise TranscriptionError(
@@ -94,6 +106,12 @@ class RemoteTranscriptionEngine(BaseTranscriptionEngine):
                 f"Remote transcription failed: {e}", engine=self.name, cause=e
             )
 
+        if on_progress:
+            on_progress(1, 1)
+        if on_segments and result.segments:
+            on_segments(result.segments)
+        return result
+
     def is_available(self) -> bool:
         """
         Check if remote server is reachable.
@@ -11,20 +11,30 @@ Supports two model types:
 
 from __future__ import annotations
 
+import itertools
 import logging
+import os
 import re
+import time
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional
 
 from app.config import settings
-from .base import BaseTranscriptionEngine, TranscriptionError
+from .base import (
+    BaseTranscriptionEngine,
+    ProgressCallback,
+    SegmentsCallback,
+    TranscriptionError,
+)
+from .process_pool import TranscriptionProcessPool
 from .schemas import AudioInput, TranscriptionResult, TranscriptionSegment
 from .utils import (
-    chunk_audio,
-    cleanup_chunks,
+    SegmentMerger,
     get_audio_duration,
-    merge_overlapping_segments,
+    iter_audio_blocks,
+    iter_audio_windows,
 )
+from .vad import EnergyVAD
 
 if TYPE_CHECKING:
     from funasr import AutoModel
@@ -38,6 +48,10 @@ FUN_ASR_NANO_MODELS = {"FunAudioLLM/Fun-ASR-Nano-2512", "Fun-ASR-Nano-2512"}
 SENSEVOICE_TOKEN_PATTERN = re.compile(r"<\|[^|]+\|>")  # <|en|>, <|EMO_UNKNOWN|>, etc.
 
 
+def _is_fun_asr_nano_model(model_name: str) -> bool:
+    return any(nano_model in model_name for nano_model in FUN_ASR_NANO_MODELS)
+
+
 class SenseVoiceEngine(BaseTranscriptionEngine):
     """
     SenseVoice local GPU transcription engine.
@@ -59,6 +73,11 @@ class SenseVoiceEngine(BaseTranscriptionEngine):
     BATCH_SIZE_S = 60  # SenseVoice default
     BATCH_SIZE_S_FUN_ASR = 5  # Fun-ASR-Nano recommended (from official example)
 
+    # Chunks per generate call for long audio (see _chunk_batch_size)
+    MAX_CHUNK_BATCH = 8
+    # Rough inference memory per second of audio in a batch
+    BATCH_MEMORY_PER_AUDIO_SECOND = 8 * 1024 * 1024
+
     # SenseVoice event tags
     EVENT_PATTERN = re.compile(r"\[([A-Za-z]+)\]")
     EMOTION_TAGS = {
@@ -72,29 +91,50 @@ class SenseVoiceEngine(BaseTranscriptionEngine):
     }
     EVENT_TAGS = {"Music", "Laughter", "Cough", "Applause", "BGM", "Speech"}
 
-    def __init__(self, model_size: str = "small", device: str = "cuda:0"):
+    def __init__(
+        self,
+        model_size: str = "small",
+        device: str = "cuda:0",
+        process_workers: int = 0,
+    ):
         """
         Initialize SenseVoice engine.
 
         Args:
             model_size: Model size ("small" or "large")
             device: Device to use ("cuda" or "cpu")
+            process_workers: Run inference in this many worker processes, each
+                with its own model, instead of in the calling process (0)
         """
         self.model_size = model_size
         self.device = device
+        self._pool: Optional[TranscriptionProcessPool] = (
+            TranscriptionProcessPool(process_workers, model_size, device)
+            if process_workers > 0
+            else None
+        )
         self._model: Any = None  # FunASR AutoModel instance (lazy loaded)
         self._model_loaded = False
         self._is_fun_asr_nano = False  # Flag for Fun-ASR-Nano model type
+        # Per-batch throughput of the last chunked transcription
+        self.last_run_stats: dict[str, Any] = {}
 
     @property
     def name(self) -> str:
         return f"sensevoice-{self.model_size}"
 
     def _load_model(self):
-        """Lazy load the SenseVoice model."""
+        """Lazy load the SenseVoice model (or start the worker processes)."""
         if self._model_loaded:
             return
 
+        if self._pool is not None:
+            # Each worker loads its own model; this process only needs the type
+            self._is_fun_asr_nano = _is_fun_asr_nano_model(settings.SENSEVOICE_MODEL)
+            self._pool.start()
+            self._model_loaded = True
+            return
+
         try:
             from funasr import AutoModel
 
@@ -103,9 +143,7 @@ class SenseVoiceEngine(BaseTranscriptionEngine):
             model_name = settings.SENSEVOICE_MODEL
 
             # Check if using Fun-ASR-Nano model (requires VAD)
-            self._is_fun_asr_nano = any(
-                nano_model in model_name for nano_model in FUN_ASR_NANO_MODELS
-            )
+            self._is_fun_asr_nano = _is_fun_asr_nano_model(model_name)
 
             logger.info(
                 f"Loading SenseVoice model: {model_name} (Fun-ASR-Nano: {self._is_fun_asr_nano})"
@@ -244,7 +282,12 @@ class SenseVoiceEngine(BaseTranscriptionEngine):
         """SenseVoice supports multiple languages."""
         return ["zh", "en", "ja", "ko", "yue"]  # Cantonese
 
-    def transcribe(self, audio: AudioInput) -> TranscriptionResult:
+    def transcribe(
+        self,
+        audio: AudioInput,
+        on_progress: Optional[ProgressCallback] = None,
+        on_segments: Optional[SegmentsCallback] = None,
+    ) -> TranscriptionResult:
         """
         Transcribe audio using SenseVoice.
 
@@ -253,6 +296,8 @@ class SenseVoiceEngine(BaseTranscriptionEngine):
 
         Args:
             audio: AudioInput instance
+            on_progress: Called after each chunk with (done, total)
+            on_segments: Called with merged segments as each chunk finishes
 
         Returns:
             TranscriptionResult with time-aligned segments
@@ -264,20 +309,33 @@ class SenseVoiceEngine(BaseTranscriptionEngine):
 
         logger.info(f"Transcribing audio: {audio_path} ({total_duration:.1f}s)")
 
+        # Worker processes only take in-memory windows, even for short audio
+        short = total_duration <= self.CHUNK_DURATION + 5 and self._pool is None
+
         if self._is_fun_asr_nano:
             # Fun-ASR-Nano: use chunking for long audio (VAD has compatibility issues)
-            if total_duration <= self.CHUNK_DURATION + 5:
+            if short:
                 segments = self._transcribe_fun_asr_nano(audio_path)
+                if on_progress:
+                    on_progress(1, 1)
+                if on_segments and segments:
+                    on_segments(segments)
             else:
                 segments = self._transcribe_fun_asr_nano_chunked(
-                    audio_path, total_duration
+                    audio_path, total_duration, on_progress, on_segments
                 )
-        elif total_duration <= self.CHUNK_DURATION + 5:
+        elif short:
             # Short audio: process directly
             segments = self._transcribe_single(audio_path)
+            if on_progress:
+                on_progress(1, 1)
+            if on_segments and segments:
+                on_segments(segments)
         else:
             # Long audio: chunk and merge
-            segments = self._transcribe_chunked(audio_path, total_duration)
+            segments = self._transcribe_chunked(
+                audio_path, total_duration, on_progress, on_segments
+            )
 
         # Build full text
         full_text = " ".join(seg.text for seg in segments)
@@ -472,69 +530,74 @@ class SenseVoiceEngine(BaseTranscriptionEngine):
         return result.strip()
 
     def _transcribe_fun_asr_nano_chunked(
-        self, audio_path: Path, total_duration: float
+        self,
+        audio_path: Path,
+        total_duration: float,
+        on_progress: Optional[ProgressCallback] = None,
+        on_segments: Optional[SegmentsCallback] = None,
     ) -> list[TranscriptionSegment]:
-        """Transcribe long audio using Fun-ASR-Nano by chunking manually."""
-        chunks = None
-        try:
-            # Split audio into chunks - Fun-ASR-Nano can handle longer chunks
-            chunks = chunk_audio(
-                audio_path,
-                chunk_duration=self.CHUNK_DURATION_FUN_ASR,
-                overlap_duration=self.OVERLAP_DURATION,
-            )
-
-            logger.info(f"Processing {len(chunks)} chunks with Fun-ASR-Nano")
-
-            all_segments: list[TranscriptionSegment] = []
-
-            for i, (chunk_path, chunk_start, chunk_end) in enumerate(chunks):
-                logger.debug(
-                    f"Processing chunk {i + 1}/{len(chunks)}: {chunk_start:.1f}s - {chunk_end:.1f}s"
-                )
+        """
+        Transcribe long audio using Fun-ASR-Nano by chunking manually.
 
-                try:
-                    result = self._model.generate(
-                        input=[str(chunk_path)],  # Fun-ASR-Nano expects list input
-                        cache={},
-                        batch_size_s=self.BATCH_SIZE_S_FUN_ASR,
-                    )
+        Chunks are decoded on the fly and passed to the model as in-memory
+        16kHz float32 arrays, so memory stays bounded by one batch of chunks.
+        """
+        windows, _, vad = self._audio_windows(audio_path, self.CHUNK_DURATION_FUN_ASR)
+        logger.info(f"Processing {total_duration:.0f}s of audio with Fun-ASR-Nano")
+
+        merged: list[TranscriptionSegment] = []
+        emitted = 0
+
+        results = self._generate_batched(
+            windows,
+            total_duration,
+            self.CHUNK_DURATION_FUN_ASR,
+            on_progress,
+            batch_size_s=self.BATCH_SIZE_S_FUN_ASR,
+        )
+        for item, chunk_start, _ in results:
+            if item is None:
+                continue
 
-                    logger.debug(f"Chunk {i + 1} result: {result}")
+            # Parse result - now returns segments with token-level timestamps
+            chunk_segments = self._parse_fun_asr_nano_result([item])
 
-                    # Parse result - now returns segments with token-level timestamps
-                    chunk_segments = self._parse_fun_asr_nano_result(result)
+            # Adjust timestamps to global timeline
+            for seg in chunk_segments:
+                seg.start_time += chunk_start
+                seg.end_time += chunk_start
 
-                    # Adjust timestamps to global timeline
-                    for seg in chunk_segments:
-                        seg.start_time += chunk_start
-                        seg.end_time += chunk_start
-                        all_segments.append(seg)
+            # Merge segments with same text in overlapping regions
+            self._merge_adjacent_segments(chunk_segments, merged)
 
-                except Exception as e:
-                    logger.warning(f"Failed to transcribe chunk {i + 1}: {e}")
-                    # Continue with other chunks
+            # The last merged segment may still absorb the next chunk's first one
+            if on_segments and len(merged) - 1 > emitted:
+                on_segments(merged[emitted:-1])
+                emitted = len(merged) - 1
 
-            # Merge segments with same text in overlapping regions
-            merged_segments = self._merge_adjacent_segments(all_segments)
+        self._record_vad(vad)
 
-            return merged_segments
+        if on_segments and len(merged) > emitted:
+            on_segments(merged[emitted:])
 
-        finally:
-            # Clean up temporary chunk files
-            if chunks:
-                cleanup_chunks(chunks)
+        return merged
 
     def _merge_adjacent_segments(
-        self, segments: list[TranscriptionSegment]
+        self,
+        segments: list[TranscriptionSegment],
+        merged: Optional[list[TranscriptionSegment]] = None,
     ) -> list[TranscriptionSegment]:
-        """Merge adjacent segments that might have duplicate text from overlapping chunks."""
-        if not segments:
-            return []
-
-        merged = [segments[0]]
+        """
+        Merge adjacent segments that might have duplicate text from overlapping
+        chunks, appending to ``merged`` (a new list if not given).
+        """
+        if merged is None:
+            merged = []
 
-        for seg in segments[1:]:
+        for seg in segments:
+            if not merged:
+                merged.append(seg)
+                continue
             last = merged[-1]
             # If segments overlap and have similar text, merge them
             if last.end_time >= seg.start_time:
@@ -573,56 +636,219 @@ class SenseVoiceEngine(BaseTranscriptionEngine):
             )
 
     def _transcribe_chunked(
-        self, audio_path: Path, total_duration: float
+        self,
+        audio_path: Path,
+        total_duration: float,
+        on_progress: Optional[ProgressCallback] = None,
+        on_segments: Optional[SegmentsCallback] = None,
     ) -> list[TranscriptionSegment]:
-        """Transcribe long audio by chunking with overlap."""
-        chunks = None
-        try:
-            # Split audio into chunks
-            chunks = chunk_audio(
-                audio_path,
-                chunk_duration=self.CHUNK_DURATION,
-                overlap_duration=self.OVERLAP_DURATION,
-            )
+        """
+        Transcribe long audio by chunking with overlap.
 
-            logger.info(f"Processing {len(chunks)} chunks")
+        Chunks are streamed from the decoder as 16kHz float32 arrays and fed
+        to the model directly (no whole-file load, no temp WAVs).
+        """
+        windows, overlap, vad = self._audio_windows(audio_path, self.CHUNK_DURATION)
+        logger.info(f"Processing {total_duration:.0f}s of audio in chunks")
+
+        # Merge overlapping segments as chunks finish (VAD windows don't
+        # overlap: concatenated)
+        merger = SegmentMerger(overlap_duration=overlap)
+        merged: list[TranscriptionSegment] = []
+
+        results = self._generate_batched(
+            windows,
+            total_duration,
+            self.CHUNK_DURATION,
+            on_progress,
+            language="auto",
+            use_itn=True,
+            batch_size_s=self.BATCH_SIZE_S,
+        )
+        for item, start_time, end_time in results:
+            if item is not None:
+                chunk_segments = self._parse_result([item])
+                final = merger.add(chunk_segments, start_time, end_time)
+                merged.extend(final)
+                if on_segments and final:
+                    on_segments(final)
 
-            # Transcribe each chunk
-            all_chunk_segments: list[
-                tuple[list[TranscriptionSegment], float, float]
-            ] = []
+        self._record_vad(vad)
 
-            for i, (chunk_path, start_time, end_time) in enumerate(chunks):
-                logger.debug(f"Processing chunk {i + 1}/{len(chunks)}")
+        final = merger.finish()
+        merged.extend(final)
+        if on_segments and final:
+            on_segments(final)
 
-                try:
-                    result = self._model.generate(
-                        input=str(chunk_path),
-                        cache={},
-                        language="auto",
-                        use_itn=True,
-                        batch_size_s=self.BATCH_SIZE_S,
-                    )
+        return merged
 
-                    chunk_segments = self._parse_result(result)
-                    all_chunk_segments.append((chunk_segments, start_time, end_time))
+    def _audio_windows(
+        self, audio_path: Path, window_duration: float
+    ) -> tuple[Iterator[tuple[Any, float, float]], float, Optional[EnergyVAD]]:
+        """
+        Windows to transcribe, the overlap between them, and the VAD used.
 
-                except Exception as e:
-                    logger.warning(f"Failed to transcribe chunk {i}: {e}")
-                    # Continue with other chunks
+        With SENSEVOICE_VAD, windows are speech spans cut at pauses (silence
+        is never sent to the model); otherwise fixed windows with overlap.
+        """
+        if settings.SENSEVOICE_VAD:
+            vad = EnergyVAD(max_window_duration=window_duration)
+            return vad.windows(iter_audio_blocks(audio_path)), 0.0, vad
+        windows = iter_audio_windows(
+            audio_path,
+            window_duration=window_duration,
+            overlap_duration=self.OVERLAP_DURATION,
+        )
+        return windows, self.OVERLAP_DURATION, None
 
-            # Merge overlapping segments
-            merged = merge_overlapping_segments(
-                all_chunk_segments,
-                overlap_duration=self.OVERLAP_DURATION,
-            )
+    def _record_vad(self, vad: Optional[EnergyVAD]) -> None:
+        if vad is None:
+            return
+        self.last_run_stats["audio_seconds"] = round(vad.audio_seconds, 2)
+        self.last_run_stats["speech_seconds"] = round(vad.speech_seconds, 2)
 
-            return merged
+    def _chunk_batch_size(self, chunk_duration: float) -> int:
+        """
+        Chunks per generate call: SENSEVOICE_CHUNK_BATCH_SIZE if set, otherwise
+        as many as fit in half the free (GPU or system) memory, shared between
+        the worker processes if there are any.
+        """
+        if settings.SENSEVOICE_CHUNK_BATCH_SIZE > 0:
+            return settings.SENSEVOICE_CHUNK_BATCH_SIZE
+
+        available = self._available_memory()
+        if available is None:
+            return 1
+        models = self._pool.workers if self._pool is not None else 1
+        per_chunk = chunk_duration * self.BATCH_MEMORY_PER_AUDIO_SECOND
+        fit = available // 2 // models // per_chunk
+        return int(min(max(fit, 1), self.MAX_CHUNK_BATCH))
+
+    def _available_memory(self) -> Optional[int]:
+        """Free bytes on the inference device, or None if unknown."""
+        if str(self.device).startswith("cuda"):
+            try:
+                import torch
+
+                free, _ = torch.cuda.mem_get_info(self.device)
+                return free
+            except Exception:
+                return None
+        try:
+            return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+        except (AttributeError, ValueError, OSError):
+            return None  # Not available on Windows
+
+    def _run_batch(self, inputs: list[Any], **generate_kwargs: Any) -> list[Any]:
+        """
+        One generate call for several chunks; returns one raw result item per
+        input (None if that chunk failed). If the batched call fails, retries
+        the chunks one per call so a bad chunk is skipped on its own.
+        """
+        if len(inputs) > 1:
+            try:
+                result = self._model.generate(
+                    input=inputs, batch_size=len(inputs), **generate_kwargs
+                )
+                if len(result) == len(inputs):
+                    return list(result)
+                logger.warning(
+                    f"Batched inference returned {len(result)} results "
+                    f"for {len(inputs)} chunks"
+                )
+            except Exception as e:
+                logger.warning(f"Batched inference failed: {e}")
+            logger.info("Falling back to one chunk per generate call")
+
+        items: list[Any] = []
+        for samples in inputs:
+            try:
+                result = self._model.generate(input=[samples], **generate_kwargs)
+                items.append(result[0] if result else None)
+            except Exception as e:
+                logger.warning(f"Failed to transcribe chunk: {e}")
+                # Continue with other chunks
+                items.append(None)
+        return items
+
+    def _run_batch_timed(
+        self, batch: list[tuple[Any, float, float]], generate_kwargs: dict[str, Any]
+    ) -> tuple[list[tuple[Any, float, float]], list[Any], float]:
+        started = time.perf_counter()
+        items = self._run_batch([samples for samples, _, _ in batch], **generate_kwargs)
+        return batch, items, time.perf_counter() - started
+
+    def _generate_batched(
+        self,
+        windows: Iterable[tuple[Any, float, float]],
+        total_duration: float,
+        chunk_duration: float,
+        on_progress: Optional[ProgressCallback] = None,
+        **generate_kwargs: Any,
+    ) -> Iterator[tuple[Any, float, float]]:
+        """
+        Run the model over audio windows, several per generate call.
 
-        finally:
-            # Clean up temporary chunk files
-            if chunks:
-                cleanup_chunks(chunks)
+        Yields (raw result item, start, end) per window in order; the item is
+        None if that chunk failed. With a process pool, batches run on all
+        workers at once. Logs the real-time factor (inference seconds per
+        audio second) of every batch; the overall RTF uses wall-clock time.
+
+        Progress is reported in seconds of audio covered out of
+        ``total_duration``: VAD windows vary in length and number, so a
+        chunk count cannot be known up front.
+        """
+        batch_size = self._chunk_batch_size(chunk_duration)
+        windows = iter(windows)
+        batches = iter(lambda: list(itertools.islice(windows, batch_size)), [])
+        if self._pool is not None:
+            outcomes = self._pool.run_batches(batches, generate_kwargs)
+        else:
+            outcomes = (self._run_batch_timed(b, generate_kwargs) for b in batches)
+
+        stats: list[dict[str, Any]] = []
+        self.last_run_stats = {"batch_size": batch_size, "batches": stats}
+        started = time.perf_counter()
+        done = 0
+        total = max(1, round(total_duration))
+        reported = 0
+
+        for batch, items, elapsed in outcomes:
+            audio_seconds = sum(end - start for _, start, end in batch)
+            rtf = elapsed / audio_seconds if audio_seconds else 0.0
+            stats.append(
+                {
+                    "chunks": len(batch),
+                    "audio_seconds": round(audio_seconds, 2),
+                    "seconds": round(elapsed, 3),
+                    "rtf": round(rtf, 4),
+                }
+            )
+            logger.info(
+                f"Batch {len(stats)}: {len(batch)} chunks, {audio_seconds:.1f}s "
+                f"audio in {elapsed:.2f}s (RTF {rtf:.3f})"
+            )
+
+            for item, (_, start, end) in zip(items, batch):
+                yield item, start, end
+            done += len(batch)
+            reported = min(round(max(end for _, _, end in batch)), total)
+            if on_progress:
+                on_progress(reported, total)
+
+        # Trailing silence dropped by VAD is still covered
+        if on_progress and reported < total:
+            on_progress(total, total)
+
+        total_audio = sum(b["audio_seconds"] for b in stats)
+        wall_clock = time.perf_counter() - started
+        self.last_run_stats["rtf"] = (
+            round(wall_clock / total_audio, 4) if total_audio else None
+        )
+        logger.info(
+            f"Transcribed {done} chunks in {len(stats)} batches "
+            f"(RTF {self.last_run_stats['rtf']})"
+        )
 
     def _parse_result(self, result: list) -> list[TranscriptionSegment]:
         """
@@ -1,13 +1,15 @@
 """
 Utility functions for audio transcription.
 
-Provides audio chunking, segment merging, and time offset adjustment.
+Provides streaming audio windowing, segment merging, and time offset adjustment.
 """
 
 import logging
+import re
+import shutil
+from dataclasses import replace
 from pathlib import Path
-from typing import Optional, Tuple
-from difflib import SequenceMatcher
+from typing import Iterable, Iterator, Optional, Tuple
 
 import numpy as np
 
@@ -19,6 +21,21 @@ logger = logging.getLogger(__name__)
 SOUNDFILE_FORMATS = {".wav", ".flac", ".ogg", ".aiff", ".aif"}
 # Formats that require ffmpeg
 FFMPEG_FORMATS = {".mp3", ".m4a", ".m4v", ".aac", ".mp4", ".webm", ".opus"}
+# Sample rate expected by SenseVoice / Fun-ASR-Nano
+SAMPLE_RATE = 16000
+
+# Words per side aligned at a chunk boundary (~2s of speech is 5-10 words)
+MAX_OVERLAP_TOKENS = 64
+# Shortest word run trusted as the seam between two chunks
+MIN_ANCHOR_TOKENS = 2
+
+_WORD_CHARS = re.compile(r"[^\w']+")
+# Polynomial rolling hash over word ids
+_HASH_BASE = 1_000_003
+_HASH_MOD = (1 << 61) - 1
+
+# (normalized word, segment index, word index within the segment)
+_Token = tuple[str, int, int]
 
 
 def _load_audio_flexible(
@@ -147,65 +164,177 @@ def get_audio_duration(audio_path: Path) -> float:
             return file_size / (128 * 1024 / 8)
 
 
-def chunk_audio(
+def iter_audio_windows(
     audio_path: Path,
-    chunk_duration: float = 30.0,
+    window_duration: float = 30.0,
     overlap_duration: float = 2.0,
-    output_dir: Optional[Path] = None,
-) -> list[tuple[Path, float, float]]:
+    sample_rate: int = SAMPLE_RATE,
+) -> Iterator[tuple[np.ndarray, float, float]]:
     """
-    Split audio file into overlapping chunks.
+    Stream overlapping mono float32 windows from an audio file.
+
+    Only about one window of audio is held in memory at a time and nothing is
+    written to disk: soundfile formats are read window by window, everything
+    else is decoded and resampled by an ffmpeg pipe. Without ffmpeg, falls
+    back to loading the whole file with ``_load_audio_flexible``.
 
     Args:
         audio_path: Path to the source audio file
-        chunk_duration: Duration of each chunk in seconds
-        overlap_duration: Overlap between consecutive chunks in seconds
-        output_dir: Directory to save chunks (uses temp dir if None)
+        window_duration: Duration of each window in seconds
+        overlap_duration: Overlap between consecutive windows in seconds
+        sample_rate: Sample rate of the yielded windows
 
-    Returns:
-        List of (chunk_path, start_time, end_time) tuples
+    Yields:
+        (samples, start_time, end_time) tuples
     """
-    import tempfile
-    import soundfile as sf
-
-    if output_dir is None:
-        output_dir = Path(tempfile.mkdtemp(prefix="transcription_chunks_"))
+    window = int(window_duration * sample_rate)
+    overlap = int(overlap_duration * sample_rate)
+    if not 0 <= overlap < window:
+        raise ValueError("overlap_duration must be shorter than window_duration")
 
-    # Load audio - try multiple backends for format compatibility
-    y, sr = _load_audio_flexible(audio_path)
-    # _load_audio_flexible already handles mono conversion and resampling to 16kHz
+    blocks = iter_audio_blocks(audio_path, sample_rate)
+    yield from _windows_from_blocks(blocks, window, overlap, sample_rate)
 
-    total_duration = len(y) / sr
 
-    chunks = []
-    start = 0.0
-    chunk_idx = 0
+def iter_audio_blocks(
+    audio_path: Path, sample_rate: int = SAMPLE_RATE
+) -> Iterator[np.ndarray]:
+    """
+    Decode an audio file as a stream of mono float32 blocks (~10s each).
 
-    while start < total_duration:
-        end = min(start + chunk_duration, total_duration)
+    Soundfile formats are read directly, everything else goes through an
+    ffmpeg pipe; without ffmpeg the whole file is loaded as one block.
+    """
+    audio_path = Path(audio_path)
+    if audio_path.suffix.lower() in SOUNDFILE_FORMATS:
+        try:
+            import soundfile as sf
 
-        # Extract chunk samples
-        start_sample = int(start * sr)
-        end_sample = int(end * sr)
-        chunk_audio_data = y[start_sample:end_sample]
+            info = sf.info(str(audio_path))
+        except Exception as e:
+            logger.debug(f"soundfile failed: {e}")
+        else:
+            yield from _soundfile_blocks(audio_path, info.samplerate, sample_rate)
+            return
 
-        # Save chunk
-        chunk_path = output_dir / f"chunk_{chunk_idx:04d}.wav"
-        sf.write(str(chunk_path), chunk_audio_data, sr)
+    if shutil.which("ffmpeg"):
+        yield from _ffmpeg_blocks(audio_path, sample_rate)
+    else:
+        y, sr = _load_audio_flexible(audio_path, sample_rate)
+        yield np.asarray(y, dtype=np.float32)
+
+
+def _windows_from_blocks(
+    blocks: Iterable[np.ndarray], window: int, overlap: int, sample_rate: int
+) -> Iterator[tuple[np.ndarray, float, float]]:
+    """Cut a stream of sample blocks into ``window``-sample windows."""
+    hop = window - overlap
+    pending: list[np.ndarray] = []
+    pending_len = 0
+    offset = 0  # Sample index of the first pending sample
+    emitted = 0
+
+    for block in blocks:
+        pending.append(block)
+        pending_len += len(block)
+        if pending_len < window:
+            continue
+        # Concatenate once per window instead of once per block
+        buf = np.concatenate(pending)
+        start = 0
+        while len(buf) - start >= window:
+            yield (
+                buf[start : start + window],
+                (offset + start) / sample_rate,
+                (offset + start + window) / sample_rate,
+            )
+            emitted += 1
+            start += hop
+        offset += start
+        pending = [buf[start:]]
+        pending_len = len(buf) - start
+
+    # The tail is already covered unless it extends past the last overlap
+    if pending_len and (emitted == 0 or pending_len > overlap):
+        tail = np.concatenate(pending)
+        yield tail, offset / sample_rate, (offset + len(tail)) / sample_rate
+
+
+def _soundfile_blocks(
+    audio_path: Path, source_rate: int, target_rate: int
+) -> Iterator[np.ndarray]:
+    """Read a soundfile-readable file in blocks of mono float32 at target_rate."""
+    import soundfile as sf
 
-        chunks.append((chunk_path, start, end))
-        logger.debug(f"Created chunk {chunk_idx}: {start:.2f}s - {end:.2f}s")
+    # Whole seconds per read, so each block resamples to an exact length
+    frames = source_rate * 10
+    with sf.SoundFile(str(audio_path)) as f:
+        while True:
+            data = f.read(frames, dtype="float32", always_2d=True)
+            if not len(data):
+                break
+            yield _to_mono_float32(data, source_rate, target_rate)
 
-        # Move to next chunk with overlap
-        start = end - overlap_duration
-        chunk_idx += 1
 
-        # Avoid infinite loop for very short remaining audio
-        if end >= total_duration:
-            break
+def _ffmpeg_blocks(audio_path: Path, sample_rate: int) -> Iterator[np.ndarray]:
+    """Decode any ffmpeg-readable file to mono float32 blocks through a pipe."""
+    import subprocess
+    import tempfile
 
-    logger.info(f"Split audio into {len(chunks)} chunks")
-    return chunks
+    cmd = [
+        "ffmpeg",
+        "-nostdin",
+        "-loglevel",
+        "error",
+        "-i",
+        str(audio_path),
+        "-f",
+        "f32le",
+        "-ac",
+        "1",
+        "-ar",
+        str(sample_rate),
+        "-",
+    ]
+    block_bytes = sample_rate * 10 * 4  # ~10s of float32
+    # stderr goes to a file so a chatty ffmpeg can never block on a full pipe
+    with tempfile.TemporaryFile() as stderr:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr)
+        try:
+            while True:
+                data = proc.stdout.read(block_bytes)
+                usable = len(data) - len(data) % 4
+                if usable:
+                    yield np.frombuffer(data[:usable], dtype=np.float32)
+                if len(data) < block_bytes:
+                    break
+        except BaseException:
+            # Consumer stopped early (or failed): don't wait for the decoder
+            proc.kill()
+            raise
+        finally:
+            proc.stdout.close()
+            proc.wait()
+
+        # A decoder error part-way (corrupt or truncated file) must not pass
+        # as a complete, shorter transcript
+        if proc.returncode != 0:
+            stderr.seek(0)
+            message = stderr.read().decode("utf-8", "replace").strip()
+            raise RuntimeError(
+                f"ffmpeg could not decode '{audio_path.name}' "
+                f"(exit code {proc.returncode}): {message}"
+            )
+
+
+def _to_mono_float32(y: np.ndarray, sr: int, target_sr: int) -> np.ndarray:
+    """Downmix (frames, channels) samples and resample to target_sr as float32."""
+    y = y.mean(axis=1, dtype=np.float32) if y.ndim > 1 else y.astype(np.float32)
+    if sr == target_sr:
+        return y
+    new_length = int(len(y) * target_sr / sr)
+    indices = np.linspace(0, len(y) - 1, new_length, dtype=np.float32)
+    return np.interp(indices, np.arange(len(y), dtype=np.float32), y).astype(np.float32)
 
 
 def adjust_segment_timestamps(
@@ -243,119 +372,191 @@ def merge_overlapping_segments(
     """
     Merge segments from multiple overlapping chunks.
 
-    Uses text deduplication to remove repeated content at chunk boundaries.
+    At each chunk boundary, only the words inside the overlap window are
+    aligned: the longest run of words both chunks transcribed there is the
+    seam. The previous chunk is kept up to the end of that run and the next
+    chunk resumes right after it. Without such a run, the overlap is split
+    at its midpoint by timestamp. Each boundary costs O(overlap), so merging
+    is linear in transcript length.
+
+    The chunk segments are shifted to global timestamps in place.
 
     Args:
         all_chunk_segments: List of (segments, chunk_start, chunk_end) tuples
-        overlap_duration: Duration of overlap between chunks
+        overlap_duration: Duration of overlap between chunks (0: concatenate)
 
     Returns:
         Merged list of segments without duplicates
     """
-    if not all_chunk_segments:
-        return []
-
-    if len(all_chunk_segments) == 1:
-        segments, chunk_start, _ = all_chunk_segments[0]
-        return adjust_segment_timestamps(segments, chunk_start)
-
+    merger = SegmentMerger(overlap_duration)
     merged_segments: list[TranscriptionSegment] = []
-    prev_chunk_text = ""
-
-    for i, (segments, chunk_start, chunk_end) in enumerate(all_chunk_segments):
-        # Adjust timestamps for this chunk
-        adjusted = adjust_segment_timestamps(segments, chunk_start)
-
-        if i == 0:
-            # First chunk: keep all segments
-            merged_segments.extend(adjusted)
-            # Remember the text for deduplication
-            prev_chunk_text = " ".join(s.text for s in adjusted)
-        else:
-            # For subsequent chunks, deduplicate overlapping text
-            for seg in adjusted:
-                seg_text = seg.text.strip()
-                if not seg_text:
-                    continue
-
-                # Check if this segment's text appears at the end of previous chunk
-                # Use a sliding window to find overlap
-                is_duplicate = _is_duplicate_text(prev_chunk_text, seg_text)
-
-                if not is_duplicate:
-                    merged_segments.append(seg)
-
-            # Update prev_chunk_text for next iteration
-            prev_chunk_text = " ".join(s.text for s in adjusted)
-
+    for segments, chunk_start, chunk_end in all_chunk_segments:
+        merged_segments.extend(merger.add(segments, chunk_start, chunk_end))
+    merged_segments.extend(merger.finish())
     return merged_segments
 
 
-def _is_duplicate_text(
-    prev_text: str, current_text: str, threshold: float = 0.8
-) -> bool:
+class SegmentMerger:
     """
-    Check if current_text is a duplicate of content at the end of prev_text.
+    Incremental form of ``merge_overlapping_segments``.
 
-    Uses substring matching and similarity to detect duplicates.
+    ``add()`` takes one chunk's segments and returns the merged segments that
+    are now final; with overlapping chunks the previous chunk's tail is held
+    back until the next chunk (or ``finish()``) decides the seam. The pieces
+    returned, in order, are exactly the merged transcript.
     """
-    if not prev_text or not current_text:
-        return False
-
-    prev_lower = prev_text.lower()
-    curr_lower = current_text.lower()
-
-    # Direct substring check (most common case)
-    if curr_lower in prev_lower:
-        return True
-
-    # Check if current text starts with content from end of previous
-    # Take the last portion of prev_text for comparison
-    prev_words = prev_lower.split()
-    curr_words = curr_lower.split()
-
-    if not prev_words or not curr_words:
-        return False
-
-    # Check last N words of prev against first N words of current
-    check_length = min(len(curr_words), 10)  # Check up to 10 words
-
-    for start in range(max(0, len(prev_words) - check_length * 2), len(prev_words)):
-        prev_suffix = " ".join(prev_words[start:])
-        curr_prefix = " ".join(curr_words[:check_length])
-
-        # Check similarity
-        similarity = SequenceMatcher(None, prev_suffix, curr_prefix).ratio()
-        if similarity > threshold:
-            return True
-
-        # Check if current starts with prev suffix
-        if curr_lower.startswith(prev_suffix) or prev_suffix.endswith(
-            curr_lower[: len(curr_lower) // 2]
-        ):
-            return True
-
-    return False
 
+    def __init__(self, overlap_duration: float = 2.0):
+        self.overlap_duration = overlap_duration
+        # Segments of the previous chunk not yet committed (its tail may be cut)
+        self._pending: Optional[list[TranscriptionSegment]] = None
+
+    def add(
+        self,
+        segments: list[TranscriptionSegment],
+        chunk_start: float,
+        chunk_end: float,
+    ) -> list[TranscriptionSegment]:
+        # Move this chunk onto the global timeline (in place: no per-word copies)
+        adjusted = []
+        for seg in segments:
+            seg.start_time += chunk_start
+            seg.end_time += chunk_start
+            if seg.text.strip():
+                adjusted.append(seg)
+
+        if self.overlap_duration <= 0:
+            # Non-overlapping chunks (VAD windows): nothing to deduplicate
+            return adjusted
+        if self._pending is None:
+            self._pending = adjusted
+            return []
+
+        kept_prev, kept_curr = _stitch(
+            self._pending, adjusted, chunk_start, chunk_start + self.overlap_duration
+        )
+        self._pending = kept_curr
+        return kept_prev
+
+    def finish(self) -> list[TranscriptionSegment]:
+        pending, self._pending = self._pending, None
+        return pending or []
+
+
+def _stitch(
+    prev: list[TranscriptionSegment],
+    curr: list[TranscriptionSegment],
+    overlap_start: float,
+    overlap_end: float,
+) -> tuple[list[TranscriptionSegment], list[TranscriptionSegment]]:
+    """Split two adjacent chunks' segments at their seam; returns what each keeps."""
+    # Untimed segments (start == end) may cover the whole chunk
+    prev_from = len(prev)
+    while prev_from > 0 and (
+        prev[prev_from - 1].end_time > overlap_start
+        or prev[prev_from - 1].end_time <= prev[prev_from - 1].start_time
+    ):
+        prev_from -= 1
+    curr_to = 0
+    while curr_to < len(curr) and curr[curr_to].start_time < overlap_end:
+        curr_to += 1
+
+    prev_tokens = _tokens(prev, prev_from, len(prev))[-MAX_OVERLAP_TOKENS:]
+    curr_tokens = _tokens(curr, 0, curr_to)[:MAX_OVERLAP_TOKENS]
+    p, c, length = _longest_common_run(
+        [t[0] for t in prev_tokens], [t[0] for t in curr_tokens]
+    )
+
+    if length < MIN_ANCHOR_TOKENS:
+        # No reliable textual seam: cut timed segments at the overlap midpoint
+        mid = (overlap_start + overlap_end) / 2
+        return (
+            [s for s in prev if s.start_time < mid or s.end_time <= s.start_time],
+            [s for s in curr if s.start_time >= mid or s.end_time <= s.start_time],
+        )
 
-def cleanup_chunks(chunks: list[tuple[Path, float, float]]) -> None:
+    # Previous chunk ends with the last word of the run
+    _, seg_idx, word_idx = prev_tokens[p + length - 1]
+    kept_prev = prev[:seg_idx]
+    head = _slice_words(prev[seg_idx], 0, word_idx + 1)
+    if head is not None:
+        kept_prev.append(head)
+
+    # Next chunk resumes right after it
+    _, seg_idx, word_idx = curr_tokens[c + length - 1]
+    tail = _slice_words(curr[seg_idx], word_idx + 1, None)
+    kept_curr = ([tail] if tail is not None else []) + curr[seg_idx + 1 :]
+    return kept_prev, kept_curr
+
+
+def _tokens(segments: list[TranscriptionSegment], start: int, end: int) -> list[_Token]:
+    tokens = []
+    for seg_idx in range(start, end):
+        for word_idx, word in enumerate(segments[seg_idx].text.split()):
+            norm = _WORD_CHARS.sub("", word.lower())
+            if norm:
+                tokens.append((norm, seg_idx, word_idx))
+    return tokens
+
+
+def _slice_words(
+    seg: TranscriptionSegment, start: int, end: Optional[int]
+) -> Optional[TranscriptionSegment]:
+    """Copy of seg keeping words[start:end]; None if nothing is left."""
+    words = seg.text.split()
+    if start == 0 and (end is None or end >= len(words)):
+        return seg
+    kept = words[start:end]
+    if not kept:
+        return None
+    return replace(seg, text=" ".join(kept))
+
+
+def _longest_common_run(a: list[str], b: list[str]) -> tuple[int, int, int]:
     """
-    Clean up temporary chunk files.
+    Longest contiguous run shared by a and b, as (start in a, start in b, length).
 
-    Args:
-        chunks: List of (chunk_path, start, end) tuples
+    Binary search over the length with a rolling hash per candidate length:
+    O((len(a) + len(b)) * log(min(len(a), len(b)))).
     """
-    for chunk_path, _, _ in chunks:
-        try:
-            if chunk_path.exists():
-                chunk_path.unlink()
-        except Exception as e:
-            logger.warning(f"Failed to delete chunk {chunk_path}: {e}")
-
-    # Try to remove the parent directory if empty
-    if chunks:
-        parent_dir = chunks[0][0].parent
-        try:
-            parent_dir.rmdir()
-        except OSError:
-            pass  # Directory not empty or other error
+    if not a or not b:
+        return 0, 0, 0
+    ids: dict[str, int] = {}
+    a_ids = [ids.setdefault(w, len(ids) + 1) for w in a]
+    b_ids = [ids.setdefault(w, len(ids) + 1) for w in b]
+
+    best = (0, 0, 0)
+    lo, hi = 1, min(len(a), len(b))
+    while lo <= hi:
+        length = (lo + hi) // 2
+        match = _find_common_run(a_ids, b_ids, length)
+        if match is None:
+            hi = length - 1
+        else:
+            best = (match[0], match[1], length)
+            lo = length + 1
+    return best
+
+
+def _run_hashes(ids: list[int], length: int) -> Iterator[tuple[int, int]]:
+    """(start, hash) of every window of ``length`` ids."""
+    power = pow(_HASH_BASE, length, _HASH_MOD)
+    h = 0
+    for i, x in enumerate(ids):
+        h = (h * _HASH_BASE + x) % _HASH_MOD
+        if i >= length:
+            h = (h - ids[i - length] * power) % _HASH_MOD
+        if i >= length - 1:
+            yield i - length + 1, h
+
+
+def _find_common_run(
+    a: list[int], b: list[int], length: int
+) -> Optional[tuple[int, int]]:
+    # Keep the last occurrence in a: the seam should be as late as possible
+    seen = {h: i for i, h in _run_hashes(a, length)}
+    for j, h in _run_hashes(b, length):
+        i = seen.get(h)
+        if i is not None and a[i : i + length] == b[j : j + length]:
+            return i, j
+    return None
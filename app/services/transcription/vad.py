@@ -0,0 +1,182 @@
+"""
+Energy-based voice activity detection (VAD) front-end for chunked ASR.
+
+Fixed 30s/60s windows send silence, quiet intros/outros and the 2s overlaps
+through the model. ``EnergyVAD`` instead cuts the decoded stream at pauses
+in speech and drops the spans in between, yielding non-overlapping windows
+of at most ``max_window_duration`` seconds, so chunk results can simply be
+concatenated.
+
+Speech is any 30ms frame whose energy is a margin above an adaptive noise
+floor: a low percentile of the last ~30s of frames heard in pauses, i.e.
+outside any speech window. Frames inside speech never feed the floor, so a
+long stretch of speech cannot raise it to its own quiet parts. Until enough
+pause frames are seen, the floor is the lowest block-level estimate so far.
+This catches silence and steady beds under speech; loud music is still
+treated as speech.
+"""
+
+import logging
+from collections import deque
+from typing import Deque, Iterable, Iterator, Optional
+
+import numpy as np
+
+from .utils import SAMPLE_RATE
+
+logger = logging.getLogger(__name__)
+
+FRAME_SECONDS = 0.03
+# Pause frames used to estimate the noise floor (~30s)
+FLOOR_HISTORY_FRAMES = 1000
+# Pause frames needed (~1s) before they replace the block-level estimate
+FLOOR_MIN_FRAMES = 33
+FLOOR_PERCENTILE = 10
+
+
+class EnergyVAD:
+    """
+    Splits a stream of mono float32 blocks into speech windows.
+
+    ``audio_seconds`` and ``speech_seconds`` report how much of the stream
+    was read and how much was kept, once ``windows()`` is exhausted.
+    """
+
+    def __init__(
+        self,
+        max_window_duration: float = 30.0,
+        sample_rate: int = SAMPLE_RATE,
+        split_silence: float = 0.6,
+        padding: float = 0.2,
+        min_speech: float = 0.25,
+        margin_db: float = 6.0,
+        min_threshold_db: float = -50.0,
+    ):
+        """
+        Args:
+            max_window_duration: Longest window handed to the model
+            sample_rate: Sample rate of the incoming blocks
+            split_silence: Pause length (seconds) that ends a window
+            padding: Audio kept before and after each speech span
+            min_speech: Windows with less speech than this are dropped
+            margin_db: How far above the noise floor speech must be
+            min_threshold_db: Speech threshold never goes below this (dBFS)
+        """
+        self.sample_rate = sample_rate
+        self.frame = int(FRAME_SECONDS * sample_rate)
+        self.max_window = int(max_window_duration * sample_rate)
+        self.split_silence = int(split_silence * sample_rate)
+        self.padding = int(padding * sample_rate)
+        self.min_speech = int(min_speech * sample_rate)
+        self.margin_db = margin_db
+        self.min_threshold_db = min_threshold_db
+        self.audio_seconds = 0.0
+        self.speech_seconds = 0.0
+
+    def _frame_db(self, samples: np.ndarray) -> np.ndarray:
+        frames = samples.reshape(-1, self.frame)
+        rms = np.sqrt(np.mean(np.square(frames, dtype=np.float32), axis=1))
+        return 20 * np.log10(rms + 1e-10)
+
+    def windows(
+        self, blocks: Iterable[np.ndarray]
+    ) -> Iterator[tuple[np.ndarray, float, float]]:
+        """Yield (samples, start_time, end_time) for each speech window."""
+        sr = self.sample_rate
+        buf = np.zeros(0, dtype=np.float32)
+        buf_offset = 0  # Absolute sample index of buf[0]
+        pos = 0  # Absolute sample index of the next frame to classify
+        emitted_end = 0
+        # dB of recent frames heard outside speech windows
+        noise: Deque[np.ndarray] = deque()
+        noise_frames = 0
+        initial_floor = float("inf")
+
+        win_start: Optional[int] = None
+        last_speech_end = 0
+        speech_len = 0
+        cut: Optional[int] = None  # Quietest point in the window's second half
+        cut_db = 0.0
+
+        def emit(start: int, end: int):
+            nonlocal emitted_end
+            emitted_end = end
+            if speech_len < self.min_speech or end <= start:
+                return None
+            self.speech_seconds += (end - start) / sr
+            return buf[start - buf_offset : end - buf_offset], start / sr, end / sr
+
+        for block in blocks:
+            buf = np.concatenate([buf, block]) if len(buf) else block
+            self.audio_seconds += len(block) / sr
+            usable = (buf_offset + len(buf) - pos) // self.frame * self.frame
+            if not usable:
+                continue
+            db = self._frame_db(buf[pos - buf_offset : pos - buf_offset + usable])
+
+            if noise_frames >= FLOOR_MIN_FRAMES:
+                floor = float(np.percentile(np.concatenate(noise), FLOOR_PERCENTILE))
+            else:
+                block_floor = float(np.percentile(db, FLOOR_PERCENTILE))
+                initial_floor = floor = min(initial_floor, block_floor)
+            threshold = max(floor + self.margin_db, self.min_threshold_db)
+
+            ready = []
+            quiet = []
+            for frame_db in db.tolist():
+                i = pos
+                pos += self.frame
+                if frame_db > threshold:
+                    if win_start is None:
+                        win_start = max(i - self.padding, emitted_end, buf_offset)
+                        speech_len, cut = 0, None
+                    last_speech_end = pos
+                    speech_len += self.frame
+                elif (
+                    win_start is not None
+                    and pos - last_speech_end >= self.split_silence
+                ):
+                    end = min(last_speech_end + self.padding, pos)
+                    ready.append(emit(win_start, end))
+                    win_start = None
+
+                if win_start is None:
+                    if frame_db <= threshold:
+                        quiet.append(frame_db)
+                    continue
+                if i >= win_start + self.max_window // 2 and (
+                    cut is None or frame_db <= cut_db
+                ):
+                    cut, cut_db = i + self.frame // 2, frame_db
+                if pos - win_start >= self.max_window:
+                    # No pause long enough: cut at the quietest recent frame
+                    end = cut if cut is not None else pos
+                    ready.append(emit(win_start, end))
+                    win_start, cut = end, None
+                    speech_len = self.min_speech  # Still mid-speech
+
+            if quiet:
+                noise.append(np.array(quiet))
+                noise_frames += len(quiet)
+                while noise_frames - len(noise[0]) >= FLOOR_HISTORY_FRAMES:
+                    noise_frames -= len(noise.popleft())
+
+            for window in ready:
+                if window is not None:
+                    yield window
+
+            # Keep only what a future window can still start from
+            keep = win_start if win_start is not None else pos - self.padding
+            keep = max(keep, buf_offset)
+            buf = buf[keep - buf_offset :]
+            buf_offset = keep
+
+        if win_start is not None:
+            end = min(last_speech_end + self.padding, buf_offset + len(buf))
+            window = emit(win_start, end)
+            if window is not None:
+                yield window
+
+        logger.info(
+            f"VAD kept {self.speech_seconds:.1f}s of {self.audio_seconds:.1f}s audio"
+        )
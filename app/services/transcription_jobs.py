@@ -0,0 +1,542 @@
+"""
+Persistent transcription job queue.
+
+Transcription requests insert a row into ``transcription_jobs``; a fixed
+number of workers (TRANSCRIPTION_WORKERS) lease jobs by priority with
+``SELECT ... FOR UPDATE SKIP LOCKED``, so concurrent model runs stay bounded
+and queued work survives a restart.
+
+While a job runs, its worker renews the lease and stores the per-chunk
+progress reported by the engine. A cancel request is picked up at the next
+renewal and aborts the run before its next chunk. If a worker dies, its
+lease expires and another worker re-leases the job (up to max_attempts).
+
+Job kinds map to handlers registered by the routers that enqueue them
+(``register_handler``).
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import threading
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.core.db import AsyncSessionLocal
+from app.models.transcription_orm import TranscriptionJob
+from app.services.transcription import (
+    AudioInput,
+    TranscriptionResult,
+    TranscriptionSegment,
+)
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_STATUSES = ("queued", "running")
+# Idle workers poll this often (enqueue in this process wakes them at once)
+POLL_INTERVAL_SECONDS = 2.0
+# Running jobs persist progress (and renew their lease) at least this often
+PROGRESS_FLUSH_SECONDS = 5.0
+# Finished transcript segments are handed to the job's handler this often
+PARTIAL_FLUSH_SECONDS = 2.0
+# Payload fields (callers' credentials) removed once a job has finished
+SECRET_PAYLOAD_KEYS = ("api_key",)
+# Hostname prefix kept in worker ids (k8s pod names / FQDNs can be long)
+WORKER_HOST_CHARS = 32
+
+# Receives every final segment so far (e.g. to save a partial transcript)
+PartialSegmentsHook = Callable[[List[TranscriptionSegment]], Awaitable[None]]
+
+
+def _without_secrets(payload: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """The payload to keep on a finished job: no credentials at rest."""
+    return {k: v for k, v in (payload or {}).items() if k not in SECRET_PAYLOAD_KEYS}
+
+
+class JobCancelled(Exception):
+    """Raised inside a running job once its cancellation was requested."""
+
+
+class JobContext:
+    """
+    What a handler sees of its job: the payload plus progress/cancel hooks.
+
+    ``report`` and ``check_cancelled`` are thread-safe, so engine progress
+    callbacks can call them from the threadpool.
+    """
+
+    def __init__(self, job_id: int, target_key: str, payload: Dict[str, Any]):
+        self.job_id = job_id
+        self.target_key = target_key
+        self.payload = payload
+        self.cancelled = threading.Event()
+        self._progress: Tuple[float, Optional[str]] = (0.0, None)
+
+    @property
+    def progress(self) -> Tuple[float, Optional[str]]:
+        return self._progress
+
+    def report(self, fraction: float, message: Optional[str] = None) -> None:
+        self._progress = (min(max(fraction, 0.0), 1.0), message)
+
+    def check_cancelled(self) -> None:
+        if self.cancelled.is_set():
+            raise JobCancelled(f"Job {self.job_id} cancelled")
+
+    def _on_chunk(self, done: int, total: int) -> None:
+        self.check_cancelled()
+        fraction = done / total if total else 1.0
+        self.report(fraction, f"{round(fraction * 100)}% transcribed")
+
+    async def transcribe(
+        self,
+        audio_path: Path,
+        remote_url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        on_segments: Optional[PartialSegmentsHook] = None,
+    ) -> TranscriptionResult:
+        """
+        Run the engine in the threadpool with progress and cancellation wired.
+
+        With ``on_segments``, segments the engine has finished are collected
+        as chunks complete and awaited with all segments so far every
+        PARTIAL_FLUSH_SECONDS, until the run ends.
+        """
+        from app.services.transcription import get_default_engine
+
+        segments: List[TranscriptionSegment] = []
+        lock = threading.Lock()
+
+        def collect(new: List[TranscriptionSegment]) -> None:
+            with lock:
+                segments.extend(new)
+
+        def do_transcription():
+            engine = get_default_engine(remote_url=remote_url, api_key=api_key)
+            return engine.transcribe(
+                AudioInput.from_file(audio_path),
+                on_progress=self._on_chunk,
+                on_segments=collect if on_segments else None,
+            )
+
+        self.check_cancelled()
+        if on_segments is None:
+            return await run_in_threadpool(do_transcription)
+
+        run = asyncio.ensure_future(run_in_threadpool(do_transcription))
+        flushed = 0
+        while not run.done():
+            await asyncio.wait([run], timeout=PARTIAL_FLUSH_SECONDS)
+            with lock:
+                snapshot = list(segments)
+            # Once the run is done, the handler saves the full result instead.
+            # A cancelled run (e.g. replaced by a forced re-run) stops writing
+            # at once rather than at its next chunk boundary.
+            if self.cancelled.is_set():
+                continue
+            if len(snapshot) > flushed and not run.done():
+                try:
+                    await on_segments(snapshot)
+                except Exception as e:
+                    logger.warning(f"Saving partial transcript failed: {e}")
+                flushed = len(snapshot)
+        return run.result()
+
+
+JobHandler = Callable[[JobContext], Awaitable[None]]
+# Called when a job ends without its handler finishing (cancelled while
+# queued, or failed after its worker was lost)
+JobAbandonedHook = Callable[[Dict[str, Any], str], Awaitable[None]]
+
+
+class TranscriptionJobQueue:
+    """DB-backed queue plus the in-process worker pool that drains it."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+        workers: Optional[int] = None,
+        lease_seconds: Optional[int] = None,
+    ):
+        self._session_factory = session_factory
+        self.workers = workers or settings.TRANSCRIPTION_WORKERS
+        self.lease_seconds = lease_seconds or settings.TRANSCRIPTION_JOB_LEASE_SECONDS
+        # Unique per process, so a restarted server never "owns" old leases.
+        # The hostname is cut short so the id fits lease_owner (String(64)).
+        host = socket.gethostname()[:WORKER_HOST_CHARS]
+        self.worker_id = f"{host}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+        self._handlers: Dict[str, JobHandler] = {}
+        self._abandoned_hooks: Dict[str, JobAbandonedHook] = {}
+        self._tasks: List[asyncio.Task] = []
+        self._wakeup = asyncio.Event()
+        self._running: Dict[int, JobContext] = {}
+
+    def register_handler(
+        self,
+        kind: str,
+        handler: JobHandler,
+        on_abandoned: Optional[JobAbandonedHook] = None,
+    ) -> None:
+        self._handlers[kind] = handler
+        if on_abandoned:
+            self._abandoned_hooks[kind] = on_abandoned
+
+    # --- Producer API ---
+
+    async def enqueue(
+        self,
+        kind: str,
+        target_key: str,
+        payload: Dict[str, Any],
+        user_id: Optional[str] = None,
+        priority: int = 0,
+        replace: bool = False,
+    ) -> TranscriptionJob:
+        """
+        Queue a job, or return the active one for the same target.
+
+        With ``replace=True`` an active job for the target is cancelled and a
+        new one queued (the "force" option of the transcribe endpoints).
+        """
+        async with self._session_factory() as db:
+            active = await self._active_job(db, target_key)
+            if active is not None:
+                if not replace:
+                    return active
+                # The new job takes over the target, so no abandoned hook
+                await self._request_cancel(db, active, notify=False)
+
+            job = TranscriptionJob(
+                kind=kind,
+                target_key=target_key,
+                payload=payload,
+                user_id=user_id,
+                priority=priority,
+                status="queued",
+                progress=0.0,
+                cancel_requested=False,
+                attempts=0,
+                max_attempts=settings.TRANSCRIPTION_JOB_MAX_ATTEMPTS,
+            )
+            db.add(job)
+            await db.commit()
+
+        self._wakeup.set()
+        logger.info(f"Queued transcription job {job.id} ({target_key}, p={priority})")
+        return job
+
+    async def get(self, job_id: int) -> Optional[TranscriptionJob]:
+        async with self._session_factory() as db:
+            return await db.get(TranscriptionJob, job_id)
+
+    async def list_jobs(
+        self, user_id: Optional[str] = None, active_only: bool = True, limit: int = 50
+    ) -> List[TranscriptionJob]:
+        stmt = select(TranscriptionJob)
+        if user_id is not None:
+            stmt = stmt.where(TranscriptionJob.user_id == user_id)
+        if active_only:
+            stmt = stmt.where(TranscriptionJob.status.in_(ACTIVE_STATUSES))
+        stmt = stmt.order_by(
+            TranscriptionJob.priority.desc(), TranscriptionJob.id
+        ).limit(limit)
+        async with self._session_factory() as db:
+            return list((await db.execute(stmt)).scalars().all())
+
+    async def cancel(self, job_id: int) -> Optional[TranscriptionJob]:
+        """Cancel a queued job now, or ask its worker to stop a running one."""
+        async with self._session_factory() as db:
+            job = await db.get(TranscriptionJob, job_id)
+            if job is None:
+                return None
+            await self._request_cancel(db, job)
+            return job
+
+    async def _active_job(
+        self, db: AsyncSession, target_key: str
+    ) -> Optional[TranscriptionJob]:
+        result = await db.execute(
+            select(TranscriptionJob)
+            .where(
+                TranscriptionJob.target_key == target_key,
+                TranscriptionJob.status.in_(ACTIVE_STATUSES),
+            )
+            .order_by(TranscriptionJob.id.desc())
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
+
+    async def has_other_active_job(self, target_key: str, job_id: int) -> bool:
+        """True if a newer/other job is queued or running for the same target."""
+        async with self._session_factory() as db:
+            active = await self._active_job(db, target_key)
+            return active is not None and active.id != job_id
+
+    async def _request_cancel(
+        self, db: AsyncSession, job: TranscriptionJob, notify: bool = True
+    ) -> None:
+        if job.status == "queued":
+            # Not leased yet: no worker will ever see it, finish it here
+            result = await db.execute(
+                update(TranscriptionJob)
+                .where(
+                    TranscriptionJob.id == job.id,
+                    TranscriptionJob.status == "queued",
+                )
+                .values(
+                    status="cancelled",
+                    cancel_requested=True,
+                    payload=_without_secrets(job.payload),
+                    finished_at=datetime.utcnow(),
+                )
+            )
+            await db.commit()
+            if result.rowcount and notify:
+                await self._notify_abandoned(job.kind, job.payload, "cancelled")
+        elif job.status == "running":
+            await db.execute(
+                update(TranscriptionJob)
+                .where(TranscriptionJob.id == job.id)
+                .values(cancel_requested=True)
+            )
+            await db.commit()
+            if job.id in self._running:
+                self._running[job.id].cancelled.set()
+        await db.refresh(job)
+
+    async def _notify_abandoned(
+        self, kind: str, payload: Dict[str, Any], status: str
+    ) -> None:
+        hook = self._abandoned_hooks.get(kind)
+        if hook is None:
+            return
+        try:
+            await hook(payload, status)
+        except Exception as e:
+            logger.error(f"Abandoned-job hook for {kind} failed: {e}")
+
+    # --- Workers ---
+
+    def start(self) -> None:
+        if self._tasks:
+            return
+        self._wakeup = asyncio.Event()
+        self._tasks = [
+            asyncio.create_task(self._worker_loop()) for _ in range(self.workers)
+        ]
+        logger.info(
+            f"Transcription workers started ({self.workers}, id={self.worker_id})"
+        )
+
+    async def stop(self) -> None:
+        """
+        Stop the workers. Running jobs keep their lease until it expires and
+        are then re-leased, by this process after a restart or by another one.
+        """
+        for ctx in self._running.values():
+            ctx.cancelled.set()
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _worker_loop(self) -> None:
+        while True:
+            try:
+                job = await self.lease_next()
+            except Exception as e:
+                logger.error(f"Leasing transcription job failed: {e}")
+                job = None
+
+            if job is None:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(
+                        self._wakeup.wait(), timeout=POLL_INTERVAL_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            await self.run_job(job)
+
+    async def lease_next(self) -> Optional[TranscriptionJob]:
+        """
+        Lease the highest-priority runnable job, or None.
+
+        Runnable means queued, or running under a lease that expired (its
+        worker crashed). SKIP LOCKED lets concurrent workers (and servers)
+        lease different rows; the conditional UPDATE keeps backends without
+        row locks (SQLite) from leasing a row twice.
+        """
+        while True:
+            now = datetime.utcnow()
+            runnable = or_(
+                TranscriptionJob.status == "queued",
+                and_(
+                    TranscriptionJob.status == "running",
+                    TranscriptionJob.lease_expires_at < now,
+                ),
+            )
+            async with self._session_factory() as db:
+                result = await db.execute(
+                    select(TranscriptionJob)
+                    .where(runnable)
+                    .order_by(TranscriptionJob.priority.desc(), TranscriptionJob.id)
+                    .limit(1)
+                    .with_for_update(skip_locked=True)
+                )
+                job = result.scalar_one_or_none()
+                if job is None:
+                    return None
+
+                if job.status == "running" and (
+                    job.cancel_requested or job.attempts >= job.max_attempts
+                ):
+                    # Stale lease that must not run again
+                    status = "cancelled" if job.cancel_requested else "failed"
+                    claimed = await db.execute(
+                        update(TranscriptionJob)
+                        .where(TranscriptionJob.id == job.id, runnable)
+                        .values(
+                            status=status,
+                            error=job.error
+                            or f"Worker lost after {job.attempts} attempts",
+                            payload=_without_secrets(job.payload),
+                            lease_owner=None,
+                            lease_expires_at=None,
+                            finished_at=now,
+                        )
+                    )
+                    await db.commit()
+                    if claimed.rowcount:
+                        logger.warning(f"Transcription job {job.id} {status} (stale)")
+                        await self._notify_abandoned(job.kind, job.payload, status)
+                    continue
+
+                if job.status == "running":
+                    logger.warning(
+                        f"Re-leasing transcription job {job.id} from {job.lease_owner}"
+                    )
+
+                claimed = await db.execute(
+                    update(TranscriptionJob)
+                    .where(TranscriptionJob.id == job.id, runnable)
+                    .values(
+                        status="running",
+                        lease_owner=self.worker_id,
+                        lease_expires_at=now + timedelta(seconds=self.lease_seconds),
+                        attempts=TranscriptionJob.attempts + 1,
+                        started_at=now,
+                        error=None,
+                    )
+                )
+                await db.commit()
+                if not claimed.rowcount:
+                    continue  # Another worker won the race
+                await db.refresh(job)
+                return job
+
+    async def run_job(self, job: TranscriptionJob) -> None:
+        """Run a leased job to completion, renewing its lease meanwhile."""
+        ctx = JobContext(job.id, job.target_key, dict(job.payload or {}))
+        handler = self._handlers.get(job.kind)
+        self._running[job.id] = ctx
+        heartbeat = asyncio.create_task(self._heartbeat(ctx))
+
+        status, error = "completed", None
+        try:
+            if handler is None:
+                raise ValueError(f"No handler registered for job kind {job.kind!r}")
+            await handler(ctx)
+        except JobCancelled:
+            status = "cancelled"
+        except asyncio.CancelledError:
+            # Server shutting down: leave the lease to expire and be re-leased
+            heartbeat.cancel()
+            self._running.pop(job.id, None)
+            raise
+        except Exception as e:
+            status, error = "failed", str(e)[:2000]
+            logger.error(f"Transcription job {job.id} failed: {e}")
+        finally:
+            heartbeat.cancel()
+            self._running.pop(job.id, None)
+
+        async with self._session_factory() as db:
+            await db.execute(
+                update(TranscriptionJob)
+                .where(
+                    TranscriptionJob.id == job.id,
+                    TranscriptionJob.lease_owner == self.worker_id,
+                )
+                .values(
+                    status=status,
+                    error=error,
+                    progress=1.0 if status == "completed" else ctx.progress[0],
+                    progress_message=ctx.progress[1],
+                    payload=_without_secrets(job.payload),
+                    lease_owner=None,
+                    lease_expires_at=None,
+                    finished_at=datetime.utcnow(),
+                )
+            )
+            await db.commit()
+        logger.info(f"Transcription job {job.id} {status}")
+
+    async def _heartbeat(self, ctx: JobContext) -> None:
+        """Renew the lease, persist progress, and pick up cancel requests."""
+        interval = min(self.lease_seconds / 3, PROGRESS_FLUSH_SECONDS)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self._renew(ctx)
+            except Exception as e:
+                logger.warning(f"Lease renewal for job {ctx.job_id} failed: {e}")
+
+    async def _renew(self, ctx: JobContext) -> None:
+        fraction, message = ctx.progress
+        async with self._session_factory() as db:
+            await db.execute(
+                update(TranscriptionJob)
+                .where(
+                    TranscriptionJob.id == ctx.job_id,
+                    TranscriptionJob.lease_owner == self.worker_id,
+                )
+                .values(
+                    lease_expires_at=datetime.utcnow()
+                    + timedelta(seconds=self.lease_seconds),
+                    progress=fraction,
+                    progress_message=message,
+                )
+            )
+            await db.commit()
+            cancel_requested = await db.scalar(
+                select(TranscriptionJob.cancel_requested).where(
+                    TranscriptionJob.id == ctx.job_id
+                )
+            )
+        if cancel_requested:
+            ctx.cancelled.set()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "worker_id": self.worker_id,
+            "workers": self.workers,
+            "running": {
+                job_id: {"progress": ctx.progress[0], "message": ctx.progress[1]}
+                for job_id, ctx in self._running.items()
+            },
+        }
+
+
+transcription_queue = TranscriptionJobQueue()
@@ -2,11 +2,11 @@
 TTS Service - Text-to-Speech using Deepgram API (Primary) with Edge TTS fallback.
 """
 
-import httpx
 import edge_tts
 import logging
 
 from app.config import settings
+from app.core.http import http_clients
 
 logger = logging.getLogger(__name__)
 
@@ -45,15 +45,15 @@ class TTSService:
         }
         payload = {"text": text}
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(url, headers=headers, json=payload)
+        client = http_clients.get(use_proxy=False)
+        response = await client.post(url, headers=headers, json=payload, timeout=30.0)
 
-            if response.status_code != 200:
-                raise Exception(
-                    f"Deepgram TTS Failed ({response.status_code}): {response.text}"
-                )
+        if response.status_code != 200:
+            raise Exception(
+                f"Deepgram TTS Failed ({response.status_code}): {response.text}"
+            )
 
-            return response.content
+        return response.content
 
     async def _generate_edge(self, text: str, voice: str = None) -> bytes:
         """Generate audio using Edge TTS (fallback)."""
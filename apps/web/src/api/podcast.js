@@ -144,6 +144,36 @@ export async function refreshFeed(feedId) {
   return response.json();
 }
 
+/**
+ * Cover art served through the server's image cache.
+ * `size` is the rendered size in CSS px; the server picks a thumbnail
+ * covering it at 2x density.
+ */
+const coverSize = (size) => Math.round(size * 2);
+
+export function feedImageUrl(feedId, size) {
+  return `${BASE_URL}/feed/${feedId}/image?size=${coverSize(size)}`;
+}
+
+/**
+ * Episode artwork, falling back to the feed's, or null when neither has one.
+ */
+export function episodeCoverUrl(episode, feed, size) {
+  if (episode?.image_url && episode.id) {
+    return `${BASE_URL}/episode/${episode.id}/image?size=${coverSize(size)}`;
+  }
+  if (feed?.image_url && feed.id) return feedImageUrl(feed.id, size);
+  return null;
+}
+
+/**
+ * Search/trending artwork via the signed proxy (`artwork_token`).
+ */
+export function artworkImageUrl(podcast, size) {
+  if (!podcast.artwork_token) return podcast.artwork_url || null;
+  return `${BASE_URL}/proxy/image?token=${encodeURIComponent(podcast.artwork_token)}&size=${coverSize(size)}`;
+}
+
 /**
  * Import OPML file.
  */
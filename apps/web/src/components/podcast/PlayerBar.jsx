@@ -4,6 +4,7 @@
  */
 
 import { usePodcast } from "../../context/PodcastContext";
+import { episodeCoverUrl } from "../../api/podcast";
 import {
   Play,
   Pause,
@@ -50,6 +51,8 @@ export default function PlayerBar() {
 
   if (!currentEpisode) return null;
 
+  const coverUrl = episodeCoverUrl(currentEpisode, currentFeed, 56);
+
   const progress = duration > 0 ? (currentTime / duration) * 100 : 0;
 
   return (
@@ -85,9 +88,9 @@ export default function PlayerBar() {
         {/* Episode info */}
         <div className="flex items-center gap-3 flex-1 min-w-0">
           <div className="relative flex-shrink-0">
-            {currentEpisode.image_url || currentFeed?.image_url ? (
+            {coverUrl ? (
               <img
-                src={currentEpisode.image_url || currentFeed?.image_url}
+                src={coverUrl}
                 alt=""
                 referrerPolicy="no-referrer"
                 className="w-12 h-12 md:w-14 md:h-14 rounded-md object-cover border border-white/10 shadow-lg"
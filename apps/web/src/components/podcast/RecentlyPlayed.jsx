@@ -114,7 +114,7 @@ export default function RecentlyPlayed() {
                             <div className="relative aspect-square">
                                 {(item.episode.image_url || item.feed.image_url) ? (
                                     <img
-                                        src={item.episode.image_url || item.feed.image_url}
+                                        src={podcastApi.episodeCoverUrl(item.episode, item.feed, 192)}
                                         alt=""
                                         referrerPolicy="no-referrer"
                                         className="w-full h-full object-cover"
@@ -694,7 +694,7 @@ export default function PodcastFeedDetailView() {
             <div className="relative group/image flex-shrink-0 mx-auto sm:mx-0">
               <div className="absolute inset-0 bg-accent-primary/20 blur-xl opacity-0 group-hover/image:opacity-50 transition-opacity duration-500 rounded-full" />
               <img
-                src={feed.image_url}
+                src={podcastApi.feedImageUrl(feed.id, 192)}
                 alt={feed.title}
                 referrerPolicy="no-referrer"
                 className="w-40 h-40 sm:w-48 sm:h-48 rounded-2xl object-cover border border-white/10 shadow-2xl relative z-10"
@@ -347,7 +347,7 @@ export default function PodcastLibraryView() {
                   <div className="aspect-square relative overflow-hidden">
                     {feed.image_url ? (
                       <img
-                        src={feed.image_url}
+                        src={podcastApi.feedImageUrl(feed.id, 256)}
                         alt={feed.title}
                         referrerPolicy="no-referrer"
                         loading="lazy"
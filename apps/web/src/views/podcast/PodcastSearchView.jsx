@@ -217,7 +217,7 @@ export default function PodcastSearchView() {
                       <div className="relative flex-shrink-0">
                         <div className="absolute inset-0 bg-accent-primary/20 blur-md opacity-0 group-hover:opacity-100 transition-opacity rounded-xl" />
                         <img
-                          src={podcast.artwork_url}
+                          src={podcastApi.artworkImageUrl(podcast, 96)}
                           alt=""
                           referrerPolicy="no-referrer"
                           className="w-20 h-20 sm:w-24 sm:h-24 rounded-xl object-cover border border-white/10 relative z-10 shadow-lg"
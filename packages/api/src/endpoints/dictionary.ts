@@ -46,6 +46,31 @@ export const dictionaryApi = {
     return res.json();
   },
 
+  /**
+   * Look up many words in one request (e.g. to pre-warm a chapter's vocabulary).
+   * The server streams NDJSON; results are keyed by the requested word.
+   */
+  async lookupBatch(
+    words: string[],
+    source: "ldoce" | "collins" = "ldoce",
+  ): Promise<Record<string, DictionaryEntry>> {
+    const res = await authFetch("/api/dictionary/batch", {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify({ words, source }),
+    });
+    if (!res.ok) return {};
+
+    const text = await res.text();
+    const entries: Record<string, DictionaryEntry> = {};
+    for (const line of text.split("\n")) {
+      if (!line.trim()) continue;
+      const entry: DictionaryEntry = JSON.parse(line);
+      entries[entry.word] = entry;
+    }
+    return entries;
+  },
+
   /**
    * Look up word in both dictionaries simultaneously
    */
@@ -3222,6 +3222,8 @@ export interface components {
             rss_url?: string | null;
             /** Artwork Url */
             artwork_url?: string | null;
+            /** Artwork Token */
+            artwork_token?: string | null;
             /** Genre */
             genre?: string | null;
             /** Episode Count */
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Pre-parse every Collins/LDOCE headword into structured JSON stored in the dictionary DB.
+
+Usage:
+    uv run python scripts/build_parsed_dictionary.py
+    uv run python scripts/build_parsed_dictionary.py --source ldoce
+
+Requires databases with a rendered_entries table (scripts/convert_mdx_to_sqlite.py).
+For each headword this runs the same parser as /api/dictionary/{source}/{word}
+(so the MAX_*_PER_* truncation limits are applied here, at build time) and
+stores the model JSON, minus the "word" field, compressed in parsed_entries.
+The API then serves these bytes directly without touching BeautifulSoup.
+"""
+
+import argparse
+import logging
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+from bs4 import BeautifulSoup
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.collins_parser import collins_parser  # noqa: E402
+from app.services.ldoce_parser import ldoce_parser  # noqa: E402
+from app.services.dictionary import (  # noqa: E402
+    DICT_BASE_DIR,
+    RENDERED_SQL,
+    compress_blob,
+    decompress_html,
+    dictionary_matches_source,
+    normalize_key,
+)
+
+MAX_CROSS_REF_DEPTH = 2  # Same limit as the Collins API route
+
+
+def create_parsed_table(conn: sqlite3.Connection) -> None:
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS parsed_entries (
+            word TEXT PRIMARY KEY,
+            word_lower TEXT NOT NULL,
+            data BLOB NOT NULL,
+            codec TEXT NOT NULL
+        )
+    """)
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_parsed_key ON parsed_entries(word_lower, word)"
+    )
+
+
+def load_rendered(conn: sqlite3.Connection, word: str) -> Optional[str]:
+    row = conn.execute(RENDERED_SQL, (normalize_key(word), word)).fetchone()
+    return decompress_html(row[0], row[1]) if row else None
+
+
+def parse_collins(conn: sqlite3.Connection, word: str, html: str, depth: int = 0):
+    """Parse a Collins entry, following "see: xxx" cross-references like the API does."""
+    parsed = collins_parser.parse(html, word)
+    if (
+        parsed.found
+        and parsed.entry
+        and len(parsed.entry.senses) == 0
+        and depth < MAX_CROSS_REF_DEPTH
+    ):
+        cross_ref = collins_parser._extract_cross_reference(BeautifulSoup(html, "lxml"))
+        if cross_ref and cross_ref.lower() != word.lower():
+            ref_html = load_rendered(conn, cross_ref)
+            if ref_html:
+                ref_parsed = parse_collins(conn, cross_ref, ref_html, depth + 1)
+                if ref_parsed.found and ref_parsed.entry and ref_parsed.entry.senses:
+                    parsed = ref_parsed.model_copy(update={"word": word})
+    return parsed
+
+
+def build_parsed(db_path: Path, source: str) -> int:
+    conn = sqlite3.connect(str(db_path))
+    try:
+        has_rendered = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'rendered_entries'"
+        ).fetchone()
+        if not has_rendered:
+            print(
+                f"  Skipping {db_path.name}: no rendered_entries "
+                "(run scripts/convert_mdx_to_sqlite.py --render-only first)"
+            )
+            return 0
+
+        create_parsed_table(conn)
+        conn.execute("DELETE FROM parsed_entries")
+
+        total = conn.execute("SELECT COUNT(*) FROM rendered_entries").fetchone()[0]
+        print(f"  Parsing {total} entries ({source})...")
+
+        batch = []
+        stored = 0
+        reader = conn.cursor()
+        for word, word_lower, html_blob, codec in reader.execute(
+            "SELECT word, word_lower, html, codec FROM rendered_entries"
+        ):
+            html = decompress_html(html_blob, codec)
+            if not html:
+                continue
+
+            if source == "collins":
+                parsed = parse_collins(conn, word, html)
+            else:
+                parsed = ldoce_parser.parse(html, word)
+
+            # Not-found words are left to the live path (cheap, and cached there)
+            if not parsed.found:
+                continue
+
+            data, data_codec = compress_blob(
+                parsed.model_dump_json(exclude={"word"}).encode("utf-8")
+            )
+            batch.append((word, word_lower, data, data_codec))
+            stored += 1
+
+            if len(batch) >= 1000:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO parsed_entries (word, word_lower, data, codec) VALUES (?, ?, ?, ?)",
+                    batch,
+                )
+                conn.commit()
+                batch = []
+                print(f"    Parsed {stored} entries...")
+
+        if batch:
+            conn.executemany(
+                "INSERT OR REPLACE INTO parsed_entries (word, word_lower, data, codec) VALUES (?, ?, ?, ?)",
+                batch,
+            )
+        conn.commit()
+        return stored
+    finally:
+        conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Pre-parse Collins/LDOCE entries into the dictionary databases"
+    )
+    parser.add_argument(
+        "--source",
+        choices=["collins", "ldoce", "all"],
+        default="all",
+        help="Which dictionary to build (default: all)",
+    )
+    args = parser.parse_args()
+
+    # Parsers log every cache miss at INFO; far too noisy for a full rebuild
+    logging.getLogger("app").setLevel(logging.WARNING)
+
+    base_dir = Path(DICT_BASE_DIR)
+    if not base_dir.exists():
+        print(f"Error: Dictionary directory not found: {base_dir}")
+        return
+
+    sources = ["collins", "ldoce"] if args.source == "all" else [args.source]
+
+    for db_path in sorted(base_dir.rglob("*.db")):
+        source = next(
+            (s for s in sources if dictionary_matches_source(db_path.name, s)), None
+        )
+        if not source:
+            continue
+
+        print(f"\nBuilding parsed entries: {db_path}")
+        start_time = time.time()
+        stored = build_parsed(db_path, source)
+        print(f"  [OK] Stored {stored} entries in {time.time() - start_time:.1f}s")
+
+    print("\n[DONE] Parsed dictionary build complete!")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,24 +4,41 @@ Convert MDX/MDD dictionary files to SQLite database for low-memory usage.
 
 Usage:
     uv run python scripts/convert_mdx_to_sqlite.py
+    uv run python scripts/convert_mdx_to_sqlite.py --no-render     # raw entries only
+    uv run python scripts/convert_mdx_to_sqlite.py --render-only   # (re)build rendered HTML
 
 This script will:
 1. Scan resources/dictionaries/ for .mdx files
 2. Convert each MDX to a SQLite database (.db)
 3. Also import MDD resources if present
+4. Pre-render every entry (follow @@@LINK, rewrite asset URLs, inject CSS/JS)
+   into a compressed rendered_entries table, so runtime lookups skip HTML parsing
 """
 
+import argparse
 import sqlite3
+import sys
 import time
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
 try:
     from readmdict import MDX, MDD
 except ImportError:
     print("Error: readmdict not installed. Run: uv sync --extra dictionary")
     exit(1)
 
+from app.services.dictionary import (  # noqa: E402
+    ENTRY_SQL,
+    compress_html,
+    decode_definition,
+    normalize_key,
+    render_definition_html,
+)
+
 DICT_BASE_DIR = Path("resources/dictionaries")
+MAX_LINK_DEPTH = 5
 
 
 def create_database(db_path: Path) -> sqlite3.Connection:
@@ -36,7 +53,11 @@ def create_database(db_path: Path) -> sqlite3.Connection:
             definition BLOB NOT NULL
         )
     """)
-    conn.execute("CREATE INDEX IF NOT EXISTS idx_word_lower ON entries(word_lower)")
+    # (word_lower, word) lets ENTRY_SQL resolve the best-matching row from the
+    # index alone; only the winning row's definition is read from the table
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_entries_key ON entries(word_lower, word)"
+    )
 
     # Create resources table for MDD content (audio, images, CSS)
     conn.execute("""
@@ -46,9 +67,100 @@ def create_database(db_path: Path) -> sqlite3.Connection:
         )
     """)
 
+    create_rendered_table(conn)
+
     return conn
 
 
+def create_rendered_table(conn: sqlite3.Connection) -> None:
+    """Create the table holding final, pre-rendered HTML for each entry."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS rendered_entries (
+            word TEXT PRIMARY KEY,
+            word_lower TEXT NOT NULL,
+            html BLOB NOT NULL,
+            codec TEXT NOT NULL
+        )
+    """)
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_rendered_key ON rendered_entries(word_lower, word)"
+    )
+
+
+def has_rendered_entries(db_path: Path) -> bool:
+    conn = sqlite3.connect(str(db_path))
+    try:
+        row = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'rendered_entries'"
+        ).fetchone()
+        return row is not None
+    finally:
+        conn.close()
+
+
+def resolve_links(conn: sqlite3.Connection, html: str) -> str:
+    """Follow @@@LINK redirects the same way DictionaryManager._follow_links does."""
+    for _ in range(MAX_LINK_DEPTH):
+        if not html.startswith("@@@LINK="):
+            break
+        target = html.replace("@@@LINK=", "").strip()
+        row = conn.execute(ENTRY_SQL, (normalize_key(target), target)).fetchone()
+        target_html = decode_definition(row[0]) if row else None
+        if not target_html:
+            break
+        html = target_html
+    return html
+
+
+def render_entries(db_path: Path, conn: sqlite3.Connection) -> int:
+    """Pre-render every entry into rendered_entries (asset paths relative to DICT_BASE_DIR)."""
+    dict_name = db_path.name
+    subdir = db_path.parent.relative_to(DICT_BASE_DIR).as_posix()
+    if subdir == ".":
+        subdir = ""
+
+    create_rendered_table(conn)
+    conn.execute("DELETE FROM rendered_entries")
+
+    total = conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+    print(f"  Rendering {total} entries ({dict_name})...")
+
+    batch = []
+    rendered = 0
+    reader = conn.cursor()
+    for word, word_lower, definition in reader.execute(
+        "SELECT word, word_lower, definition FROM entries"
+    ):
+        html = decode_definition(definition)
+        if not html:
+            continue
+        html = resolve_links(conn, html)
+        if html.startswith("@@@LINK="):
+            # Dangling redirect: leave it to the runtime fallback path
+            continue
+
+        data, codec = compress_html(render_definition_html(html, dict_name, subdir))
+        batch.append((word, word_lower, data, codec))
+        rendered += 1
+
+        if len(batch) >= 2000:
+            conn.executemany(
+                "INSERT OR REPLACE INTO rendered_entries (word, word_lower, html, codec) VALUES (?, ?, ?, ?)",
+                batch,
+            )
+            batch = []
+            print(f"    Rendered {rendered}/{total} entries...")
+
+    if batch:
+        conn.executemany(
+            "INSERT OR REPLACE INTO rendered_entries (word, word_lower, html, codec) VALUES (?, ?, ?, ?)",
+            batch,
+        )
+
+    conn.commit()
+    return rendered
+
+
 def convert_mdx(mdx_path: Path, conn: sqlite3.Connection) -> int:
     """Convert MDX file to SQLite entries table."""
     print(f"  Loading MDX: {mdx_path.name}...")
@@ -61,7 +173,7 @@ def convert_mdx(mdx_path: Path, conn: sqlite3.Connection) -> int:
     for key, value in mdx.items():
         try:
             word = key.decode("utf-8").strip()
-            entries[word] = (word, word.lower(), value)  # Overwrites duplicates
+            entries[word] = (word, normalize_key(word), value)  # Overwrites duplicates
             count += 1
         except UnicodeDecodeError:
             continue
@@ -114,14 +226,40 @@ def convert_mdd(mdd_path: Path, conn: sqlite3.Connection) -> int:
     return count
 
 
-def convert_dictionary(mdx_path: Path) -> None:
+def render_existing(db_path: Path) -> None:
+    """Add (or rebuild) the rendered_entries table of an already converted database."""
+    print(f"\nRendering: {db_path}")
+    start_time = time.time()
+
+    conn = sqlite3.connect(str(db_path))
+    rendered_count = render_entries(db_path, conn)
+    print(f"  [OK] Rendered {rendered_count} entries")
+    conn.execute("VACUUM")
+    conn.close()
+
+    print(f"  [OK] Done in {time.time() - start_time:.1f}s")
+
+
+def convert_dictionary(
+    mdx_path: Path, render: bool = True, render_only: bool = False
+) -> None:
     """Convert a single MDX (and optional MDD) to SQLite."""
     db_path = mdx_path.with_suffix(".db")
 
+    if render_only:
+        if db_path.exists():
+            render_existing(db_path)
+        else:
+            print(f"Skipping {mdx_path.name} (not converted yet)")
+        return
+
     # Skip if already converted and newer than source
     if db_path.exists():
         if db_path.stat().st_mtime > mdx_path.stat().st_mtime:
-            print(f"Skipping {mdx_path.name} (already converted)")
+            if render and not has_rendered_entries(db_path):
+                render_existing(db_path)
+            else:
+                print(f"Skipping {mdx_path.name} (already converted)")
             return
         else:
             print(f"Re-converting {mdx_path.name} (source updated)")
@@ -142,6 +280,11 @@ def convert_dictionary(mdx_path: Path) -> None:
         resource_count = convert_mdd(mdd_path, conn)
         print(f"  [OK] Imported {resource_count} resources")
 
+    # Pre-render final HTML
+    if render:
+        rendered_count = render_entries(db_path, conn)
+        print(f"  [OK] Rendered {rendered_count} entries")
+
     # Optimize database
     print("  Optimizing database...")
     conn.execute("ANALYZE")
@@ -154,6 +297,19 @@ def convert_dictionary(mdx_path: Path) -> None:
 
 
 def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--no-render",
+        action="store_true",
+        help="Skip building the pre-rendered HTML table",
+    )
+    parser.add_argument(
+        "--render-only",
+        action="store_true",
+        help="Only (re)build pre-rendered HTML for existing databases",
+    )
+    args = parser.parse_args()
+
     if not DICT_BASE_DIR.exists():
         print(f"Error: Dictionary directory not found: {DICT_BASE_DIR}")
         return
@@ -169,7 +325,9 @@ def main():
 
     for mdx_path in mdx_files:
         try:
-            convert_dictionary(mdx_path)
+            convert_dictionary(
+                mdx_path, render=not args.no_render, render_only=args.render_only
+            )
         except Exception as e:
             print(f"Error converting {mdx_path}: {e}")
 
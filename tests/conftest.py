@@ -7,7 +7,9 @@ import asyncio
 nest_asyncio.apply()
 
 from typing import AsyncGenerator  # noqa: E402
+import httpx  # noqa: E402
 from httpx import AsyncClient, ASGITransport  # noqa: E402
+from unittest.mock import patch  # noqa: E402
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession  # noqa: E402
 from sqlalchemy import text  # noqa: E402
 
@@ -108,3 +110,32 @@ async def client(db_session) -> AsyncGenerator[AsyncClient, None]:
         yield ac
 
     app.dependency_overrides.clear()
+
+
+@pytest.fixture
+async def mock_http_clients():
+    """
+    Route a module's shared ``http_clients`` registry to a mock transport.
+
+    Call ``mock_http_clients("app.services.x", handler)`` with an
+    ``httpx.MockTransport`` handler; returns the client every
+    ``http_clients.get(...)`` in that module hands out. Patches are undone and
+    clients closed after the test.
+    """
+    clients = []
+    patchers = []
+
+    def install(module: str, handler) -> httpx.AsyncClient:
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        patcher = patch(f"{module}.http_clients")
+        patcher.start().get.return_value = client
+        clients.append(client)
+        patchers.append(patcher)
+        return client
+
+    yield install
+
+    for patcher in reversed(patchers):
+        patcher.stop()
+    for client in clients:
+        await client.aclose()
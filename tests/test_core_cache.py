@@ -0,0 +1,90 @@
+from unittest.mock import patch
+
+from app.core.cache import LRUCache, estimate_size
+
+
+def test_lru_keeps_recently_used_entries():
+    cache = LRUCache("test", max_bytes=30)
+    cache.set("the", "x" * 10)
+    cache.set("on", "y" * 10)
+    cache.set("get", "z" * 10)
+
+    # Touch "the" so "on" becomes least recently used
+    assert cache.get("the") == "x" * 10
+    cache.set("cold", "w" * 10)
+
+    assert "the" in cache
+    assert "on" not in cache
+    assert "get" in cache
+    assert cache.evictions == 1
+
+
+def test_byte_budget_evicts_multiple_entries():
+    cache = LRUCache("test", max_bytes=100)
+    for i in range(5):
+        cache.set(i, "a" * 20)
+
+    cache.set("big", "b" * 70)
+
+    assert "big" in cache
+    assert cache.stats()["bytes"] <= 100
+    assert cache.evictions == 4
+
+
+def test_oversized_value_is_not_cached():
+    cache = LRUCache("test", max_bytes=10)
+    cache.set("small", "abc")
+    cache.set("huge", "x" * 11)
+
+    assert "huge" not in cache
+    assert "small" in cache
+
+
+def test_max_entries_limit():
+    cache = LRUCache("test", max_bytes=1000, max_entries=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.set("c", "3")
+
+    assert len(cache) == 2
+    assert "a" not in cache
+
+
+def test_ttl_expiry():
+    cache = LRUCache("test", max_bytes=1000, ttl_seconds=60)
+    with patch("app.core.cache.time.monotonic", return_value=100.0):
+        cache.set("word", "definition")
+    with patch("app.core.cache.time.monotonic", return_value=150.0):
+        assert cache.get("word") == "definition"
+    with patch("app.core.cache.time.monotonic", return_value=200.0):
+        assert cache.get("word") is None
+
+    stats = cache.stats()
+    assert stats["expirations"] == 1
+    assert stats["bytes"] == 0
+
+
+def test_hit_miss_counters():
+    cache = LRUCache("test", max_bytes=1000)
+    cache.set("hello", "world")
+    cache.get("hello")
+    cache.get("missing")
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+
+
+def test_replacing_key_updates_size():
+    cache = LRUCache("test", max_bytes=1000)
+    cache.set("k", "a" * 100)
+    cache.set("k", "a" * 10)
+
+    assert cache.stats()["bytes"] == 10
+    assert len(cache) == 1
+
+
+def test_estimate_size_walks_containers():
+    value = [{"dictionary": "LDOCE", "definition": "x" * 100}]
+    assert estimate_size(value) >= 100
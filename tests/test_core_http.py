@@ -0,0 +1,81 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.core.http import HostLimitedTransport, HttpClientRegistry
+
+
+@pytest.mark.asyncio
+async def test_registry_reuses_clients_per_settings():
+    registry = HttpClientRegistry()
+    try:
+        client = registry.get()
+        assert registry.get() is client
+        assert registry.get(verify=False) is not client
+
+        stats = registry.stats()
+        assert len(stats["clients"]) == 2
+        assert {c["verify"] for c in stats["clients"]} == {True, False}
+        assert stats["clients"][0]["connections"] == 0
+    finally:
+        await registry.aclose()
+
+    assert client.is_closed
+    assert registry.stats()["clients"] == []
+
+
+@pytest.mark.asyncio
+async def test_host_limit_holds_slot_until_body_closed():
+    active = {"now": 0, "max": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        active["now"] += 1
+        active["max"] = max(active["max"], active["now"])
+        await asyncio.sleep(0.01)
+        active["now"] -= 1
+        return httpx.Response(200, content=b"ok")
+
+    transport = HostLimitedTransport(httpx.MockTransport(handler), max_per_host=2)
+    async with httpx.AsyncClient(transport=transport) as client:
+        responses = await asyncio.gather(
+            *(client.get("http://feeds.example.com/rss") for _ in range(6)),
+            client.get("http://other.example.com/rss"),
+        )
+
+    assert all(r.content == b"ok" for r in responses)
+    assert active["max"] <= 3  # 2 for feeds.example.com + 1 for other host
+    assert transport.requests["feeds.example.com"] == 6
+    assert transport.in_flight["feeds.example.com"] == 0
+
+
+@pytest.mark.asyncio
+async def test_waiting_for_a_host_slot_honours_the_pool_timeout():
+    release = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/download":
+            await release.wait()
+        return httpx.Response(200, content=b"ok")
+
+    transport = HostLimitedTransport(httpx.MockTransport(handler), max_per_host=1)
+    async with httpx.AsyncClient(transport=transport) as client:
+        download = asyncio.create_task(
+            client.get("http://cdn.example.com/download", timeout=None)
+        )
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(httpx.PoolTimeout):
+            await client.get(
+                "http://cdn.example.com/rss", timeout=httpx.Timeout(5, pool=0.05)
+            )
+        assert transport.in_flight["cdn.example.com"] == 1
+
+        release.set()
+        assert (await download).content == b"ok"
+        assert (await client.get("http://cdn.example.com/rss")).content == b"ok"
+
+    # A transport without an httpcore pool still reports its own counters
+    stats = transport.stats()
+    assert "connections" not in stats
+    assert stats["requests_by_host"] == {"cdn.example.com": 3}
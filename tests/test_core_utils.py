@@ -1,5 +1,5 @@
 import pytest
-from app.core.utils import parse_llm_json
+from app.core.utils import etag_matches, parse_llm_json
 
 
 def test_parse_simple_json():
@@ -36,3 +36,19 @@ def test_parse_invalid_json():
     content = '{"key": "value"'  # missing brace
     with pytest.raises(RuntimeError):
         parse_llm_json(content)
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ('"abc"', True),
+        ('"x", "abc"', True),
+        ('W/"abc"', True),
+        ("*", True),
+        ('"x"', False),
+        ("", False),
+        (None, False),
+    ],
+)
+def test_etag_matches(header, expected):
+    assert etag_matches(header, '"abc"') is expected
@@ -3,6 +3,21 @@ from httpx import AsyncClient
 from unittest.mock import patch, MagicMock
 
 
+@pytest.fixture(autouse=True)
+def isolated_asset_cache(tmp_path):
+    """Extract dictionary assets into a per-test directory with a fresh index."""
+    from app.services.dictionary_assets import dict_asset_cache
+
+    original_dir = dict_asset_cache._cache_dir
+    dict_asset_cache._cache_dir = tmp_path / "dict_assets"
+    dict_asset_cache._index.clear()
+    dict_asset_cache._misses.clear()
+    yield dict_asset_cache
+    dict_asset_cache._cache_dir = original_dir
+    dict_asset_cache._index.clear()
+    dict_asset_cache._misses.clear()
+
+
 @pytest.mark.asyncio
 async def test_api_dictionary_lookup(client: AsyncClient):
     mock_results = [
@@ -82,3 +97,435 @@ async def test_get_resource_legacy_not_found(client: AsyncClient):
         response = await client.get("/dict/resource?path=unknown.png")
 
         assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_dictionary_cache_stats(client: AsyncClient):
+    response = await client.get("/api/dictionary/cache-stats")
+
+    assert response.status_code == 200
+    names = {c["name"] for c in response.json()["caches"]}
+    assert {"dict_lookup", "collins_parse", "ldoce_parse", "ldoce_word"} <= names
+
+
+@pytest.mark.asyncio
+async def test_lookup_serves_prerendered_html(tmp_path):
+    import sqlite3
+    from app.services.dictionary import (
+        DictionaryManager,
+        compress_html,
+        render_definition_html,
+    )
+
+    db_path = tmp_path / "LDOCE.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE entries (word TEXT PRIMARY KEY, word_lower TEXT, definition BLOB)"
+    )
+    conn.execute(
+        "CREATE TABLE rendered_entries "
+        "(word TEXT PRIMARY KEY, word_lower TEXT, html BLOB, codec TEXT)"
+    )
+    raw = '<html><head></head><body><img src="pic.png"/>hello</body></html>'
+    conn.execute(
+        "INSERT INTO entries VALUES (?, ?, ?)", ("hello", "hello", raw.encode())
+    )
+    html, codec = compress_html(render_definition_html(raw, "LDOCE.db", ""))
+    conn.execute(
+        "INSERT INTO rendered_entries VALUES (?, ?, ?, ?)",
+        ("hello", "hello", html, codec),
+    )
+    conn.commit()
+    conn.close()
+
+    manager = DictionaryManager()
+    await manager._load_sqlite_databases([str(db_path)])
+    assert manager.databases[0]["rendered"] is True
+
+    with patch.object(manager, "_process_html", side_effect=AssertionError):
+        results = await manager.lookup("Hello")
+
+    assert len(results) == 1
+    assert "/dict/resource?path=pic.png" in results[0]["definition"]
+
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_ldoce_serves_prebuilt_entry(client: AsyncClient):
+    prebuilt = b'{"found":true,"entries":[],"raw_html":null}'
+
+    with (
+        patch("app.services.dictionary.dict_manager.get_parsed", return_value=prebuilt),
+        patch("app.services.dictionary.dict_manager.lookup") as mock_lookup,
+    ):
+        response = await client.get("/api/dictionary/ldoce/Hello")
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "word": "Hello",
+            "found": True,
+            "entries": [],
+            "raw_html": None,
+        }
+        mock_lookup.assert_not_called()
+
+
+def _make_dictionary_db(path, entries):
+    import sqlite3
+
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE entries (word TEXT PRIMARY KEY, word_lower TEXT, definition BLOB)"
+    )
+    conn.executemany(
+        "INSERT INTO entries VALUES (?, ?, ?)",
+        [(w, w.lower(), html.encode()) for w, html in entries.items()],
+    )
+    conn.commit()
+    conn.close()
+
+
+@pytest.mark.asyncio
+async def test_lookup_many_batches_and_fills_cache(tmp_path):
+    from app.services.dictionary import DictionaryManager
+
+    db_path = tmp_path / "Test.db"
+    _make_dictionary_db(
+        db_path,
+        {
+            "Run": "<html><body>run</body></html>",
+            "ran": "@@@LINK=Run",
+            "walk": "<html><body>walk</body></html>",
+        },
+    )
+
+    manager = DictionaryManager()
+    await manager._load_sqlite_databases([str(db_path)])
+
+    results = await manager.lookup_many(["run", "ran", "walk", "missing"])
+
+    assert set(results) == {"run", "ran", "walk", "missing"}
+    assert "run" in results["ran"][0]["definition"]
+    assert results["missing"] == []
+
+    # Single-word lookups are now cache hits
+    with patch.object(manager, "_lookup_sqlite", side_effect=AssertionError):
+        assert await manager.lookup("walk") == results["walk"]
+
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_lookup_many_prefers_lowercase_headword_like_lookup(tmp_path):
+    from app.services.dictionary import DictionaryManager
+
+    db_path = tmp_path / "Test.db"
+    _make_dictionary_db(
+        db_path,
+        {
+            "Polish": "<html><body>of Poland</body></html>",
+            "polish": "<html><body>make shiny</body></html>",
+        },
+    )
+
+    single = DictionaryManager()
+    await single._load_sqlite_databases([str(db_path)])
+    expected = await single.lookup("polish")
+    await single.close()
+
+    manager = DictionaryManager()
+    await manager._load_sqlite_databases([str(db_path)])
+    results = await manager.lookup_many(["Polish"])
+
+    assert "make shiny" in results["polish"][0]["definition"]
+    assert results["polish"] == expected
+    assert await manager.lookup("polish") == expected
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_batch_endpoint_streams_ndjson(client: AsyncClient):
+    import json
+
+    prebuilt = {"simmer": b'{"found":true,"entries":[],"raw_html":null}'}
+
+    with (
+        patch(
+            "app.services.dictionary.dict_manager.get_parsed_many",
+            return_value=prebuilt,
+        ),
+        patch("app.services.dictionary.dict_manager.lookup_many", return_value={}),
+        patch("app.services.dictionary.dict_manager.lookup", return_value=[]),
+    ):
+        response = await client.post(
+            "/api/dictionary/batch",
+            json={"words": ["Simmer", "zzzz", "simmer"], "source": "ldoce"},
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [(item["word"], item["found"]) for item in lines] == [
+        ("Simmer", True),
+        ("simmer", True),
+        ("zzzz", False),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_batch_parses_misses_off_the_event_loop(client: AsyncClient):
+    import json
+    import threading
+    import time
+
+    from app.api.routers import dictionary
+    from app.models.ldoce_schemas import LDOCEWord
+
+    active = {"now": 0, "max": 0}
+    lock = threading.Lock()
+    loop_thread = threading.current_thread()
+    parse_threads = set()
+
+    def slow_parse(html, word, include_raw_html=False):
+        parse_threads.add(threading.current_thread())
+        with lock:
+            active["now"] += 1
+            active["max"] = max(active["max"], active["now"])
+        time.sleep(0.02)
+        with lock:
+            active["now"] -= 1
+        return LDOCEWord(word=word, found=True)
+
+    words = [f"w{i}" for i in range(10)]
+    dictionary._ldoce_cache.clear()
+    with (
+        patch("app.services.dictionary.dict_manager.get_parsed_many", return_value={}),
+        patch("app.services.dictionary.dict_manager.lookup_many", return_value={}),
+        patch(
+            "app.services.dictionary.dict_manager.lookup",
+            return_value=[{"dictionary": "LDOCE", "definition": "<p>x</p>"}],
+        ),
+        patch.object(dictionary.ldoce_parser, "parse", side_effect=slow_parse),
+    ):
+        response = await client.post(
+            "/api/dictionary/batch", json={"words": words, "source": "ldoce"}
+        )
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(item["word"] for item in lines) == sorted(words)
+    assert loop_thread not in parse_threads
+    assert 1 < active["max"] <= dictionary.BATCH_PARSE_CONCURRENCY
+
+
+@pytest.mark.asyncio
+async def test_read_pool_hands_out_connections_fifo(tmp_path):
+    import asyncio
+    from app.services.dictionary import SQLiteReadPool
+
+    db_path = tmp_path / "Pool.db"
+    _make_dictionary_db(db_path, {"hello": "<p>hello</p>"})
+
+    pool = SQLiteReadPool(str(db_path), size=1)
+    await pool.open()
+
+    order = []
+
+    async def worker(name):
+        async with pool.acquire() as conn:
+            order.append(name)
+            async with conn.execute("SELECT COUNT(*) FROM entries") as cursor:
+                assert (await cursor.fetchone())[0] == 1
+            await asyncio.sleep(0.01)
+
+    async with pool.acquire():
+        tasks = [asyncio.create_task(worker(i)) for i in range(3)]
+        await asyncio.sleep(0.01)
+        assert pool.stats()["waiting"] == 3
+
+    await asyncio.gather(*tasks)
+    stats = pool.stats()
+    await pool.close()
+
+    assert order == [0, 1, 2]
+    assert stats["checkouts"] == 4
+    assert stats["waited_checkouts"] == 3
+    assert stats["max_wait_ms"] > 0
+
+
+@pytest.mark.asyncio
+async def test_read_pool_is_read_only(tmp_path):
+    import sqlite3
+    from app.services.dictionary import SQLiteReadPool
+
+    db_path = tmp_path / "Pool.db"
+    _make_dictionary_db(db_path, {"hello": "<p>hello</p>"})
+
+    pool = SQLiteReadPool(str(db_path), size=2)
+    await pool.open()
+    try:
+        async with pool.acquire() as conn:
+            with pytest.raises(sqlite3.OperationalError):
+                await conn.execute("DELETE FROM entries")
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_read_pool_sees_tables_added_after_open(tmp_path):
+    import sqlite3
+    from app.services.dictionary import SQLiteReadPool
+
+    db_path = tmp_path / "Pool.db"
+    _make_dictionary_db(db_path, {"hello": "<p>hello</p>"})
+
+    pool = SQLiteReadPool(str(db_path), size=1)
+    await pool.open()
+    try:
+        async with pool.acquire() as conn:
+            async with conn.execute("SELECT COUNT(*) FROM entries") as cursor:
+                assert (await cursor.fetchone())[0] == 1
+
+        # e.g. convert_mdx_to_sqlite.py --render-only writing rendered_entries
+        writer = sqlite3.connect(db_path)
+        writer.execute("CREATE TABLE rendered_entries (key TEXT, html TEXT)")
+        writer.execute("INSERT INTO rendered_entries VALUES ('hello', '<p>x</p>')")
+        writer.commit()
+        writer.close()
+
+        async with pool.acquire() as conn:
+            async with conn.execute("SELECT html FROM rendered_entries") as cursor:
+                assert (await cursor.fetchone())[0] == "<p>x</p>"
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_read_pool_open_closes_connections_on_failure(tmp_path):
+    import aiosqlite
+    from app.services.dictionary import SQLiteReadPool
+
+    db_path = tmp_path / "Pool.db"
+    _make_dictionary_db(db_path, {"hello": "<p>hello</p>"})
+
+    opened = []
+    real_connect = aiosqlite.connect
+
+    def connect(*args, **kwargs):
+        if len(opened) == 2:
+            raise RuntimeError("boom")
+        conn = real_connect(*args, **kwargs)
+        opened.append(conn)
+        return conn
+
+    pool = SQLiteReadPool(str(db_path), size=3)
+    with patch("app.services.dictionary.aiosqlite.connect", side_effect=connect):
+        with pytest.raises(RuntimeError):
+            await pool.open()
+
+    assert len(opened) == 2
+    assert all(conn._connection is None for conn in opened)
+    assert pool.stats()["size"] == 3
+    assert not pool._connections and not pool._idle
+
+
+@pytest.mark.asyncio
+async def test_resource_served_from_disk_with_etag_and_range(client: AsyncClient):
+    content = b"0123456789" * 100
+
+    with patch("app.services.dictionary.dict_manager.get_resource") as mock_get:
+        mock_get.return_value = (content, "audio/mpeg")
+
+        first = await client.get("/dict/resource?path=sound/hello.mp3")
+        assert first.status_code == 200
+        assert first.content == content
+        etag = first.headers["etag"]
+        assert "immutable" in first.headers["cache-control"]
+
+        # Conditional request: not modified
+        cached = await client.get(
+            "/dict/resource?path=sound/hello.mp3", headers={"If-None-Match": etag}
+        )
+        assert cached.status_code == 304
+
+        # Range request for seeking in audio
+        partial = await client.get(
+            "/dict/resource?path=sound/hello.mp3", headers={"Range": "bytes=10-19"}
+        )
+        assert partial.status_code == 206
+        assert partial.content == content[10:20]
+
+        # Only the first request touched the dictionary DB
+        mock_get.assert_called_once_with("sound/hello.mp3")
+
+
+@pytest.mark.asyncio
+async def test_dict_asset_basename_fallback_single_lookup(client: AsyncClient):
+    with patch("app.services.dictionary.dict_manager.get_resource") as mock_get:
+        mock_get.return_value = (b"body {}", "text/css")
+
+        response = await client.get("/dict-assets/Collins/missing_dir/style.css")
+
+        assert response.status_code == 200
+        assert response.content == b"body {}"
+        mock_get.assert_called_once_with("Collins/missing_dir/style.css", "style.css")
+
+
+@pytest.mark.asyncio
+async def test_asset_misses_expire_and_are_not_cached_while_loading(
+    isolated_asset_cache,
+):
+    from app.services import dictionary_assets
+    from app.services.dictionary import dict_manager
+
+    cache = isolated_asset_cache
+    with (
+        patch.object(dict_manager, "get_resource") as mock_get,
+        patch.object(dict_manager, "loaded", False),
+        patch("app.core.cache.time") as clock,
+    ):
+        clock.monotonic.return_value = 1000.0
+        mock_get.return_value = (None, None)
+
+        # Still loading: the miss is not remembered
+        assert await cache.get("sound/late.mp3") is None
+        mock_get.return_value = (b"audio", "audio/mpeg")
+        assert (await cache.get("sound/late.mp3")).path.read_bytes() == b"audio"
+
+        # Loaded: a miss is remembered until the TTL runs out
+        dict_manager.loaded = True
+        mock_get.return_value = (None, None)
+        assert await cache.get("sound/gone.mp3") is None
+        assert await cache.get("sound/gone.mp3") is None
+        assert mock_get.call_count == 3
+
+        clock.monotonic.return_value += dictionary_assets.MISS_TTL_SECONDS + 1
+        mock_get.return_value = (b"found", "audio/mpeg")
+        assert (await cache.get("sound/gone.mp3")).path.read_bytes() == b"found"
+
+
+@pytest.mark.asyncio
+async def test_get_resource_prefers_exact_path_over_fallback(tmp_path):
+    import sqlite3
+    from app.services.dictionary import DictionaryManager
+
+    db_path = tmp_path / "Res.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE resources (path TEXT PRIMARY KEY, content BLOB)")
+    conn.executemany(
+        "INSERT INTO resources VALUES (?, ?)",
+        [("\\a\\x.css".encode(), b"exact"), ("\\x.css".encode(), b"basename")],
+    )
+    conn.commit()
+    conn.close()
+
+    manager = DictionaryManager()
+    await manager._load_sqlite_databases([str(db_path)])
+    try:
+        assert await manager.get_resource("a/x.css", "x.css") == (b"exact", "text/css")
+        assert await manager.get_resource("b/x.css", "x.css") == (
+            b"basename",
+            "text/css",
+        )
+    finally:
+        await manager.close()
@@ -0,0 +1,102 @@
+"""
+Micro-benchmark for dictionary point lookups against a generated 200k-entry DB.
+
+Run with -s to see the numbers:
+    uv run pytest tests/test_dictionary_lookup_benchmark.py -s
+"""
+
+import random
+import sqlite3
+import string
+import time
+
+import pytest
+
+from app.services.dictionary import ENTRY_SQL, DictionaryManager, normalize_key
+
+ENTRY_COUNT = 200_000
+LOOKUP_COUNT = 5_000
+LEGACY_ENTRY_SQL = (
+    "SELECT definition FROM entries WHERE word = ? OR word_lower = ? LIMIT 1"
+)
+
+
+@pytest.fixture(scope="module")
+def benchmark_db(tmp_path_factory):
+    db_path = tmp_path_factory.mktemp("dict_bench") / "Bench.db"
+    rng = random.Random(42)
+
+    words = set()
+    while len(words) < ENTRY_COUNT:
+        length = rng.randint(3, 12)
+        word = "".join(rng.choices(string.ascii_lowercase, k=length))
+        if rng.random() < 0.1:
+            word = word.title()
+        words.add(word)
+    words = sorted(words)
+
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE entries (word TEXT PRIMARY KEY, word_lower TEXT NOT NULL, definition BLOB NOT NULL)"
+    )
+    conn.execute("CREATE INDEX idx_entries_key ON entries(word_lower, word)")
+    conn.executemany(
+        "INSERT INTO entries VALUES (?, ?, ?)",
+        ((w, normalize_key(w), f"<p>{w}</p>".encode() * 20) for w in words),
+    )
+    conn.execute("ANALYZE")
+    conn.commit()
+    conn.close()
+
+    sample = rng.sample(words, LOOKUP_COUNT)
+    # Mix in case variants and misses, like real reader clicks
+    queries = [w.upper() if i % 5 == 0 else w for i, w in enumerate(sample)]
+    queries += ["zz" + w for w in sample[: LOOKUP_COUNT // 10]]
+    return db_path, queries
+
+
+def test_entry_lookup_is_single_index_seek(benchmark_db):
+    db_path, _ = benchmark_db
+    conn = sqlite3.connect(db_path)
+    plan = " ".join(
+        row[-1]
+        for row in conn.execute(f"EXPLAIN QUERY PLAN {ENTRY_SQL}", ("run", "Run"))
+    )
+    conn.close()
+
+    assert "idx_entries_key" in plan
+    assert "SCAN" not in plan
+
+
+@pytest.mark.asyncio
+async def test_lookup_throughput(benchmark_db):
+    db_path, queries = benchmark_db
+    manager = DictionaryManager()
+    await manager._load_sqlite_databases([str(db_path)])
+    pool = manager.databases[0]["pool"]
+
+    try:
+        start = time.perf_counter()
+        hits = 0
+        for word in queries:
+            if await manager._lookup_sqlite(word, normalize_key(word), pool):
+                hits += 1
+        elapsed = time.perf_counter() - start
+
+        legacy_start = time.perf_counter()
+        async with pool.acquire() as conn:
+            for word in queries:
+                async with conn.execute(
+                    LEGACY_ENTRY_SQL, (word, normalize_key(word))
+                ) as cursor:
+                    await cursor.fetchone()
+        legacy_elapsed = time.perf_counter() - legacy_start
+    finally:
+        await manager.close()
+
+    print(
+        f"\n{len(queries)} lookups on {ENTRY_COUNT} entries: "
+        f"{len(queries) / elapsed:,.0f} lookups/s "
+        f"(legacy OR query: {len(queries) / legacy_elapsed:,.0f} lookups/s)"
+    )
+    assert hits == LOOKUP_COUNT
@@ -0,0 +1,195 @@
+"""Test the persistent EPUB parse cache."""
+
+import pytest
+from unittest.mock import patch
+
+PARAGRAPH = (
+    "The quick brown fox jumps over the lazy dog. "
+    "It was a bright cold day in April. "
+    "The clocks were striking thirteen."
+)
+PNG_BYTES = b"\x89PNG\r\n\x1a\n" + b"\x00" * 32
+
+
+def _write_epub(path):
+    from ebooklib import epub
+
+    book = epub.EpubBook()
+    book.set_identifier("test-book")
+    book.set_title("Test Book")
+    book.set_language("en")
+
+    chapter = epub.EpubHtml(title="Chapter One", file_name="chap_1.xhtml", lang="en")
+    chapter.content = (
+        "<html><body><h1>Chapter One</h1>"
+        '<img src="images/fox.png" alt="A fox"/>'
+        f"<p>{PARAGRAPH}</p><p>{PARAGRAPH} Again.</p></body></html>"
+    )
+    image = epub.EpubItem(
+        uid="fox", file_name="images/fox.png", media_type="image/png", content=PNG_BYTES
+    )
+    book.add_item(chapter)
+    book.add_item(image)
+    book.toc = [chapter]
+    book.spine = ["nav", chapter]
+    book.add_item(epub.EpubNcx())
+    book.add_item(epub.EpubNav())
+    epub.write_epub(str(path), book)
+
+
+@pytest.fixture
+def epub_env(tmp_path):
+    from app.services.content_providers import epub_provider
+    from app.services.content_providers.epub_provider import EpubProvider
+    from app.services.epub_cache import EpubParseCache
+
+    epub_dir = tmp_path / "epub"
+    epub_dir.mkdir()
+    _write_epub(epub_dir / "book.epub")
+
+    cache = EpubParseCache(tmp_path / "epub_parse_cache.db")
+    with (
+        patch.object(EpubProvider, "EPUB_DIR", epub_dir),
+        patch.object(epub_provider, "epub_parse_cache", cache),
+        patch.dict(epub_provider._epub_cache, clear=True),
+    ):
+        epub_provider._chapter_cache.clear()
+        yield epub_dir, cache
+    epub_provider._chapter_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_parsed_book_survives_restart_without_reparse(epub_env):
+    from app.services.content_providers import epub_provider
+    from app.services.content_providers.epub_provider import EpubProvider
+
+    first = await EpubProvider().fetch("book.epub", chapter_index=0)
+    assert any(b.type.value == "paragraph" for b in first.blocks)
+
+    # Simulate a worker restart: empty memory cache, parser unavailable
+    epub_provider._epub_cache.clear()
+    epub_provider._chapter_cache.clear()
+    with patch.object(EpubProvider, "_parse_epub", side_effect=AssertionError):
+        provider = EpubProvider()
+        second = await provider.fetch("book.epub", chapter_index=0)
+
+    assert second.blocks == first.blocks
+    assert second.full_text == first.full_text
+    assert provider._cached_articles[0]["block_sentence_count"] == 7
+    # Neither raw HTML nor blocks are held in memory once persisted
+    assert "raw_html" not in provider._cached_articles[0]
+    assert "blocks" not in provider._cached_articles[0]
+
+
+def test_modified_epub_is_reparsed(epub_env):
+    import os
+    from app.services.content_providers import epub_provider
+    from app.services.content_providers.epub_provider import EpubProvider
+
+    epub_dir, _ = epub_env
+    assert EpubProvider()._load_epub("book.epub")
+
+    stat = (epub_dir / "book.epub").stat()
+    os.utime(epub_dir / "book.epub", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    epub_provider._epub_cache.clear()
+
+    with patch.object(
+        EpubProvider, "_parse_epub", wraps=EpubProvider()._parse_epub
+    ) as parse:
+        assert EpubProvider()._load_epub("book.epub")
+        parse.assert_called_once()
+
+
+def test_images_read_lazily_from_zip(epub_env):
+    from app.services.content_providers.epub_provider import EpubProvider
+
+    provider = EpubProvider()
+    assert provider.get_image("book.epub", "images/fox.png") == (
+        PNG_BYTES,
+        "image/png",
+    )
+    # Basename fallback
+    assert provider.get_image("book.epub", "../somewhere/fox.png") == (
+        PNG_BYTES,
+        "image/png",
+    )
+    assert provider.get_image("book.epub", "missing.png") is None
+
+
+@pytest.mark.asyncio
+async def test_chapter_sentences_served_from_memory(epub_env):
+    from app.services.content_providers.epub_provider import EpubProvider
+
+    _, cache = epub_env
+    provider = EpubProvider()
+    chapter = await provider.get_chapter("book.epub", 0)
+
+    # heading, image, paragraph (3 sentences), paragraph (4 sentences)
+    assert [b.type.value for b in chapter.blocks] == [
+        "heading",
+        "image",
+        "paragraph",
+        "paragraph",
+    ]
+    assert chapter.block_offsets == [0, 0, 0, 3, 7]
+    assert chapter.sentences[3] == chapter.blocks[3].sentences[0]
+    assert chapter.neighbours(0) == (None, chapter.sentences[1])
+    assert chapter.neighbours(6) == (chapter.sentences[5], None)
+
+    with patch.object(cache, "load_blocks", side_effect=AssertionError):
+        assert await provider.get_chapter("book.epub", 0) is chapter
+        bundle = await provider.fetch("book.epub", chapter_index=0)
+    assert bundle.blocks == chapter.blocks
+
+
+def _rezip_uncompressed(src, dst):
+    import zipfile
+
+    with (
+        zipfile.ZipFile(src) as zin,
+        zipfile.ZipFile(dst, "w", compression=zipfile.ZIP_STORED) as zout,
+    ):
+        for info in zin.infolist():
+            zout.writestr(info.filename, zin.read(info.filename))
+
+
+@pytest.mark.parametrize("book", ["book.epub", "stored.epub"])
+def test_image_member_streams_ranges(epub_env, book):
+    from app.services.content_providers.epub_provider import EpubProvider
+
+    epub_dir, _ = epub_env
+    _rezip_uncompressed(epub_dir / "book.epub", epub_dir / "stored.epub")
+
+    image = EpubProvider().get_image_member(book, "fox.png")
+    assert image.size == len(PNG_BYTES)
+    assert b"".join(image.iter_bytes()) == PNG_BYTES
+    assert b"".join(image.iter_bytes(4, 11, chunk_size=3)) == PNG_BYTES[4:12]
+
+
+@pytest.mark.asyncio
+async def test_epub_image_endpoint_etag_and_range(epub_env, client):
+    params = {"filename": "book.epub", "image_path": "images/fox.png"}
+
+    full = await client.get("/api/reading/epub/image", params=params)
+    assert full.status_code == 200
+    assert full.content == PNG_BYTES
+    assert full.headers["content-type"] == "image/png"
+    etag = full.headers["etag"]
+
+    not_modified = await client.get(
+        "/api/reading/epub/image", params=params, headers={"If-None-Match": etag}
+    )
+    assert not_modified.status_code == 304
+
+    partial = await client.get(
+        "/api/reading/epub/image", params=params, headers={"Range": "bytes=-8"}
+    )
+    assert partial.status_code == 206
+    assert partial.content == PNG_BYTES[-8:]
+    size = len(PNG_BYTES)
+    assert partial.headers["content-range"] == f"bytes {size - 8}-{size - 1}/{size}"
+
+    unsatisfiable = await client.get(
+        "/api/reading/epub/image", params=params, headers={"Range": "bytes=999-"}
+    )
+    assert unsatisfiable.status_code == 416
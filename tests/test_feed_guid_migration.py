@@ -0,0 +1,79 @@
+"""Duplicate-episode merge in the feed-guid uniqueness migration."""
+
+import importlib.util
+from pathlib import Path
+
+import sqlalchemy as sa
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+
+MIGRATION = (
+    Path(__file__).resolve().parent.parent
+    / "alembic"
+    / "versions"
+    / "7c1e4b9a2d3f_add_feed_cache_validators.py"
+)
+
+
+def _load_migration():
+    spec = importlib.util.spec_from_file_location("feed_guid_migration", MIGRATION)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _schema(conn):
+    conn.exec_driver_sql(
+        "CREATE TABLE podcast_episodes (id INTEGER PRIMARY KEY, feed_id INTEGER, guid TEXT)"
+    )
+    conn.exec_driver_sql(
+        "CREATE TABLE podcast_listening_sessions ("
+        "id INTEGER PRIMARY KEY, user_id TEXT, episode_id INTEGER)"
+    )
+    conn.exec_driver_sql(
+        "CREATE TABLE user_episode_states ("
+        "id INTEGER PRIMARY KEY, user_id TEXT, episode_id INTEGER, "
+        "current_position_seconds FLOAT, updated_at TIMESTAMP, "
+        "CONSTRAINT uq_user_episode_state UNIQUE (user_id, episode_id))"
+    )
+
+
+def test_merge_keeps_latest_state_when_user_has_state_on_several_dupes():
+    migration = _load_migration()
+    engine = sa.create_engine("sqlite://")
+    with engine.begin() as conn:
+        _schema(conn)
+        conn.exec_driver_sql(
+            "INSERT INTO podcast_episodes VALUES "
+            "(1, 1, 'ep'), (2, 1, 'ep'), (3, 1, 'ep'), (4, 1, 'other')"
+        )
+        # u1 has state on both non-kept duplicates and none on episode 1.
+        conn.exec_driver_sql(
+            "INSERT INTO user_episode_states VALUES "
+            "(10, 'u1', 2, 30.0, '2026-01-01 00:00:00'), "
+            "(11, 'u1', 3, 90.0, '2026-02-01 00:00:00'), "
+            "(12, 'u2', 1, 5.0, '2026-01-01 00:00:00'), "
+            "(13, 'u2', 3, 7.0, '2025-01-01 00:00:00'), "
+            "(14, 'u1', 4, 1.0, '2026-01-01 00:00:00')"
+        )
+        conn.exec_driver_sql(
+            "INSERT INTO podcast_listening_sessions VALUES (20, 'u1', 2), (21, 'u1', 3)"
+        )
+
+        with Operations.context(MigrationContext.configure(conn)):
+            migration._merge_duplicate_episodes()
+
+        assert conn.exec_driver_sql(
+            "SELECT id FROM podcast_episodes ORDER BY id"
+        ).fetchall() == [(1,), (4,)]
+        assert conn.exec_driver_sql(
+            "SELECT id, user_id, episode_id, current_position_seconds "
+            "FROM user_episode_states ORDER BY id"
+        ).fetchall() == [
+            (11, "u1", 1, 90.0),
+            (12, "u2", 1, 5.0),
+            (14, "u1", 4, 1.0),
+        ]
+        assert conn.exec_driver_sql(
+            "SELECT episode_id FROM podcast_listening_sessions ORDER BY id"
+        ).fetchall() == [(1,), (1,)]
@@ -0,0 +1,123 @@
+"""Streaming, resumable, content-addressed episode audio cache."""
+
+import httpx
+import pytest
+
+from app.services.audio_cache import EpisodeAudioCache
+
+AUDIO = bytes(range(256)) * 4096  # 1 MiB
+ETAG = '"audio-v1"'
+
+
+class _DroppingStream(httpx.AsyncByteStream):
+    """Sends part of the body, then fails like a dropped connection."""
+
+    def __init__(self, data: bytes):
+        self._data = data
+
+    async def __aiter__(self):
+        yield self._data
+        raise httpx.ReadError("connection reset")
+
+
+class FakeAudioServer:
+    def __init__(self):
+        self.requests = []
+        self.drop_after = None
+        self.bytes_sent = 0
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        headers = {"ETag": ETAG, "Accept-Ranges": "bytes"}
+        if request.headers.get("if-none-match") == ETAG:
+            return httpx.Response(304, headers=headers)
+
+        start, status = 0, 200
+        range_header = request.headers.get("range")
+        if range_header and request.headers.get("if-range") == ETAG:
+            start = int(range_header.split("=")[1].rstrip("-"))
+            status = 206
+            headers["Content-Range"] = f"bytes {start}-{len(AUDIO) - 1}/{len(AUDIO)}"
+        body = AUDIO[start:]
+        headers["Content-Length"] = str(len(body))
+
+        if self.drop_after is not None:
+            body, self.drop_after = body[: self.drop_after], None
+            self.bytes_sent += len(body)
+            return httpx.Response(status, headers=headers, stream=_DroppingStream(body))
+        self.bytes_sent += len(body)
+        return httpx.Response(status, headers=headers, content=body)
+
+
+def _files(path):
+    return list(path.iterdir()) if path.exists() else []
+
+
+@pytest.fixture
+def audio_server(mock_http_clients):
+    server = FakeAudioServer()
+    mock_http_clients("app.services.audio_cache", server.handler)
+    return server
+
+
+@pytest.mark.asyncio
+async def test_download_is_cached_by_etag_and_content(audio_server, tmp_path):
+    cache = EpisodeAudioCache(cache_dir=tmp_path)
+
+    path = await cache.fetch("http://cdn.example.com/ep1.mp3")
+    assert path.read_bytes() == AUDIO
+    assert path.parent.name == "blobs" and path.suffix == ".mp3"
+
+    # Re-transcribing revalidates instead of downloading again
+    assert await cache.fetch("http://cdn.example.com/ep1.mp3") == path
+    assert audio_server.requests[-1].headers["if-none-match"] == ETAG
+    assert audio_server.bytes_sent == len(AUDIO)
+
+    # Same audio behind another URL is stored once
+    other = await cache.fetch("http://tracker.example.com/r/ep1.mp3")
+    assert other == path
+    assert len(_files(tmp_path / "blobs")) == 1
+
+
+@pytest.mark.asyncio
+async def test_interrupted_download_resumes_with_range(audio_server, tmp_path):
+    cache = EpisodeAudioCache(cache_dir=tmp_path)
+    audio_server.drop_after = 300_000
+
+    path = await cache.fetch("http://cdn.example.com/ep2.mp3")
+
+    assert path.read_bytes() == AUDIO
+    resumed = audio_server.requests[-1]
+    assert resumed.headers["range"] == "bytes=300000-"
+    assert resumed.headers["if-range"] == ETAG
+    assert audio_server.bytes_sent == len(AUDIO)
+    assert _files(tmp_path / "partial") == []
+
+
+@pytest.mark.asyncio
+async def test_oversized_audio_is_refused(audio_server, tmp_path):
+    cache = EpisodeAudioCache(cache_dir=tmp_path, max_download_bytes=1000)
+
+    with pytest.raises(ValueError, match="download limit"):
+        await cache.fetch("http://cdn.example.com/huge.mp3")
+    assert _files(tmp_path / "blobs") == []
+    assert _files(tmp_path / "partial") == []
+
+
+@pytest.mark.asyncio
+async def test_audio_in_use_is_not_evicted(tmp_path, mock_http_clients):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=request.url.path.encode() * 1000)
+
+    mock_http_clients("app.services.audio_cache", handler)
+    cache = EpisodeAudioCache(cache_dir=tmp_path, max_bytes=10_000)
+    # Another job is still decoding a.mp3 when b.mp3 goes over budget
+    a = await cache.fetch("http://cdn.example.com/a.mp3")
+    b = await cache.fetch("http://cdn.example.com/b.mp3")
+    assert a.exists() and b.exists()
+
+    cache.release(a)
+    cache.release(b)
+    c = await cache.fetch("http://cdn.example.com/c.mp3")
+
+    assert c.exists() and not a.exists()
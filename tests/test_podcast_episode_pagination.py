@@ -0,0 +1,112 @@
+"""Keyset-paginated episode lists and the cached per-feed episode count."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models.podcast_orm import PodcastFeed, UserEpisodeState
+from app.services.podcast_service import (
+    decode_episode_cursor,
+    encode_episode_cursor,
+    podcast_service,
+)
+
+BASE = datetime(2026, 1, 1, 12, 0, 0, 123456)
+
+
+def _episode(guid, published_at):
+    return {
+        "guid": guid,
+        "title": guid,
+        "description": f"About {guid}",
+        "audio_url": f"http://cdn.example.com/{guid}.mp3",
+        "duration_seconds": 60,
+        "image_url": None,
+        "published_at": published_at,
+    }
+
+
+@pytest.fixture
+async def feed(db_session):
+    feed = PodcastFeed(rss_url="http://feeds.example.com/paged.xml", title="Paged")
+    db_session.add(feed)
+    await db_session.flush()
+    episodes = [_episode(f"d{i}", BASE - timedelta(days=i)) for i in range(7)]
+    # Same publish time (ties broken by id) and undated episodes (listed last)
+    episodes += [_episode("same", BASE - timedelta(days=3)), _episode("u1", None)]
+    episodes.append(_episode("u2", None))
+    await podcast_service._upsert_episodes(db_session, feed.id, episodes)
+    return feed
+
+
+async def _all_pages(db_session, feed_id, limit):
+    pages, cursor = [], None
+    while True:
+        data = await podcast_service.get_feed_with_episodes(
+            db_session, "u", feed_id, limit=limit, cursor=cursor
+        )
+        pages.append([ep["guid"] for ep in data["episodes"]])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            return pages, data
+
+
+@pytest.mark.asyncio
+async def test_cursor_pages_cover_every_episode_once_in_order(db_session, feed):
+    offset_page = await podcast_service.get_feed_with_episodes(
+        db_session, "u", feed.id, limit=10
+    )
+    expected = [ep["guid"] for ep in offset_page["episodes"]]
+    assert expected[:3] == ["d0", "d1", "d2"]
+    assert set(expected[3:5]) == {"d3", "same"}
+    assert expected[-2:] == ["u2", "u1"]
+
+    for limit in (1, 3, 4, 10):
+        pages, last = await _all_pages(db_session, feed.id, limit)
+        assert [guid for page in pages for guid in page] == expected
+        assert all(0 < len(page) <= limit for page in pages)
+        assert last["total_episodes"] == 10
+
+    # Legacy offset paging agrees with the cursor order
+    page = await podcast_service.get_feed_with_episodes(
+        db_session, "u", feed.id, limit=4, offset=6
+    )
+    assert [ep["guid"] for ep in page["episodes"]] == expected[6:10]
+
+
+@pytest.mark.asyncio
+async def test_episode_rows_carry_user_state_and_count_tracks_upserts(db_session, feed):
+    data = await podcast_service.get_feed_with_episodes(db_session, "u", feed.id)
+    first = data["episodes"][0]
+    db_session.add(
+        UserEpisodeState(
+            user_id="u",
+            episode_id=first["id"],
+            current_position_seconds=42.0,
+            is_finished=True,
+        )
+    )
+    new = _episode("new", BASE + timedelta(days=1))
+    assert await podcast_service._upsert_episodes(db_session, feed.id, [new]) == 1
+    await db_session.flush()
+
+    data = await podcast_service.get_feed_with_episodes(
+        db_session, "u", feed.id, limit=2
+    )
+    assert [ep["guid"] for ep in data["episodes"]] == ["new", "d0"]
+    assert data["episodes"][1]["current_position"] == 42.0
+    assert data["episodes"][1]["is_finished"] is True
+    assert data["episodes"][0]["description"] == "About new"
+    assert data["total_episodes"] == 11
+
+    batch = await podcast_service.get_episodes_batch(db_session, "u", [first["id"]])
+    assert batch[0]["episode"]["guid"] == "d0"
+    assert batch[0]["feed"] == {"id": feed.id, "title": "Paged", "image_url": None}
+    assert batch[0]["last_position_seconds"] == 42.0
+
+
+def test_cursor_round_trips_and_rejects_garbage():
+    assert decode_episode_cursor(encode_episode_cursor(BASE, 7)) == (BASE, 7)
+    assert decode_episode_cursor(encode_episode_cursor(None, 3)) == (None, 3)
+    with pytest.raises(ValueError):
+        decode_episode_cursor("not-a-cursor")
@@ -0,0 +1,94 @@
+"""Conditional-GET feed refresh and episode upsert."""
+
+import httpx
+import pytest
+from unittest.mock import patch
+from sqlalchemy import select
+
+from app.models.podcast_orm import PodcastEpisode
+from app.services.podcast_service import podcast_service
+
+FEED_URL = "http://feeds.example.com/show.xml"
+
+
+def _rss(*items):
+    entries = "".join(
+        f"""<item><guid>{guid}</guid><title>{guid}</title>
+        <enclosure url="http://cdn.example.com/{guid}.mp3" type="audio/mpeg" length="{length}"/>
+        </item>"""
+        for guid, length in items
+    )
+    return (
+        '<?xml version="1.0"?><rss version="2.0"><channel>'
+        f"<title>Show</title>{entries}</channel></rss>"
+    ).encode()
+
+
+class FakeFeedServer:
+    def __init__(self, body: bytes, etag: str):
+        self.body = body
+        self.etag = etag
+        self.requests = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.headers.get("if-none-match") == self.etag:
+            return httpx.Response(304)
+        return httpx.Response(200, content=self.body, headers={"ETag": self.etag})
+
+
+@pytest.fixture
+def feed_server(mock_http_clients):
+    server = FakeFeedServer(_rss(("ep1", 100), ("ep2", 200)), '"v1"')
+    mock_http_clients("app.services.podcast_service", server.handler)
+    return server
+
+
+async def _episodes(db_session, feed_id):
+    result = await db_session.execute(
+        select(PodcastEpisode)
+        .where(PodcastEpisode.feed_id == feed_id)
+        .order_by(PodcastEpisode.guid)
+        .execution_options(populate_existing=True)
+    )
+    return result.scalars().all()
+
+
+@pytest.mark.asyncio
+async def test_refresh_skips_parsing_when_unchanged(db_session, feed_server):
+    feed = await podcast_service.get_or_create_feed(db_session, FEED_URL)
+    await db_session.flush()
+    assert feed.etag == '"v1"'
+    assert feed.content_hash
+    assert len(await _episodes(db_session, feed.id)) == 2
+
+    with patch.object(
+        podcast_service, "_parse_feed_content", side_effect=AssertionError
+    ):
+        # 304 Not Modified
+        assert await podcast_service.refresh_feed_content(db_session, feed) == 0
+        assert feed_server.requests[-1].headers["if-none-match"] == '"v1"'
+
+        # 200 with a new ETag but an identical body
+        feed_server.etag = '"v2"'
+        assert await podcast_service.refresh_feed_content(db_session, feed) == 0
+        assert feed.etag == '"v2"'
+
+
+@pytest.mark.asyncio
+async def test_refresh_upserts_new_and_changed_episodes(db_session, feed_server):
+    feed = await podcast_service.get_or_create_feed(db_session, FEED_URL)
+    await db_session.flush()
+
+    # ep1 changed size, ep3 is new (and repeated in the feed)
+    feed_server.body = _rss(("ep1", 150), ("ep2", 200), ("ep3", 300), ("ep3", 300))
+    feed_server.etag = '"v2"'
+
+    assert await podcast_service.refresh_feed_content(db_session, feed) == 1
+
+    episodes = await _episodes(db_session, feed.id)
+    assert [(e.guid, e.file_size) for e in episodes] == [
+        ("ep1", 150),
+        ("ep2", 200),
+        ("ep3", 300),
+    ]
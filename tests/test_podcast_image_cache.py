@@ -0,0 +1,152 @@
+"""Content-addressed podcast artwork cache with LRU eviction and thumbnails."""
+
+import io
+import os
+
+import httpx
+import pytest
+from PIL import Image
+from unittest.mock import patch
+
+from app.services import image_cache as image_cache_module
+from app.services.image_cache import ImageCache, thumbnail_size
+
+
+class FakeImageServer:
+    def __init__(self):
+        self.images = {}
+        self.requests = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        body, content_type = self.images[str(request.url)]
+        return httpx.Response(200, content=body, headers={"content-type": content_type})
+
+
+@pytest.fixture
+def image_server(mock_http_clients):
+    server = FakeImageServer()
+    mock_http_clients("app.services.image_cache", server.handler)
+    return server
+
+
+def _files(path):
+    return sorted(p.name for p in path.iterdir()) if path.exists() else []
+
+
+def test_requested_sizes_snap_up_to_thumbnail_sizes():
+    assert thumbnail_size(None) is None
+    assert thumbnail_size(96) == 128
+    assert thumbnail_size(128) == 128
+    assert thumbnail_size(384) == 512
+    assert thumbnail_size(2000) is None  # Bigger than any thumbnail: original
+
+
+@pytest.mark.asyncio
+async def test_same_image_behind_two_urls_is_stored_once(image_server, tmp_path):
+    image_server.images["http://a.example.com/cover.png"] = (b"png" * 10, "image/png")
+    image_server.images["http://b.example.com/c?id=1"] = (b"png" * 10, "image/png")
+    cache = ImageCache(cache_dir=tmp_path)
+
+    first = await cache.fetch("http://a.example.com/cover.png")
+    second = await cache.fetch("http://b.example.com/c?id=1")
+
+    assert first == second and first.suffix == ".png"
+    assert len(_files(tmp_path / "blobs")) == 1
+    assert len(_files(tmp_path / "index")) == 2
+    assert _files(tmp_path / "partial") == []
+
+
+@pytest.mark.asyncio
+async def test_index_survives_a_restart(image_server, tmp_path):
+    url = "http://cdn.example.com/art.jpg"
+    image_server.images[url] = (b"jpeg", "image/jpeg")
+    path = await ImageCache(cache_dir=tmp_path).fetch(url)
+
+    assert await ImageCache(cache_dir=tmp_path).fetch(url) == path
+    assert len(image_server.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_images_are_evicted(image_server, tmp_path):
+    for name in "abc":
+        image_server.images[f"http://cdn.example.com/{name}.jpg"] = (
+            name.encode() * 100,
+            "image/jpeg",
+        )
+    cache = ImageCache(cache_dir=tmp_path, max_bytes=250)
+
+    a = await cache.fetch("http://cdn.example.com/a.jpg")
+    b = await cache.fetch("http://cdn.example.com/b.jpg")
+    await cache.fetch("http://cdn.example.com/a.jpg")  # a is now the newest
+    c = await cache.fetch("http://cdn.example.com/c.jpg")
+
+    assert a.exists() and c.exists() and not b.exists()
+    assert len(image_server.requests) == 3
+
+    # An evicted image is downloaded again
+    assert (await cache.fetch("http://cdn.example.com/b.jpg")).exists()
+    assert len(image_server.requests) == 4
+    assert len(_files(tmp_path / "blobs")) == 2
+
+
+@pytest.mark.asyncio
+async def test_oversized_image_is_refused(image_server, tmp_path):
+    image_server.images["http://cdn.example.com/huge.jpg"] = (b"x" * 100, "image/jpeg")
+    cache = ImageCache(cache_dir=tmp_path)
+
+    with patch.object(image_cache_module, "MAX_IMAGE_BYTES", 50):
+        with pytest.raises(ValueError, match="byte limit"):
+            await cache.fetch("http://cdn.example.com/huge.jpg")
+    assert _files(tmp_path / "blobs") == []
+    assert _files(tmp_path / "partial") == []
+
+
+@pytest.mark.asyncio
+async def test_files_from_the_old_layout_are_removed(image_server, tmp_path):
+    legacy = tmp_path / f"{'0' * 32}.jpg"
+    legacy.write_bytes(b"old")
+    image_server.images["http://cdn.example.com/new.jpg"] = (b"new", "image/jpeg")
+
+    await ImageCache(cache_dir=tmp_path).fetch("http://cdn.example.com/new.jpg")
+
+    assert not legacy.exists()
+
+
+@pytest.mark.asyncio
+async def test_thumbnails_are_resized_and_cached(image_server, tmp_path):
+    buffer = io.BytesIO()
+    Image.new("RGB", (1400, 1400), "red").save(buffer, "JPEG")
+    url = "http://cdn.example.com/cover.jpg"
+    image_server.images[url] = (buffer.getvalue(), "image/jpeg")
+    cache = ImageCache(cache_dir=tmp_path)
+
+    thumb = await cache.fetch(url, size=200)
+
+    assert thumb.parent.name == "thumbs"
+    with Image.open(thumb) as img:
+        assert img.size == (256, 256)
+    assert os.path.getsize(thumb) < len(buffer.getvalue())
+    assert await cache.fetch(url, size=256) == thumb
+    assert (await cache.fetch(url)).parent.name == "blobs"
+    assert len(image_server.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_small_or_unreadable_images_are_served_as_they_are(
+    image_server, tmp_path
+):
+    buffer = io.BytesIO()
+    Image.new("RGB", (100, 100), "blue").save(buffer, "PNG")
+    image_server.images["http://cdn.example.com/small.png"] = (
+        buffer.getvalue(),
+        "image/png",
+    )
+    image_server.images["http://cdn.example.com/bad.jpg"] = (b"junk", "image/jpeg")
+    cache = ImageCache(cache_dir=tmp_path)
+
+    small = await cache.fetch("http://cdn.example.com/small.png", size=128)
+    bad = await cache.fetch("http://cdn.example.com/bad.jpg", size=128)
+
+    assert small.parent.name == "blobs" and bad.parent.name == "blobs"
+    assert _files(tmp_path / "thumbs") == []
@@ -1,94 +1,59 @@
+import hashlib
+
+import httpx
 import pytest
-import shutil
-from pathlib import Path
-from unittest.mock import MagicMock, patch, AsyncMock
+from unittest.mock import patch
 from fastapi import HTTPException
 from app.api.routers.podcast import _proxy_image
+from app.services.image_cache import ImageCache
 
-# Test setup
-# We override the podcast_cache_dir for testing to avoid cluttering the real cache
-TEST_CACHE_DIR = Path("tests/temp_cache")
-
+DUMMY_JPEG = b"\xff\xd8\xff\xe0\x00\x10JFIF"  # Fake JPEG header
 
-@pytest.fixture(autouse=True)
-def clean_cache():
-    """Clean up cache directory before and after tests."""
-    # Since settings is already instantiated in podcast.py, patching Settings.podcast_cache_dir property
-    # might not work if it's accessed via the instance.
-    # Instead, we patch the 'settings' object in app.api.routers.podcast directly.
 
-    with patch("app.api.routers.podcast.settings") as mock_settings:
-        mock_settings.podcast_cache_dir = TEST_CACHE_DIR
-        # Also need to mock other settings accessed
-        mock_settings.PROXY_URL = None
-        mock_settings.SECRET_KEY = "test-secret"
+@pytest.fixture
+def upstream(tmp_path, mock_http_clients):
+    """Serve images from a dict of url -> (status, body) into a fresh cache."""
+    images = {}
+    requests = []
 
-        if TEST_CACHE_DIR.exists():
-            shutil.rmtree(TEST_CACHE_DIR)
-        TEST_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        status, body = images.get(str(request.url), (404, b""))
+        return httpx.Response(
+            status, content=body, headers={"content-type": "image/jpeg"}
+        )
 
-        yield
-
-        if TEST_CACHE_DIR.exists():
-            shutil.rmtree(TEST_CACHE_DIR)
+    mock_http_clients("app.services.image_cache", handler)
+    with patch("app.api.routers.podcast.image_cache", ImageCache(cache_dir=tmp_path)):
+        yield images, requests
 
 
 @pytest.mark.asyncio
-async def test_proxy_image_cache_miss_then_hit():
+async def test_proxy_image_cache_miss_then_hit(upstream, tmp_path):
     """Test that image is fetched, cached, and then served from cache."""
-
+    images, requests = upstream
     url = "http://example.com/image.jpg"
-    dummy_content = b"\xff\xd8\xff\xe0\x00\x10JFIF"  # Fake JPEG header
-
-    # Mock httpx.AsyncClient
-    with patch("httpx.AsyncClient") as mock_client_cls:
-        # Create an AsyncMock for the client instance
-        mock_client = AsyncMock()
-
-        # Configure __aenter__ to return the mock client itself
-        mock_client.__aenter__.return_value = mock_client
-        mock_client.__aexit__.return_value = None
-
-        # Mock Response
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.content = dummy_content
-        mock_response.headers = {"content-type": "image/jpeg"}
-
-        # Ensure client.get returns the mock response
-        mock_client.get.return_value = mock_response
+    images[url] = (200, DUMMY_JPEG)
 
-        # Configure the class to return our mock instance
-        mock_client_cls.return_value = mock_client
+    # 1. First Call: Cache Miss
+    response = await _proxy_image(url)
 
-        # 1. First Call: Cache Miss
-        response = await _proxy_image(url)
+    assert response.status_code == 200
+    assert "image.jpg" in response.headers["content-disposition"]
+    assert response.media_type == "image/jpeg"
+    assert len(requests) == 1
+    assert "Mozilla" in requests[0].headers["user-agent"]
 
-        # Verify response
-        assert response.status_code == 200  # FileResponse usually sets 200
-        assert "image.jpg" in response.headers["content-disposition"]
+    # Stored by content hash
+    expected_path = tmp_path / "blobs" / f"{hashlib.sha256(DUMMY_JPEG).hexdigest()}.jpg"
+    assert str(response.path) == str(expected_path)
+    assert expected_path.read_bytes() == DUMMY_JPEG
 
-        # Verify network call
-        mock_client.get.assert_called_once_with(url)
+    # 2. Second Call: Cache Hit, no network call
+    response2 = await _proxy_image(url)
 
-        # Verify file creation
-        import hashlib
-
-        url_hash = hashlib.md5(url.encode("utf-8")).hexdigest()
-        expected_path = TEST_CACHE_DIR / f"{url_hash}.jpg"
-        assert expected_path.exists()
-        assert expected_path.read_bytes() == dummy_content
-
-        # 2. Second Call: Cache Hit
-        mock_client.get.reset_mock()
-
-        response2 = await _proxy_image(url)
-
-        # Verify response
-        assert str(response2.path) == str(expected_path)
-
-        # Verify NO network call
-        mock_client.get.assert_not_called()
+    assert str(response2.path) == str(expected_path)
+    assert len(requests) == 1
 
 
 @pytest.mark.asyncio
@@ -100,20 +65,19 @@ async def test_proxy_image_invalid_url():
 
 
 @pytest.mark.asyncio
-async def test_proxy_image_upstream_404():
+async def test_proxy_image_upstream_404(upstream, tmp_path):
     """Test upstream 404 handling."""
-    url = "http://example.com/notfound.jpg"
+    with pytest.raises(HTTPException) as exc:
+        await _proxy_image("http://example.com/notfound.jpg")
+    assert exc.value.status_code == 404
+    assert list((tmp_path / "partial").iterdir()) == []
+
 
-    with patch("httpx.AsyncClient") as mock_client_cls:
-        mock_client = AsyncMock()
-        mock_client.__aenter__.return_value = mock_client
-        mock_client.__aexit__.return_value = None
+def test_itunes_results_carry_a_signed_artwork_token():
+    from app.api.routers.podcast import _itunes_result, verify_signed_url
 
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        mock_client.get.return_value = mock_response
-        mock_client_cls.return_value = mock_client
+    url = "https://is1.mzstatic.com/image/cover/600x600bb.jpg"
+    result = _itunes_result({"title": "Show", "artwork_url": url})
+    assert verify_signed_url(result.artwork_token) == url
 
-        with pytest.raises(HTTPException) as exc:
-            await _proxy_image(url)
-        assert exc.value.status_code == 404
+    assert _itunes_result({"title": "No art"}).artwork_token is None
@@ -0,0 +1,129 @@
+"""Background feed refresh scheduler."""
+
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models.podcast_orm import PodcastFeed, PodcastFeedSubscription
+from app.services.podcast_refresh import (
+    DEFAULT_INTERVAL_SECONDS,
+    FeedRefreshScheduler,
+    compute_refresh_interval,
+)
+
+HOUR = 3600
+NOW = datetime(2026, 10, 16, 12, 0)
+
+
+def _every(hours: float, count: int = 8, start: datetime = NOW):
+    return [start - timedelta(hours=hours * i) for i in range(count)]
+
+
+def test_interval_follows_publish_cadence():
+    def interval(dates):
+        return compute_refresh_interval(dates, NOW, 30 * 60, 24 * HOUR)
+
+    assert interval(_every(24)) == 6 * HOUR  # daily show
+    assert interval(_every(0.5)) == 30 * 60  # clamped to the minimum
+    assert interval(_every(24 * 7)) == 24 * HOUR  # clamped to the maximum
+    assert interval([NOW, None]) == DEFAULT_INTERVAL_SECONDS
+    # A daily show that went quiet three days ago backs off
+    assert interval(_every(24, start=NOW - timedelta(days=3))) == 18 * HOUR
+
+
+@pytest.fixture
+async def scheduler(db_session):
+    # Savepoint per scheduler session so its commits roll back with the test
+    factory = async_sessionmaker(
+        bind=db_session.bind,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+    return FeedRefreshScheduler(session_factory=factory, concurrency=2, host_delay=0)
+
+
+async def _subscribed_feed(db_session, url, next_refresh_at=None):
+    feed = PodcastFeed(rss_url=url, title=url, next_refresh_at=next_refresh_at)
+    db_session.add(feed)
+    await db_session.flush()
+    db_session.add(PodcastFeedSubscription(user_id="default_user", feed_id=feed.id))
+    await db_session.commit()
+    return feed
+
+
+@pytest.mark.asyncio
+async def test_enqueue_due_staggers_new_feeds_and_queues_due_ones(
+    db_session, scheduler
+):
+    past = datetime.utcnow() - timedelta(minutes=5)
+    new = await _subscribed_feed(db_session, "http://a.example.com/new.xml")
+    due = await _subscribed_feed(db_session, "http://a.example.com/due.xml", past)
+    db_session.add(
+        PodcastFeed(
+            rss_url="http://a.example.com/unsubscribed.xml",
+            title="unsubscribed",
+            next_refresh_at=past,
+        )
+    )
+    await db_session.commit()
+
+    assert await scheduler.enqueue_due() == 1
+    assert scheduler.metrics()["queue_depth"] == 1
+    assert scheduler._queue.get_nowait() == due.id
+
+    await db_session.refresh(new)
+    assert new.next_refresh_at > past
+
+    # Already queued/in flight feeds are not queued twice
+    assert await scheduler.enqueue_due() == 0
+
+
+@pytest.mark.asyncio
+async def test_refresh_one_persists_schedule_and_backs_off(db_session, scheduler):
+    feed = await _subscribed_feed(db_session, "http://b.example.com/feed.xml")
+    refresh = AsyncMock(return_value=2)
+
+    with patch(
+        "app.services.podcast_refresh.podcast_service.refresh_feed_content", refresh
+    ):
+        await scheduler.refresh_one(feed.id)
+        await db_session.refresh(feed)
+        assert feed.refresh_interval_seconds == DEFAULT_INTERVAL_SECONDS
+        assert feed.next_refresh_at > datetime.utcnow() + timedelta(hours=5)
+
+        refresh.side_effect = ValueError("HTTP 503")
+        await scheduler.refresh_one(feed.id)
+        await db_session.refresh(feed)
+        assert feed.refresh_failures == 1
+        assert feed.last_refresh_error == "HTTP 503"
+        assert feed.next_refresh_at > datetime.utcnow() + timedelta(hours=10)
+
+    metrics = scheduler.metrics()
+    assert metrics["refreshed"] == 1
+    assert metrics["failed"] == 1
+    assert metrics["new_episodes"] == 2
+    assert metrics["latency_seconds"]["count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_fetches_to_one_host_are_spaced_out():
+    scheduler = FeedRefreshScheduler(host_delay=0.05)
+    loop = asyncio.get_running_loop()
+    started = {}
+
+    async def fetch(name, host):
+        await scheduler._wait_for_host(host)
+        started[name] = loop.time()
+
+    t0 = loop.time()
+    await asyncio.gather(
+        fetch("a1", "a.example.com"),
+        fetch("a2", "a.example.com"),
+        fetch("b1", "b.example.com"),
+    )
+    assert started["a2"] - started["a1"] >= 0.04
+    assert started["b1"] - t0 < 0.04
@@ -0,0 +1,128 @@
+"""Incremental transcript delivery over SSE."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.api.routers import podcast
+from app.models.podcast_orm import PodcastEpisode, PodcastFeed
+from app.services import podcast_transcripts
+
+
+def _segment(start, text):
+    return {"start_time": start, "end_time": start + 1, "text": text}
+
+
+async def _events(body, count):
+    events = []
+    async for chunk in body:
+        if chunk.startswith(":"):
+            continue
+        data = chunk.split("data: ", 1)[1]
+        events.append(json.loads(data))
+        if len(events) == count:
+            return events
+    return events
+
+
+@pytest.mark.asyncio
+async def test_stream_pushes_new_segments_until_transcription_completes(db_session):
+    feed = PodcastFeed(rss_url="http://test.com/rss", title="Test Feed")
+    db_session.add(feed)
+    await db_session.flush()
+    episode = PodcastEpisode(
+        feed_id=feed.id,
+        guid="stream",
+        title="Stream Ep",
+        audio_url="http://audio.com",
+        transcript_status="processing",
+    )
+    db_session.add(episode)
+    await db_session.flush()
+    await podcast_transcripts.save_segments(
+        db_session, episode.id, [_segment(0, "one")]
+    )
+
+    async def add_segment(status, seq, segment):
+        await db_session.execute(
+            update(PodcastEpisode)
+            .where(PodcastEpisode.id == episode.id)
+            .values(transcript_status=status)
+        )
+        await podcast_transcripts.save_segments(
+            db_session, episode.id, [segment], start=seq
+        )
+        await db_session.flush()
+
+    sessions = async_sessionmaker(
+        bind=db_session.bind,
+        class_=AsyncSession,
+        join_transaction_mode="create_savepoint",
+    )
+    request = MagicMock(headers={})
+    with (
+        patch.object(podcast, "AsyncSessionLocal", sessions),
+        patch.object(podcast, "TRANSCRIPT_STREAM_POLL_SECONDS", 0),
+    ):
+        response = await podcast.stream_episode_transcript(
+            episode.id, request, user_id="u"
+        )
+        body = response.body_iterator
+
+        assert await _events(body, 2) == [
+            {"type": "status", "status": "processing"},
+            {"type": "segments", "start": 0, "segments": [_segment(0, "one")]},
+        ]
+
+        # The next chunk finished
+        await add_segment("processing", 1, _segment(1, "two"))
+        assert await _events(body, 1) == [
+            {"type": "segments", "start": 1, "segments": [_segment(1, "two")]}
+        ]
+
+        await add_segment("completed", 2, _segment(2, "3"))
+        assert await _events(body, 10) == [
+            {"type": "status", "status": "completed"},
+            {"type": "segments", "start": 2, "segments": [_segment(2, "3")]},
+            {"type": "complete", "status": "completed", "total": 3},
+        ]
+
+
+@pytest.mark.asyncio
+async def test_stream_resumes_after_the_last_event_id(db_session):
+    feed = PodcastFeed(rss_url="http://test.com/rss2", title="Test Feed")
+    db_session.add(feed)
+    await db_session.flush()
+    episode = PodcastEpisode(
+        feed_id=feed.id,
+        guid="resume",
+        title="Resume Ep",
+        audio_url="http://audio.com",
+        transcript_status="completed",
+    )
+    db_session.add(episode)
+    await db_session.flush()
+    await podcast_transcripts.save_segments(
+        db_session, episode.id, [_segment(0, "one"), _segment(1, "two")]
+    )
+
+    sessions = async_sessionmaker(
+        bind=db_session.bind,
+        class_=AsyncSession,
+        join_transaction_mode="create_savepoint",
+    )
+    request = MagicMock(headers={"last-event-id": "1"})
+    with patch.object(podcast, "AsyncSessionLocal", sessions):
+        response = await podcast.stream_episode_transcript(
+            episode.id, request, user_id="u"
+        )
+        events = await _events(response.body_iterator, 10)
+
+    assert events == [
+        {"type": "status", "status": "completed"},
+        {"type": "segments", "start": 1, "segments": [_segment(1, "two")]},
+        {"type": "complete", "status": "completed", "total": 2},
+    ]
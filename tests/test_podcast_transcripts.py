@@ -0,0 +1,135 @@
+"""Transcript segment storage and time-window lookup."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.api.routers.content import _get_podcast_player_content
+from app.api.routers.podcast import _run_transcription
+from app.models.podcast_orm import PodcastEpisode, PodcastFeed
+from app.services import podcast_transcripts
+from app.services.transcription import TranscriptionSegment
+from app.services.transcription_jobs import JobCancelled
+
+
+@pytest.fixture
+async def episode(db_session):
+    feed = PodcastFeed(rss_url="http://test.com/transcripts", title="Test Feed")
+    db_session.add(feed)
+    await db_session.flush()
+    episode = PodcastEpisode(
+        feed_id=feed.id,
+        guid="transcripts",
+        title="Transcript Ep",
+        audio_url="http://audio.com",
+        transcript_status="completed",
+    )
+    db_session.add(episode)
+    await db_session.flush()
+    # Ten 10-second segments: "s0" at 0-10s ... "s9" at 90-100s
+    segments = [
+        {"start_time": i * 10.0, "end_time": i * 10.0 + 10, "text": f"s{i}"}
+        for i in range(10)
+    ]
+    await podcast_transcripts.save_segments(db_session, episode.id, segments)
+    return episode
+
+
+async def _texts(db, episode_id, **kwargs):
+    segments = await podcast_transcripts.load_segments(db, episode_id, **kwargs)
+    return [s.text for s in segments]
+
+
+@pytest.mark.asyncio
+async def test_time_window_returns_overlapping_segments(db_session, episode):
+    assert await _texts(db_session, episode.id, from_time=25, to_time=45) == [
+        "s2",
+        "s3",
+        "s4",
+    ]
+    assert await _texts(db_session, episode.id, from_time=30, to_time=40) == ["s3"]
+    assert await _texts(db_session, episode.id, from_time=95) == ["s9"]
+    assert await _texts(db_session, episode.id, to_time=15) == ["s0", "s1"]
+    assert await _texts(db_session, episode.id, from_time=200) == []
+    assert await _texts(db_session, episode.id, after=8) == ["s8", "s9"]
+
+
+@pytest.mark.asyncio
+async def test_save_replaces_segments_from_the_given_position(db_session, episode):
+    tail = [{"start_time": 20.0, "end_time": 25.0, "text": "new", "language": "en"}]
+
+    await podcast_transcripts.save_segments(db_session, episode.id, tail, start=2)
+
+    segments = await podcast_transcripts.load_segments(db_session, episode.id)
+    assert [s.text for s in segments] == ["s0", "s1", "new"]
+    assert podcast_transcripts.segment_to_dict(segments[-1]) == tail[0]
+    assert await podcast_transcripts.count_segments(db_session, episode.id) == 3
+
+
+@pytest.mark.asyncio
+async def test_player_content_loads_only_the_requested_window(db_session, episode):
+    sessions = async_sessionmaker(
+        bind=db_session.bind,
+        class_=AsyncSession,
+        join_transaction_mode="create_savepoint",
+    )
+    with patch("app.core.db.AsyncSessionLocal", sessions):
+        bundle = await _get_podcast_player_content(
+            episode.id, "u", from_time=600, to_time=900
+        )
+        assert bundle.blocks == []
+
+        bundle = await _get_podcast_player_content(
+            episode.id, "u", from_time=50, to_time=70
+        )
+        assert [b.text for b in bundle.blocks] == ["s5", "s6"]
+        assert bundle.full_text == "s5 s6"
+
+        episode.transcript_status = "processing"
+        await db_session.flush()
+        with pytest.raises(HTTPException) as exc:
+            await _get_podcast_player_content(episode.id, "u")
+        assert exc.value.status_code == 400
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("error", [JobCancelled, RuntimeError])
+async def test_forced_rerun_keeps_the_completed_transcript(db_session, episode, error):
+    episode.transcript_text = "s0 ... s9"
+    await db_session.flush()
+    sessions = async_sessionmaker(
+        bind=db_session.bind,
+        class_=AsyncSession,
+        join_transaction_mode="create_savepoint",
+    )
+
+    async def transcribe(audio_path, on_segments=None, **kwargs):
+        if on_segments:
+            await on_segments([TranscriptionSegment(0.0, 5.0, "partial")])
+        raise error("stopped")
+
+    job = MagicMock(payload={"episode_id": episode.id, "audio_url": "http://a"})
+    job.transcribe = transcribe
+    with (
+        patch("app.api.routers.podcast.AsyncSessionLocal", sessions),
+        patch("app.api.routers.podcast.episode_audio_cache") as audio_cache,
+        patch("app.api.routers.podcast.transcription_queue") as queue,
+    ):
+        audio_cache.fetch = AsyncMock(return_value="/tmp/ep.mp3")
+        queue.has_other_active_job = AsyncMock(return_value=False)
+        with pytest.raises(error):
+            await _run_transcription(job)
+
+    assert await _texts(db_session, episode.id) == [f"s{i}" for i in range(10)]
+    row = (
+        await db_session.execute(
+            select(PodcastEpisode.transcript_text, PodcastEpisode.transcript_status)
+            .where(PodcastEpisode.id == episode.id)
+            .execution_options(populate_existing=True)
+        )
+    ).one()
+    expected = "completed" if error is JobCancelled else "failed"
+    assert tuple(row) == ("s0 ... s9", expected)
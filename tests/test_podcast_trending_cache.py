@@ -0,0 +1,134 @@
+"""Trending chart warmup, persistence and stale-while-revalidate."""
+
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from app.services.podcast_service import PodcastService, podcast_service
+
+CHARTS = {
+    # V2 global chart
+    "rss.applemarketingtools.com": ["1", "2", "3"],
+    # V1 genre charts, overlapping with the global one
+    "1301": ["2", "3", "4"],
+    "1303": ["1", "4", "5"],
+}
+
+
+def _v1(ids):
+    return {
+        "feed": {
+            "entry": [
+                {"im:name": {"label": f"Show {i}"}, "id": {"attributes": {"im:id": i}}}
+                for i in ids
+            ]
+        }
+    }
+
+
+def _v2(ids):
+    return {"feed": {"results": [{"id": i, "name": f"Show {i}"} for i in ids]}}
+
+
+class FakeItunes:
+    def __init__(self):
+        self.looked_up = []
+        self.chart_requests = 0
+        self.fail = False
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        if self.fail:
+            return httpx.Response(503)
+        path = request.url.path
+        if path == "/lookup":
+            ids = request.url.params["id"].split(",")
+            self.looked_up.extend(ids)
+            return httpx.Response(
+                200,
+                json={
+                    "results": [
+                        {"collectionId": int(i), "feedUrl": f"http://feeds/{i}"}
+                        for i in ids
+                    ]
+                },
+            )
+        self.chart_requests += 1
+        if request.url.host == "rss.applemarketingtools.com":
+            return httpx.Response(200, json=_v2(CHARTS[request.url.host]))
+        genre = path.split("genre=")[1].split("/")[0]
+        return httpx.Response(200, json=_v1(CHARTS[genre]))
+
+
+@pytest.fixture
+def itunes(tmp_path, mock_http_clients):
+    server = FakeItunes()
+    mock_http_clients("app.services.podcast_service", server.handler)
+    mock_settings = MagicMock(podcast_trending_dir=tmp_path)
+    with (
+        patch("app.services.podcast_service.settings", mock_settings),
+        patch.object(PodcastService, "_trending_cache", {}),
+        patch.object(PodcastService, "_trending_loaded", False),
+        patch.object(PodcastService, "_trending_revalidating", {}),
+        patch.object(PodcastService, "CATEGORY_IDS", ["1301", "1303"]),
+        patch.object(PodcastService, "WARMUP_MIN_INTERVAL", 0),
+    ):
+        yield server
+
+
+def _simulate_restart():
+    PodcastService._trending_cache.clear()
+    PodcastService._trending_loaded = False
+
+
+@pytest.mark.asyncio
+async def test_warmup_merges_lookups_and_survives_restart(itunes, tmp_path):
+    await podcast_service.refresh_trending_cache()
+
+    assert itunes.chart_requests == 3
+    # Five unique podcasts across three charts, each resolved once
+    assert sorted(itunes.looked_up) == ["1", "2", "3", "4", "5"]
+    assert {p.name for p in tmp_path.iterdir()} == {
+        "global.json",
+        "1301.json",
+        "1303.json",
+    }
+
+    _simulate_restart()
+    itunes.fail = True
+
+    results = await podcast_service._fetch_trending_upstream("1303", limit=3)
+    assert [r["rss_url"] for r in results] == [
+        "http://feeds/1",
+        "http://feeds/4",
+        "http://feeds/5",
+    ]
+    assert itunes.chart_requests == 3
+
+
+@pytest.mark.asyncio
+async def test_stale_chart_is_served_then_revalidated(itunes):
+    stale = datetime.utcnow() - timedelta(seconds=PodcastService.CACHE_TTL + 60)
+    PodcastService._trending_cache["1301"] = {
+        "timestamp": stale,
+        "data": [{"itunes_id": "9", "rss_url": None}],
+    }
+    PodcastService._trending_loaded = True
+
+    results = await podcast_service._fetch_trending_upstream("1301", limit=1)
+    assert results == [{"itunes_id": "9", "rss_url": None}]
+    assert itunes.chart_requests == 0
+
+    # A second stale hit doesn't start another refresh
+    task = PodcastService._trending_revalidating["1301"]
+    await podcast_service._fetch_trending_upstream("1301", limit=1)
+    await task
+    await asyncio.sleep(0)
+
+    assert itunes.chart_requests == 1
+    entry = PodcastService._trending_cache["1301"]
+    assert entry["timestamp"] > stale
+    assert [r["itunes_id"] for r in entry["data"]] == ["2", "3", "4"]
+    assert PodcastService._trending_revalidating == {}
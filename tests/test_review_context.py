@@ -2,12 +2,8 @@ import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 from app.api.routers.review import get_review_context
 from app.models.orm import ReviewItem
-from app.models.content_schemas import (
-    ContentBundle,
-    ContentBlock,
-    BlockType,
-    SourceType,
-)
+from app.models.content_schemas import ContentBlock, BlockType
+from app.services.content_providers.epub_provider import EpubChapter
 
 
 @pytest.mark.asyncio
@@ -30,12 +26,11 @@ async def test_get_review_context_epub():
     mock_result.scalar_one_or_none.return_value = mock_item
     mock_db.execute.return_value = mock_result
 
-    # 2. Mock ContentService
-    mock_bundle = ContentBundle(
-        id="epub:test_book.epub:1",
-        source_type=SourceType.EPUB,
-        title="Chapter 1",
-        blocks=[
+    # 2. Mock EPUB chapter
+    mock_chapter = EpubChapter.from_blocks(
+        "Chapter 1",
+        "Prev. Target. Next.",
+        [
             ContentBlock(
                 type=BlockType.PARAGRAPH,
                 text="Prev. Target. Next.",
@@ -46,14 +41,14 @@ async def test_get_review_context_epub():
                 ],
             )
         ],
-        metadata={"filename": "test_book.epub"},
+        total_chapters=2,
     )
 
     with patch(
-        "app.services.content_service.content_service.get_content",
+        "app.services.content_providers.epub_provider.EpubProvider.get_chapter",
         new_callable=AsyncMock,
-    ) as mock_get_content:
-        mock_get_content.return_value = mock_bundle
+    ) as mock_get_chapter:
+        mock_get_chapter.return_value = mock_chapter
 
         # 3. Call the function
         response = await get_review_context(item_id=1, db=mock_db)
@@ -64,6 +59,7 @@ async def test_get_review_context_epub():
         assert response.next_sentence == "This is the next sentence."
         assert response.source_title == "test_book.epub"
         assert response.chapter_title == "Chapter 1"
+        mock_get_chapter.assert_awaited_once_with("test_book.epub", 1)
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,284 @@
+"""Persistent transcription job queue."""
+
+import asyncio
+import threading
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import delete, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.api.routers.audiobook import TranscribeRequest as AudiobookTranscribeRequest
+from app.models.podcast_schemas import TranscribeRequest
+from app.models.transcription_orm import TranscriptionJob
+from app.services.transcription import TranscriptionResult, TranscriptionSegment
+from app.services.transcription_jobs import (
+    JobCancelled,
+    JobContext,
+    TranscriptionJobQueue,
+)
+
+
+@pytest.fixture
+async def session_factory(db_session):
+    # Start the outer transaction with a write (SQLite only BEGINs on DML),
+    # then give each queue session a savepoint so its commits roll back too
+    await db_session.execute(delete(TranscriptionJob))
+    return async_sessionmaker(
+        bind=db_session.bind,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+
+
+@pytest.fixture
+def queue(session_factory):
+    return TranscriptionJobQueue(session_factory=session_factory, lease_seconds=60)
+
+
+async def _expire_lease(db_session, job_id):
+    await db_session.execute(
+        update(TranscriptionJob)
+        .where(TranscriptionJob.id == job_id)
+        .values(lease_expires_at=datetime.utcnow() - timedelta(seconds=1))
+    )
+    await db_session.commit()
+
+
+@pytest.mark.asyncio
+async def test_jobs_are_leased_by_priority_then_age(queue):
+    low = await queue.enqueue("test", "t:low", {})
+    high = await queue.enqueue("test", "t:high", {}, priority=5)
+    low2 = await queue.enqueue("test", "t:low2", {})
+
+    leased = [await queue.lease_next() for _ in range(3)]
+    assert [job.id for job in leased] == [high.id, low.id, low2.id]
+    assert all(job.status == "running" for job in leased)
+    assert leased[0].lease_owner == queue.worker_id
+    assert leased[0].attempts == 1
+    assert await queue.lease_next() is None
+
+
+def test_worker_id_fits_lease_owner_column():
+    long_host = "transcriber-" + "x" * 80 + ".svc.cluster.local"
+    with patch(
+        "app.services.transcription_jobs.socket.gethostname", return_value=long_host
+    ):
+        queue = TranscriptionJobQueue(session_factory=AsyncMock())
+
+    column = TranscriptionJob.__table__.c.lease_owner
+    assert len(queue.worker_id) <= column.type.length
+    assert queue.worker_id.startswith("transcriber-")
+
+
+@pytest.mark.parametrize("model", [TranscribeRequest, AudiobookTranscribeRequest])
+def test_request_priority_is_bounded(model):
+    assert model(priority=10).priority == 10
+    for priority in (11, 10_000, -11):
+        with pytest.raises(ValidationError):
+            model(priority=priority)
+
+
+@pytest.mark.asyncio
+async def test_enqueue_dedupes_per_target_and_replace_cancels(queue):
+    abandoned = AsyncMock()
+    queue.register_handler("test", AsyncMock(), on_abandoned=abandoned)
+
+    first = await queue.enqueue("test", "t:1", {"n": 1})
+    assert (await queue.enqueue("test", "t:1", {"n": 2})).id == first.id
+
+    # Replacing hands the target to the new job without the abandoned hook
+    second = await queue.enqueue("test", "t:1", {"n": 3}, replace=True)
+    assert second.id != first.id
+    assert (await queue.get(first.id)).status == "cancelled"
+    abandoned.assert_not_awaited()
+
+    cancelled = await queue.cancel(second.id)
+    assert cancelled.status == "cancelled"
+    abandoned.assert_awaited_once_with({"n": 3}, "cancelled")
+    assert await queue.lease_next() is None
+
+
+@pytest.mark.asyncio
+async def test_expired_lease_is_released_until_attempts_run_out(
+    db_session, queue, session_factory
+):
+    abandoned = AsyncMock()
+    queue.register_handler("test", AsyncMock(), on_abandoned=abandoned)
+    job = await queue.enqueue("test", "t:crash", {"n": 1})
+    await queue.lease_next()
+
+    # A live lease is never taken over
+    other = TranscriptionJobQueue(session_factory=session_factory, lease_seconds=60)
+    other.register_handler("test", AsyncMock(), on_abandoned=abandoned)
+    assert await other.lease_next() is None
+
+    # The worker "crashed": its lease expires and another worker takes the job
+    await _expire_lease(db_session, job.id)
+    await db_session.execute(
+        update(TranscriptionJob)
+        .where(TranscriptionJob.id == job.id)
+        .values(max_attempts=2)
+    )
+    await db_session.commit()
+    released = await other.lease_next()
+    assert released.id == job.id
+    assert released.attempts == 2
+    assert released.lease_owner == other.worker_id
+
+    # Out of attempts: finalized as failed instead of running again
+    await _expire_lease(db_session, job.id)
+    assert await other.lease_next() is None
+    failed = await queue.get(job.id)
+    assert failed.status == "failed"
+    assert failed.finished_at is not None
+    abandoned.assert_awaited_once_with({"n": 1}, "failed")
+
+
+@pytest.mark.asyncio
+async def test_run_job_records_progress_and_honours_cancel(queue):
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def handler(ctx: JobContext):
+        ctx._on_chunk(1, 4)
+        started.set()
+        await release.wait()
+        ctx._on_chunk(2, 4)  # Raises JobCancelled once cancel was requested
+
+    queue.register_handler("test", handler)
+    await queue.enqueue("test", "t:run", {})
+    job = await queue.lease_next()
+
+    run = asyncio.create_task(queue.run_job(job))
+    await started.wait()
+    assert queue.stats()["running"][job.id]["progress"] == 0.25
+
+    await queue.cancel(job.id)
+    release.set()
+    await run
+
+    done = await queue.get(job.id)
+    assert done.status == "cancelled"
+    assert done.cancel_requested
+    assert done.progress == 0.25
+    assert done.progress_message == "25% transcribed"
+    assert done.lease_owner is None
+    assert queue.stats()["running"] == {}
+
+
+@pytest.mark.asyncio
+async def test_run_job_marks_handler_errors_failed(queue):
+    queue.register_handler("test", AsyncMock(side_effect=RuntimeError("boom")))
+    await queue.enqueue("test", "t:err", {})
+    job = await queue.lease_next()
+
+    await queue.run_job(job)
+
+    failed = await queue.get(job.id)
+    assert failed.status == "failed"
+    assert failed.error == "boom"
+
+
+@pytest.mark.asyncio
+async def test_finished_jobs_do_not_keep_api_keys(db_session, queue):
+    seen = []
+
+    async def handler(ctx: JobContext):
+        seen.append(ctx.payload.get("api_key"))
+
+    queue.register_handler("test", handler)
+    payload = {"n": 1, "remote_url": "http://asr", "api_key": "secret"}
+
+    ran = await queue.enqueue("test", "t:ran", dict(payload))
+    await queue.run_job(await queue.lease_next())
+    queued = await queue.enqueue("test", "t:queued", dict(payload))
+    await queue.cancel(queued.id)
+    stale = await queue.enqueue("test", "t:stale", dict(payload))
+    await queue.lease_next()
+    await db_session.execute(
+        update(TranscriptionJob)
+        .where(TranscriptionJob.id == stale.id)
+        .values(max_attempts=1)
+    )
+    await _expire_lease(db_session, stale.id)
+    assert await queue.lease_next() is None
+
+    # The handler still got the key while the job ran
+    assert seen == ["secret"]
+    for job in (ran, queued, stale):
+        finished = await queue.get(job.id)
+        assert finished.status in ("completed", "cancelled", "failed")
+        assert finished.payload == {"n": 1, "remote_url": "http://asr"}
+
+
+@pytest.mark.asyncio
+async def test_transcribe_hands_partial_segments_to_the_handler(tmp_path):
+    first = TranscriptionSegment(start_time=0.0, end_time=1.0, text="first")
+    last = TranscriptionSegment(start_time=1.0, end_time=2.0, text="last")
+    saved = threading.Event()
+
+    class _Engine:
+        def transcribe(self, audio, on_progress=None, on_segments=None):
+            on_segments([first])
+            assert saved.wait(5)  # The first chunk is saved mid-run
+            on_segments([last])
+            return TranscriptionResult(segments=[first, last], full_text="", duration=2)
+
+    partials = []
+
+    async def save(segments):
+        partials.append(list(segments))
+        saved.set()
+
+    audio = tmp_path / "a.wav"
+    audio.write_bytes(b"")
+    ctx = JobContext(1, "t:partial", {})
+    with (
+        patch("app.services.transcription.get_default_engine", return_value=_Engine()),
+        patch("app.services.transcription_jobs.PARTIAL_FLUSH_SECONDS", 0.01),
+    ):
+        result = await ctx.transcribe(audio, on_segments=save)
+
+    assert result.segments == [first, last]
+    # Nothing is saved after the run: the handler stores the full result
+    assert partials == [[first]]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_run_stops_saving_partial_segments(tmp_path):
+    first = TranscriptionSegment(start_time=0.0, end_time=1.0, text="first")
+    ctx = JobContext(1, "t:cancel", {})
+    release = threading.Event()
+
+    class _Engine:
+        def transcribe(self, audio, on_progress=None, on_segments=None):
+            on_segments([first])
+            ctx.cancelled.set()  # Cancelled mid-chunk, before the next flush
+            assert release.wait(5)
+            on_progress(1, 2)  # The next chunk boundary raises JobCancelled
+
+    partials = []
+
+    async def save(segments):
+        partials.append(list(segments))
+
+    async def release_later():
+        await asyncio.sleep(0.1)
+        release.set()
+
+    audio = tmp_path / "a.wav"
+    audio.write_bytes(b"")
+    with (
+        patch("app.services.transcription.get_default_engine", return_value=_Engine()),
+        patch("app.services.transcription_jobs.PARTIAL_FLUSH_SECONDS", 0.01),
+    ):
+        releaser = asyncio.create_task(release_later())
+        with pytest.raises(JobCancelled):
+            await ctx.transcribe(audio, on_segments=save)
+        await releaser
+
+    assert partials == []
@@ -0,0 +1,110 @@
+"""
+Chunk-boundary merging of transcripts, plus a benchmark over a synthetic
+3-hour word-level transcript (30s chunks, 2s overlap).
+
+Run with -s to see the numbers:
+    uv run pytest tests/test_transcription_merge_benchmark.py -s
+"""
+
+import random
+import string
+import time
+
+from app.services.transcription.schemas import TranscriptionSegment
+from app.services.transcription.utils import merge_overlapping_segments
+
+CHUNK = 30.0
+OVERLAP = 2.0
+
+
+def _words(count, rng):
+    vocab = ["the", "a", "and", "of", "to"] + [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9)))
+        for _ in range(2000)
+    ]
+    return [rng.choice(vocab) for _ in range(count)]
+
+
+def _chunked(words, seconds_per_word=0.4):
+    """Word-level chunk transcripts, as SenseVoice returns them."""
+    total = len(words) * seconds_per_word
+    chunks = []
+    start = 0.0
+    while True:
+        end = min(start + CHUNK, total)
+        segments = [
+            TranscriptionSegment(
+                start_time=i * seconds_per_word - start,
+                end_time=(i + 1) * seconds_per_word - start,
+                text=word,
+            )
+            for i, word in enumerate(words)
+            if start <= i * seconds_per_word and (i + 1) * seconds_per_word <= end
+        ]
+        chunks.append((segments, start, end))
+        if end >= total:
+            return chunks
+        start = end - OVERLAP
+
+
+def _seg(start, end, text):
+    return TranscriptionSegment(start_time=start, end_time=end, text=text)
+
+
+def test_overlap_words_are_kept_once_and_repeats_elsewhere_survive():
+    words = _words(400, random.Random(1))
+    words[100] = words[10] = "the"  # Same word in both chunks, outside the overlap
+
+    merged = merge_overlapping_segments(_chunked(words), overlap_duration=OVERLAP)
+
+    assert [s.text for s in merged] == words
+    starts = [s.start_time for s in merged]
+    assert starts == sorted(starts)
+
+
+def test_sentence_segments_are_cut_at_the_seam():
+    chunks = [
+        ([_seg(0, 27, "we went down to"), _seg(27, 29.8, "the river and sw")], 0, 30),
+        ([_seg(0, 1.8, "the river and swam"), _seg(2.0, 6, "all day")], 28, 58),
+    ]
+
+    merged = merge_overlapping_segments(chunks, overlap_duration=OVERLAP)
+
+    # The previous chunk's garbled last word is replaced by the next chunk's
+    text = " ".join(s.text for s in merged)
+    assert text == "we went down to the river and swam all day"
+    assert [s.start_time for s in merged] == [0, 27, 28, 30.0]
+
+
+def test_without_a_shared_run_the_overlap_is_split_at_its_midpoint():
+    chunks = [
+        ([_seg(0, 20, "one"), _seg(28.2, 28.6, "two"), _seg(29.2, 29.6, "x")], 0, 30),
+        ([_seg(0.2, 0.6, "too"), _seg(1.2, 1.6, "three"), _seg(3, 4, "four")], 28, 58),
+    ]
+
+    merged = merge_overlapping_segments(chunks, overlap_duration=OVERLAP)
+
+    assert [s.text for s in merged] == ["one", "two", "three", "four"]
+
+
+def test_merge_three_hour_transcript_is_fast():
+    rng = random.Random(42)
+    words = _words(27_000, rng)  # 3h at 2.5 words/s
+    chunks = _chunked(words)
+    assert len(chunks) > 350
+
+    # Drop or garble a word at some boundaries, like real chunk edges
+    for segments, _, _ in chunks[1::7]:
+        segments[0].text = segments[0].text[:2]
+
+    start = time.perf_counter()
+    merged = merge_overlapping_segments(chunks, overlap_duration=OVERLAP)
+    elapsed = time.perf_counter() - start
+    print(
+        f"\nmerged {len(chunks)} chunks / {len(words)} words in {elapsed * 1000:.1f}ms"
+    )
+
+    texts = [s.text for s in merged]
+    assert len(texts) == len(words)
+    assert texts == words
+    assert elapsed < 0.5  # Low milliseconds locally; generous for slow CI
@@ -0,0 +1,78 @@
+"""Multi-process SenseVoice inference."""
+
+import os
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from app.config import settings
+from app.services.transcription import AudioInput
+from app.services.transcription.process_pool import TranscriptionProcessPool
+from app.services.transcription.sensevoice import SenseVoiceEngine
+
+
+class _EchoModel:
+    """Stands in for FunASR: reports each input's length, value and process."""
+
+    def generate(self, input, **kwargs):
+        return [
+            {
+                "text": f"{len(x)} {x[0]:.0f} {os.getpid()}",
+                "timestamp": [[0, 500, f"{x[0]:.0f}"]],
+            }
+            for x in input
+        ]
+
+
+class _EchoEngine(SenseVoiceEngine):
+    def _load_model(self):
+        self._model = _EchoModel()
+        self._model_loaded = True
+
+
+@pytest.fixture(scope="module")
+def pool():
+    pool = TranscriptionProcessPool(2, engine_factory=_EchoEngine)
+    pool.start()
+    yield pool
+    pool.shutdown()
+
+
+def _batch(*values, length=8):
+    return [(np.full(length, v, np.float32), v * 2.0, v * 2.0 + 3) for v in values]
+
+
+def test_batches_run_in_workers_and_come_back_in_order(pool):
+    batches = [_batch(0, 1), _batch(2, 3), _batch(4)]
+
+    outcomes = list(pool.run_batches(iter(batches), {}, max_in_flight=2))
+
+    assert [batch for batch, _, _ in outcomes] == batches
+    texts = [item["text"].split() for _, items, _ in outcomes for item in items]
+    assert [(length, value) for length, value, _ in texts] == [
+        ("8", str(v)) for v in range(5)
+    ]
+    assert {pid for _, _, pid in texts} != {str(os.getpid())}
+    assert all(seconds >= 0 for _, _, seconds in outcomes)
+
+
+def test_engine_transcribes_through_the_pool(pool, tmp_path):
+    path = tmp_path / "talk.wav"
+    sf.write(str(path), np.full(16000 * 10, 3, np.float32), 16000, subtype="FLOAT")
+
+    engine = SenseVoiceEngine(device="cpu")
+    engine._pool = pool
+    engine._model_loaded = True
+    progress = []
+
+    # Short audio is windowed too: workers only take in-memory arrays
+    with patch.object(settings, "SENSEVOICE_VAD", False):
+        result = engine.transcribe(
+            AudioInput.from_file(path), on_progress=lambda *p: progress.append(p)
+        )
+
+    assert [seg.text for seg in result.segments] == ["3"]
+    assert progress == [(10, 10)]
+    assert engine.last_run_stats["batches"][0]["audio_seconds"] == 10.0
@@ -0,0 +1,108 @@
+"""Energy VAD front-end for chunked transcription."""
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from app.config import settings
+from app.services.transcription import AudioInput
+from app.services.transcription.sensevoice import SenseVoiceEngine
+from app.services.transcription.vad import EnergyVAD
+
+SR = 16000
+
+
+def _audio(seconds, speech_spans, seed=0, bed=1e-4):
+    """Background noise (``bed``) with louder 'speech' noise in the given spans."""
+    rng = np.random.default_rng(seed)
+    y = rng.normal(0, bed, int(seconds * SR)).astype(np.float32)
+    for start, end in speech_spans:
+        n = int((end - start) * SR)
+        t = np.arange(n) / SR
+        # Syllable-rate amplitude modulation, so there are quieter moments
+        envelope = 0.6 + 0.4 * np.sin(2 * np.pi * 3 * t)
+        y[int(start * SR) : int(start * SR) + n] += rng.normal(0, 0.2, n) * envelope
+    return y
+
+
+def _blocks(y, size=SR * 10):
+    return (y[i : i + size] for i in range(0, len(y), size))
+
+
+def test_silence_is_dropped_and_speech_padded():
+    vad = EnergyVAD()
+    windows = list(vad.windows(_blocks(_audio(24, [(5, 8), (12, 14)]))))
+
+    spans = [(start, end) for _, start, end in windows]
+    assert len(spans) == 2
+    assert spans[0] == pytest.approx((4.8, 8.2), abs=0.05)
+    assert spans[1] == pytest.approx((11.8, 14.2), abs=0.05)
+    for samples, start, end in windows:
+        assert samples.dtype == np.float32
+        assert len(samples) == round((end - start) * SR)
+    assert vad.audio_seconds == pytest.approx(24)
+    assert vad.speech_seconds == pytest.approx(5.8, abs=0.1)
+
+
+def test_continuous_speech_is_cut_into_bounded_contiguous_windows():
+    vad = EnergyVAD(max_window_duration=30)
+    windows = list(vad.windows(_blocks(_audio(70, [(0, 70)]))))
+
+    spans = [(start, end) for _, start, end in windows]
+    assert len(spans) == 3
+    assert spans[0][0] == 0
+    assert spans[-1][1] == pytest.approx(70, abs=0.05)
+    assert all(end - start <= 30 for start, end in spans)
+    # No overlap and no gap between forced cuts
+    assert all(a[1] == b[0] for a, b in zip(spans, spans[1:]))
+
+
+@pytest.mark.parametrize("bed", [0.02, 0.05, 0.08])
+@pytest.mark.parametrize("speech", [(10, 50), (0, 40)])
+def test_long_speech_over_a_steady_bed_is_kept(bed, speech):
+    # Speech filling the floor history must not raise the floor to itself
+    vad = EnergyVAD()
+    windows = list(vad.windows(_blocks(_audio(60, [speech], bed=bed))))
+
+    assert vad.speech_seconds == pytest.approx(40, abs=0.5)
+    assert windows[0][1] == pytest.approx(max(speech[0] - 0.2, 0), abs=0.05)
+    assert windows[-1][2] == pytest.approx(speech[1], abs=0.25)
+    assert all(a[2] == b[1] for a, b in zip(windows, windows[1:]))
+
+
+def test_bed_between_speech_is_dropped():
+    vad = EnergyVAD()
+    y = _audio(60, [(5, 8), (12, 14), (40, 50)], bed=0.05)
+    bounds = [t for _, start, end in vad.windows(_blocks(y)) for t in (start, end)]
+
+    assert bounds == pytest.approx([4.8, 8.2, 11.8, 14.2, 39.8, 50.2], abs=0.25)
+
+
+def test_engine_only_sends_speech_and_concatenates_results(tmp_path):
+    path = tmp_path / "episode.wav"
+    sf.write(str(path), _audio(90, [(20, 23), (60, 62)]), SR, subtype="FLOAT")
+
+    engine = SenseVoiceEngine(device="cpu")
+    engine._model_loaded = True
+    engine._model = MagicMock()
+    engine._model.generate.side_effect = lambda input, **kw: [
+        {"text": "hi", "timestamp": [[100, 500, "hi"]]} for _ in input
+    ]
+
+    with (
+        patch.object(settings, "SENSEVOICE_VAD", True),
+        patch.object(settings, "SENSEVOICE_CHUNK_BATCH_SIZE", 4),
+    ):
+        result = engine.transcribe(AudioInput.from_file(path))
+
+    (call,) = engine._model.generate.call_args_list
+    assert [len(x) / SR for x in call.kwargs["input"]] == pytest.approx(
+        [3.4, 2.4], abs=0.05
+    )
+    assert [s.start_time for s in result.segments] == pytest.approx(
+        [19.9, 59.9], abs=0.05
+    )
+    assert engine.last_run_stats["speech_seconds"] == pytest.approx(5.8, abs=0.1)
+    assert engine.last_run_stats["audio_seconds"] == pytest.approx(90)
@@ -0,0 +1,222 @@
+"""Streaming audio windows and batched inference for chunked transcription."""
+
+from unittest.mock import MagicMock, patch
+
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from app.services.transcription import AudioInput
+from app.services.transcription.sensevoice import SenseVoiceEngine
+from app.services.transcription.utils import (
+    _ffmpeg_blocks,
+    _windows_from_blocks,
+    iter_audio_windows,
+)
+
+
+def _ramp_wav(path, seconds, sr=8000, channels=2):
+    ramp = np.linspace(0, 1, int(seconds * sr), dtype=np.float32)
+    sf.write(str(path), np.stack([ramp] * channels, axis=1), sr)
+    return ramp
+
+
+def test_windows_are_resampled_float32_with_overlap(tmp_path):
+    path = tmp_path / "talk.wav"
+    _ramp_wav(path, 7.5)
+
+    windows = list(iter_audio_windows(path, window_duration=3, overlap_duration=1))
+
+    assert [(start, end) for _, start, end in windows] == [
+        (0, 3),
+        (2, 5),
+        (4, 7),
+        (6, 7.5),
+    ]
+    for samples, start, end in windows:
+        assert samples.dtype == np.float32
+        assert samples.ndim == 1
+        assert len(samples) == round((end - start) * 16000)
+        # Stereo was downmixed and the ramp kept its position in the file
+        assert samples[0] == pytest.approx(start / 7.5, abs=1e-3)
+
+
+def test_stream_ending_on_a_window_boundary_has_no_extra_tail():
+    blocks = [np.zeros(7, dtype=np.float32) for _ in range(5)]  # 35 samples
+
+    windows = list(_windows_from_blocks(blocks, window=15, overlap=5, sample_rate=5))
+
+    assert [(start, end) for _, start, end in windows] == [(0, 3), (2, 5), (4, 7)]
+
+
+def test_short_stream_yields_a_single_window():
+    windows = list(
+        _windows_from_blocks([np.ones(4, dtype=np.float32)], 15, 5, sample_rate=5)
+    )
+    assert [(len(w), start, end) for w, start, end in windows] == [(4, 0, 0.8)]
+
+
+def _fake_ffmpeg(script):
+    """Popen that runs ``script`` in place of the ffmpeg command."""
+    popen = subprocess.Popen
+    return lambda cmd, **kwargs: popen([sys.executable, "-c", script], **kwargs)
+
+
+def test_ffmpeg_failing_part_way_is_an_error(tmp_path):
+    script = (
+        "import sys; sys.stdout.buffer.write(bytes(4000)); sys.stdout.flush(); "
+        "sys.stderr.write('Invalid data found'); sys.exit(1)"
+    )
+    blocks = []
+    with patch("subprocess.Popen", _fake_ffmpeg(script)):
+        with pytest.raises(RuntimeError, match="exit code 1.*Invalid data found"):
+            for block in _ffmpeg_blocks(tmp_path / "cut.mp3", 16000):
+                blocks.append(block)
+    assert sum(len(b) for b in blocks) == 1000  # Decoded up to the error
+
+
+def test_ffmpeg_stopped_early_by_the_consumer_is_not_an_error(tmp_path):
+    script = "import sys\nwhile True: sys.stdout.buffer.write(bytes(640000))"
+    with patch("subprocess.Popen", _fake_ffmpeg(script)):
+        blocks = _ffmpeg_blocks(tmp_path / "long.mp3", 16000)
+        assert len(next(blocks)) == 160000
+        blocks.close()
+
+
+def _engine(result_for):
+    engine = SenseVoiceEngine(device="cpu")
+    engine._model_loaded = True
+    engine._model = MagicMock()
+    engine._model.generate.side_effect = lambda input, **kw: [
+        result_for(samples) for samples in input
+    ]
+    return engine
+
+
+def _hello(samples):
+    return {"text": "hello", "timestamp": [[0, 500, "hello"]]}
+
+
+def test_chunked_transcription_feeds_arrays_to_the_model(tmp_path):
+    path = tmp_path / "long.wav"
+    _ramp_wav(path, 70, sr=16000, channels=1)
+    engine = _engine(_hello)
+    progress = []
+
+    with patch("app.services.transcription.sensevoice.settings") as settings:
+        settings.SENSEVOICE_CHUNK_BATCH_SIZE = 2
+        settings.SENSEVOICE_VAD = False
+        result = engine.transcribe(
+            AudioInput.from_file(path), on_progress=lambda *p: progress.append(p)
+        )
+
+    calls = engine._model.generate.call_args_list
+    assert [len(call.kwargs["input"]) for call in calls] == [2, 1]
+    assert calls[0].kwargs["batch_size"] == 2
+    inputs = [x for call in calls for x in call.kwargs["input"]]
+    assert all(isinstance(x, np.ndarray) and x.dtype == np.float32 for x in inputs)
+    # Seconds of audio covered: windows 0-30 and 28-58, then 56-70
+    assert progress == [(58, 70), (70, 70)]
+    assert result.segments[0].text == "hello"
+    assert list(tmp_path.iterdir()) == [path]  # No temp chunk files
+
+    stats = engine.last_run_stats
+    assert stats["batch_size"] == 2
+    assert [b["chunks"] for b in stats["batches"]] == [2, 1]
+    assert [b["audio_seconds"] for b in stats["batches"]] == [60.0, 14.0]
+    assert stats["rtf"] is not None
+
+
+def test_vad_progress_follows_audio_time_not_window_count(tmp_path):
+    # One second of tone every two seconds: dozens of short VAD windows
+    sr = 16000
+    t = np.arange(70 * sr) / sr
+    audio = (0.3 * np.sin(2 * np.pi * 220 * t) * (t % 2 < 1)).astype(np.float32)
+    path = tmp_path / "bursts.wav"
+    sf.write(str(path), audio, sr)
+    engine = _engine(_hello)
+    progress = []
+
+    with patch("app.services.transcription.sensevoice.settings") as settings:
+        settings.SENSEVOICE_CHUNK_BATCH_SIZE = 4
+        settings.SENSEVOICE_VAD = True
+        engine.transcribe(
+            AudioInput.from_file(path), on_progress=lambda *p: progress.append(p)
+        )
+
+    assert len(progress) > 5
+    assert all(total == 70 for _, total in progress)
+    done = [d for d, _ in progress]
+    assert done == sorted(done) and done[-1] == 70
+    # The first batch of four windows covers about eight of 70 seconds
+    assert done[0] < 10
+
+
+def test_segments_are_delivered_as_chunks_finish(tmp_path):
+    path = tmp_path / "long.wav"
+    _ramp_wav(path, 70, sr=16000, channels=1)
+    engine = _engine(
+        lambda samples: {"text": "hi", "timestamp": [[10000, 10500, "hi"]]}
+    )
+    events = []
+
+    with patch("app.services.transcription.sensevoice.settings") as settings:
+        settings.SENSEVOICE_CHUNK_BATCH_SIZE = 1
+        settings.SENSEVOICE_VAD = False
+        result = engine.transcribe(
+            AudioInput.from_file(path),
+            on_progress=lambda *p: events.append(("progress", p)),
+            on_segments=lambda segs: events.append(("segments", list(segs))),
+        )
+
+    # A chunk's segments are final once the next chunk settled their seam
+    assert [kind for kind, _ in events] == [
+        "progress",
+        "segments",
+        "progress",
+        "segments",
+        "progress",
+        "segments",
+    ]
+    delivered = [seg for kind, segs in events if kind == "segments" for seg in segs]
+    assert delivered == result.segments
+    assert [seg.start_time for seg in delivered] == [10.0, 38.0, 66.0]
+
+
+def test_failed_batch_falls_back_to_single_chunks():
+    windows = [
+        (np.full(4, i, dtype=np.float32), i * 2.0, i * 2.0 + 3) for i in range(3)
+    ]
+
+    def result_for(samples):
+        if samples[0] == 1:
+            raise RuntimeError("bad chunk")
+        return {"text": f"chunk {int(samples[0])}"}
+
+    engine = _engine(result_for)
+    with patch.object(engine, "_chunk_batch_size", return_value=3):
+        results = list(engine._generate_batched(windows, 3, 3.0))
+
+    assert [item and item["text"] for item, _, _ in results] == [
+        "chunk 0",
+        None,
+        "chunk 2",
+    ]
+    assert [start for _, start, _ in results] == [0.0, 2.0, 4.0]
+    # One failed batched call, then one call per chunk
+    assert engine._model.generate.call_count == 4
+
+
+def test_batch_size_follows_available_memory():
+    engine = SenseVoiceEngine(device="cpu")
+    per_chunk = 30 * engine.BATCH_MEMORY_PER_AUDIO_SECOND
+
+    with patch.object(engine, "_available_memory", return_value=per_chunk * 6):
+        assert engine._chunk_batch_size(30) == 3
+    with patch.object(engine, "_available_memory", return_value=per_chunk * 100):
+        assert engine._chunk_batch_size(30) == engine.MAX_CHUNK_BATCH
+    with patch.object(engine, "_available_memory", return_value=None):
+        assert engine._chunk_batch_size(30) == 1
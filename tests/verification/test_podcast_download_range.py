@@ -44,11 +44,10 @@ async def test_download_endpoint_range_header():
             # mock_db_session.execute needs to be awaitable
             mock_db_session.execute = AsyncMock(return_value=mock_result)
 
-            # Mock httpx.AsyncClient
-            with patch("httpx.AsyncClient") as MockClient:
-                # In impl: client = httpx.AsyncClient(...)
-                # So client is MockClient.return_value
-                mock_client_instance = MockClient.return_value
+            # Mock the shared HTTP client
+            with patch("app.api.routers.podcast.http_clients") as mock_registry:
+                # In impl: client = http_clients.get()
+                mock_client_instance = mock_registry.get.return_value
 
                 # Mock the response
                 mock_response = MagicMock()
@@ -72,7 +71,6 @@ async def test_download_endpoint_range_header():
 
                 # Mock client.send (Async)
                 mock_client_instance.send = AsyncMock(return_value=mock_response)
-                mock_client_instance.aclose = AsyncMock()
 
                 # Make request using TestClient or simulate params
                 # To test the actual router function logic:
@@ -140,15 +138,9 @@ async def test_download_head_endpoint_headers():
             mock_result.scalar_one_or_none.return_value = mock_episode
             mock_db_session.execute = AsyncMock(return_value=mock_result)
 
-            # Mock httpx.AsyncClient
-            with patch("httpx.AsyncClient") as MockClient:
-                mock_client_instance = MockClient.return_value
-
-                # Mock Context Manager methods since download_episode_head uses 'async with'
-                mock_client_instance.__aenter__ = AsyncMock(
-                    return_value=mock_client_instance
-                )
-                mock_client_instance.__aexit__ = AsyncMock(return_value=None)
+            # Mock the shared HTTP client
+            with patch("app.api.routers.podcast.http_clients") as mock_registry:
+                mock_client_instance = mock_registry.get.return_value
 
                 # Mock HEAD response
                 mock_response = MagicMock()
@@ -164,13 +156,12 @@ async def test_download_head_endpoint_headers():
 
                 await download_episode_head(episode_id=1, user_id="test_user")
 
-                # Verify constructor was called with headers containing User-Agent
-                # In download_episode_head, headers are passed to constructor
-                call_args = MockClient.call_args
+                # Verify the HEAD request was sent with headers containing User-Agent
+                call_args = mock_client_instance.head.call_args
                 headers_passed = call_args.kwargs.get("headers")
 
                 assert headers_passed is not None, (
-                    "Headers should be passed to AsyncClient constructor"
+                    "Headers should be passed to the HEAD request"
                 )
                 assert "User-Agent" in headers_passed
                 assert "Mozilla/5.0" in headers_passed["User-Agent"]